@@ -41,10 +41,23 @@ export const LogAPI = {
 
     /**
      * 노드 실행 로그 조회
-     * @param {Object} filters - 필터 옵션 (execution_id, script_id, node_id, limit, offset)
+     * @param {Object} filters - 필터 옵션 (execution_id, script_id, node_id, limit, cursor, fields, include_payload)
+     *   include_payload: true면 파라미터/결과/스택 트레이스 포함 (기본값은 목록용 짧은 필드만)
+     *   cursor: 다음 페이지 조회 시 이전 응답의 next_cursor (getNodeExecutionLogsPage 참고)
+     *   fields: 반환할 필드 배열 (예: ['id', 'node_name', 'status', 'started_at'])
      * @returns {Promise<Array>} 로그 목록
      */
     async getNodeExecutionLogs(filters = {}) {
+        const page = await this.getNodeExecutionLogsPage(filters);
+        return page.logs;
+    },
+
+    /**
+     * 노드 실행 로그 한 페이지 조회 (키셋 페이지네이션)
+     * @param {Object} filters - getNodeExecutionLogs와 같은 필터 옵션
+     * @returns {Promise<{logs: Array, nextCursor: string|null}>} 로그 목록과 다음 페이지 커서 (마지막 페이지면 null)
+     */
+    async getNodeExecutionLogsPage(filters = {}) {
         try {
             // 쿼리 파라미터 생성
             const params = new URLSearchParams();
@@ -60,17 +73,23 @@ export const LogAPI = {
             if (filters.limit) {
                 params.append('limit', filters.limit);
             }
-            if (filters.offset) {
-                params.append('offset', filters.offset);
+            if (filters.cursor) {
+                params.append('cursor', filters.cursor);
+            }
+            if (filters.fields && filters.fields.length > 0) {
+                params.append('fields', filters.fields.join(','));
+            }
+            if (filters.include_payload) {
+                params.append('include_payload', 'true');
             }
 
             const queryString = params.toString();
             const endpoint = `/api/logs/node-execution${queryString ? `?${queryString}` : ''}`;
 
             const result = await apiCall(endpoint);
-            // 응답 형식: {success: true, message: "...", data: [...], count: N}
+            // 응답 형식: {success: true, message: "...", data: [...], count: N, next_cursor: "..." | null}
             const logs = result.data || result; // 하위 호환성 유지
-            return logs;
+            return { logs, nextCursor: result.next_cursor || null };
         } catch (error) {
             const logger = getLogger();
             logger.error('[LogAPI] ❌ 로그 조회 실패:', error);
@@ -132,9 +151,9 @@ export const LogAPI = {
             const endpoint = `/api/logs/node-execution/failed${queryString ? `?${queryString}` : ''}`;
 
             const result = await apiCall(endpoint);
-            // 응답 형식: {success: true, message: "...", data: [...], count: N}
+            // 응답 형식: {success: true, message: "...", data: [...], count: N, next_cursor: "..." | null}
             const logs = result.data || result; // 하위 호환성 유지
-            return logs;
+            return { logs, nextCursor: result.next_cursor || null };
         } catch (error) {
             const logger = getLogger();
             logger.error('[LogAPI] ❌ 실패한 로그 조회 실패:', error);
@@ -142,6 +161,31 @@ export const LogAPI = {
         }
     },
 
+    /**
+     * 노드 실행 로그 전문 검색 (에러 메시지, 스택 트레이스, 노드 이름/식별자)
+     * @param {string} query - 검색어 (단어는 접두어 검색, 큰따옴표로 묶으면 구문 검색)
+     * @param {Object} filters - 필터 옵션 (script_id, node_type, status, since, until, columns, order, limit, cursor)
+     * @returns {Promise<{logs: Array, nextCursor: string|null}>} 검색 결과 (각 로그의 snippet은 검색어를 <mark>로 감싼 이스케이프된 HTML)
+     */
+    async searchNodeExecutionLogs(query, filters = {}) {
+        try {
+            const params = new URLSearchParams({ q: query });
+            const keys = ['script_id', 'node_type', 'status', 'since', 'until', 'columns', 'order', 'limit', 'cursor'];
+            for (const key of keys) {
+                if (filters[key]) {
+                    params.append(key, filters[key]);
+                }
+            }
+
+            const result = await apiCall(`/api/logs/search?${params.toString()}`);
+            return { logs: result.data || [], nextCursor: result.next_cursor || null };
+        } catch (error) {
+            const logger = getLogger();
+            logger.error('[LogAPI] ❌ 로그 검색 실패:', error);
+            throw error;
+        }
+    },
+
     /**
      * 특정 노드 실행 로그 삭제
      * @param {number} logId - 로그 ID
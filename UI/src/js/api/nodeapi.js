@@ -46,6 +46,25 @@ export const NodeAPI = {
         });
     },
 
+    /**
+     * 노드 변경분 저장 (마지막 저장 이후 바뀐 노드만 전송)
+     * @param {number} scriptId - 스크립트 ID
+     * @param {Array} nodes - 추가하거나 변경할 노드 배열
+     * @param {Array<string>} removed - 삭제할 노드 ID 배열
+     * @param {Array|null} connections - 전체 연결 배열 (null이면 서버의 기존 연결 유지)
+     * @returns {Promise<Object>} 추가/변경/삭제/변경 없음 노드 개수
+     */
+    async patchNodesBatch(scriptId, nodes, removed = [], connections = null) {
+        const body = { nodes, removed };
+        if (connections !== null) {
+            body.connections = connections;
+        }
+        return await apiCall(`/api/nodes/script/${scriptId}/batch`, {
+            method: 'PATCH',
+            body: JSON.stringify(body)
+        });
+    },
+
     /**
      * 노드 업데이트
      * @param {number} scriptId - 스크립트 ID
@@ -0,0 +1,48 @@
+// node-input-replay.js
+// 입력 재생 노드 정의
+
+(function () {
+    if (!window.NodeManager) {
+        return;
+    }
+
+    window.NodeManager.registerNodeType('input-replay', {
+        /**
+         * 입력 재생 노드 내용 생성
+         * @param {Object} nodeData
+         */
+        renderContent(nodeData) {
+            // 노드 아이콘은 node-icons.config.js에서 중앙 관리
+            const NodeIcons = window.NodeIcons || {};
+            const icon = NodeIcons.getIcon('input-replay', nodeData) || NodeIcons.icons?.default || '⏯️';
+
+            let summary = '녹화 없음';
+            if (nodeData.event_stream) {
+                try {
+                    const stream =
+                        typeof nodeData.event_stream === 'string'
+                            ? JSON.parse(nodeData.event_stream)
+                            : nodeData.event_stream;
+                    summary = `이벤트 ${stream.event_count || 0}개 · x${nodeData.speed || 1}`;
+                } catch (e) {
+                    summary = '잘못된 녹화 데이터';
+                }
+            }
+
+            return `
+                <div class="node-input"></div>
+                <div class="node-content">
+                    <div class="node-icon-box">
+                        <div class="node-icon">${icon}</div>
+                    </div>
+                    <div class="node-text-area">
+                        <div class="node-title">${this.escapeHtml(nodeData.title || '입력 재생')}</div>
+                        <div class="node-description">${this.escapeHtml(summary)}</div>
+                    </div>
+                </div>
+                <div class="node-output"></div>
+                <div class="node-settings" data-node-id="${nodeData.id}">⚙</div>
+            `;
+        }
+    });
+})();
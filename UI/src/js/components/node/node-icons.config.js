@@ -16,8 +16,10 @@ const NODE_ICONS = {
     wait: '🕐', // 대기 노드: 시계 아이콘
     'image-touch': '🖼️', // 이미지 터치 노드: 이미지 아이콘
     'process-focus': '🖥️', // 프로세스 포커스 노드: 모니터 아이콘
+    'input-replay': '⏯️', // 입력 재생 노드: 재생 아이콘
     'excel-open': '📊', // 엑셀 열기 노드: 차트 아이콘
     'excel-select-sheet': '📋', // 엑셀 시트 선택 노드: 클립보드 아이콘
+    'excel-read': '📑', // 엑셀 읽기 노드: 문서 아이콘
     'excel-close': '📕', // 엑셀 닫기 노드: 책 아이콘
 
     // 로직 노드
@@ -904,10 +904,10 @@ export class DashboardManager {
 
             logger.log('[Dashboard] ✅ 전체 실행 횟수 증가 완료:', result);
 
-            // 통계 즉시 업데이트
+            // 통계 즉시 업데이트 (서버는 현재 값을 읽지 않고 증분만 반환하므로 화면 값에 더함)
             if (result.data) {
-                this.executionStats.allExecutions = result.data.all_executions || 0;
-                this.executionStats.allFailed = result.data.all_failed_scripts || 0;
+                this.executionStats.allExecutions += result.data.all_executions || 0;
+                this.executionStats.allFailed += result.data.all_failed_scripts || 0;
                 this.updateStats();
             } else {
                 // 폴백: 서버에서 다시 로드
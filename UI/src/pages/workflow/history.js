@@ -304,6 +304,7 @@ export class HistoryManager {
         });
 
         // 헤더 클릭 이벤트 (삭제 버튼 제외)
+        let detailsLoaded = false;
         header.addEventListener('click', (e) => {
             // 삭제 버튼이나 그 자식 요소 클릭 시에는 토글하지 않음
             if (e.target.closest('.history-delete-execution-btn')) {
@@ -313,6 +314,12 @@ export class HistoryManager {
             const isExpanded = body.style.display !== 'none';
             body.style.display = isExpanded ? 'none' : 'block';
             toggleIcon.textContent = isExpanded ? '▼' : '▲';
+
+            // 목록 조회에는 파라미터/결과/스택 트레이스가 없으므로 처음 펼칠 때 상세 조회
+            if (!isExpanded && !detailsLoaded) {
+                detailsLoaded = true;
+                this.loadExecutionDetails(executionId, logs, body);
+            }
         });
 
         group.appendChild(header);
@@ -321,6 +328,27 @@ export class HistoryManager {
         return group;
     }
 
+    /**
+     * 실행 그룹의 로그 상세(파라미터/결과/스택 트레이스) 조회 후 본문 다시 그리기
+     */
+    async loadExecutionDetails(executionId, logs, body) {
+        const logger = getLogger();
+        try {
+            const detailedLogs = await LogAPI.getNodeExecutionLogs({
+                execution_id: executionId,
+                include_payload: true
+            });
+            const detailsById = new Map(detailedLogs.filter((log) => log.id).map((log) => [log.id, log]));
+
+            body.innerHTML = '';
+            logs.forEach((log) => {
+                body.appendChild(this.createLogItem(detailsById.get(log.id) || log));
+            });
+        } catch (error) {
+            logger.error('[History] 로그 상세 조회 실패:', error);
+        }
+    }
+
     /**
      * 로그 아이템 생성
      */
@@ -10,6 +10,9 @@ import { getSimpleNodeIdentifier } from '../utils/node-identifier.js';
 export class WorkflowSaveService {
     constructor(workflowPage) {
         this.workflowPage = workflowPage;
+        // 마지막으로 저장한 내용 { scriptId, nodes: Map<노드 ID, JSON 문자열>, connections: JSON 문자열 }
+        // 같은 스크립트를 다시 저장할 때 바뀐 노드만 보내는 데 사용
+        this.lastSaved = null;
     }
 
     /**
@@ -87,7 +90,7 @@ export class WorkflowSaveService {
                     connectionCount: connections.length
                 });
 
-                const response = await nodeAPI.updateNodesBatch(scriptIdToSave, nodesForAPI, connectionsForAPI);
+                const response = await this.saveNodes(nodeAPI, scriptIdToSave, nodesForAPI, connectionsForAPI);
 
                 logger.log('[WorkflowPage] 저장 완료 응답:', response);
 
@@ -102,6 +105,40 @@ export class WorkflowSaveService {
         }
     }
 
+    /**
+     * 노드 저장 요청
+     * 같은 스크립트를 이전에 저장했으면 바뀐 노드와 삭제한 노드 ID만 보내고(PATCH),
+     * 처음 저장하거나 변경분 저장이 실패하면 전체 노드를 보냅니다.
+     */
+    async saveNodes(nodeAPI, scriptId, nodes, connections) {
+        const snapshot = {
+            scriptId: String(scriptId),
+            nodes: new Map(nodes.map((node) => [node.id, JSON.stringify(node)])),
+            connections: JSON.stringify(connections)
+        };
+        const last = this.lastSaved;
+        // 저장 결과를 알기 전까지는 서버 상태를 알 수 없으므로 비워 둠 (실패하면 다음 저장은 전체 저장)
+        this.lastSaved = null;
+
+        let response = null;
+        if (last && last.scriptId === snapshot.scriptId) {
+            const changed = nodes.filter((node) => last.nodes.get(node.id) !== snapshot.nodes.get(node.id));
+            const removed = [...last.nodes.keys()].filter((nodeId) => !snapshot.nodes.has(nodeId));
+            const changedConnections = last.connections !== snapshot.connections ? connections : null;
+            try {
+                response = await nodeAPI.patchNodesBatch(scriptId, changed, removed, changedConnections);
+            } catch (error) {
+                this.workflowPage.getLogger().log('[WorkflowSaveService] 변경분 저장 실패, 전체 저장으로 재시도:', error);
+            }
+        }
+        if (response === null) {
+            response = await nodeAPI.updateNodesBatch(scriptId, nodes, connections);
+        }
+
+        this.lastSaved = snapshot;
+        return response;
+    }
+
     /**
      * 노드 데이터를 API 형식으로 변환
      */
@@ -81,8 +81,10 @@ function getNodeTypeLabel(nodeType) {
         wait: '대기',
         'image-touch': '이미지터치',
         'process-focus': '프로세스포커스',
+        'input-replay': '입력재생',
         'excel-open': '엑셀열기',
         'excel-select-sheet': '엑셀시트선택',
+        'excel-read': '엑셀읽기',
         'excel-close': '엑셀닫기',
         testUIconfig: 'UI테스트'
     };
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+노드 디스패치 오버헤드 벤치마크
+ActionService.process_node가 핸들러를 호출하기 전후에 드는 비용(노드 데이터 병합, 메타데이터 추가,
+핸들러 조회, 결과 정규화, 로그 포맷팅)을 이전 방식과 비교합니다.
+핸들러는 아무 일도 하지 않는 함수로 교체하여 디스패치 경로 비용만 측정합니다.
+
+이전 방식:
+    - process_node: 노드 식별자 문자열 생성, 노드 데이터 전체를 담은 f-string 로그, 결과 정규화 2회
+    - process_action: 호출마다 INFO 로그, 등록된 핸들러 목록을 list(keys())로 두 번 포맷팅
+
+로그 출력(I/O) 비용을 빼기 위해 로거 레벨을 WARNING으로 올리고 측정합니다.
+(f-string 로그는 레벨과 무관하게 문자열을 만들므로 이전 방식의 포맷팅 비용은 그대로 포함됩니다)
+
+사용법:
+    python scripts/benchmarks/bench-action-dispatch.py
+    python scripts/benchmarks/bench-action-dispatch.py --executions 200000 --trace
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+# 프로젝트 루트 디렉토리 (benchmarks -> scripts -> project_root)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from log import log_manager  # noqa: E402
+from services.action_service import ActionService  # noqa: E402
+from services.node_execution_context import NodeExecutionContext  # noqa: E402
+from utils import compile_parameter_plan  # noqa: E402
+
+logger = log_manager.logger
+
+# 벤치마크용 노드 타입
+BENCH_NODE_TYPE = "bench-noop"
+
+# 엑셀 데이터 기반 스크립트의 일반적인 노드와 비슷한 크기의 파라미터
+NODE = {
+    "id": "node_42",
+    "type": BENCH_NODE_TYPE,
+    "data": {"title": "셀 읽기", "sheet": "Sheet1", "row": 42, "column": "B", "execution_id": "exec_1"},
+    "parameters": {"retry": 1, "timeout": 30, "delay": 0.0},
+}
+
+
+async def noop_handler(parameters: dict[str, Any]) -> dict[str, Any]:
+    """아무 일도 하지 않는 노드 핸들러 (디스패치 오버헤드만 측정)"""
+    return {"action": BENCH_NODE_TYPE, "status": "completed", "output": {"ok": True}}
+
+
+async def legacy_process_action(
+    service: ActionService, action_type: str, parameters: dict[str, Any], action_node_type: str | None = None
+) -> dict[str, Any]:
+    """이전 방식의 process_action (호출마다 INFO 로그와 핸들러 목록 포맷팅)"""
+    logger.info(
+        f"[process_action] 호출됨 - 액션 타입: {action_type}, 실제 노드 종류: {action_node_type}, 파라미터: {parameters}"
+    )
+    logger.info(f"[process_action] 사용 가능한 핸들러: {list(service.node_handlers.keys())}")
+    logger.info(f"[process_action] 요청된 액션 타입: {action_type}")
+    handler = service.node_handlers.get(action_type)
+    logger.info(f"[process_action] 핸들러 찾음: {handler} (action_type: {action_type})")
+    logger.debug(f"핸들러 실행 중: {handler.__name__}")
+    result = await handler(parameters)
+    logger.debug(f"핸들러 실행 완료: {result}")
+    if result is None:
+        result = {"action": action_type, "status": "completed", "output": None}
+    if not isinstance(result, dict):
+        result = {"action": action_type, "status": "completed", "output": result}
+    return result
+
+
+async def legacy_process_node(
+    service: ActionService, node: dict[str, Any], context: NodeExecutionContext, execution_id: str, plan: Any
+) -> dict[str, Any]:
+    """이전 방식의 process_node 핵심 경로 (식별자 문자열, 노드 데이터 전체 f-string 로그)"""
+    logger.debug(f"process_node 호출됨 - 노드: {node}")
+    node_type = node.get("type")
+    node_id = node.get("id", "")
+    node_parameters = node.get("parameters")
+    logger.debug(f"[process_node] parameters 병합 완료: {list(node_parameters.keys())}")
+    node_data = {**(node.get("data") or {}), **node_parameters}
+    node_name = node_data.get("title") or node_data.get("name")
+    node_data["_execution_id"] = execution_id
+    node_data["_node_id"] = node_id
+    if node_name:
+        node_data["_node_name"] = node_name
+
+    node_identifier_parts = []
+    if node_name:
+        node_identifier_parts.append(node_name)
+    node_identifier_parts.append(f"({node_type})")
+    if node_id and node_id != "start":
+        node_identifier_parts.append(f"ID:{node_id}")
+    node_identifier = " ".join(node_identifier_parts)
+    logger.info(f"[process_node] 노드 실행: {node_identifier}")
+    logger.debug(f"[process_node] 노드 데이터 키 목록: {list(node_data.keys()) if node_data else []}")
+
+    context.set_current_node(node_id)
+    prev_result = context.get_previous_node_result()
+    if prev_result and isinstance(prev_result, dict) and "execution_id" in node_data:
+        execution_id_value = node_data.get("execution_id")
+        if not execution_id_value or execution_id_value == "":
+            pass
+    logger.debug(f"준비된 노드 데이터: {node_data}")
+
+    action_node_type = node_data.get("action_node_type")
+    result = await legacy_process_action(service, str(node_type), node_data, action_node_type)
+    logger.debug(f"process_action 결과: {result}")
+    if result is None:
+        result = {"action": node_type, "status": "completed", "output": None}
+    if not isinstance(result, dict):
+        result = {"action": node_type, "status": "completed", "output": result}
+    if "output" not in result:
+        result["output"] = None
+    result["_execution_id"] = execution_id
+    result["_node_id"] = node_id
+    if node_name:
+        result["_node_name"] = node_name
+    context.add_node_result(node_id, node_name, result)
+    logger.debug(f"process_node 최종 결과: {result}")
+    return result
+
+
+async def run_legacy(service: ActionService, executions: int) -> None:
+    context = NodeExecutionContext()
+    plan = compile_parameter_plan(ActionService._merge_node_data(NODE))
+    for _ in range(executions):
+        await legacy_process_node(service, NODE, context, "exec_1", plan)
+
+
+async def run_current(service: ActionService, executions: int) -> None:
+    context = NodeExecutionContext()
+    plan = service.compile_parameter_plan(NODE)
+    for _ in range(executions):
+        await service.process_node(NODE, context, "exec_1", None, plan)
+
+
+def measure(label: str, coro_factory: Any, executions: int) -> float:
+    """코루틴 실행 시간을 측정하고 노드 실행당 오버헤드(마이크로초)를 출력합니다."""
+    started = time.perf_counter()
+    asyncio.run(coro_factory())
+    per_node_us = (time.perf_counter() - started) / executions * 1_000_000
+    print(f"  {label:<28} {per_node_us:8.2f} µs/node")
+    return per_node_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="노드 디스패치 오버헤드 벤치마크")
+    parser.add_argument("--executions", type=int, default=100_000, help="노드 실행 횟수 (기본값: 100000)")
+    parser.add_argument("--trace", action="store_true", help="상세 추적 로그 모드(NODE_TRACE)도 측정")
+    args = parser.parse_args()
+    executions = args.executions
+
+    # 로그 출력(I/O)을 제외하고 포맷팅 비용만 비교
+    logger.setLevel(logging.WARNING)
+
+    service = ActionService()
+    service.register_handler(BENCH_NODE_TYPE, noop_handler)
+    service.set_trace(False)
+
+    print(f"process_node 디스패치 오버헤드 (노드 실행 {executions:,}회, 핸들러는 no-op)")
+    legacy = measure("이전 방식", lambda: run_legacy(service, executions), executions)
+    current = measure("현재 방식", lambda: run_current(service, executions), executions)
+    if args.trace:
+        service.set_trace(True)
+        measure("현재 방식 (NODE_TRACE)", lambda: run_current(service, executions), executions)
+        service.set_trace(False)
+    print(f"  -> 이전 방식 대비 {legacy / current:.1f}배 빠름 (목표: 노드당 50 µs 미만)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+조건 평가 마이크로 벤치마크
+조건 노드 평가 비용을 이전 방식(조건 타입 문자열 비교 체인 + 매 평가 비교값 변환)과
+컴파일된 술어(get_compiled_condition / CompiledCondition) 방식으로 비교합니다.
+조건 노드는 실행 계획을 만들 때 조건을 미리 컴파일하므로(ConditionService.compile_condition_plan)
+실행 시 비용은 "미리 컴파일" 항목에 해당합니다. (캐시 조회는 조건 파라미터가 경로 문자열일 때만 사용)
+
+사용법:
+    python scripts/benchmarks/bench-conditions.py
+    python scripts/benchmarks/bench-conditions.py --iterations 200000
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+# 프로젝트 루트 디렉토리 (benchmarks -> scripts -> project_root)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from utils.condition_predicate import CompiledCondition, get_compiled_condition  # noqa: E402
+from utils.field_path_resolver import compile_relative_path  # noqa: E402
+
+# 엑셀 행 하나에 여러 조건을 검사하는 데이터 기반 스크립트와 비슷한 구성
+ROW = {"name": "row42", "value": 42, "status": "ok", "tags": ["a", "b"]}
+CONDITIONS = [
+    ("equals", "status", "ok"),
+    ("not_equals", "name", "row0"),
+    ("contains", "name", "42"),
+    ("greater_than", "value", "10"),
+    ("less_or_equal", "value", "100"),
+    ("is_not_empty", "tags", ""),
+]
+
+
+def legacy_evaluate(condition_type: str, actual_value: Any, compare_value: Any) -> bool:
+    """이전 방식: 조건 타입 문자열 비교 체인, 비교값을 매번 float()/str()로 변환"""
+    if condition_type == "equals":
+        return str(actual_value) == str(compare_value)
+    if condition_type == "not_equals":
+        return str(actual_value) != str(compare_value)
+    if condition_type == "contains":
+        return str(compare_value) in str(actual_value)
+    if condition_type == "not_contains":
+        return str(compare_value) not in str(actual_value)
+    if condition_type == "greater_than":
+        try:
+            return float(actual_value) > float(compare_value)
+        except (ValueError, TypeError):
+            return False
+    elif condition_type == "less_than":
+        try:
+            return float(actual_value) < float(compare_value)
+        except (ValueError, TypeError):
+            return False
+    elif condition_type == "greater_or_equal":
+        try:
+            return float(actual_value) >= float(compare_value)
+        except (ValueError, TypeError):
+            return False
+    elif condition_type == "less_or_equal":
+        try:
+            return float(actual_value) <= float(compare_value)
+        except (ValueError, TypeError):
+            return False
+    elif condition_type == "is_empty":
+        return (
+            actual_value is None or actual_value == "" or (isinstance(actual_value, (list, dict)) and not actual_value)
+        )
+    elif condition_type == "is_not_empty":
+        return (
+            actual_value is not None
+            and actual_value != ""
+            and not (isinstance(actual_value, (list, dict)) and not actual_value)
+        )
+    return False
+
+
+def bench(label: str, func: Any, iterations: int) -> float:
+    """함수를 iterations번 실행하고 1회당 소요 시간(마이크로초)을 출력합니다."""
+    # 3회 측정 중 최솟값 사용 (다른 프로세스의 영향을 줄이기 위함)
+    best = min(timeit.repeat(func, number=iterations, repeat=3))
+    per_call_us = best / iterations * 1_000_000
+    print(f"  {label:<44} {per_call_us:8.3f} µs/call")
+    return per_call_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="조건 평가 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100_000, help="측정 반복 횟수 (기본값: 100000)")
+    args = parser.parse_args()
+    iterations = args.iterations
+
+    compiled = [CompiledCondition(condition_type, field, value) for condition_type, field, value in CONDITIONS]
+
+    # 조건 노드와 같이 field_path는 캐시된 접근자로 추출 (조건 평가 비용만 비교)
+    def legacy_row() -> list[bool]:
+        return [
+            legacy_evaluate(condition_type, compile_relative_path(field).get_from(ROW), value)
+            for condition_type, field, value in CONDITIONS
+        ]
+
+    def cached_row() -> list[bool]:
+        return [
+            get_compiled_condition(condition_type, field, value).evaluate(ROW)
+            for condition_type, field, value in CONDITIONS
+        ]
+
+    def compiled_row() -> list[bool]:
+        return [condition.evaluate(ROW) for condition in compiled]
+
+    # 결과가 같은지 먼저 확인
+    expected = legacy_row()
+    assert cached_row() == expected
+    assert compiled_row() == expected
+
+    print(f"행 하나에 조건 {len(CONDITIONS)}개 평가 ({iterations:,}회)")
+    legacy = bench("이전 방식 (문자열 비교 체인)", legacy_row, iterations)
+    bench("get_compiled_condition (캐시 조회 포함)", cached_row, iterations)
+    fast = bench("CompiledCondition.evaluate (미리 컴파일)", compiled_row, iterations)
+    print(f"  -> 미리 컴파일한 조건이 {legacy / fast:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+필드 경로 해석 마이크로 벤치마크
+노드 파라미터의 경로 문자열 해석 비용을 이전 방식(매번 접두사 비교/문자열 분리)과
+컴파일된 접근자(FieldPathAccessor / ParameterPlan) 방식으로 비교합니다.
+
+사용법:
+    python scripts/benchmarks/bench-field-paths.py
+    python scripts/benchmarks/bench-field-paths.py --iterations 200000
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+# 프로젝트 루트 디렉토리 (benchmarks -> scripts -> project_root)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from utils.field_path_resolver import (  # noqa: E402
+    compile_parameter_plan,
+    compile_relative_path,
+    resolve_parameter_paths,
+)
+
+# 이전 노드 결과 (엑셀 읽기 노드 출력과 비슷한 형태)
+PREV_RESULT = {
+    "action": "excel-read",
+    "status": "completed",
+    "output": {
+        "execution_id": "20250101-120000-abcd",
+        "sheet_name": "Sheet1",
+        "rows": [{"name": f"row{i}", "value": i} for i in range(100)],
+        "has_more": True,
+    },
+}
+
+# 경로 파라미터 2개 + 정적 파라미터 6개 (일반적인 노드 구성)
+NODE_DATA = {
+    "title": "엑셀 비교",
+    "execution_id": "outdata.output.execution_id",
+    "sheet_name": "output.data.sheet_name",
+    "folder_path": "C:\\images\\touch",
+    "timeout": 30,
+    "has_header": True,
+    "chunk_size": 100,
+    "description": "비교 노드",
+    "compare_mode": "exact",
+}
+
+
+def legacy_resolve_field_path(field_path: str, previous_output: dict[str, Any]) -> Any | None:
+    """이전 방식: 매 호출마다 접두사 비교 후 점(.)으로 분리"""
+    if field_path.startswith("outdata."):
+        value = previous_output.get("outdata")
+        for key in field_path[8:].split("."):
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                return None
+        return value
+    return None
+
+
+def legacy_resolve_parameter_paths(node_data: dict[str, Any], previous_output: dict[str, Any]) -> dict[str, Any]:
+    """이전 방식: 모든 파라미터를 검사하고 이전 형식 접두사를 매번 변환"""
+    wrapped_output = previous_output.copy()
+    wrapped_output["indata"] = {k: v for k, v in node_data.items() if not k.startswith("_")}
+    for key, value in node_data.items():
+        if isinstance(value, str):
+            if value.startswith(("outdata.", "indata.")):
+                resolved = legacy_resolve_field_path(value, wrapped_output)
+                if resolved is not None:
+                    node_data[key] = resolved
+            elif value.startswith("output."):
+                path = value
+                if path.startswith("output.data.output."):
+                    path = "outdata.output." + path[19:]
+                elif path.startswith("output.data."):
+                    path = "outdata.output." + path[12:]
+                else:
+                    path = "outdata.output." + path[7:]
+                resolved = legacy_resolve_field_path(path, wrapped_output)
+                if resolved is not None:
+                    node_data[key] = resolved
+    return node_data
+
+
+def bench(label: str, func: Any, iterations: int) -> float:
+    """함수를 iterations번 실행하고 1회당 소요 시간(마이크로초)을 출력합니다."""
+    # 3회 측정 중 최솟값 사용 (다른 프로세스의 영향을 줄이기 위함)
+    best = min(timeit.repeat(func, number=iterations, repeat=3))
+    per_call_us = best / iterations * 1_000_000
+    print(f"  {label:<44} {per_call_us:8.3f} µs/call")
+    return per_call_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="필드 경로 해석 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100_000, help="측정 반복 횟수 (기본값: 100000)")
+    args = parser.parse_args()
+    iterations = args.iterations
+
+    wrapped = {"outdata": PREV_RESULT}
+    plan = compile_parameter_plan(NODE_DATA)
+    static_plan = compile_parameter_plan({k: v for k, v in NODE_DATA.items() if not isinstance(v, str)})
+
+    # 결과가 같은지 먼저 확인
+    expected = legacy_resolve_parameter_paths(dict(NODE_DATA), wrapped)
+    assert plan.resolve(dict(NODE_DATA), PREV_RESULT) == expected
+    assert resolve_parameter_paths(dict(NODE_DATA), wrapped) == expected
+
+    print(f"노드 파라미터 해석 ({len(NODE_DATA)}개 파라미터, 동적 {len(plan.dynamic)}개, {iterations:,}회)")
+    legacy = bench(
+        "이전 방식 (매번 검사/분리)", lambda: legacy_resolve_parameter_paths(dict(NODE_DATA), wrapped), iterations
+    )
+    bench(
+        "resolve_parameter_paths (캐시된 컴파일)", lambda: resolve_parameter_paths(dict(NODE_DATA), wrapped), iterations
+    )
+    compiled = bench(
+        "ParameterPlan.resolve (미리 컴파일)", lambda: plan.resolve(dict(NODE_DATA), PREV_RESULT), iterations
+    )
+    bench(
+        "ParameterPlan (정적 파라미터만, 해석 건너뜀)",
+        lambda: static_plan.is_static or static_plan.resolve({}),
+        iterations,
+    )
+    print(f"  -> 미리 컴파일한 계획이 {legacy / compiled:.1f}배 빠름")
+
+    print(f"\n조건 노드 field_path 평가 ({iterations:,}회)")
+    output = PREV_RESULT["output"]
+    field_path = "rows.42.value"
+
+    def legacy_split() -> Any:
+        value: Any = output
+        for key in field_path.split("."):
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list) and key.isdigit():
+                value = value[int(key)]
+            else:
+                return None
+        return value
+
+    accessor = compile_relative_path(field_path)
+    assert accessor is not None
+    assert accessor.get_from(output) == legacy_split()
+    legacy = bench("이전 방식 (매번 split)", legacy_split, iterations)
+    bench(
+        "compile_relative_path (캐시 조회 포함)", lambda: compile_relative_path(field_path).get_from(output), iterations
+    )
+    compiled = bench("FieldPathAccessor.get_from (미리 컴파일)", lambda: accessor.get_from(output), iterations)
+    print(f"  -> 미리 컴파일한 접근자가 {legacy / compiled:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
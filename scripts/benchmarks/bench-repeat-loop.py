@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+반복 실행 계획 벤치마크
+반복 노드가 있는 요청을 실행 계획(compile_execution_plan)으로 한 번 컴파일하고 run_steps로 실행하여
+이전 방식(반복마다 노드를 복사하고 모든 반복 결과를 쌓은 뒤 펼쳐서 응답)과 시간/최대 메모리를 비교합니다.
+노드 실행은 아무 일도 하지 않는 실행 함수로 교체하여 반복 처리 비용만 측정합니다.
+
+워크플로우 구성 (중첩 반복 포함):
+    start -> repeat_outer -(bottom)-> click_a -> repeat_inner -(bottom)-> click_b
+                                                 repeat_inner -> click_c
+             repeat_outer -> end
+
+사용법:
+    python scripts/benchmarks/bench-repeat-loop.py
+    python scripts/benchmarks/bench-repeat-loop.py --iterations 1000 --inner 5
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+# 프로젝트 루트 디렉토리 (benchmarks -> scripts -> project_root)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from log import log_manager  # noqa: E402
+from services.repeat_loop import PlanNode, RepeatLoop, compile_execution_plan, run_steps  # noqa: E402
+
+logger = log_manager.logger
+
+# click_c는 바깥 반복 번호가 이 값의 배수일 때 실패 (집계 확인용)
+FAIL_EVERY = 10
+
+
+def build_request(iterations: int, inner: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """클라이언트가 보내는 노드 목록(실행 순서)과 연결 정보를 만듭니다."""
+    nodes = [
+        {"id": "start", "type": "start", "data": {"title": "시작"}},
+        {"id": "repeat_outer", "type": "repeat", "data": {"title": "바깥 반복", "repeat_count": iterations}},
+        {"id": "click_a", "type": "click", "data": {"title": "A", "x": 10, "y": 20}},
+        {"id": "repeat_inner", "type": "repeat", "data": {"title": "안쪽 반복", "repeat_count": inner}},
+        {"id": "click_b", "type": "click", "data": {"title": "B", "x": 30, "y": 40}},
+        {"id": "click_c", "type": "click", "data": {"title": "C", "x": 50, "y": 60}},
+        {"id": "end", "type": "end", "data": {"title": "끝"}},
+    ]
+    connections = [
+        {"from": "start", "to": "repeat_outer", "outputType": "output"},
+        {"from": "repeat_outer", "to": "click_a", "outputType": "bottom"},
+        {"from": "click_a", "to": "repeat_inner", "outputType": "output"},
+        {"from": "repeat_inner", "to": "click_b", "outputType": "bottom"},
+        {"from": "repeat_inner", "to": "click_c", "outputType": "output"},
+        {"from": "repeat_outer", "to": "end", "outputType": "output"},
+    ]
+    return nodes, connections
+
+
+def node_result(node: dict[str, Any], iteration: tuple[int, int] | None) -> dict[str, Any]:
+    """노드 하나의 표준 실행 결과 (반복 노드는 repeat_count를 output에 담음)"""
+    node_id = node["id"]
+    if node["type"] == "repeat":
+        output: dict[str, Any] = {"repeat_count": node["data"]["repeat_count"], "completed": True, "iterations": []}
+        return {"action": "repeat", "status": "completed", "output": output, "_node_id": node_id}
+    if node_id == "click_c" and iteration and iteration[0] % FAIL_EVERY == 0:
+        return {"action": "click", "status": "failed", "error": "image_not_found", "_node_id": node_id, "output": None}
+    return {"action": node["type"], "status": "completed", "output": {"x": 1, "y": 2}, "_node_id": node_id}
+
+
+async def run_node(step: PlanNode, iteration: tuple[int, int] | None) -> dict[str, Any]:
+    """실행 계획용 노드 실행 함수 (아무 일도 하지 않음)"""
+    return node_result(step.node, iteration)
+
+
+async def current_execute(nodes: list[dict[str, Any]], connections: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """현재 방식: 실행 계획을 한 번 컴파일하고 반복 단계에서 집계만 유지"""
+    steps = compile_execution_plan(nodes, {}, connections)
+    return await run_steps(steps, run_node)
+
+
+async def legacy_execute(nodes: list[dict[str, Any]], iterations: int, inner: int) -> list[dict[str, Any]]:
+    """이전 방식: 반복마다 본문 노드를 repeat_info와 함께 복사하고 모든 반복 결과를 쌓은 뒤 펼침"""
+    by_id = {node["id"]: node for node in nodes}
+    all_iteration_results: list[list[dict[str, Any]]] = []
+    for i in range(1, iterations + 1):
+        outer_info = {"current_iteration": i, "total_iterations": iterations, "repeat_node_id": "repeat_outer"}
+        iteration_results = []
+        for node_id in ("click_a", "repeat_inner"):
+            node = {**by_id[node_id], "repeat_info": outer_info}
+            iteration_results.append(node_result(node, (i, iterations)))
+        for j in range(1, inner + 1):
+            inner_info = {"current_iteration": j, "total_iterations": inner, "repeat_node_id": "repeat_inner"}
+            node = {**by_id["click_b"], "repeat_info": inner_info}
+            iteration_results.append(node_result(node, (j, inner)))
+        node = {**by_id["click_c"], "repeat_info": outer_info}
+        iteration_results.append(node_result(node, (i, iterations)))
+        all_iteration_results.append(iteration_results)
+    return [result for results in all_iteration_results for result in results]
+
+
+def check_plan(nodes: list[dict[str, Any]], connections: list[dict[str, Any]], iterations: int, inner: int) -> None:
+    """실행 계획 구성과 반복 집계가 올바른지 확인합니다."""
+    steps = compile_execution_plan(nodes, {}, connections)
+    assert [getattr(step, "node_id", None) or step.repeat_node_id for step in steps] == [
+        "start",
+        "repeat_outer",
+        "end",
+    ]
+    outer = steps[1]
+    assert isinstance(outer, RepeatLoop)
+    assert [getattr(step, "node_id", None) or step.repeat_node_id for step in outer.body] == [
+        "click_a",
+        "repeat_inner",
+        "click_c",
+    ]
+    assert isinstance(outer.body[1], RepeatLoop)
+
+    results = asyncio.run(run_steps(steps, run_node))
+    assert [result["_node_id"] for result in results] == ["start", "repeat_outer", "end"]
+    summary = results[1]["output"]["summary"]
+    failed = iterations // FAIL_EVERY
+    assert summary["completed_iterations"] == iterations
+    assert summary["failed_iterations"] == failed
+    assert summary["node_counts"]["click_c"] == {"completed": iterations - failed, "failed": failed}
+    assert summary["node_counts"]["repeat_inner"] == {"completed": iterations, "failed": 0}
+    # 중첩 반복의 집계는 마지막 반복 결과에 포함된 안쪽 반복 노드 결과에 있음
+    last_inner = results[1]["output"]["iterations"][-1]["results"][1]["output"]["summary"]
+    assert last_inner["node_counts"]["click_b"] == {"completed": inner, "failed": 0}
+    assert results[1]["output"]["completed"] is True
+
+
+def measure(label: str, coro_factory: Any, with_memory: bool) -> float:
+    """코루틴 실행 시간(과 선택적으로 최대 메모리)을 측정하여 출력합니다."""
+    if with_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    asyncio.run(coro_factory())
+    elapsed = time.perf_counter() - started
+    memory = ""
+    if with_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = f", 최대 메모리 {peak / 1024 / 1024:8.1f} MiB"
+    print(f"  {label:<28} {elapsed:8.3f} s{memory}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="반복 실행 계획 벤치마크")
+    parser.add_argument("--iterations", type=int, default=10_000, help="바깥 반복 횟수 (기본값: 10000)")
+    parser.add_argument("--inner", type=int, default=3, help="안쪽 반복 횟수 (기본값: 3)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 최대 메모리 측정 생략")
+    args = parser.parse_args()
+
+    # 반복 시작/완료 로그 출력(I/O)을 제외하고 반복 처리 비용만 비교
+    logger.setLevel(logging.WARNING)
+
+    nodes, connections = build_request(args.iterations, args.inner)
+    check_plan(nodes, connections, args.iterations, args.inner)
+
+    executions = args.iterations * (3 + args.inner)
+    with_memory = not args.no_memory
+    print(
+        f"중첩 반복 실행 ({args.iterations:,}회 x (본문 3개 + 안쪽 반복 {args.inner}회) = 노드 실행 {executions:,}회)"
+    )
+    legacy = measure("이전 방식", lambda: legacy_execute(nodes, args.iterations, args.inner), with_memory)
+    current = measure("실행 계획 (RepeatLoop)", lambda: current_execute(nodes, connections), with_memory)
+    print(
+        f"  -> 노드 실행당 {current / executions * 1_000_000:.2f} µs, 실행 시간은 이전 방식의 {current / legacy:.2f}배"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+워크플로우 엔진 런타임 벤치마크
+루프 노드로 노드 실행 1,000,000회를 수행하여 엔진 자체의 오버헤드(노드 객체 생성, 결과 딕셔너리 생성,
+실행 요약 계산)를 이전 방식과 비교합니다. 핸들러는 아무 일도 하지 않는 노드로 교체하여 엔진 비용만 측정합니다.
+
+이전 방식:
+    - 반복마다 루프 내부 WorkflowNode(__dict__ 보유)를 새로 생성 (f-string ID)
+    - 노드 실행마다 to_dict()로 결과 딕셔너리 생성, 모든 반복 결과를 리스트에 보관
+    - 실행 요약에서 상태별로 노드 목록을 세 번 순회
+
+사용법:
+    python scripts/benchmarks/bench-workflow-engine.py
+    python scripts/benchmarks/bench-workflow-engine.py --executions 200000 --memory
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+# 프로젝트 루트 디렉토리 (benchmarks -> scripts -> project_root)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SERVER_DIR = PROJECT_ROOT / "server"
+sys.path.insert(0, str(SERVER_DIR))
+
+from workflow.workflow_engine import NodeStatus, NodeType, WorkflowEngine, WorkflowNode  # noqa: E402
+
+# 루프 본문 노드 개수 (반복 횟수 = 실행 횟수 / 본문 노드 개수)
+BODY_SIZE = 4
+
+
+async def noop_handler(node: Any) -> dict[str, Any]:
+    """아무 일도 하지 않는 노드 핸들러 (엔진 오버헤드만 측정)"""
+    return {"action": "custom", "success": True}
+
+
+class LegacyNode:
+    """이전 방식의 노드 (__slots__ 없음, 실행마다 to_dict)"""
+
+    def __init__(self, node_id: str, node_type: NodeType, data: dict[str, Any]) -> None:
+        self.id = node_id
+        self.type = node_type
+        self.data = data
+        self.status = NodeStatus.PENDING
+        self.start_time: float | None = None
+        self.end_time: float | None = None
+        self.error_message: str | None = None
+        self.result: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "data": self.data,
+            "status": self.status.value,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "error_message": self.error_message,
+            "result": self.result,
+        }
+
+
+async def legacy_execute_node(node: LegacyNode) -> dict[str, Any]:
+    """이전 방식의 _execute_node (실행마다 결과 딕셔너리 생성)"""
+    node.status = NodeStatus.RUNNING
+    node.start_time = time.time()
+    try:
+        node.result = await noop_handler(node)
+        node.status = NodeStatus.COMPLETED
+    except Exception as e:
+        node.status = NodeStatus.FAILED
+        node.error_message = str(e)
+    finally:
+        node.end_time = time.time()
+    return node.to_dict()
+
+
+async def legacy_loop(loop_id: str, loop_count: int, loop_nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    """이전 방식의 _handle_loop_node (반복마다 노드 생성, 모든 결과 보관) + 3회 순회 요약"""
+    results = []
+    for i in range(loop_count):
+        for loop_node_data in loop_nodes:
+            loop_node = LegacyNode(
+                node_id=f"{loop_id}_loop_{i}_{loop_node_data.get('id', 'unknown')}",
+                node_type=NodeType(loop_node_data.get("type", "click")),
+                data=loop_node_data.get("data", {}),
+            )
+            results.append(await legacy_execute_node(loop_node))
+    nodes = [LegacyNode(loop_id, NodeType.LOOP, {})]
+    nodes[0].status = NodeStatus.COMPLETED
+    summary = {
+        "completed_nodes": len([n for n in nodes if n.status == NodeStatus.COMPLETED]),
+        "failed_nodes": len([n for n in nodes if n.status == NodeStatus.FAILED]),
+        "skipped_nodes": len([n for n in nodes if n.status == NodeStatus.SKIPPED]),
+    }
+    return {"loop_count": loop_count, "results": results, "summary": summary}
+
+
+async def current_loop(loop_count: int, loop_nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    """현재 엔진으로 루프 노드 실행"""
+    engine = WorkflowEngine()
+    engine.node_handlers[NodeType.CUSTOM] = noop_handler
+    engine.add_node(WorkflowNode("loop_1", NodeType.LOOP, {"loop_count": loop_count, "nodes": loop_nodes}))
+    return await engine.execute_workflow()
+
+
+def measure(label: str, coro_factory: Any, with_memory: bool) -> float:
+    """코루틴 실행 시간(과 선택적으로 최대 메모리)을 측정하여 출력합니다."""
+    if with_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    asyncio.run(coro_factory())
+    elapsed = time.perf_counter() - started
+    memory = ""
+    if with_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        memory = f", 최대 메모리 {peak / 1024 / 1024:8.1f} MiB"
+    print(f"  {label:<28} {elapsed:8.3f} s{memory}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워크플로우 엔진 런타임 벤치마크")
+    parser.add_argument("--executions", type=int, default=1_000_000, help="노드 실행 횟수 (기본값: 1000000)")
+    parser.add_argument("--memory", action="store_true", help="tracemalloc으로 최대 메모리도 측정 (느려짐)")
+    args = parser.parse_args()
+
+    loop_nodes = [{"id": f"custom_{i}", "type": "custom", "data": {"custom_action": "noop"}} for i in range(BODY_SIZE)]
+    loop_count = max(args.executions // BODY_SIZE, 1)
+    executions = loop_count * BODY_SIZE
+
+    print(f"루프 노드 실행 ({loop_count:,}회 반복 x 본문 {BODY_SIZE}개 = 노드 실행 {executions:,}회)")
+    legacy = measure("이전 방식", lambda: legacy_loop("loop_1", loop_count, loop_nodes), args.memory)
+    current = measure("현재 엔진", lambda: current_loop(loop_count, loop_nodes), args.memory)
+    print(f"  -> 노드 실행당 {current / executions * 1_000_000:.2f} µs, 이전 방식 대비 {legacy / current:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
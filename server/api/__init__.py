@@ -6,7 +6,9 @@ from .action_node_router import router as action_node_router
 from .action_router import router as action_router
 from .config_router import router as config_router
 from .dashboard_router import router as dashboard_router
+from .input_recorder_router import router as input_recorder_router
 from .log_router import router as log_router
+from .monitoring_router import router as monitoring_router
 from .node_router import router as node_router
 from .screenshot_router import router as screenshot_router
 from .script_router import router as script_router
@@ -17,7 +19,9 @@ __all__ = [
     "action_router",
     "config_router",
     "dashboard_router",
+    "input_recorder_router",
     "log_router",
+    "monitoring_router",
     "node_router",
     "screenshot_router",
     "script_router",
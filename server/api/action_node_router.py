@@ -10,7 +10,7 @@ from config.action_node_types import get_action_node_config, get_action_node_typ
 from log import log_manager
 
 router = APIRouter(prefix="/api", tags=["action-nodes"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 @router.get("/action-node-types")
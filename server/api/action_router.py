@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException
 
 from api.helpers import api_handler, error_response, list_response, success_response
 from api.helpers.constants import API_CONSTANTS
+from automation.window_registry import get_window_registry
 from db.database import db_manager
 from log import log_manager
 from models import (
@@ -24,13 +25,15 @@ from models.process_focus_models import (
     ProcessFocusParams,  # Pydantic 모델로 입력 검증 (process_id 또는 hwnd 중 하나는 필수)
 )
 from models.response_models import ListResponse
+from monitoring import tracer
 from nodes.excelnodes.excel_manager import cleanup_excel_objects
 from services import action_service
 from services.node_execution_context import NodeExecutionContext
+from services.repeat_loop import PlanNode, RepeatLoop, compile_execution_plan, is_failed_result, run_steps
 from utils.execution_id_generator import generate_execution_id
 
 router = APIRouter(prefix="/api", tags=["actions"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 @router.post("/action", response_model=ActionResponse)
@@ -52,8 +55,8 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
     노드 기반 워크플로우를 실행합니다.
     노드 간 데이터 전달을 지원합니다.
     """
-    logger.info(f"[API] execute_nodes 호출됨 - 노드 개수: {len(request.nodes)}, 실행 모드: {request.execution_mode}")
-    logger.debug(f"[API] 요청 데이터: {request}")
+    logger.info("[API] execute_nodes 호출됨 - 노드 개수: %s, 실행 모드: %s", len(request.nodes), request.execution_mode)
+    logger.debug("[API] 요청 데이터: %s", request)
 
     # 실행 ID 생성 (같은 실행의 노드들을 그룹화)
     # 반복 노드 실행 시 클라이언트에서 전달된 execution_id 사용, 없으면 새로 생성
@@ -76,14 +79,22 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
                 script_id=script_id, status="running", error_message=None, execution_time_ms=None
             )
             logger.info(
-                f"[API] 스크립트 실행 기록 저장 (시작) - 실행 ID: {execution_record_id}, 스크립트 ID: {script_id}"
+                "[API] 스크립트 실행 기록 저장 (시작) - 실행 ID: %s, 스크립트 ID: %s", execution_record_id, script_id
             )
         except Exception as e:
-            logger.warning(f"[API] 스크립트 실행 기록 저장 실패 (무시): {e!s}")
+            logger.warning("[API] 스크립트 실행 기록 저장 실패 (무시): %s", e)
+
+    # 노드별 파라미터 해석 계획을 요청당 한 번만 컴파일 (반복 실행 시 재사용)
+    # 경로 문자열이 없는 정적 파라미터는 노드 실행 시 해석 단계를 건너뜀
+    parameter_plans = {
+        node.get("id", f"node_{i}"): action_service.compile_parameter_plan(node) for i, node in enumerate(request.nodes)
+    }
 
     # 노드 실행 컨텍스트 생성 (데이터 전달)
     # 노드 간 데이터 전달을 위한 컨텍스트 객체 (이전 노드의 출력을 다음 노드에 전달)
-    context = NodeExecutionContext()
+    # 파라미터 해석 계획에서 이름/ID로 참조하는 노드의 결과만 보관하고 나머지는 다음 노드 실행 후 해제
+    retained_refs = set().union(*(plan.node_refs for plan in parameter_plans.values()))
+    context = NodeExecutionContext(retained_refs=retained_refs)
 
     # 클라이언트에서 전달된 이전 노드 결과가 있으면 컨텍스트에 추가
     # 반복 노드나 조건 노드에서 이전 반복/분기의 결과를 사용하기 위함
@@ -94,361 +105,174 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
         prev_node_id = prev_result.get("node_id") or prev_result.get("_node_id") or "previous"
         prev_node_name = prev_result.get("node_name") or prev_result.get("_node_name") or "이전 노드"
         context.add_node_result(prev_node_id, prev_node_name, prev_result)
-        logger.debug(f"[API] 이전 노드 결과를 컨텍스트에 추가: {prev_node_id} - {prev_result.get('action', 'unknown')}")
+        logger.debug(
+            "[API] 이전 노드 결과를 컨텍스트에 추가: %s - %s", prev_node_id, prev_result.get("action", "unknown")
+        )
 
-    results = []
+    # 실행 집계 (반복 실행 시 결과를 모두 보관하지 않으므로 노드 실행 시점에 바로 집계)
     has_error = False
     error_message = None
+    succeeded_count = 0
+    failed_count = 0
+    # 성공적으로 실행된 노드 타입 (엑셀 닫기 노드 실행 여부 확인용)
+    completed_actions: set[str] = set()
+
+    # 전체 노드 개수와 현재 순번 결정 (클라이언트에서 전달된 값 우선, 없으면 요청의 노드 개수 사용)
+    # total_nodes: 전체 노드 개수 (진행률 표시용)
+    total_nodes = request.total_nodes if request.total_nodes is not None else len(request.nodes)
+    # start_index: 현재 노드 순번의 시작 인덱스 (반복 노드 내부에서 사용)
+    start_index = request.current_node_index if request.current_node_index is not None else 0
+
+    async def run_node(step: PlanNode, iteration: tuple[int, int] | None) -> dict[str, Any]:
+        """노드 하나를 실행하고 결과를 표준 형식으로 정규화합니다. (모든 실행 경로에서 공통 사용)"""
+        nonlocal has_error, error_message, succeeded_count, failed_count
+
+        node = step.node
+        node_id, node_type, node_name = step.node_id, step.node_type, step.node_name
+        # 현재 노드 순번 계산 (클라이언트에서 전달된 순번 + 요청 내 인덱스)
+        current_node_number = start_index + step.index + 1
+        # 로그 접두사 (반복 본문이면 반복 번호 포함)
+        prefix = f"[API] 반복 {iteration[0]}/{iteration[1]} - " if iteration else "[API] "
+
+        # 노드 식별자 포맷팅
+        node_identifier_parts = []
+        if node_name:
+            node_identifier_parts.append(node_name)
+        node_identifier_parts.append(f"({node_type})")
+        node_identifier_parts.append(f"#{current_node_number}/{total_nodes}")
+        if node_id and node_id != "start":
+            node_identifier_parts.append(f"ID:{node_id}")
+        node_identifier = " ".join(node_identifier_parts)
+
+        logger.info("%s노드 실행 시작: %s", prefix, node_identifier)
+        try:
+            # 실행 컨텍스트와 함께 노드 실행 (execution_id와 메타데이터 전달)
+            # 반복 본문도 같은 노드 데이터와 미리 컴파일된 파라미터 해석 계획을 그대로 재사용 (반복마다 복사하지 않음)
+            result = await action_service.process_node(
+                node,
+                context,
+                execution_id=execution_id,
+                script_id=script_id,
+                parameter_plan=step.plan,
+            )
 
-    if request.execution_mode == "sequential":
-        logger.info(f"[API] 순차 실행 시작 - 실행 ID: {execution_id}")
-
-        # 전체 노드 개수와 현재 순번 결정 (클라이언트에서 전달된 값 우선, 없으면 요청의 노드 개수 사용)
-        # total_nodes: 전체 노드 개수 (진행률 표시용)
-        total_nodes = request.total_nodes if request.total_nodes is not None else len(request.nodes)
-        # start_index: 현재 노드 순번의 시작 인덱스 (반복 노드 내부에서 사용)
-        start_index = request.current_node_index if request.current_node_index is not None else 0
-
-        # 반복 정보 확인 및 처리
-        # repeat_info가 있고 repeat_count가 있으면 반복 노드 실행 모드
-        repeat_info = request.repeat_info
-        if repeat_info and repeat_info.get("repeat_count"):
-            # 반복 노드의 반복 연결점에 연결된 노드들을 반복 실행
-            # current_iteration이 있으면 해당 반복만 실행 (프론트엔드에서 각 반복마다 요청)
-            current_iteration = repeat_info.get("current_iteration")
-            total_iterations = repeat_info.get("total_iterations")
-            repeat_count = repeat_info.get("repeat_count", 1)
-            repeat_node_id = repeat_info.get("repeat_node_id")
-
-            # current_iteration이 있으면 해당 반복만 실행, 없으면 모든 반복 실행
-            if current_iteration and total_iterations:
-                # 프론트엔드에서 각 반복마다 요청을 보내는 경우
-                logger.info(
-                    f"[API] 반복 노드 실행 - 반복 {current_iteration}/{total_iterations}, 반복 노드 ID: {repeat_node_id}"
-                )
-                # 단일 반복 실행 (현재 반복만 실행)
-                # iteration_results: 현재 반복의 실행 결과 리스트
-                iteration_results = []
-                # 요청된 노드들을 순차적으로 실행
-                for i, node in enumerate(request.nodes):
-                    node_id = node.get("id", f"node_{i}")
-                    node_type = node.get("type", "unknown")
-                    node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or node_id
-
-                    # 노드의 repeat_info 확인
-                    node_repeat_info = node.get("repeat_info", {})
-                    is_repeat_start = node_repeat_info.get("is_repeat_start", False)
-                    is_repeat_end = node_repeat_info.get("is_repeat_end", False)
-
-                    # 현재 노드 순번 계산 (전체 워크플로우에서의 순번)
-                    # start_index: 이전에 실행된 노드 개수, i: 현재 반복 내 노드 인덱스
-                    current_node_number = start_index + i + 1
-                    logger.info(
-                        f"[API] 반복 {current_iteration}/{total_iterations} - 노드 {current_node_number}/{total_nodes} 실행 시작 - "
-                        f"ID: {node_id}, 타입: {node_type}, 이름: {node_name}, "
-                        f"반복 시작: {is_repeat_start}, 반복 종료: {is_repeat_end}"
-                    )
+            # 결과가 None이면 기본값으로 변환
+            if result is None:
+                result = {"action": node_type, "status": "completed", "output": None}
+
+            # 결과가 dict가 아니면 dict로 변환
+            if not isinstance(result, dict):
+                result = {"action": node_type, "status": "completed", "output": result}
+
+            # output 필드가 없으면 추가
+            if "output" not in result:
+                result["output"] = None
+        except Exception as node_error:
+            logger.error("%s노드 실행 실패 (예외 발생) - %s, 에러: %s", prefix, node_identifier, node_error)
+
+            # 에러 결과도 항상 dict로 반환
+            result = {
+                "action": node_type,
+                "status": "failed",
+                "error": str(node_error),
+                "node_id": node_id,
+                "output": None,
+            }
 
-                    try:
-                        # 반복 정보를 노드 데이터에 추가 (서버에서 사용할 수 있도록)
-                        # 노드 객체를 복사하여 수정 (원본 변경 방지)
-                        node_with_repeat = {**node}
-                        # repeat_info가 없으면 빈 딕셔너리로 초기화
-                        if not node_with_repeat.get("repeat_info"):
-                            node_with_repeat["repeat_info"] = {}
-                        # 현재 반복 번호와 전체 반복 횟수를 노드 데이터에 추가
-                        node_with_repeat["repeat_info"]["current_iteration"] = current_iteration
-                        node_with_repeat["repeat_info"]["total_iterations"] = total_iterations
-
-                        # 실행 컨텍스트와 함께 노드 실행 (execution_id와 메타데이터 전달)
-                        result = await action_service.process_node(
-                            node_with_repeat, context, execution_id=execution_id, script_id=script_id
-                        )
-
-                        # 결과가 None이면 기본값으로 변환
-                        if result is None:
-                            result = {"action": node.get("type", "unknown"), "status": "completed", "output": None}
-
-                        # 결과가 dict가 아니면 dict로 변환
-                        if not isinstance(result, dict):
-                            result = {"action": node.get("type", "unknown"), "status": "completed", "output": result}
-
-                        # 결과의 status가 "failed"인지 확인 (NodeExecutor가 에러를 catch해서 dict로 반환하는 경우)
-                        if result.get("status") == "failed" or result.get("error"):
-                            # 에러 발생 플래그 설정
-                            has_error = True
-                            error_msg = result.get("error") or result.get("message") or "노드 실행 실패"
-                            if not error_message:
-                                error_message = error_msg
-                            logger.error(
-                                f"[API] 반복 {current_iteration}/{total_iterations} - 노드 {current_node_number}/{total_nodes} 실행 실패 (status: failed) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {error_msg}"
-                            )
-                        else:
-                            # 성공한 경우 로그 출력
-                            logger.info(
-                                f"[API] 반복 {current_iteration}/{total_iterations} - 노드 {current_node_number}/{total_nodes} 실행 성공 - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 상태: {result.get('status', 'completed')}"
-                            )
-
-                        # 실행 결과를 반복 결과 리스트에 추가
-                        iteration_results.append(result)
-                        logger.debug(
-                            f"[API] 반복 {current_iteration}/{total_iterations} - 노드 {i + 1} 실행 결과: {result}"
-                        )
-
-                        # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
-                        # 에러가 발생해도 컨텍스트에 저장하여 다음 노드에서 참조할 수 있도록 함
-                        context.add_node_result(node_id, node_name, result)
-
-                    except Exception as node_error:
-                        # 노드 실행 중 예외 발생 시 처리
-                        logger.error(
-                            f"[API] 반복 {current_iteration}/{total_iterations} - 노드 {current_node_number}/{total_nodes} 실행 실패 (예외 발생) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {node_error}"
-                        )
-                        node_id = node.get("id", f"node_{i}")
-                        node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name")
-                        error_msg = str(node_error)
-
-                        # 에러 발생 플래그 설정
-                        has_error = True
-                        if not error_message:
-                            error_message = error_msg
-
-                        # 에러 결과도 항상 dict로 반환
-                        error_result = {
-                            "action": node.get("type", "unknown"),
-                            "status": "failed",
-                            "error": error_msg,
-                            "node_id": node_id,
-                            "output": None,
-                        }
-                        iteration_results.append(error_result)
-
-                        # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
-                        context.add_node_result(node_id, node_name, error_result)
-
-                results = iteration_results
-                logger.info(f"[API] 반복 {current_iteration}/{total_iterations} 실행 완료 - {len(results)}개 노드 실행")
-            else:
-                # 서버에서 모든 반복을 한 번에 실행하는 경우 (레거시)
-                logger.info(f"[API] 반복 노드 실행 시작 - 반복 횟수: {repeat_count}, 반복 노드 ID: {repeat_node_id}")
-                # 반복 실행
-                all_iteration_results = []
-                for iteration in range(repeat_count):
-                    logger.info(f"[API] 반복 실행 {iteration + 1}/{repeat_count} 시작")
-                    # iteration_results: 현재 반복의 실행 결과 리스트
-                    iteration_results = []
-
-                    # 요청된 노드들을 순차적으로 실행
-                    for i, node in enumerate(request.nodes):
-                        node_id = node.get("id", f"node_{i}")
-                        node_type = node.get("type", "unknown")
-                        node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or node_id
-
-                        # 노드의 repeat_info 확인
-                        node_repeat_info = node.get("repeat_info", {})
-                        is_repeat_start = node_repeat_info.get("is_repeat_start", False)
-                        is_repeat_end = node_repeat_info.get("is_repeat_end", False)
-
-                        # 현재 노드 순번 계산
-                        current_node_number = start_index + i + 1
-                        logger.info(
-                            f"[API] 반복 {iteration + 1}/{repeat_count} - 노드 {current_node_number}/{total_nodes} 실행 시작 - "
-                            f"ID: {node_id}, 타입: {node_type}, 이름: {node_name}, "
-                            f"반복 시작: {is_repeat_start}, 반복 종료: {is_repeat_end}"
-                        )
-
-                        try:
-                            # 반복 정보를 노드 데이터에 추가 (서버에서 사용할 수 있도록)
-                            node_with_repeat = {**node}
-                            if not node_with_repeat.get("repeat_info"):
-                                node_with_repeat["repeat_info"] = {}
-                            node_with_repeat["repeat_info"]["current_iteration"] = iteration + 1
-                            node_with_repeat["repeat_info"]["total_iterations"] = repeat_count
-
-                            # 실행 컨텍스트와 함께 노드 실행 (execution_id와 메타데이터 전달)
-                            result = await action_service.process_node(
-                                node_with_repeat, context, execution_id=execution_id, script_id=script_id
-                            )
-
-                            # 결과가 None이면 기본값으로 변환
-                            if result is None:
-                                result = {"action": node.get("type", "unknown"), "status": "completed", "output": None}
-
-                            # 결과가 dict가 아니면 dict로 변환
-                            if not isinstance(result, dict):
-                                result = {
-                                    "action": node.get("type", "unknown"),
-                                    "status": "completed",
-                                    "output": result,
-                                }
-
-                            # 결과의 status가 "failed"인지 확인 (NodeExecutor가 에러를 catch해서 dict로 반환하는 경우)
-                            if result.get("status") == "failed" or result.get("error"):
-                                # 에러 발생 플래그 설정
-                                has_error = True
-                                error_msg = result.get("error") or result.get("message") or "노드 실행 실패"
-                                if not error_message:
-                                    error_message = error_msg
-                                logger.error(
-                                    f"[API] 반복 {iteration + 1}/{repeat_count} - 노드 {current_node_number}/{total_nodes} 실행 실패 (status: failed) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {error_msg}"
-                                )
-                            else:
-                                logger.info(
-                                    f"[API] 반복 {iteration + 1}/{repeat_count} - 노드 {current_node_number}/{total_nodes} 실행 성공 - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 상태: {result.get('status', 'completed')}"
-                                )
-
-                            iteration_results.append(result)
-                            logger.debug(
-                                f"[API] 반복 {iteration + 1}/{repeat_count} - 노드 {i + 1} 실행 결과: {result}"
-                            )
-
-                            # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
-                            context.add_node_result(node_id, node_name, result)
-
-                        except Exception as node_error:
-                            logger.error(
-                                f"[API] 반복 {iteration + 1}/{repeat_count} - 노드 {current_node_number}/{total_nodes} 실행 실패 (예외 발생) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {node_error}"
-                            )
-                            node_id = node.get("id", f"node_{i}")
-                            node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name")
-                            error_msg = str(node_error)
-
-                            # 에러 발생 플래그 설정
-                            has_error = True
-                            if not error_message:
-                                error_message = error_msg
-
-                            # 에러 결과도 항상 dict로 반환
-                            error_result = {
-                                "action": node.get("type", "unknown"),
-                                "status": "failed",
-                                "error": error_msg,
-                                "node_id": node_id,
-                                "output": None,
-                            }
-                            iteration_results.append(error_result)
-
-                            # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
-                            context.add_node_result(node_id, node_name, error_result)
-
-                    # 반복 결과 저장
-                    all_iteration_results.append({"iteration": iteration + 1, "results": iteration_results})
-                    logger.info(f"[API] 반복 실행 {iteration + 1}/{repeat_count} 완료")
-
-                # 모든 반복 결과를 results에 추가 (평탄화)
-                results = []
-                for iteration_data in all_iteration_results:
-                    results.extend(iteration_data["results"])
-                logger.info(
-                    f"[API] 반복 노드 실행 완료 - 총 {repeat_count}회 반복, 각 반복당 {len(request.nodes)}개 노드 실행"
-                )
+        # 결과의 status가 "failed"인지 확인 (NodeExecutor가 에러를 catch해서 dict로 반환하는 경우 포함)
+        if is_failed_result(result):
+            # 에러 발생 플래그 설정
+            has_error = True
+            failed_count += 1
+            error_msg = result.get("error") or result.get("message") or "노드 실행 실패"
+            if not error_message:
+                error_message = error_msg
+            logger.error("%s노드 실행 실패 (status: failed) - %s, 에러: %s", prefix, node_identifier, error_msg)
         else:
-            # 일반 노드 실행 (반복 정보가 없는 경우)
-            for i, node in enumerate(request.nodes):
-                node_id = node.get("id", f"node_{i}")
-                node_type = node.get("type", "unknown")
-                node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name") or None
-                # 현재 노드 순번 계산 (클라이언트에서 전달된 순번 + 루프 인덱스)
-                current_node_number = start_index + i + 1
-
-                # 노드 식별자 포맷팅
-                node_identifier_parts = []
-                if node_name:
-                    node_identifier_parts.append(node_name)
-                node_identifier_parts.append(f"({node_type})")
-                node_identifier_parts.append(f"#{current_node_number}/{total_nodes}")
-                if node_id and node_id != "start":
-                    node_identifier_parts.append(f"ID:{node_id}")
-                node_identifier = " ".join(node_identifier_parts)
-
-                logger.info(f"[API] 노드 실행 시작: {node_identifier}")
-                try:
-                    # 실행 컨텍스트와 함께 노드 실행 (execution_id와 메타데이터 전달)
-                    result = await action_service.process_node(
-                        node, context, execution_id=execution_id, script_id=script_id
+            succeeded_count += 1
+            if result.get("status") == "completed":
+                completed_actions.add(result.get("action") or node_type)
+            logger.info("%s노드 실행 성공 - %s, 상태: %s", prefix, node_identifier, result.get("status", "completed"))
+        logger.debug("%s노드 %s 실행 결과: %s", prefix, node_identifier, result)
+
+        # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
+        context.add_node_result(node_id, node_name, result)
+        return result
+
+    # 실행 계획 컴파일 (요청당 한 번)
+    # 연결 정보가 있으면 반복 노드의 아래 연결점(bottom)에 연결된 노드 체인을 반복 단계로 묶어 서버에서 반복 실행
+    steps = compile_execution_plan(request.nodes, parameter_plans, request.connections)
+
+    # 반복 집계 (repeat_info로 서버 반복 실행을 요청한 경우)
+    repeat_summary = None
+
+    results: list[dict[str, Any]] = []
+
+    # 실행 추적: 요청 단위 최상위 스팬 (같은 execution_id의 반복 요청은 하나의 Trace에 이어서 기록)
+    with tracer.trace(execution_id, "execute-nodes", script_id=script_id, nodes=len(request.nodes)) as request_span:
+        if request.execution_mode == "sequential":
+            logger.info("[API] 순차 실행 시작 - 실행 ID: %s", execution_id)
+
+            repeat_info = request.repeat_info
+            if repeat_info and repeat_info.get("repeat_count"):
+                # 반복 노드의 반복 연결점에 연결된 노드들(요청 노드 전체)을 반복 실행
+                current_iteration = repeat_info.get("current_iteration")
+                total_iterations = repeat_info.get("total_iterations")
+                repeat_node_id = repeat_info.get("repeat_node_id")
+
+                if current_iteration and total_iterations:
+                    # 프론트엔드에서 각 반복마다 요청을 보내는 경우 (현재 반복만 실행)
+                    logger.info(
+                        "[API] 반복 노드 실행 - 반복 %s/%s, 반복 노드 ID: %s",
+                        current_iteration,
+                        total_iterations,
+                        repeat_node_id,
                     )
-
-                    # 결과가 None이면 기본값으로 변환
-                    if result is None:
-                        result = {"action": node.get("type", "unknown"), "status": "completed", "output": None}
-
-                    # 결과가 dict가 아니면 dict로 변환
-                    if not isinstance(result, dict):
-                        result = {"action": node.get("type", "unknown"), "status": "completed", "output": result}
-
-                    # output 필드가 없으면 추가
-                    if "output" not in result:
-                        result["output"] = None
-
-                    # 결과의 status가 "failed"인지 확인
-                    if result.get("status") == "failed" or result.get("error"):
-                        # 에러 발생 플래그 설정
-                        has_error = True
-                        error_msg = result.get("error") or result.get("message") or "노드 실행 실패"
-                        if not error_message:
-                            error_message = error_msg
-                        logger.error(
-                            f"[API] 노드 {current_node_number}/{total_nodes} 실행 실패 (status: failed) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {error_msg}"
-                        )
-                    else:
-                        logger.info(
-                            f"[API] 노드 {current_node_number}/{total_nodes} 실행 성공 - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 상태: {result.get('status', 'completed')}"
-                        )
-
-                    results.append(result)
-                    logger.debug(f"[API] 노드 {i + 1} 실행 결과: {result}")
-
-                    # 컨텍스트에 결과 저장
-                    context.add_node_result(node_id, node_name, result)
-                except Exception as node_error:
-                    logger.error(
-                        f"[API] 노드 {current_node_number}/{total_nodes} 실행 실패 (예외 발생) - ID: {node_id}, 타입: {node_type}, 이름: {node_name}, 에러: {node_error}"
+                    results = await run_steps(steps, run_node, (current_iteration, total_iterations))
+                    logger.info(
+                        "[API] 반복 %s/%s 실행 완료 - %s개 노드 실행", current_iteration, total_iterations, len(results)
                     )
-                    node_id = node.get("id", f"node_{i}")
-                    node_name = node.get("data", {}).get("title") or node.get("data", {}).get("name")
-                    error_msg = str(node_error)
-
-                    # 에러 발생 플래그 설정
-                    has_error = True
-                    if not error_message:
-                        error_message = error_msg
-
-                    # 에러 결과도 항상 dict로 반환
-                    error_result = {
-                        "action": node.get("type", "unknown"),
-                        "status": "failed",
-                        "error": error_msg,
-                        "node_id": node_id,
-                        "output": None,
-                    }
-                    results.append(error_result)
-
-                    # 에러 결과도 컨텍스트에 저장 (다음 노드에서 참조 가능)
-                    context.add_node_result(node_id, node_name, error_result)
+                else:
+                    # 서버에서 모든 반복을 한 번에 실행하는 경우
+                    # 반복별 결과는 집계만 남기고, 응답 결과에는 마지막 반복의 결과만 포함
+                    repeat_count = repeat_info.get("repeat_count", 1)
+                    repeat_count = max(int(repeat_count), 1) if isinstance(repeat_count, (int, float)) else 1
+                    loop = RepeatLoop(None, steps, repeat_node_id=repeat_node_id)
+                    repeat_summary = await loop.run(run_node, repeat_count)
+                    results = repeat_summary.last_results
+                    logger.info(
+                        "[API] 반복 노드 실행 완료 - 총 %s회 반복, 각 반복당 %s개 노드 실행",
+                        repeat_count,
+                        len(request.nodes),
+                    )
+            else:
+                # 일반 노드 실행 (반복 노드가 있으면 반복 단계에서 본문을 반복 실행)
+                results = await run_steps(steps, run_node)
+        request_span.set("succeeded", succeeded_count)
+        request_span.set("failed", failed_count)
 
-    # 실행 완료 로그 출력 (성공/실패 개수 계산)
-    # 성공: status가 "failed"가 아니고 error 필드가 없는 결과
-    # 실패: status가 "failed"이거나 error 필드가 있는 결과
+    # 실행 완료 로그 출력 (성공/실패 개수는 노드 실행 시점에 집계)
     logger.info(
-        f"[API] 모든 노드 실행 완료 - 총 {len(request.nodes)}개 노드, 성공: {len([r for r in results if r.get('status') != 'failed' and not r.get('error')])}개, 실패: {len([r for r in results if r.get('status') == 'failed' or r.get('error')])}개"
+        "[API] 모든 노드 실행 완료 - 총 %s개 노드, 성공: %s개, 실패: %s개",
+        len(request.nodes),
+        succeeded_count,
+        failed_count,
     )
-    logger.debug(f"[API] 실행 결과 상세: {results}")
+    logger.debug("[API] 실행 결과 상세: %s", results)
 
     # 엑셀 객체 정리 (엑셀 닫기 노드가 실행된 경우에만 정리)
     # 각 노드가 별도의 API 호출로 실행되므로, 엑셀 객체를 즉시 정리하면 안 됨
     # 엑셀 닫기 노드가 실행된 경우에만 정리하도록 함
-    excel_close_executed = any(
-        result.get("action") == "excel-close" and result.get("status") == "completed" for result in results
-    )
+    excel_close_executed = "excel-close" in completed_actions
     if excel_close_executed:
         try:
             cleanup_excel_objects(execution_id)
-            logger.info(f"[API] 엑셀 닫기 노드 실행으로 인한 엑셀 객체 정리 완료 - execution_id: {execution_id}")
+            logger.info("[API] 엑셀 닫기 노드 실행으로 인한 엑셀 객체 정리 완료 - execution_id: %s", execution_id)
         except Exception as e:
             # 엑셀 객체 정리 실패해도 전체 실행에는 영향 없음 (경고만 출력)
-            logger.warning(f"[API] 엑셀 객체 정리 중 오류 발생 (무시): {e!s}")
+            logger.warning("[API] 엑셀 객체 정리 중 오류 발생 (무시): %s", e)
     else:
-        logger.debug(f"[API] 엑셀 닫기 노드가 실행되지 않아 엑셀 객체를 유지합니다 - execution_id: {execution_id}")
+        logger.debug("[API] 엑셀 닫기 노드가 실행되지 않아 엑셀 객체를 유지합니다 - execution_id: %s", execution_id)
 
     # 실행 완료 시간 계산 (밀리초 단위)
     # execution_start_time이 있으면 현재 시간과의 차이를 밀리초로 변환
@@ -471,41 +295,44 @@ async def execute_nodes(request: NodeExecutionRequest) -> ActionResponse:
                 execution_id=execution_record_id,
             )
             logger.info(
-                f"[API] 스크립트 실행 기록 업데이트 (완료) - 실행 ID: {execution_record_id}, 상태: {final_status}"
+                "[API] 스크립트 실행 기록 업데이트 (완료) - 실행 ID: %s, 상태: %s", execution_record_id, final_status
             )
         except Exception as e:
-            logger.warning(f"[API] 스크립트 실행 기록 업데이트 실패 (무시): {e!s}")
+            logger.warning("[API] 스크립트 실행 기록 업데이트 실패 (무시): %s", e)
+
+    # 응답 데이터 (컨텍스트는 디버그 요청 시에만 포함 - 노드 결과 전체를 직렬화하므로)
+    response_data: dict[str, Any] = {
+        "results": results,
+        "execution_id": execution_id,  # 실행 ID 반환 (로그 확인용)
+    }
+    # 서버 반복 실행 집계 (반복 횟수, 노드별 성공/실패 횟수, 앞쪽 실패 정보)
+    if repeat_summary is not None:
+        response_data["repeat"] = repeat_summary.to_dict()
+    if request.debug:
+        response_data["context"] = context.to_dict()
 
     # 에러가 발생했으면 success: False 반환
     if has_error:
         # 에러 발생 시에도 엑셀 객체는 유지 (다음 노드에서 사용할 수 있도록)
         # 엑셀 닫기 노드가 실행되지 않았으면 엑셀 객체를 정리하지 않음
         logger.debug(
-            f"[API] 에러 발생했지만 엑셀 객체는 유지합니다 (다음 노드에서 사용 가능) - execution_id: {execution_id}"
+            "[API] 에러 발생했지만 엑셀 객체는 유지합니다 (다음 노드에서 사용 가능) - execution_id: %s", execution_id
         )
 
-        logger.warning(f"[API] 노드 실행 중 오류 발생 - 에러 메시지: {error_message}")
+        logger.warning("[API] 노드 실행 중 오류 발생 - 에러 메시지: %s", error_message)
         # 에러 응답 반환 (success: False, 에러 메시지와 결과 포함)
         return ActionResponse(
             success=False,
             message=f"노드 실행 중 오류 발생: {error_message}",
-            data={
-                "results": results,
-                "context": context.to_dict(),  # 컨텍스트 정보도 반환 (디버깅용)
-                "execution_id": execution_id,  # 실행 ID 반환 (로그 확인용)
-            },
+            data=response_data,
         )
 
     # 모든 노드 실행 성공 시 성공 응답 반환
-    logger.info(f"[API] 모든 노드 실행 성공 - {len(request.nodes)}개 노드 모두 성공")
+    logger.info("[API] 모든 노드 실행 성공 - %s개 노드 모두 성공", len(request.nodes))
     return ActionResponse(
         success=True,
         message=f"{len(request.nodes)}개 노드 실행 완료",
-        data={
-            "results": results,
-            "context": context.to_dict(),  # 컨텍스트 정보도 반환 (디버깅용)
-            "execution_id": execution_id,  # 실행 ID 반환 (로그 확인용)
-        },
+        data=response_data,
     )
 
 
@@ -628,69 +455,13 @@ async def get_process_list() -> ListResponse:
     화면에 보이는 프로세스 목록을 가져옵니다.
     백그라운드 프로세스는 제외하고 실제 창이 있는 프로세스만 반환합니다.
     """
+    # 창 목록은 WindowRegistry가 TTL 동안 캐시하고, 새로 나타난 프로세스만 psutil로 조회
     try:
-        import psutil
-        import win32gui
-        import win32process
-    except ImportError:
-        raise HTTPException(status_code=500, detail="Windows 전용 기능입니다. pywin32와 psutil 패키지가 필요합니다.")
-
-    processes = []
-    process_dict = {}  # 중복 제거용 (같은 프로세스 이름의 여러 창)
-
-    def enum_window_callback(hwnd: int, extra: Any) -> None:
-        """창 열거 콜백 함수"""
-        if win32gui.IsWindowVisible(hwnd):
-            window_text = win32gui.GetWindowText(hwnd)
-            # 빈 창 제목 제외
-            if window_text:
-                try:
-                    # 프로세스 ID 가져오기
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-
-                    # 프로세스 정보 가져오기
-                    try:
-                        proc = psutil.Process(pid)
-                        process_name = proc.name()
-                        exe_path = proc.exe() if hasattr(proc, "exe") else None
-
-                        # 중복 제거: 같은 프로세스 이름이면 창 제목만 추가
-                        if process_name not in process_dict:
-                            process_dict[process_name] = {
-                                "process_name": process_name,
-                                "process_id": pid,
-                                "exe_path": exe_path,
-                                "windows": [],
-                                "hwnd": hwnd,  # 첫 번째 창 핸들 저장
-                            }
-
-                        # 창 정보 추가
-                        process_dict[process_name]["windows"].append({"title": window_text, "hwnd": hwnd})
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        # 프로세스가 종료되었거나 접근 권한이 없는 경우 무시
-                        pass
-                except Exception:
-                    # 창 정보를 가져올 수 없는 경우 무시
-                    pass
-
-    # 모든 창 열거
-    win32gui.EnumWindows(enum_window_callback, None)
-
-    # 딕셔너리를 리스트로 변환
-    for _process_name, process_info in process_dict.items():
-        processes.append(
-            {
-                "process_name": process_info["process_name"],
-                "process_id": process_info["process_id"],
-                "exe_path": process_info["exe_path"],
-                "window_count": len(process_info["windows"]),
-                "windows": process_info["windows"],
-                "hwnd": process_info["hwnd"],  # 포커스용 핸들
-            }
-        )
+        registry = get_window_registry()
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-    # 프로세스 이름으로 정렬
-    processes.sort(key=lambda x: x["process_name"].lower())
+    processes = registry.list_processes()
 
     return list_response(processes, "프로세스 목록 조회 완료")
 
@@ -703,7 +474,6 @@ async def focus_process(request: dict[str, Any]) -> SuccessResponse:
     """
     try:
         import win32gui
-        import win32process
     except ImportError:
         raise HTTPException(status_code=500, detail="Windows 전용 기능입니다. pywin32 패키지가 필요합니다.")
 
@@ -720,29 +490,16 @@ async def focus_process(request: dict[str, Any]) -> SuccessResponse:
         # hwnd가 있으면 그대로 사용
         target_hwnd = hwnd
     else:
-        # process_id로 창 핸들 찾기
-        # target_hwnd: 찾은 창 핸들 (콜백 함수에서 설정됨)
-        target_hwnd = None
-
-        def find_window_callback(hwnd: int, extra: Any) -> bool:
-            """창 찾기 콜백 함수 (모든 창을 순회하며 process_id와 일치하는 창 찾기)"""
-            nonlocal target_hwnd
-            # 보이는 창만 확인
-            if win32gui.IsWindowVisible(hwnd):
-                # 창의 프로세스 ID 가져오기
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                # 프로세스 ID가 일치하면 target_hwnd 설정
-                if pid == process_id:
-                    target_hwnd = hwnd
-                    return False  # 찾았으면 중단 (False 반환 시 EnumWindows 중단)
-            return True  # 계속 찾기 (True 반환 시 계속 순회)
-
-        # 모든 창을 열거하며 process_id와 일치하는 창 찾기
-        win32gui.EnumWindows(find_window_callback, None)
+        # process_id로 창 핸들 찾기 (WindowRegistry의 pid 색인 사용)
+        try:
+            windows = get_window_registry().find_by_pid(process_id)
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
         # 창을 찾지 못했으면 404 에러 반환
-        if not target_hwnd:
+        if not windows:
             raise HTTPException(status_code=404, detail=f"프로세스 ID {process_id}에 해당하는 창을 찾을 수 없습니다.")
+        target_hwnd = windows[0].hwnd
 
     # 창을 최상단으로 가져오기
     win32gui.ShowWindow(target_hwnd, 9)  # SW_RESTORE = 9
@@ -16,7 +16,7 @@ from log import log_manager
 from models.response_models import SuccessResponse
 
 router = APIRouter(prefix="/api/config", tags=["config"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 @router.get("/", response_model=SuccessResponse)
@@ -48,6 +48,10 @@ async def get_nodes_config() -> SuccessResponse:
         if "requires_folder_path" in config:
             nodes_config_client[node_type]["requiresFolderPath"] = config["requires_folder_path"]
 
+        # 실행 정책 기본값이 있으면 포함 (노드별 execution_policy 재정의 시 참고용)
+        if "execution_policy" in config:
+            nodes_config_client[node_type]["executionPolicy"] = config["execution_policy"]
+
         # 노드 레벨 파라미터가 있으면 포함
         if "parameters" in config:
             nodes_config_client[node_type]["parameters"] = config["parameters"]
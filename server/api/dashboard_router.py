@@ -5,12 +5,13 @@
 from fastapi import APIRouter, Body, HTTPException, Request
 
 from api.helpers import success_response
+from api.helpers.constants import API_CONSTANTS
 from db.database import db_manager
 from log import log_manager
 from models.response_models import SuccessResponse
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 @router.get("/dashboard/stats", response_model=SuccessResponse)
@@ -20,13 +21,13 @@ async def get_dashboard_stats(request: Request, use_cache: bool = True) -> Succe
 
     Args:
         request: HTTP 요청 객체
-        use_cache: 캐시 사용 여부 (기본값: True)
+        use_cache: 이전 버전 호환용 (통계 카운터가 항상 최신이므로 사용하지 않음)
     """
     client_ip = request.client.host if request.client else "unknown"
     logger.info(f"[API] 대시보드 통계 조회 요청 - 클라이언트 IP: {client_ip}, 캐시 사용: {use_cache}")
 
     try:
-        # 캐시 우선 조회 또는 강제 재계산
+        # 트리거로 갱신되는 카운터 조회 (use_cache는 이전 버전 호환용)
         stats = db_manager.get_dashboard_stats(use_cache=use_cache)
         logger.info(f"[API] 대시보드 통계 조회 성공: {stats}")
         return success_response(stats, "대시보드 통계 조회 완료")
@@ -68,6 +69,8 @@ async def increment_execution_count(request: Request, data: dict = Body(...)) ->
     """
     전체 실행 횟수 증가 (각 스크립트 실행 후 호출)
 
+    현재 값을 읽지 않고 증분만 누적하므로 여러 스크립트가 동시에 끝나도 횟수가 누락되지 않습니다.
+
     Args:
         request: HTTP 요청 객체
         data: {success: bool} - 성공 여부
@@ -77,29 +80,49 @@ async def increment_execution_count(request: Request, data: dict = Body(...)) ->
 
     try:
         is_success = data.get("success", True)
-        current_stats = db_manager.get_dashboard_stats(use_cache=False)
-
-        # 현재 통계 가져오기 (None 체크 및 타입 보장)
-        current_executions = current_stats.get("all_executions", 0) or 0
-        current_failed = current_stats.get("all_failed_scripts", 0) or 0
+        increments = db_manager.increment_all_execution_stats(1, 0 if is_success else 1)
 
-        # 타입 보장 (int로 변환)
-        current_executions = int(current_executions)
-        current_failed = int(current_failed)
+        logger.info(f"[API] 전체 실행 횟수 증가 완료 - 증분: {increments}")
+        return success_response(increments, "전체 실행 횟수 증가 완료")
+    except Exception as e:
+        logger.error(f"[API] 전체 실행 횟수 증가 실패: {e!s}")
+        raise HTTPException(status_code=500, detail=f"전체 실행 횟수 증가 실패: {e!s}")
 
-        # 통계 증가
-        new_executions = current_executions + 1
-        new_failed = current_failed + (0 if is_success else 1)
 
-        # 통계 업데이트
-        db_manager.set_all_execution_stats(new_executions, new_failed)
+@router.post("/dashboard/increment-executions", response_model=SuccessResponse)
+async def increment_execution_counts(request: Request, data: dict = Body(...)) -> SuccessResponse:
+    """
+    전체 실행 횟수 일괄 증가 (여러 스크립트 실행 결과를 한 번에 반영)
 
-        logger.info(f"[API] 전체 실행 횟수 증가 완료 - 총 실행: {new_executions}, 실패: {new_failed}")
-        return success_response(
-            {"all_executions": new_executions, "all_failed_scripts": new_failed}, "전체 실행 횟수 증가 완료"
+    Args:
+        request: HTTP 요청 객체
+        data: {executions: int, failed: int} - 실행된 스크립트 개수와 그중 실패한 개수
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    logger.info(f"[API] 전체 실행 횟수 일괄 증가 요청 - 클라이언트 IP: {client_ip}, 요청: {data}")
+
+    executions = data.get("executions", 0)
+    failed = data.get("failed", 0)
+    if (
+        not isinstance(executions, int)
+        or not isinstance(failed, int)
+        or isinstance(executions, bool)
+        or isinstance(failed, bool)
+        or executions < 0
+        or not 0 <= failed <= executions
+    ):
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_BAD_REQUEST,
+            detail="executions와 failed는 0 이상의 정수이고 failed는 executions 이하여야 합니다.",
         )
+
+    try:
+        increments = db_manager.increment_all_execution_stats(executions, failed)
+
+        logger.info(f"[API] 전체 실행 횟수 일괄 증가 완료 - 증분: {increments}")
+        return success_response(increments, "전체 실행 횟수 증가 완료")
     except Exception as e:
-        logger.error(f"[API] 전체 실행 횟수 증가 실패: {e!s}")
+        logger.error(f"[API] 전체 실행 횟수 일괄 증가 실패: {e!s}")
         raise HTTPException(status_code=500, detail=f"전체 실행 횟수 증가 실패: {e!s}")
 
 
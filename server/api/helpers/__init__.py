@@ -4,13 +4,14 @@ API 헬퍼 모듈
 """
 
 from api.helpers.constants import API_CONSTANTS
-from api.helpers.response_helpers import error_response, list_response, success_response
+from api.helpers.response_helpers import cursor_page_response, error_response, list_response, success_response
 from api.helpers.router_wrapper import api_handler
 from api.helpers.script_helpers import get_script_or_raise, save_script_data_or_raise
 
 __all__ = [
     "API_CONSTANTS",
     "api_handler",
+    "cursor_page_response",
     "error_response",
     "get_script_or_raise",
     "list_response",
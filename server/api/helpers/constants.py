@@ -16,6 +16,14 @@ class API_CONSTANTS:
     MIN_LOG_LIMIT = 1
     MAX_LOG_LIMIT = 1000
 
+    # 로그 검색 결과 페이지 크기
+    DEFAULT_LOG_SEARCH_LIMIT = 50
+    MAX_LOG_SEARCH_LIMIT = 200
+
+    # 스크립트 목록 페이지 크기 (cursor만 지정한 경우 기본값)
+    DEFAULT_SCRIPT_PAGE_LIMIT = 100
+    MAX_SCRIPT_PAGE_LIMIT = 1000
+
     # 대시보드 통계 캐시 시간 (분)
     DASHBOARD_STATS_CACHE_MINUTES = 5
 
@@ -45,9 +53,12 @@ class API_CONSTANTS:
     ERROR_SCRIPT_EXECUTE_FAILED = "스크립트 실행 실패"
     ERROR_SCRIPT_ACTIVE_STATE_FAILED = "스크립트 활성 상태 변경 실패"
     ERROR_SCRIPT_EXECUTION_RECORD_FAILED = "스크립트 실행 기록 저장 실패"
+    ERROR_SCRIPT_STATS_FAILED = "스크립트 실행 통계 조회 실패"
+    ERROR_SCRIPT_STATS_REBUILD_FAILED = "스크립트 실행 통계 재생성 실패"
     ERROR_SCRIPT_ORDER_UPDATE_FAILED = "스크립트 순서 업데이트 실패"
     ERROR_LOG_CREATE_FAILED = "로그 생성 실패"
     ERROR_LOG_GET_FAILED = "로그 조회 실패"
     ERROR_LOG_DELETE_FAILED = "로그 삭제 실패"
     ERROR_LOG_SAVE_CHECK_FAILED = "로그 저장 확인 실패"
+    ERROR_LOG_SEARCH_FAILED = "로그 검색 실패"
     ERROR_SERVER_INTERNAL_ERROR = "서버 내부 오류"
@@ -5,7 +5,7 @@ API 응답 헬퍼 함수
 
 from typing import Any
 
-from models.response_models import ErrorResponse, ListResponse, SuccessResponse
+from models.response_models import CursorPageResponse, ErrorResponse, ListResponse, SuccessResponse
 
 
 def success_response(
@@ -97,3 +97,31 @@ def list_response(
         count=len(items),
         **kwargs,
     )
+
+
+def cursor_page_response(
+    items: list[Any],
+    next_cursor: str | None,
+    message: str | None = None,
+) -> CursorPageResponse:
+    """
+    커서 페이지 응답 생성 (키셋 페이지네이션)
+
+    Args:
+        items: 응답에 포함할 리스트 데이터
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+        message: 성공 메시지
+
+    Returns:
+        CursorPageResponse: 커서 페이지 응답 모델
+
+    Examples:
+        >>> cursor_page_response(logs, next_cursor, "로그 조회 완료")
+    """
+    return CursorPageResponse(
+        success=True,
+        message=message,
+        data=items,
+        count=len(items),
+        next_cursor=next_cursor,
+    )
@@ -12,7 +12,7 @@ from fastapi import HTTPException
 from api.helpers.constants import API_CONSTANTS
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 # 제네릭 타입 변수 정의
 # P: ParamSpec - 함수의 매개변수 스펙(인자 타입, 키워드 인자 타입 등)을 나타냅니다.
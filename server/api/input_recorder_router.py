@@ -0,0 +1,56 @@
+"""
+입력 녹화 관련 API 라우터
+마우스/키보드 입력을 녹화하여 입력 재생 노드(input-replay)에서 사용할 이벤트 스트림을 만듭니다.
+"""
+
+from fastapi import APIRouter, Body
+
+from api.helpers import api_handler, success_response
+from automation.input_recorder import get_input_recorder
+from log import log_manager
+from models.response_models import SuccessResponse
+
+router = APIRouter(prefix="/api/input-recorder", tags=["input-recorder"])
+logger = log_manager.get_logger(__name__)
+
+
+@router.post("/start", response_model=SuccessResponse)
+@api_handler
+async def start_recording(
+    record_moves: bool = Body(default=False, embed=True),
+    move_sample_ms: float = Body(default=10.0, embed=True),
+) -> SuccessResponse:
+    """
+    입력 녹화를 시작합니다.
+
+    Args:
+        record_moves: 마우스 이동 이벤트 녹화 여부
+        move_sample_ms: 마우스 이동 이벤트 최소 간격 (밀리초)
+    """
+    recorder = get_input_recorder()
+    recorder.record_moves = record_moves
+    recorder.move_sample_ns = int(max(0.0, move_sample_ms) * 1_000_000)
+    recorder.start()
+    return success_response({"recording": True}, "입력 녹화를 시작했습니다.")
+
+
+@router.post("/stop", response_model=SuccessResponse)
+@api_handler
+async def stop_recording() -> SuccessResponse:
+    """
+    입력 녹화를 중지하고 컴파일된 이벤트 스트림을 반환합니다.
+    반환된 event_stream을 입력 재생 노드의 event_stream 파라미터에 설정하면 됩니다.
+    """
+    stream = get_input_recorder().stop()
+    return success_response(
+        {"recording": False, "event_stream": stream.to_dict()},
+        f"입력 녹화를 종료했습니다. (이벤트 {len(stream)}개)",
+    )
+
+
+@router.get("/status", response_model=SuccessResponse)
+@api_handler
+async def get_recording_status() -> SuccessResponse:
+    """현재 녹화 상태를 반환합니다."""
+    recorder = get_input_recorder()
+    return success_response({"recording": recorder.is_recording, "record_moves": recorder.record_moves})
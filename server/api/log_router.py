@@ -2,17 +2,27 @@
 로그 관련 API 라우터
 """
 
+import asyncio
+from datetime import datetime
+import itertools
+from typing import Any
+
+from execution_logging import log_retention
 from execution_logging.execution_log_models import NodeExecutionLogRequest, NodeExecutionLogResponse
+from execution_logging.execution_log_repository import LOG_FIELDS
+from execution_logging.log_search import SEARCH_COLUMNS
 from fastapi import APIRouter, HTTPException, Query, Request
 
-from api.helpers import api_handler, list_response, success_response
+from api.helpers import api_handler, cursor_page_response, success_response
 from api.helpers.constants import API_CONSTANTS
 from db.database import db_manager
 from log import log_manager
-from models.response_models import ListResponse, SuccessResponse
+from models.response_models import CursorPageResponse, SuccessResponse
+from monitoring import DB, metrics, tracer
+from utils.pagination import parse_fields
 
 router = APIRouter(prefix="/api/logs", tags=["logs"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 @router.post("/node-execution", response_model=NodeExecutionLogResponse)
@@ -28,32 +38,32 @@ async def create_node_execution_log(request: NodeExecutionLogRequest, api_reques
     )
 
     try:
-        log_id = db_manager.node_execution_logs.create_log(
-            execution_id=request.execution_id,
-            script_id=request.script_id,
-            node_id=request.node_id,
-            node_type=request.node_type,
-            node_name=request.node_name,
-            status=request.status,
-            started_at=request.started_at,
-            finished_at=request.finished_at,
-            execution_time_ms=request.execution_time_ms,
-            parameters=request.parameters,
-            result=request.result,
-            error_message=request.error_message,
-            error_traceback=request.error_traceback,
-            is_connected=request.is_connected,
-            connection_sequence=request.connection_sequence,
-            node_identifier=request.node_identifier,
-        )
+        with (
+            metrics.time_db("node_log_write"),
+            tracer.span_for(request.execution_id, "db_write", DB, node_id=request.node_id, status=request.status),
+        ):
+            log_id = db_manager.node_execution_logs.create_log(
+                execution_id=request.execution_id,
+                script_id=request.script_id,
+                node_id=request.node_id,
+                node_type=request.node_type,
+                node_name=request.node_name,
+                status=request.status,
+                started_at=request.started_at,
+                finished_at=request.finished_at,
+                execution_time_ms=request.execution_time_ms,
+                parameters=request.parameters,
+                result=request.result,
+                error_message=request.error_message,
+                error_traceback=request.error_traceback,
+                is_connected=request.is_connected,
+                connection_sequence=request.connection_sequence,
+                node_identifier=request.node_identifier,
+                attempt=request.attempt,
+                sequence=request.sequence,
+            )
 
-        # 통계 업데이트 (completed 또는 failed 상태일 때만, running은 제외)
-        # running 상태는 나중에 completed/failed로 업데이트되므로 중복 카운팅 방지
-        if request.status in ("completed", "failed"):
-            try:
-                db_manager.log_stats.calculate_and_update_stats()
-            except Exception as stats_error:
-                logger.warning(f"[API] 로그 통계 업데이트 실패 (무시): {stats_error!s}")
+        # 로그 통계는 최종 로그 저장과 같은 트랜잭션에서 증가 (전체 로그를 다시 세지 않음)
 
         logger.info(
             f"[API] 노드 실행 로그 생성 성공 - 로그 ID: {log_id}, 노드 ID: {request.node_id}, 상태: {request.status}"
@@ -68,7 +78,7 @@ async def create_node_execution_log(request: NodeExecutionLogRequest, api_reques
         )
 
 
-@router.get("/node-execution", response_model=ListResponse)
+@router.get("/node-execution", response_model=CursorPageResponse)
 @api_handler
 async def get_node_execution_logs(
     http_request: Request,
@@ -81,10 +91,15 @@ async def get_node_execution_logs(
         le=API_CONSTANTS.MAX_LOG_LIMIT,
         description="조회할 최대 개수",
     ),
-    offset: int = Query(0, ge=0, description="건너뛸 개수"),
-) -> ListResponse:
+    offset: int = Query(0, ge=0, description="건너뛸 개수 (이전 버전 호환용, cursor 사용 권장)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    fields: str | None = Query(None, description="반환할 필드 (쉼표로 구분, 예: id,node_name,status,started_at)"),
+    include_payload: bool = Query(False, description="파라미터/결과/스택 트레이스 포함 여부 (압축 해제 비용이 있음)"),
+) -> CursorPageResponse:
     """
-    노드 실행 로그를 조회합니다.
+    노드 실행 로그를 최신순으로 조회합니다.
+    기본적으로 로그 행의 짧은 컬럼만 반환하며, 파라미터/결과/스택 트레이스는 include_payload=true이거나 fields에 포함된 경우에만 포함합니다.
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회합니다. (execution_id 조회는 실행의 전체 로그를 반환)
     """
     client_ip = http_request.client.host if http_request.client else "unknown"
     logger.debug(
@@ -92,18 +107,46 @@ async def get_node_execution_logs(
     )
 
     try:
+        selected_fields = parse_fields(fields, LOG_FIELDS)
+        repository = db_manager.node_execution_logs
+        next_cursor = None
         if execution_id:
-            logs = db_manager.node_execution_logs.get_logs_by_execution_id(execution_id)
-        elif script_id:
-            logs = db_manager.node_execution_logs.get_logs_by_script_id(script_id, limit=limit, offset=offset)
-        elif node_id:
-            logs = db_manager.node_execution_logs.get_logs_by_node_id(node_id, limit=limit, offset=offset)
+            logs = repository.get_logs_by_execution_id(
+                execution_id, include_payload=include_payload, fields=selected_fields
+            )
+        elif offset and cursor is None:
+            # 이전 버전 호환 (OFFSET 페이지네이션)
+            if script_id:
+                logs = repository.get_logs_by_script_id(
+                    script_id, limit=limit, offset=offset, include_payload=include_payload, fields=selected_fields
+                )
+            elif node_id:
+                logs = repository.get_logs_by_node_id(
+                    node_id, limit=limit, offset=offset, include_payload=include_payload, fields=selected_fields
+                )
+            else:
+                raise HTTPException(
+                    status_code=API_CONSTANTS.HTTP_BAD_REQUEST,
+                    detail="offset은 script_id 또는 node_id와 함께 사용하세요. (전체 조회는 cursor 사용)",
+                )
         else:
-            logs = db_manager.node_execution_logs.get_recent_logs(limit=limit)
+            logs, next_cursor = repository.get_logs_page(
+                script_id=script_id,
+                node_id=node_id,
+                limit=limit,
+                cursor=cursor,
+                fields=selected_fields,
+                include_payload=include_payload,
+            )
 
         logger.info(f"[API] 노드 실행 로그 조회 성공 - 로그 개수: {len(logs)}개")
 
-        return list_response(logs, "노드 실행 로그 조회 완료")
+        return cursor_page_response(logs, next_cursor, "노드 실행 로그 조회 완료")
+    except HTTPException:
+        raise
+    except ValueError as e:
+        # 잘못된 커서 또는 필드
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"[API] 노드 실행 로그 조회 실패: {e!s}")
         raise HTTPException(
@@ -111,7 +154,7 @@ async def get_node_execution_logs(
         )
 
 
-@router.get("/node-execution/failed", response_model=ListResponse)
+@router.get("/node-execution/failed", response_model=CursorPageResponse)
 @api_handler
 async def get_failed_node_execution_logs(
     http_request: Request,
@@ -122,19 +165,31 @@ async def get_failed_node_execution_logs(
         le=API_CONSTANTS.MAX_LOG_LIMIT,
         description="조회할 최대 개수",
     ),
-) -> ListResponse:
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    fields: str | None = Query(None, description="반환할 필드 (쉼표로 구분)"),
+    include_payload: bool = Query(False, description="파라미터/결과/스택 트레이스 포함 여부"),
+) -> CursorPageResponse:
     """
-    실패한 노드 실행 로그를 조회합니다.
+    실패한 노드 실행 로그를 최신순으로 조회합니다.
     """
     client_ip = http_request.client.host if http_request.client else "unknown"
     logger.debug(f"[API] 실패한 노드 실행 로그 조회 요청 - script_id: {script_id}, 클라이언트 IP: {client_ip}")
 
     try:
-        logs = db_manager.node_execution_logs.get_failed_logs(script_id=script_id, limit=limit)
+        logs, next_cursor = db_manager.node_execution_logs.get_logs_page(
+            script_id=script_id,
+            status="failed",
+            limit=limit,
+            cursor=cursor,
+            fields=parse_fields(fields, LOG_FIELDS),
+            include_payload=include_payload,
+        )
 
         logger.info(f"[API] 실패한 노드 실행 로그 조회 성공 - 로그 개수: {len(logs)}개")
 
-        return list_response(logs, "실패한 노드 실행 로그 조회 완료")
+        return cursor_page_response(logs, next_cursor, "실패한 노드 실행 로그 조회 완료")
+    except ValueError as e:
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"[API] 실패한 노드 실행 로그 조회 실패: {e!s}")
         raise HTTPException(
@@ -388,3 +443,173 @@ async def check_logs_ready(
             status_code=API_CONSTANTS.HTTP_INTERNAL_SERVER_ERROR,
             detail=f"{API_CONSTANTS.ERROR_LOG_SAVE_CHECK_FAILED}: {e!s}",
         )
+
+
+# 경로 파라미터 라우트는 /node-execution/failed, /node-execution/check-ready 뒤에 등록
+@router.get("/node-execution/{log_id}", response_model=SuccessResponse)
+@api_handler
+async def get_node_execution_log(log_id: int) -> SuccessResponse:
+    """
+    노드 실행 로그 하나를 파라미터/결과/스택 트레이스와 함께 조회합니다. (상세 보기)
+    """
+    log = db_manager.node_execution_logs.get_log(log_id)
+    if log is None:
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_NOT_FOUND, detail="로그를 찾을 수 없습니다.")
+    return success_response(log, "노드 실행 로그 조회 완료")
+
+
+@router.get("/search", response_model=CursorPageResponse)
+@api_handler
+async def search_node_execution_logs(
+    q: str = Query(..., min_length=1, description="검색어 (단어는 접두어 검색, 큰따옴표로 묶으면 구문 검색)"),
+    script_id: int | None = Query(None, description="스크립트 ID"),
+    node_type: str | None = Query(None, description="노드 타입 (예: excel-open)"),
+    status: str | None = Query(None, description="실행 상태 (completed 또는 failed)"),
+    since: str | None = Query(None, description="이 시각 이후에 시작한 로그 (ISO 형식)"),
+    until: str | None = Query(None, description="이 시각 이전에 시작한 로그 (ISO 형식)"),
+    columns: str | None = Query(
+        None, description=f"검색할 컬럼 (쉼표로 구분, 기본값: 전체, 가능한 값: {', '.join(SEARCH_COLUMNS)})"
+    ),
+    order: str = Query("rank", description="정렬 방식 (rank: 관련도순, recent: 최근 저장순)"),
+    limit: int = Query(
+        API_CONSTANTS.DEFAULT_LOG_SEARCH_LIMIT,
+        ge=API_CONSTANTS.MIN_LOG_LIMIT,
+        le=API_CONSTANTS.MAX_LOG_SEARCH_LIMIT,
+        description="조회할 최대 개수",
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+) -> CursorPageResponse:
+    """
+    노드 실행 로그의 에러 메시지, 스택 트레이스, 노드 이름/식별자를 전문 검색합니다.
+    각 로그에는 검색어를 <mark>로 감싼 snippet(HTML 이스케이프됨)과 관련도 score가 포함됩니다.
+    """
+    try:
+        for value in (since, until):
+            if value is not None:
+                datetime.fromisoformat(value)
+        logs, next_cursor = await asyncio.to_thread(
+            db_manager.node_execution_logs.search_logs,
+            q,
+            script_id=script_id,
+            node_type=node_type,
+            status=status,
+            since=since,
+            until=until,
+            columns=parse_fields(columns, SEARCH_COLUMNS),
+            order=order,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        # 빈 검색어, 잘못된 컬럼/정렬 방식/커서/시각
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"[API] 노드 실행 로그 검색 실패: {e!s}")
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_INTERNAL_SERVER_ERROR,
+            detail=f"{API_CONSTANTS.ERROR_LOG_SEARCH_FAILED}: {e!s}",
+        )
+
+    logger.debug(f"[API] 노드 실행 로그 검색 - 검색어: {q}, 결과: {len(logs)}개")
+    return cursor_page_response(logs, next_cursor, "노드 실행 로그 검색 완료")
+
+
+@router.post("/search/rebuild", response_model=SuccessResponse)
+@api_handler
+async def rebuild_log_search_index() -> SuccessResponse:
+    """
+    전문 검색 인덱스를 로그 테이블 기준으로 다시 만듭니다. (인덱스가 로그와 맞지 않을 때 사용)
+    """
+    indexed = await asyncio.to_thread(db_manager.node_execution_logs.rebuild_search_index)
+    return success_response({"indexed_count": indexed}, f"{indexed}개의 노드 실행 로그를 검색 인덱스에 추가했습니다.")
+
+
+@router.get("/retention", response_model=SuccessResponse)
+@api_handler
+async def get_log_retention_status() -> SuccessResponse:
+    """
+    로그 보관 정책 설정, 마지막 정리 결과와 현재 DB 사용량을 조회합니다.
+    """
+    status = log_retention.status()
+    status["storage"] = await asyncio.to_thread(db_manager.node_execution_logs.get_storage_stats)
+    return success_response(status, "로그 보관 정책 조회 완료")
+
+
+@router.post("/retention/run", response_model=SuccessResponse)
+@api_handler
+async def run_log_retention() -> SuccessResponse:
+    """
+    로그 보관 정책에 따라 지금 정리합니다. (주기 정리와 동시에 실행되지 않음)
+    """
+    summary = await log_retention.run_once()
+    return success_response(summary, f"{summary['deleted_logs']}개의 노드 실행 로그를 정리했습니다.")
+
+
+@router.get("/archives", response_model=SuccessResponse)
+@api_handler
+async def get_log_archives() -> SuccessResponse:
+    """
+    로그 보관 파일 목록을 조회합니다. (최신 파일부터)
+    """
+    archives = await asyncio.to_thread(log_retention.archive.list)
+    return success_response({"archives": archives, "count": len(archives)}, "로그 보관 파일 목록 조회 완료")
+
+
+def _read_archive(
+    name: str, execution_id: str | None, script_id: int | None, status: str | None, limit: int | None, offset: int = 0
+) -> list[dict[str, Any]]:
+    """보관 파일에서 조건에 맞는 로그를 읽습니다. (작업 스레드에서 실행)"""
+    logs = log_retention.archive.iter_logs(name, execution_id=execution_id, script_id=script_id, status=status)
+    stop = offset + limit if limit is not None else None
+    try:
+        return list(itertools.islice(logs, offset, stop))
+    except ValueError as e:
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_NOT_FOUND, detail="보관 파일을 찾을 수 없습니다.")
+
+
+@router.get("/archives/{name}", response_model=SuccessResponse)
+@api_handler
+async def query_log_archive(
+    name: str,
+    execution_id: str | None = Query(None, description="워크플로우 실행 ID"),
+    script_id: int | None = Query(None, description="스크립트 ID"),
+    status: str | None = Query(None, description="실행 상태 (completed 또는 failed)"),
+    limit: int = Query(100, ge=1, le=1000, description="조회할 최대 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+) -> SuccessResponse:
+    """
+    로그 보관 파일의 로그를 조건으로 조회합니다. (파라미터/결과/스택 트레이스 포함)
+    """
+    logs = await asyncio.to_thread(_read_archive, name, execution_id, script_id, status, limit, offset)
+    return success_response({"name": name, "logs": logs, "count": len(logs)}, "로그 보관 파일 조회 완료")
+
+
+@router.post("/archives/{name}/restore", response_model=SuccessResponse)
+@api_handler
+async def restore_log_archive(
+    name: str,
+    execution_id: str | None = Query(None, description="복원할 실행 ID (없으면 파일 전체)"),
+) -> SuccessResponse:
+    """
+    로그 보관 파일의 로그를 DB에 다시 저장합니다.
+    이미 있는 최종 로그는 건너뛰며, 보관 기간이 지난 로그는 다음 정리 때 다시 보관 파일로 옮겨집니다.
+    """
+    logs = await asyncio.to_thread(_read_archive, name, execution_id, None, None, None)
+    if not logs:
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_NOT_FOUND, detail="복원할 로그가 없습니다.")
+
+    restored = await asyncio.to_thread(db_manager.node_execution_logs.import_logs, logs)
+    stats = db_manager.log_stats.calculate_and_update_stats() if restored else None
+    logger.info("[API] 로그 보관 파일 복원 - 파일: %s, 실행 ID: %s, 복원: %s개", name, execution_id, restored)
+    return success_response(
+        {
+            "name": name,
+            "execution_id": execution_id,
+            "restored_count": restored,
+            "skipped_count": len(logs) - restored,
+            "stats": stats,
+        },
+        f"{restored}개의 노드 실행 로그를 복원했습니다.",
+    )
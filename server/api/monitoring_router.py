@@ -0,0 +1,204 @@
+"""
+런타임 모니터링 API 라우터
+"""
+
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from api.helpers import api_handler, success_response
+from api.helpers.constants import API_CONSTANTS
+from db.database import db_manager
+from log import log_manager
+from models.response_models import SuccessResponse
+from monitoring import loop_monitor, metrics, metrics_snapshotter, to_chrome_trace, tracer
+
+router = APIRouter(prefix="/api/monitoring", tags=["monitoring"])
+logger = log_manager.get_logger(__name__)
+
+# Prometheus 텍스트 노출 형식 Content-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# 노드 실행 시간 히스토그램 레이블 (group_by 기본값)
+NODE_LATENCY_LABELS = ("node_type", "status", "script_id")
+# 실행 추적 내보내기 형식
+TRACE_FORMATS = ("json", "chrome")
+
+
+@router.get("/event-loop", response_model=SuccessResponse)
+@api_handler
+async def get_event_loop_stats(
+    execution_id: str | None = Query(None, description="지정하면 해당 실행 중에 발생한 멈춤만 반환"),
+    limit: int = Query(20, ge=0, le=100, description="반환할 최근 멈춤 기록 개수"),
+    include_stack: bool = Query(True, description="멈춤 기록에 스택 포함 여부"),
+) -> SuccessResponse:
+    """
+    이벤트 루프 지연 통계와 최근 멈춤 기록을 조회합니다.
+
+    멈춤 기록에는 멈춘 시간, 멈춤 당시 실행 중이던 실행 ID/노드, 이벤트 루프 스레드의 스택이 포함됩니다.
+    """
+    stats = loop_monitor.get_stats(execution_id=execution_id, limit=limit, include_stack=include_stack)
+    return success_response(stats, "이벤트 루프 지연 통계 조회 완료")
+
+
+@router.post("/event-loop/reset", response_model=SuccessResponse)
+@api_handler
+async def reset_event_loop_stats() -> SuccessResponse:
+    """이벤트 루프 지연 통계와 멈춤 기록을 초기화합니다."""
+    loop_monitor.reset()
+    logger.info("[API] 이벤트 루프 지연 통계 초기화")
+    return success_response(None, "이벤트 루프 지연 통계 초기화 완료")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+@api_handler
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """
+    서버 메트릭을 Prometheus 텍스트 노출 형식으로 반환합니다. (서버 시작 이후 누적)
+
+    노드 타입/상태/스크립트별 실행 시간 히스토그램과 추정 분위수, 노드 실행/재시도 횟수,
+    로그 전송 대기 수, DB 작업 시간 히스토그램이 포함됩니다.
+    """
+    return PlainTextResponse(metrics.to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/metrics/json", response_model=SuccessResponse)
+@api_handler
+async def get_metrics_json(
+    since_hours: float | None = Query(
+        None,
+        gt=0,
+        description="지정하면 저장된 스냅샷을 포함하여 최근 N시간 동안의 값을 반환 (없으면 서버 시작 이후 누적)",
+    ),
+    node_type: str | None = Query(None, description="노드 타입 필터"),
+    status: str | None = Query(None, description="실행 상태 필터 (completed, failed)"),
+    script_id: str | None = Query(None, description="스크립트 ID 필터"),
+    group_by: str = Query(
+        ",".join(NODE_LATENCY_LABELS),
+        description="실행 시간 분포를 묶을 레이블 (쉼표 구분, 빈 문자열이면 전체 합산)",
+    ),
+) -> SuccessResponse:
+    """
+    대시보드용 메트릭을 JSON으로 조회합니다.
+
+    예: 이번 주 image-touch 노드의 p95 -> ?since_hours=168&node_type=image-touch&group_by=node_type
+    """
+    labels = [label.strip() for label in group_by.split(",") if label.strip()]
+    unknown = [label for label in labels if label not in NODE_LATENCY_LABELS]
+    if unknown:
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_BAD_REQUEST,
+            detail=f"지원하지 않는 group_by 레이블: {', '.join(unknown)} (사용 가능: {', '.join(NODE_LATENCY_LABELS)})",
+        )
+
+    if since_hours is None:
+        since = metrics.started_at
+        state = None
+    else:
+        since = datetime.now() - timedelta(hours=since_hours)
+        state = await metrics_snapshotter.load_history(since)
+
+    data = metrics.describe(
+        state,
+        group_by=labels,
+        filters={"node_type": node_type, "status": status, "script_id": script_id},
+    )
+    data["since"] = since.isoformat(timespec="seconds")
+    data["last_snapshot_at"] = (
+        metrics_snapshotter.last_snapshot_at.isoformat(timespec="seconds")
+        if metrics_snapshotter.last_snapshot_at
+        else None
+    )
+    return success_response(data, "메트릭 조회 완료")
+
+
+@router.get("/schema", response_model=SuccessResponse)
+@api_handler
+async def get_schema_status() -> SuccessResponse:
+    """
+    DB 스키마 버전과 적용한 마이그레이션 단계를 조회합니다.
+
+    단계마다 적용 소요 시간(duration_ms)과 데이터 채우기 완료 시간(backfilled_at, 진행 중이면 null)이 포함됩니다.
+    """
+    return success_response(db_manager.get_schema_status(), "스키마 버전 조회 완료")
+
+
+@router.get("/traces", response_model=SuccessResponse)
+@api_handler
+async def list_traces(
+    limit: int = Query(50, ge=1, le=500, description="반환할 저장된 실행 추적 최대 개수"),
+) -> SuccessResponse:
+    """
+    실행 추적 목록을 조회합니다.
+
+    recent: 메모리에 있는 최근 실행 (서버 재시작 시 사라짐), saved: 저장 요청으로 DB에 보관된 실행
+    """
+    data = {
+        "enabled": tracer.enabled,
+        "recent": tracer.list_traces(),
+        "saved": db_manager.traces.list_traces(limit=limit),
+    }
+    return success_response(data, "실행 추적 목록 조회 완료")
+
+
+@router.get("/traces/{execution_id}", response_model=None)
+@api_handler
+async def get_trace(
+    execution_id: str,
+    format: str = Query(
+        "json", description="json: 스팬 목록, chrome: Chrome trace 이벤트 파일 (chrome://tracing, Perfetto)"
+    ),
+) -> SuccessResponse | JSONResponse:
+    """
+    실행 추적을 조회합니다. 메모리에 없으면 저장된 실행 추적을 조회합니다.
+
+    format=chrome이면 chrome://tracing, https://ui.perfetto.dev, https://www.speedscope.app 에서 열 수 있는
+    JSON 파일로 내려받습니다.
+    """
+    if format not in TRACE_FORMATS:
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_BAD_REQUEST,
+            detail=f"지원하지 않는 형식: {format} (사용 가능: {', '.join(TRACE_FORMATS)})",
+        )
+
+    trace = tracer.get_trace(execution_id)
+    data = trace.to_dict() if trace is not None else db_manager.traces.get_trace(execution_id)
+    if data is None:
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_NOT_FOUND, detail=f"실행 추적을 찾을 수 없습니다: {execution_id}"
+        )
+
+    if format == "chrome":
+        return JSONResponse(
+            to_chrome_trace(data),
+            headers={"Content-Disposition": f'attachment; filename="trace-{execution_id}.json"'},
+        )
+    return success_response(data, "실행 추적 조회 완료")
+
+
+@router.post("/traces/{execution_id}/persist", response_model=SuccessResponse)
+@api_handler
+async def persist_trace(execution_id: str) -> SuccessResponse:
+    """메모리에 있는 실행 추적을 DB에 저장합니다. (서버 재시작 후에도 조회 가능)"""
+    trace = tracer.get_trace(execution_id)
+    if trace is None:
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_NOT_FOUND,
+            detail=f"메모리에 실행 추적이 없습니다 (최근 {tracer.max_traces}개 실행만 보관): {execution_id}",
+        )
+
+    data = trace.to_dict()
+    db_manager.traces.save_trace(data)
+    logger.info("[API] 실행 추적 저장 - 실행 ID: %s, 스팬 수: %s", execution_id, len(data["spans"]))
+    return success_response(trace.summary(), "실행 추적 저장 완료")
+
+
+@router.delete("/traces/{execution_id}", response_model=SuccessResponse)
+@api_handler
+async def delete_trace(execution_id: str) -> SuccessResponse:
+    """저장된 실행 추적을 삭제합니다."""
+    if not db_manager.traces.delete_trace(execution_id):
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_NOT_FOUND, detail=f"저장된 실행 추적을 찾을 수 없습니다: {execution_id}"
+        )
+    return success_response({"execution_id": execution_id}, "실행 추적 삭제 완료")
@@ -16,7 +16,7 @@ from log import log_manager
 from models.response_models import SuccessResponse
 
 router = APIRouter(prefix="/api", tags=["screenshots"])
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 screen_capture = ScreenCapture()
 
 
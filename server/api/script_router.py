@@ -2,19 +2,21 @@
 스크립트 관련 API 라우터
 """
 
+import asyncio
 from typing import Any
 
-from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi import APIRouter, Body, HTTPException, Query, Request
 
 from api.helpers import (
+    cursor_page_response,
     error_response,
     get_script_or_raise,
-    list_response,
     save_script_data_or_raise,
     success_response,
 )
 from api.helpers.constants import API_CONSTANTS
 from db.database import db_manager
+from db.script_repository import SCRIPT_FIELDS
 from log import log_manager
 from models import (
     BaseResponse,
@@ -24,26 +26,44 @@ from models import (
     ScriptUpdateRequest,
     StandardResponseType,
 )
-from models.response_models import ListResponse, SuccessResponse
+from models.response_models import CursorPageResponse, SuccessResponse
 from services import action_service
+from utils.pagination import parse_fields
 
 router = APIRouter(prefix="/api", tags=["scripts"])
-logger = log_manager.logger
-
-
-@router.get("/scripts", response_model=ListResponse)
-async def get_all_scripts(request: Request) -> ListResponse:
-    """모든 스크립트 목록 조회"""
+logger = log_manager.get_logger(__name__)
+
+
+@router.get("/scripts", response_model=CursorPageResponse)
+async def get_all_scripts(
+    request: Request,
+    limit: int | None = Query(
+        None, ge=1, le=API_CONSTANTS.MAX_SCRIPT_PAGE_LIMIT, description="조회할 최대 개수 (없으면 전체)"
+    ),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (다음 페이지 조회)"),
+    fields: str | None = Query(None, description="반환할 필드 (쉼표로 구분, 예: id,name,active)"),
+) -> CursorPageResponse:
+    """스크립트 목록 조회 (실행 순서대로, limit을 지정하면 키셋 페이지네이션)"""
     client_ip = request.client.host if request.client else "unknown"
     logger.info(f"[API] 스크립트 목록 조회 요청 받음 - 클라이언트 IP: {client_ip}")
 
     try:
-        logger.info("[DB 조회] 모든 스크립트 목록 조회 시작")
-        scripts = db_manager.get_all_scripts()
+        selected_fields = parse_fields(fields, SCRIPT_FIELDS)
+        next_cursor = None
+        logger.info("[DB 조회] 스크립트 목록 조회 시작")
+        if limit is None and cursor is None:
+            scripts = db_manager.get_all_scripts(selected_fields)
+        else:
+            scripts, next_cursor = db_manager.get_scripts_page(
+                limit or API_CONSTANTS.DEFAULT_SCRIPT_PAGE_LIMIT, cursor, selected_fields
+            )
         logger.info(f"[DB 조회] 스크립트 목록 조회 완료 - 스크립트 개수: {len(scripts)}개")
         logger.debug(f"[DB 조회] 스크립트 목록 상세: {[{'id': s.get('id'), 'name': s.get('name')} for s in scripts]}")
         logger.info(f"[API] 스크립트 목록 조회 성공 - 스크립트 개수: {len(scripts)}개")
-        return list_response(scripts, "스크립트 목록 조회 완료")
+        return cursor_page_response(scripts, next_cursor, "스크립트 목록 조회 완료")
+    except ValueError as e:
+        # 잘못된 커서 또는 필드
+        raise HTTPException(status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(f"[API] 스크립트 목록 조회 실패: {e!s}")
         raise HTTPException(
@@ -123,13 +143,6 @@ async def create_script(request: ScriptCreateRequest, http_request: Request) ->
         script_id = db_manager.create_script(request.name, description)
         logger.info(f"[DB 저장] 스크립트 생성 완료 - 스크립트 ID: {script_id}, 이름: {request.name}")
 
-        # 대시보드 통계 업데이트 (전체 워크플로우 개수)
-        try:
-            db_manager.update_stat("total_scripts")
-            logger.info("[DB 통계] 전체 워크플로우 통계 업데이트 완료")
-        except Exception as e:
-            logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
         # 생성된 스크립트 정보 조회 (클라이언트에서 목록에 추가하기 위해)
         logger.info(f"[DB 조회] 생성된 스크립트 정보 조회 시작 - 스크립트 ID: {script_id}")
         created_script = db_manager.get_script(script_id)
@@ -217,13 +230,6 @@ async def delete_script(script_id: int, request: Request) -> SuccessResponse:
         if success:
             logger.info(f"[DB 삭제] 스크립트 삭제 완료 - 스크립트 ID: {script_id}, 이름: {script_name}")
 
-            # 대시보드 통계 업데이트 (전체 워크플로우 개수)
-            try:
-                db_manager.update_stat("total_scripts")
-                logger.info("[DB 통계] 전체 워크플로우 통계 업데이트 완료")
-            except Exception as e:
-                logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
             logger.info(f"[API] 스크립트 삭제 성공 - 스크립트 ID: {script_id}, 이름: {script_name}")
             return success_response({"id": script_id}, "스크립트가 삭제되었습니다.")
         logger.warning(f"[DB 삭제] 스크립트 삭제 실패 - 스크립트 ID: {script_id}")
@@ -294,6 +300,52 @@ async def update_nodes_batch(
         )
 
 
+@router.patch("/nodes/script/{script_id}/batch", response_model=SuccessResponse)
+async def patch_nodes_batch(script_id: int, request: dict[str, Any] = Body(...)) -> SuccessResponse:
+    """
+    노드 변경분 저장 (UI가 마지막 저장 이후 바뀐 노드만 전송)
+
+    요청 본문:
+    - nodes: 추가하거나 변경할 노드 목록 (저장된 노드의 생략한 필드는 기존 값 유지)
+    - removed: 삭제할 노드 ID 목록
+    - connections: 스크립트의 전체 연결 목록 (생략하면 기존 연결에서 삭제한 노드의 연결만 제외)
+    """
+    nodes = request.get("nodes", [])
+    removed = request.get("removed", [])
+    connections = request.get("connections")
+    if (
+        not isinstance(nodes, list)
+        or not isinstance(removed, list)
+        or (connections is not None and not isinstance(connections, list))
+    ):
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_BAD_REQUEST,
+            detail="nodes, removed, connections는 배열이어야 합니다.",
+        )
+
+    try:
+        get_script_or_raise(script_id)
+        logger.info(
+            f"[DB 저장] 노드 변경분 저장 시작 - 스크립트 ID: {script_id}, 변경 노드: {len(nodes)}개, 삭제 노드: {len(removed)}개"
+        )
+        result = db_manager.patch_script_data(script_id, nodes, removed, connections)
+        logger.info(f"[DB 저장] 노드 변경분 저장 완료 - 스크립트 ID: {script_id}, 결과: {result}")
+        return success_response({"script_id": script_id, **result}, "노드가 성공적으로 저장되었습니다.")
+    except HTTPException:
+        raise
+    except (KeyError, ValueError) as e:
+        # 잘못된 노드 형식, 연결 검증 실패
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_BAD_REQUEST, detail=f"{API_CONSTANTS.ERROR_NODE_SAVE_FAILED}: {e!s}"
+        )
+    except Exception as e:
+        logger.error(f"[API] 노드 변경분 저장 실패 - 스크립트 ID: {script_id}, 에러: {e!s}")
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_INTERNAL_SERVER_ERROR,
+            detail=f"{API_CONSTANTS.ERROR_NODE_SAVE_FAILED}: {e!s}",
+        )
+
+
 @router.post("/scripts/{script_id}/execute", response_model=BaseResponse)
 async def execute_script(script_id: int, request: NodeExecutionRequest) -> StandardResponseType:
     """스크립트 실행"""
@@ -420,13 +472,6 @@ async def toggle_script_active(
         if success:
             logger.info(f"[DB 저장] 스크립트 활성 상태 업데이트 완료 - 스크립트 ID: {script_id}, 활성: {active}")
 
-            # 대시보드 통계 업데이트 (비활성 스크립트 개수)
-            try:
-                db_manager.update_stat("inactive_scripts")
-                logger.info("[DB 통계] 비활성 스크립트 통계 업데이트 완료")
-            except Exception as e:
-                logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
             logger.info(
                 f"[API] 스크립트 활성 상태 변경 성공 - 스크립트 ID: {script_id}, 이름: {script_name}, 활성: {active}"
             )
@@ -494,6 +539,53 @@ async def record_script_execution(
         )
 
 
+@router.get("/scripts/{script_id}/stats", response_model=SuccessResponse)
+async def get_script_stats(script_id: int, request: Request) -> SuccessResponse:
+    """
+    스크립트 실행 통계 조회 (실행 횟수, 평균/p50/p95 실행 시간, 마지막 실행)
+
+    실행 완료 시 갱신되는 script_stats 행 하나만 읽으므로 실행 기록 수와 관계없이 비용이 같습니다.
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    logger.info(f"[API] 스크립트 실행 통계 조회 요청 - 스크립트 ID: {script_id}, 클라이언트 IP: {client_ip}")
+
+    try:
+        get_script_or_raise(script_id)
+        stats = db_manager.get_script_stats(script_id)
+        if stats is None:
+            # 완료된 실행이 없는 스크립트
+            stats = {"script_id": script_id, "total_executions": 0, "success_count": 0, "error_count": 0}
+        return success_response(stats, "스크립트 실행 통계 조회 완료")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[API] 스크립트 실행 통계 조회 실패 - 스크립트 ID: {script_id}, 에러: {e!s}")
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_INTERNAL_SERVER_ERROR,
+            detail=f"{API_CONSTANTS.ERROR_SCRIPT_STATS_FAILED}: {e!s}",
+        )
+
+
+@router.post("/scripts/stats/rebuild", response_model=SuccessResponse)
+async def rebuild_script_stats(request: Request) -> SuccessResponse:
+    """
+    스크립트별 실행 통계를 실행 기록 전체로 다시 만듭니다. (통계가 실행 기록과 맞지 않을 때 사용)
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    logger.info(f"[API] 스크립트 실행 통계 재생성 요청 - 클라이언트 IP: {client_ip}")
+
+    try:
+        rebuilt = await asyncio.to_thread(db_manager.rebuild_script_stats)
+        logger.info(f"[API] 스크립트 실행 통계 재생성 완료 - 스크립트 {rebuilt}개")
+        return success_response({"script_count": rebuilt}, f"{rebuilt}개 스크립트의 실행 통계를 다시 만들었습니다.")
+    except Exception as e:
+        logger.error(f"[API] 스크립트 실행 통계 재생성 실패: {e!s}")
+        raise HTTPException(
+            status_code=API_CONSTANTS.HTTP_INTERNAL_SERVER_ERROR,
+            detail=f"{API_CONSTANTS.ERROR_SCRIPT_STATS_REBUILD_FAILED}: {e!s}",
+        )
+
+
 @router.patch("/scripts/order", response_model=SuccessResponse)
 async def update_script_order(request: Request, script_orders: list[dict[str, int]] = Body(...)) -> SuccessResponse:
     """스크립트 순서 업데이트"""
@@ -1,10 +1,23 @@
 # automation 모듈
 from .application_state import ApplicationState
-from .input_handler import InputHandler
+from .input_handler import InputHandler, InputSequence
+from .input_recorder import InputRecorder, RecordedEventStream
+from .input_timing import InputTimingPolicy, get_timing_policy
 from .screen_capture import ScreenCapture
+from .window_registry import FakeWindowBackend, WindowBackend, WindowInfo, WindowRegistry, get_window_registry
 
 __all__ = [
     "ApplicationState",
+    "FakeWindowBackend",
     "InputHandler",
+    "InputRecorder",
+    "InputSequence",
+    "InputTimingPolicy",
+    "RecordedEventStream",
     "ScreenCapture",
+    "WindowBackend",
+    "WindowInfo",
+    "WindowRegistry",
+    "get_timing_policy",
+    "get_window_registry",
 ]
@@ -4,7 +4,7 @@ from typing import Any
 
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ApplicationState:
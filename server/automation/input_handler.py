@@ -1,3 +1,4 @@
+from collections.abc import Callable
 import time
 from typing import Any
 
@@ -5,18 +6,87 @@ import pyautogui
 from pynput.keyboard import Listener as KeyboardListener
 from pynput.mouse import Listener as MouseListener
 
+from automation.input_timing import InputTimingPolicy, get_timing_policy
+from config.server_config import settings
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
+
+
+class InputSequence:
+    """
+    한 번에 디스패치할 입력 이벤트 묶음
+
+    텍스트 입력, 단축키 + 클릭 같은 저수준 이벤트를 모아 InputHandler.dispatch()로
+    한 번에 실행합니다. 메서드 체이닝을 지원합니다.
+
+    예:
+        InputSequence().click(100, 200).type_text("hello").hotkey("ctrl", "s")
+    """
+
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        # events: (이벤트 종류, 인자 튜플) 목록
+        self.events: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1) -> "InputSequence":
+        """클릭 이벤트 추가"""
+        self.events.append(("click", (x, y, button, clicks)))
+        return self
+
+    def move(self, x: int, y: int) -> "InputSequence":
+        """마우스 이동 이벤트 추가"""
+        self.events.append(("move", (x, y)))
+        return self
+
+    def type_text(self, text: str) -> "InputSequence":
+        """텍스트 입력 이벤트 추가"""
+        self.events.append(("type", (text,)))
+        return self
+
+    def press(self, key: str, presses: int = 1) -> "InputSequence":
+        """키 입력 이벤트 추가"""
+        self.events.append(("press", (key, presses)))
+        return self
+
+    def hotkey(self, *keys: str) -> "InputSequence":
+        """키 조합 이벤트 추가"""
+        self.events.append(("hotkey", keys))
+        return self
+
+    def scroll(self, x: int, y: int, clicks: int) -> "InputSequence":
+        """스크롤 이벤트 추가 (clicks가 양수면 위, 음수면 아래)"""
+        self.events.append(("scroll", (x, y, clicks)))
+        return self
+
+    def wait(self, seconds: float) -> "InputSequence":
+        """명시적 대기 이벤트 추가 (정책과 무관하게 항상 대기)"""
+        self.events.append(("wait", (seconds,)))
+        return self
 
 
 class InputHandler:
     """입력 처리 클래스"""
 
-    def __init__(self) -> None:
+    def __init__(self, timing: str | InputTimingPolicy | None = None) -> None:
+        """
+        InputHandler 초기화
+
+        Args:
+            timing: 입력 타이밍 정책 ("fast"/"humanized" 또는 InputTimingPolicy).
+                    None이면 설정(INPUT_TIMING_MODE)을 따릅니다.
+        """
         # PyAutoGUI 설정
+        # pyautogui는 기본적으로 모든 호출 뒤에 PAUSE(0.1초)만큼 대기하므로 전역 설정을 바꾸지 않고
+        # 각 호출에 _pause=False를 넘겨 건너뛰며, 지연은 InputTimingPolicy로만 제어합니다.
         pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
+
+        # 입력 타이밍 정책
+        self.timing = get_timing_policy(timing if timing is not None else settings.INPUT_TIMING_MODE)
 
         # 마우스/키보드 리스너
         self.mouse_listener: MouseListener | None = None
@@ -24,7 +94,24 @@ class InputHandler:
         self.last_click_position: tuple[int, int] | None = None
         self.last_key_press: str | None = None
 
-    def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float = 0.1) -> bool:
+    def _after_action(self) -> None:
+        """정책에 따라 액션 뒤 지연을 적용합니다. (fast 정책에서는 아무것도 하지 않음)"""
+        delay = self.timing.vary(self.timing.action_delay)
+        if delay > 0.0:
+            time.sleep(delay)
+
+    def _write(self, text: str, interval: float | None) -> None:
+        """텍스트를 입력합니다. jitter가 있으면 글자마다 지연을 다르게 적용합니다."""
+        if interval is not None:
+            pyautogui.typewrite(text, interval=interval, _pause=False)
+        elif self.timing.key_interval > 0.0 and self.timing.jitter > 0.0:
+            for char in text:
+                pyautogui.press(char, _pause=False)
+                time.sleep(self.timing.vary(self.timing.key_interval))
+        else:
+            pyautogui.typewrite(text, interval=self.timing.key_interval, _pause=False)
+
+    def click(self, x: int, y: int, button: str = "left", clicks: int = 1, interval: float | None = None) -> bool:
         """
         마우스 클릭을 수행합니다.
 
@@ -32,17 +119,19 @@ class InputHandler:
             x, y: 클릭할 좌표
             button: 클릭할 버튼 ('left', 'right', 'middle')
             clicks: 클릭 횟수
-            interval: 클릭 간격
+            interval: 클릭 간격 (None이면 타이밍 정책의 click_interval 사용)
 
         Returns:
             클릭 성공 여부
         """
         try:
-            pyautogui.click(x, y, clicks=clicks, interval=interval, button=button)
+            click_interval = self.timing.click_interval if interval is None else interval
+            pyautogui.click(x, y, clicks=clicks, interval=click_interval, button=button, _pause=False)
             self.last_click_position = (x, y)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"클릭 실패: {e}")
+            logger.error("클릭 실패: %s", e)
             return False
 
     def double_click(self, x: int, y: int) -> bool:
@@ -53,61 +142,66 @@ class InputHandler:
         """우클릭을 수행합니다."""
         return self.click(x, y, button="right")
 
-    def drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float = 1.0) -> bool:
+    def drag(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: float | None = None) -> bool:
         """
         드래그 액션을 수행합니다.
 
         Args:
             start_x, start_y: 시작 좌표
             end_x, end_y: 끝 좌표
-            duration: 드래그 시간
+            duration: 드래그 시간 (None이면 타이밍 정책의 drag_duration 사용)
 
         Returns:
             드래그 성공 여부
         """
         try:
-            pyautogui.drag(end_x - start_x, end_y - start_y, duration=duration, button="left")
+            drag_duration = self.timing.drag_duration if duration is None else duration
+            pyautogui.drag(end_x - start_x, end_y - start_y, duration=drag_duration, button="left", _pause=False)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"드래그 실패: {e}")
+            logger.error("드래그 실패: %s", e)
             return False
 
-    def type_text(self, text: str, interval: float = 0.1) -> bool:
+    def type_text(self, text: str, interval: float | None = None) -> bool:
         """
         텍스트를 입력합니다.
 
         Args:
             text: 입력할 텍스트
-            interval: 입력 간격
+            interval: 입력 간격 (None이면 타이밍 정책의 key_interval 사용)
 
         Returns:
             입력 성공 여부
         """
         try:
-            pyautogui.typewrite(text, interval=interval)
+            self._write(text, interval)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"텍스트 입력 실패: {e}")
+            logger.error("텍스트 입력 실패: %s", e)
             return False
 
-    def press_key(self, key: str, presses: int = 1, interval: float = 0.1) -> bool:
+    def press_key(self, key: str, presses: int = 1, interval: float | None = None) -> bool:
         """
         키를 누릅니다.
 
         Args:
             key: 누를 키
             presses: 누를 횟수
-            interval: 누름 간격
+            interval: 누름 간격 (None이면 타이밍 정책의 key_interval 사용)
 
         Returns:
             키 입력 성공 여부
         """
         try:
-            pyautogui.press(key, presses=presses, interval=interval)
+            key_interval = self.timing.key_interval if interval is None else interval
+            pyautogui.press(key, presses=presses, interval=key_interval, _pause=False)
             self.last_key_press = key
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"키 입력 실패: {e}")
+            logger.error("키 입력 실패: %s", e)
             return False
 
     def key_combination(self, *keys: str) -> bool:
@@ -121,10 +215,11 @@ class InputHandler:
             키 조합 입력 성공 여부
         """
         try:
-            pyautogui.hotkey(*keys)
+            pyautogui.hotkey(*keys, interval=self.timing.key_interval, _pause=False)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"키 조합 입력 실패: {e}")
+            logger.error("키 조합 입력 실패: %s", e)
             return False
 
     def scroll(self, x: int, y: int, clicks: int = 3, direction: str = "up") -> bool:
@@ -141,50 +236,117 @@ class InputHandler:
         """
         try:
             scroll_direction = 1 if direction == "up" else -1
-            pyautogui.scroll(scroll_direction * clicks, x=x, y=y)
+            pyautogui.scroll(scroll_direction * clicks, x=x, y=y, _pause=False)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"스크롤 실패: {e}")
+            logger.error("스크롤 실패: %s", e)
             return False
 
-    def move_mouse(self, x: int, y: int, duration: float = 0.5) -> bool:
+    def move_mouse(self, x: int, y: int, duration: float | None = None) -> bool:
         """
         마우스를 이동시킵니다.
 
         Args:
             x, y: 이동할 좌표
-            duration: 이동 시간
+            duration: 이동 시간 (None이면 타이밍 정책의 move_duration 사용)
 
         Returns:
             이동 성공 여부
         """
         try:
-            pyautogui.moveTo(x, y, duration=duration)
+            move_duration = self.timing.vary(self.timing.move_duration) if duration is None else duration
+            pyautogui.moveTo(x, y, duration=move_duration, _pause=False)
+            self._after_action()
             return True
         except Exception as e:
-            logger.error(f"마우스 이동 실패: {e}")
+            logger.error("마우스 이동 실패: %s", e)
             return False
 
+    def dispatch(self, sequence: InputSequence) -> bool:
+        """
+        입력 이벤트 묶음을 한 번에 실행합니다.
+
+        개별 메서드를 여러 번 호출하는 것과 달리 이벤트마다 예외 처리/로깅을 반복하지 않고,
+        정책 지연은 이벤트 사이에만 적용합니다 (fast 정책에서는 지연 없이 연속 실행).
+
+        Args:
+            sequence: 실행할 InputSequence
+
+        Returns:
+            모든 이벤트 실행 성공 여부 (실패 시 이후 이벤트는 실행하지 않음)
+        """
+        timing = self.timing
+        last_index = len(sequence.events) - 1
+        for index, (kind, args) in enumerate(sequence.events):
+            try:
+                if kind == "click":
+                    x, y, button, clicks = args
+                    pyautogui.click(x, y, clicks=clicks, interval=timing.click_interval, button=button, _pause=False)
+                    self.last_click_position = (x, y)
+                elif kind == "move":
+                    pyautogui.moveTo(args[0], args[1], duration=timing.vary(timing.move_duration), _pause=False)
+                elif kind == "type":
+                    self._write(args[0], None)
+                elif kind == "press":
+                    pyautogui.press(args[0], presses=args[1], interval=timing.key_interval, _pause=False)
+                    self.last_key_press = args[0]
+                elif kind == "hotkey":
+                    pyautogui.hotkey(*args, interval=timing.key_interval, _pause=False)
+                elif kind == "scroll":
+                    pyautogui.scroll(args[2], x=args[0], y=args[1], _pause=False)
+                elif kind == "wait":
+                    time.sleep(max(0.0, float(args[0])))
+                else:
+                    logger.error("알 수 없는 입력 이벤트: %s", kind)
+                    return False
+            except Exception as e:
+                logger.error("입력 이벤트 실행 실패 (%s/%s, %s): %s", index + 1, last_index + 1, kind, e)
+                return False
+
+            if index != last_index and kind != "wait":
+                self._after_action()
+        return True
+
     def get_mouse_position(self) -> tuple[int, int]:
         """현재 마우스 위치를 반환합니다."""
         pos = pyautogui.position()
         return (pos.x, pos.y)
 
-    def start_input_monitoring(self) -> None:
-        """입력 모니터링을 시작합니다."""
+    def start_input_monitoring(
+        self,
+        on_click: Callable[[int, int, Any, bool], None] | None = None,
+        on_press: Callable[[Any], None] | None = None,
+        on_release: Callable[[Any], None] | None = None,
+        on_move: Callable[[int, int], None] | None = None,
+        on_scroll: Callable[[int, int, int, int], None] | None = None,
+    ) -> None:
+        """
+        입력 모니터링을 시작합니다.
+
+        콜백을 지정하지 않으면 클릭/키 입력을 디버그 로그로만 남깁니다.
+        콜백은 pynput 리스너 스레드에서 호출되므로 가볍게 유지해야 합니다.
+
+        Args:
+            on_click: 마우스 클릭 콜백 (x, y, button, pressed)
+            on_press: 키 누름 콜백 (key)
+            on_release: 키 뗌 콜백 (key)
+            on_move: 마우스 이동 콜백 (x, y)
+            on_scroll: 스크롤 콜백 (x, y, dx, dy)
+        """
 
-        def on_click(x: int, y: int, button: Any, pressed: bool) -> None:
+        def log_click(x: int, y: int, button: Any, pressed: bool) -> None:
             if pressed:
-                logger.debug(f"마우스 클릭 감지: ({x}, {y}) - {button}")
+                logger.debug("마우스 클릭 감지: (%s, %s) - %s", x, y, button)
 
-        def on_press(key: Any) -> None:
+        def log_press(key: Any) -> None:
             try:
-                logger.debug(f"키 입력 감지: {key.char}")
+                logger.debug("키 입력 감지: %s", key.char)
             except AttributeError:
-                logger.debug(f"특수 키 입력 감지: {key}")
+                logger.debug("특수 키 입력 감지: %s", key)
 
-        self.mouse_listener = MouseListener(on_click=on_click)
-        self.keyboard_listener = KeyboardListener(on_press=on_press)
+        self.mouse_listener = MouseListener(on_click=on_click or log_click, on_move=on_move, on_scroll=on_scroll)
+        self.keyboard_listener = KeyboardListener(on_press=on_press or log_press, on_release=on_release)
 
         if self.mouse_listener:
             self.mouse_listener.start()
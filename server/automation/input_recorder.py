@@ -0,0 +1,367 @@
+"""
+입력 녹화/재생 모듈
+
+InputHandler.start_input_monitoring으로 마우스/키보드 이벤트를 녹화하고,
+녹화 결과를 배열 기반의 압축된 이벤트 스트림(RecordedEventStream)으로 컴파일합니다.
+컴파일된 스트림은 고해상도 스케줄러(replay_event_stream)로 녹화 당시의 타임라인대로 재생됩니다.
+
+이벤트마다 노드를 하나씩 만드는 대신 긴 UI 조작을 노드 하나로 재생할 수 있어
+노드 실행/로그 전송 오버헤드 없이 이벤트당 마이크로초 단위의 오버헤드만 발생합니다.
+"""
+
+from array import array
+import base64
+from collections.abc import Callable
+import sys
+import threading
+import time
+from typing import Any
+
+from pynput.keyboard import Controller as KeyboardController
+from pynput.keyboard import Key, KeyCode
+from pynput.mouse import Button
+from pynput.mouse import Controller as MouseController
+
+from automation.input_handler import InputHandler
+from log import log_manager
+
+logger = log_manager.get_logger(__name__)
+
+# 이벤트 종류 코드
+EVENT_MOVE = 0
+EVENT_MOUSE_DOWN = 1
+EVENT_MOUSE_UP = 2
+EVENT_SCROLL = 3
+EVENT_KEY_DOWN = 4
+EVENT_KEY_UP = 5
+
+# 마우스 버튼 코드
+_BUTTON_CODES: dict[str, int] = {"left": 1, "right": 2, "middle": 3}
+_BUTTONS_BY_CODE: dict[int, Any] = {1: Button.left, 2: Button.right, 3: Button.middle}
+
+# 스트림 직렬화 포맷 버전
+STREAM_FORMAT_VERSION = 1
+
+# 남은 시간이 이 값보다 크면 sleep으로 대기하고, 그 이하는 busy-wait으로 정밀하게 맞춤 (나노초)
+_SPIN_THRESHOLD_NS = 2_000_000
+
+
+class RecordedEventStream:
+    """
+    배열 기반 입력 이벤트 스트림
+
+    이벤트 하나를 객체로 만들지 않고 열(column) 단위 배열에 저장합니다.
+    - kinds: 이벤트 종류 코드
+    - times_us: 녹화 시작 기준 경과 시간 (마이크로초)
+    - xs, ys: 마우스 좌표 (키 이벤트는 0)
+    - data: 마우스 버튼 코드 / 스크롤 양 / 키 테이블 인덱스
+    - keys: 키 문자열 테이블 (같은 키는 한 번만 저장)
+    """
+
+    __slots__ = ("data", "keys", "kinds", "times_us", "xs", "ys")
+
+    def __init__(self) -> None:
+        self.kinds = array("B")
+        self.times_us = array("q")
+        self.xs = array("i")
+        self.ys = array("i")
+        self.data = array("i")
+        self.keys: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def duration_us(self) -> int:
+        """스트림 전체 길이 (마이크로초)"""
+        return self.times_us[-1] if self.times_us else 0
+
+    def append(self, kind: int, time_us: int, x: int = 0, y: int = 0, data: int = 0) -> None:
+        """이벤트 하나를 추가합니다."""
+        self.kinds.append(kind)
+        self.times_us.append(time_us)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.data.append(data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        JSON으로 저장 가능한 딕셔너리로 변환합니다.
+        배열은 리틀 엔디언 바이트를 base64로 인코딩하여 저장합니다.
+        """
+        columns: dict[str, str] = {}
+        for name in ("kinds", "times_us", "xs", "ys", "data"):
+            column = getattr(self, name)
+            if sys.byteorder != "little":
+                column = array(column.typecode, column)
+                column.byteswap()
+            columns[name] = base64.b64encode(column.tobytes()).decode("ascii")
+
+        return {
+            "version": STREAM_FORMAT_VERSION,
+            "event_count": len(self),
+            "duration_ms": round(self.duration_us / 1000, 3),
+            "keys": list(self.keys),
+            "columns": columns,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "RecordedEventStream":
+        """
+        to_dict()로 만든 딕셔너리에서 스트림을 복원합니다.
+
+        Raises:
+            ValueError: 딕셔너리가 아니거나, 포맷 버전이 다르거나, 열 길이가 일치하지 않는 경우
+        """
+        if not isinstance(payload, dict):
+            raise ValueError(f"이벤트 스트림은 객체여야 합니다: {type(payload).__name__}")
+        if payload.get("version") != STREAM_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 이벤트 스트림 버전입니다: {payload.get('version')}")
+
+        stream = cls()
+        columns = payload.get("columns") or {}
+        if not isinstance(columns, dict):
+            raise ValueError("이벤트 스트림의 columns 형식이 올바르지 않습니다.")
+        for name in ("kinds", "times_us", "xs", "ys", "data"):
+            column = getattr(stream, name)
+            column.frombytes(base64.b64decode(columns.get(name, "")))
+            if sys.byteorder != "little":
+                column.byteswap()
+        stream.keys = [str(key) for key in payload.get("keys") or []]
+
+        length = len(stream.kinds)
+        if any(len(getattr(stream, name)) != length for name in ("times_us", "xs", "ys", "data")):
+            raise ValueError("이벤트 스트림의 열 길이가 일치하지 않습니다.")
+        return stream
+
+
+def _key_to_name(key: Any) -> str:
+    """pynput 키 객체를 저장용 문자열로 변환합니다."""
+    if isinstance(key, Key):
+        return f"Key.{key.name}"
+    char = getattr(key, "char", None)
+    if char:
+        return str(char)
+    vk = getattr(key, "vk", None)
+    return f"vk:{vk}" if vk is not None else str(key)
+
+
+def _name_to_key(name: str) -> Any:
+    """저장용 문자열을 pynput 키 객체로 변환합니다."""
+    if name.startswith("Key."):
+        return Key[name[4:]]
+    if name.startswith("vk:"):
+        return KeyCode.from_vk(int(name[3:]))
+    return KeyCode.from_char(name)
+
+
+class InputRecorder:
+    """
+    입력 이벤트 녹화기
+
+    InputHandler.start_input_monitoring에 콜백을 연결하여 이벤트를 녹화합니다.
+    리스너 스레드에서는 (시각, 종류, x, y, 값) 튜플만 추가하고,
+    stop() 시점에 한 번에 RecordedEventStream으로 컴파일합니다.
+    """
+
+    def __init__(
+        self,
+        input_handler: InputHandler | None = None,
+        record_moves: bool = False,
+        move_sample_ms: float = 10.0,
+    ) -> None:
+        """
+        InputRecorder 초기화
+
+        Args:
+            input_handler: 모니터링에 사용할 InputHandler (None이면 새로 생성)
+            record_moves: 마우스 이동 이벤트 녹화 여부 (False면 클릭/스크롤 위치만 기록)
+            move_sample_ms: 마우스 이동 이벤트 최소 간격 (밀리초, 이보다 촘촘한 이동은 생략)
+        """
+        self.input_handler = input_handler or InputHandler()
+        self.record_moves = record_moves
+        self.move_sample_ns = int(max(0.0, move_sample_ms) * 1_000_000)
+        self._raw_events: list[tuple[int, int, int, int, Any]] = []
+        self._started_ns = 0
+        self._last_move_ns = 0
+        self._lock = threading.Lock()
+        self.is_recording = False
+
+    def _record(self, kind: int, x: int = 0, y: int = 0, value: Any = 0) -> None:
+        """리스너 스레드에서 호출되는 원시 이벤트 기록 함수"""
+        self._raw_events.append((time.perf_counter_ns(), kind, x, y, value))
+
+    def _on_move(self, x: int, y: int) -> None:
+        now_ns = time.perf_counter_ns()
+        if now_ns - self._last_move_ns < self.move_sample_ns:
+            return
+        self._last_move_ns = now_ns
+        self._raw_events.append((now_ns, EVENT_MOVE, int(x), int(y), 0))
+
+    def _on_click(self, x: int, y: int, button: Any, pressed: bool) -> None:
+        code = _BUTTON_CODES.get(getattr(button, "name", ""), 1)
+        self._record(EVENT_MOUSE_DOWN if pressed else EVENT_MOUSE_UP, int(x), int(y), code)
+
+    def _on_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
+        self._record(EVENT_SCROLL, int(x), int(y), int(dy))
+
+    def _on_press(self, key: Any) -> None:
+        self._record(EVENT_KEY_DOWN, value=_key_to_name(key))
+
+    def _on_release(self, key: Any) -> None:
+        self._record(EVENT_KEY_UP, value=_key_to_name(key))
+
+    def start(self) -> None:
+        """녹화를 시작합니다. 이미 녹화 중이면 기존 기록을 버리고 다시 시작합니다."""
+        with self._lock:
+            if self.is_recording:
+                self.input_handler.stop_input_monitoring()
+            self._raw_events = []
+            self._started_ns = time.perf_counter_ns()
+            self._last_move_ns = 0
+            self.input_handler.start_input_monitoring(
+                on_click=self._on_click,
+                on_scroll=self._on_scroll,
+                on_move=self._on_move if self.record_moves else None,
+                on_press=self._on_press,
+                on_release=self._on_release,
+            )
+            self.is_recording = True
+        logger.info(f"[InputRecorder] 녹화 시작 - 마우스 이동 기록: {self.record_moves}")
+
+    def stop(self) -> RecordedEventStream:
+        """
+        녹화를 중지하고 기록된 이벤트를 스트림으로 컴파일합니다.
+
+        Returns:
+            컴파일된 RecordedEventStream
+        """
+        with self._lock:
+            if self.is_recording:
+                self.input_handler.stop_input_monitoring()
+                self.is_recording = False
+            raw_events, self._raw_events = self._raw_events, []
+
+        stream = compile_event_stream(raw_events, self._started_ns)
+        logger.info(f"[InputRecorder] 녹화 종료 - 이벤트 {len(stream)}개, 길이 {stream.duration_us / 1000:.1f}ms")
+        return stream
+
+
+def compile_event_stream(raw_events: list[tuple[int, int, int, int, Any]], started_ns: int) -> RecordedEventStream:
+    """
+    원시 이벤트 목록을 RecordedEventStream으로 컴파일합니다.
+
+    Args:
+        raw_events: (perf_counter_ns, 종류, x, y, 값) 튜플 목록
+        started_ns: 녹화 시작 시각 (perf_counter_ns)
+
+    Returns:
+        RecordedEventStream
+    """
+    stream = RecordedEventStream()
+    key_indices: dict[str, int] = {}
+    # 리스너가 두 개(마우스/키보드) 스레드이므로 시각 기준으로 정렬
+    for timestamp_ns, kind, x, y, value in sorted(raw_events, key=lambda event: event[0]):
+        time_us = max(0, (timestamp_ns - started_ns) // 1000)
+        if kind in (EVENT_KEY_DOWN, EVENT_KEY_UP):
+            index = key_indices.get(value)
+            if index is None:
+                index = key_indices[value] = len(stream.keys)
+                stream.keys.append(value)
+            stream.append(kind, time_us, 0, 0, index)
+        else:
+            stream.append(kind, time_us, x, y, int(value))
+    return stream
+
+
+def replay_event_stream(
+    stream: RecordedEventStream,
+    speed: float = 1.0,
+    stop_event: threading.Event | None = None,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> dict[str, Any]:
+    """
+    이벤트 스트림을 녹화 당시의 타임라인대로 재생합니다. (블로킹 함수, 스레드에서 호출 권장)
+
+    대기 시간이 길면 sleep으로 쉬고, 목표 시각 직전 2ms는 busy-wait으로 맞춰
+    OS 타이머 해상도와 관계없이 각 이벤트를 목표 시각에 가깝게 발생시킵니다.
+
+    Args:
+        stream: 재생할 이벤트 스트림
+        speed: 재생 속도 배율 (2.0이면 2배 빠르게)
+        stop_event: 설정되면 재생을 중단하는 이벤트
+        clock: 나노초 단위 시계 함수
+
+    Returns:
+        재생 통계 딕셔너리 (dispatched, stopped, duration_ms, max_lateness_us, mean_lateness_us)
+    """
+    if speed <= 0:
+        raise ValueError("재생 속도는 0보다 커야 합니다.")
+
+    mouse = MouseController()
+    keyboard = KeyboardController()
+    # 키 객체는 재생 전에 한 번만 변환
+    keys = [_name_to_key(name) for name in stream.keys]
+
+    kinds, times_us, xs, ys, data = stream.kinds, stream.times_us, stream.xs, stream.ys, stream.data
+    scale_ns = 1000.0 / speed
+    total_lateness_ns = 0
+    max_lateness_ns = 0
+    dispatched = 0
+    stopped = False
+
+    start_ns = clock()
+    for i in range(len(kinds)):
+        if stop_event is not None and stop_event.is_set():
+            stopped = True
+            break
+
+        target_ns = start_ns + int(times_us[i] * scale_ns)
+        remaining_ns = target_ns - clock()
+        if remaining_ns > _SPIN_THRESHOLD_NS:
+            time.sleep((remaining_ns - _SPIN_THRESHOLD_NS) / 1_000_000_000)
+        while clock() < target_ns:
+            pass
+
+        lateness_ns = clock() - target_ns
+        total_lateness_ns += lateness_ns
+        if lateness_ns > max_lateness_ns:
+            max_lateness_ns = lateness_ns
+
+        kind = kinds[i]
+        if kind == EVENT_MOVE:
+            mouse.position = (xs[i], ys[i])
+        elif kind == EVENT_MOUSE_DOWN:
+            mouse.position = (xs[i], ys[i])
+            mouse.press(_BUTTONS_BY_CODE.get(data[i], Button.left))
+        elif kind == EVENT_MOUSE_UP:
+            mouse.position = (xs[i], ys[i])
+            mouse.release(_BUTTONS_BY_CODE.get(data[i], Button.left))
+        elif kind == EVENT_SCROLL:
+            mouse.position = (xs[i], ys[i])
+            mouse.scroll(0, data[i])
+        elif kind == EVENT_KEY_DOWN:
+            keyboard.press(keys[data[i]])
+        elif kind == EVENT_KEY_UP:
+            keyboard.release(keys[data[i]])
+        dispatched += 1
+
+    return {
+        "dispatched": dispatched,
+        "stopped": stopped,
+        "duration_ms": round((clock() - start_ns) / 1_000_000, 3),
+        "max_lateness_us": round(max_lateness_ns / 1000, 1),
+        "mean_lateness_us": round(total_lateness_ns / dispatched / 1000, 1) if dispatched else 0.0,
+    }
+
+
+# 전역 녹화기 (API에서 사용)
+_recorder: InputRecorder | None = None
+
+
+def get_input_recorder() -> InputRecorder:
+    """전역 InputRecorder 인스턴스를 반환합니다."""
+    global _recorder
+    if _recorder is None:
+        _recorder = InputRecorder()
+    return _recorder
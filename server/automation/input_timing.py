@@ -0,0 +1,127 @@
+"""
+입력 타이밍 정책 모듈
+
+마우스/키보드 입력 사이에 넣을 지연 시간을 액션 종류별로 정의합니다.
+pyautogui의 전역 PAUSE(모든 호출 뒤 고정 지연) 대신 이 정책을 사용하여
+기본적으로는 인위적인 지연 없이 입력하고, 필요할 때만 사람처럼 보이는 지연을 추가합니다.
+
+정책 종류:
+- fast: 인위적인 지연 없음 (기본값)
+- humanized: 액션/글자 사이에 무작위 편차(jitter)가 있는 짧은 지연 추가
+"""
+
+import random
+
+# 정책 모드 이름
+TIMING_MODE_FAST = "fast"
+TIMING_MODE_HUMANIZED = "humanized"
+
+
+class InputTimingPolicy:
+    """
+    입력 액션별 지연 시간 정책
+
+    모든 시간 단위는 초입니다. jitter는 각 지연에 곱해지는 편차 비율로,
+    0.3이면 지연 시간이 ±30% 범위에서 무작위로 달라집니다.
+    """
+
+    __slots__ = ("action_delay", "click_interval", "drag_duration", "jitter", "key_interval", "move_duration", "name")
+
+    def __init__(
+        self,
+        name: str,
+        action_delay: float = 0.0,
+        click_interval: float = 0.0,
+        key_interval: float = 0.0,
+        move_duration: float = 0.0,
+        drag_duration: float = 0.2,
+        jitter: float = 0.0,
+    ) -> None:
+        """
+        InputTimingPolicy 초기화
+
+        Args:
+            name: 정책 이름
+            action_delay: 각 액션이 끝난 뒤 대기 시간
+            click_interval: 연속 클릭(더블 클릭 등) 사이 간격
+            key_interval: 글자/키 입력 사이 간격
+            move_duration: 마우스 이동에 걸리는 시간
+            drag_duration: 드래그에 걸리는 시간 (0이면 일부 앱에서 드래그가 인식되지 않으므로 기본값 0.2)
+            jitter: 지연 시간 편차 비율 (0.0 ~ 1.0)
+        """
+        self.name = name
+        self.action_delay = max(0.0, float(action_delay))
+        self.click_interval = max(0.0, float(click_interval))
+        self.key_interval = max(0.0, float(key_interval))
+        self.move_duration = max(0.0, float(move_duration))
+        self.drag_duration = max(0.0, float(drag_duration))
+        self.jitter = min(max(0.0, float(jitter)), 1.0)
+
+    @property
+    def is_instant(self) -> bool:
+        """액션 사이에 인위적인 지연이 전혀 없는 정책인지 여부"""
+        return self.action_delay == 0.0 and self.key_interval == 0.0
+
+    def vary(self, seconds: float) -> float:
+        """
+        jitter를 적용한 지연 시간을 반환합니다.
+
+        Args:
+            seconds: 기준 지연 시간
+
+        Returns:
+            편차가 적용된 지연 시간 (0 이상)
+        """
+        if seconds <= 0.0 or self.jitter == 0.0:
+            return seconds
+        return max(0.0, seconds * random.uniform(1.0 - self.jitter, 1.0 + self.jitter))
+
+    def to_dict(self) -> dict[str, float | str]:
+        """정책을 딕셔너리로 변환"""
+        return {
+            "name": self.name,
+            "action_delay": self.action_delay,
+            "click_interval": self.click_interval,
+            "key_interval": self.key_interval,
+            "move_duration": self.move_duration,
+            "drag_duration": self.drag_duration,
+            "jitter": self.jitter,
+        }
+
+
+# 기본 정책: 인위적인 지연 없음
+FAST_POLICY = InputTimingPolicy(name=TIMING_MODE_FAST)
+
+# 사람처럼 보이는 입력이 필요한 경우(봇 감지, 입력 속도가 느린 앱 등)에 사용하는 정책
+HUMANIZED_POLICY = InputTimingPolicy(
+    name=TIMING_MODE_HUMANIZED,
+    action_delay=0.08,
+    click_interval=0.1,
+    key_interval=0.05,
+    move_duration=0.25,
+    drag_duration=0.5,
+    jitter=0.4,
+)
+
+_POLICIES: dict[str, InputTimingPolicy] = {
+    TIMING_MODE_FAST: FAST_POLICY,
+    TIMING_MODE_HUMANIZED: HUMANIZED_POLICY,
+}
+
+
+def get_timing_policy(mode: str | InputTimingPolicy | None = None) -> InputTimingPolicy:
+    """
+    모드 이름으로 타이밍 정책을 가져옵니다.
+
+    Args:
+        mode: 정책 이름("fast"/"humanized") 또는 InputTimingPolicy 인스턴스.
+              None이거나 알 수 없는 이름이면 fast 정책을 반환합니다.
+
+    Returns:
+        InputTimingPolicy 인스턴스
+    """
+    if isinstance(mode, InputTimingPolicy):
+        return mode
+    if not mode:
+        return FAST_POLICY
+    return _POLICIES.get(str(mode).lower(), FAST_POLICY)
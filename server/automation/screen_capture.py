@@ -1,3 +1,4 @@
+import threading
 import time
 
 import cv2
@@ -5,8 +6,9 @@ import numpy as np
 import pyautogui
 
 from log import log_manager
+from monitoring import tracer
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ScreenCapture:
@@ -26,14 +28,16 @@ class ScreenCapture:
         Returns:
             캡처된 이미지 (numpy array)
         """
-        if region:
-            screenshot = pyautogui.screenshot(region=region)
-        else:
-            screenshot = pyautogui.screenshot()
+        # 실행 추적: 화면 캡처 구간 (노드 실행 중일 때만 기록)
+        with tracer.span("screen_capture"):
+            if region:
+                screenshot = pyautogui.screenshot(region=region)
+            else:
+                screenshot = pyautogui.screenshot()
 
-        # PIL Image를 OpenCV 형식으로 변환
-        img_array = np.array(screenshot)
-        return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+            # PIL Image를 OpenCV 형식으로 변환
+            img_array = np.array(screenshot)
+            return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
 
     def find_template(
         self,
@@ -42,6 +46,7 @@ class ScreenCapture:
         max_attempts: int | None = None,
         delay: float = 0.5,
         timeout: float | None = None,
+        stop_event: threading.Event | None = None,
     ) -> tuple[int, int, int, int] | None:
         """
         템플릿 매칭을 통해 특정 이미지를 찾습니다.
@@ -55,6 +60,7 @@ class ScreenCapture:
             timeout: 타임아웃 시간 (초). 이 값이 지정되면 max_attempts는 무시되고
                      timeout과 delay를 기반으로 최대 시도 횟수를 계산합니다.
                      예: timeout=30, delay=0.5이면 최대 60회 시도 (30초 / 0.5초)
+            stop_event: 설정되면 남은 시도를 중단하고 None 반환 (별도 스레드에서 실행 중인 검색을 취소할 때 사용)
 
         Returns:
             찾은 위치 (x, y, width, height) 또는 None
@@ -70,22 +76,25 @@ class ScreenCapture:
             calculated_max_attempts = max(1, int(timeout / delay)) if delay > 0 else 1
             max_attempts = calculated_max_attempts
             logger.debug(
-                f"[ScreenCapture] 타임아웃 기반 시도 횟수 계산: timeout={timeout}초, delay={delay}초, max_attempts={max_attempts}"
+                "[ScreenCapture] 타임아웃 기반 시도 횟수 계산: timeout=%s초, delay=%s초, max_attempts=%s",
+                timeout,
+                delay,
+                max_attempts,
             )
         elif max_attempts is None:
             # timeout도 없고 max_attempts도 없는 경우: 기본값 5회 사용
             max_attempts = 5
-            logger.debug(f"[ScreenCapture] 기본 max_attempts 사용: {max_attempts}")
+            logger.debug("[ScreenCapture] 기본 max_attempts 사용: %s", max_attempts)
         else:
             # max_attempts가 명시적으로 지정된 경우 그대로 사용
-            logger.debug(f"[ScreenCapture] 명시적 max_attempts 사용: {max_attempts}")
+            logger.debug("[ScreenCapture] 명시적 max_attempts 사용: %s", max_attempts)
 
         # 경로 정규화 (Windows 경로 문제 해결)
         template_path = os.path.normpath(template_path)
 
         # 템플릿 이미지 로드 (한글 경로 지원)
         if not os.path.exists(template_path):
-            logger.error(f"이미지 파일을 찾을 수 없습니다: {template_path}")
+            logger.error("이미지 파일을 찾을 수 없습니다: %s", template_path)
             return None
 
         # OpenCV의 cv2.imread()는 한글 경로를 제대로 처리하지 못하므로
@@ -102,49 +111,68 @@ class ScreenCapture:
             template = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
 
             if template is None:
-                logger.error(f"이미지를 디코딩할 수 없습니다: {template_path}")
+                logger.error("이미지를 디코딩할 수 없습니다: %s", template_path)
                 return None
         except Exception as e:
-            logger.error(f"이미지 로드 중 오류 발생: {template_path}, 에러: {e}")
+            logger.error("이미지 로드 중 오류 발생: %s, 에러: %s", template_path, e)
             return None
 
-        logger.debug(f"이미지 로드 성공: {template_path}, 크기: {template.shape}")
+        logger.debug("이미지 로드 성공: %s, 크기: %s", template_path, template.shape)
 
         # 여러 번 시도하여 이미지 찾기
         for attempt in range(1, max_attempts + 1):
-            logger.debug(f"이미지 찾기 시도 {attempt}/{max_attempts}")
+            if stop_event is not None and stop_event.is_set():
+                logger.debug("[ScreenCapture] 이미지 찾기 중단 요청으로 남은 시도를 건너뜀")
+                return None
+
+            logger.debug("이미지 찾기 시도 %s/%s", attempt, max_attempts)
 
             # 화면 캡처
             screen = self.capture_screen()
-            logger.debug(f"화면 캡처 완료, 크기: {screen.shape}")
+            logger.debug("화면 캡처 완료, 크기: %s", screen.shape)
 
             # 템플릿이 화면보다 큰 경우 처리
             if template.shape[0] > screen.shape[0] or template.shape[1] > screen.shape[1]:
-                logger.warning(f"템플릿 이미지가 화면보다 큽니다. 템플릿: {template.shape}, 화면: {screen.shape}")
+                logger.warning("템플릿 이미지가 화면보다 큽니다. 템플릿: %s, 화면: %s", template.shape, screen.shape)
                 return None
 
             # 템플릿 매칭
-            result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-            _min_val, max_val, _min_loc, max_loc = cv2.minMaxLoc(result)
+            with tracer.span("template_match", attempt=attempt) as match_span:
+                result = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+                _min_val, max_val, _min_loc, max_loc = cv2.minMaxLoc(result)
+                match_span.set("score", round(float(max_val), 4))
 
-            logger.debug(f"이미지 매칭 점수: {max_val:.4f} (임계값: {threshold})")
+            logger.debug("이미지 매칭 점수: %.4f (임계값: %s)", max_val, threshold)
 
             if max_val >= threshold:
                 h, w = template.shape[:2]
                 logger.debug(
-                    f"이미지 찾기 성공! 위치: ({max_loc[0]}, {max_loc[1]}), 크기: {w}x{h}, 시도 횟수: {attempt}"
+                    "이미지 찾기 성공! 위치: (%s, %s), 크기: %sx%s, 시도 횟수: %s",
+                    max_loc[0],
+                    max_loc[1],
+                    w,
+                    h,
+                    attempt,
                 )
                 return (max_loc[0], max_loc[1], w, h)
             logger.debug(
-                f"이미지 찾기 실패 (시도 {attempt}/{max_attempts}): 매칭 점수 {max_val:.4f}가 임계값 {threshold}보다 낮습니다."
+                "이미지 찾기 실패 (시도 %s/%s): 매칭 점수 %.4f가 임계값 %s보다 낮습니다.",
+                attempt,
+                max_attempts,
+                max_val,
+                threshold,
             )
 
             # 마지막 시도가 아니면 딜레이
             if attempt < max_attempts:
-                logger.debug(f"{delay}초 대기 후 재시도...")
-                time.sleep(delay)
-
-        logger.debug(f"모든 시도 실패: {max_attempts}번 시도했지만 이미지를 찾을 수 없습니다.")
+                logger.debug("%s초 대기 후 재시도...", delay)
+                # 중단 요청이 오면 대기 중에도 바로 깨어나도록 stop_event로 대기
+                if stop_event is not None:
+                    stop_event.wait(delay)
+                else:
+                    time.sleep(delay)
+
+        logger.debug("모든 시도 실패: %s번 시도했지만 이미지를 찾을 수 없습니다.", max_attempts)
         return None
 
     def find_color_region(self, color: tuple[int, int, int], tolerance: int = 10) -> list:
@@ -194,5 +222,5 @@ class ScreenCapture:
             cv2.imwrite(filename, screenshot)
             return True
         except Exception as e:
-            logger.error(f"스크린샷 저장 실패: {e}")
+            logger.error("스크린샷 저장 실패: %s", e)
             return False
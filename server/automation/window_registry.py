@@ -0,0 +1,353 @@
+"""
+창/프로세스 레지스트리
+화면에 보이는 창 목록을 hwnd, 프로세스 ID, 프로세스 이름, 창 제목으로 색인하여 캐시합니다.
+
+매 요청마다 모든 창을 열거하고 창마다 psutil.Process를 새로 만드는 대신,
+TTL이 지난 경우에만 창 목록을 다시 열거하고 새로 나타난 프로세스만 psutil로 조회합니다.
+창 열거 코드는 WindowBackend 인터페이스 뒤에 있어 FakeWindowBackend로 대체할 수 있습니다.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+import threading
+import time
+from typing import Any
+
+from log import log_manager
+
+logger = log_manager.get_logger(__name__)
+
+# 창 목록 캐시 유효 시간 (초)
+DEFAULT_WINDOW_TTL_SECONDS = 2.0
+
+
+class WindowInfo:
+    """창 하나의 정보"""
+
+    __slots__ = ("exe_path", "hwnd", "pid", "process_name", "title")
+
+    def __init__(self, hwnd: int, pid: int, title: str, process_name: str, exe_path: str | None) -> None:
+        self.hwnd = hwnd
+        self.pid = pid
+        self.title = title
+        self.process_name = process_name
+        self.exe_path = exe_path
+
+    def to_dict(self) -> dict[str, Any]:
+        """창 정보를 딕셔너리로 변환"""
+        return {
+            "hwnd": self.hwnd,
+            "process_id": self.pid,
+            "title": self.title,
+            "process_name": self.process_name,
+            "exe_path": self.exe_path,
+        }
+
+
+class WindowBackend(ABC):
+    """창/프로세스 열거 백엔드 인터페이스"""
+
+    @abstractmethod
+    def enum_windows(self) -> list[tuple[int, int, str]]:
+        """
+        화면에 보이고 제목이 있는 창 목록을 반환합니다.
+
+        Returns:
+            (hwnd, pid, title) 튜플 목록
+        """
+
+    @abstractmethod
+    def get_process_info(self, pids: Iterable[int]) -> dict[int, tuple[str, str | None]]:
+        """
+        프로세스 정보를 조회합니다. 종료되었거나 접근할 수 없는 프로세스는 결과에서 제외됩니다.
+
+        Args:
+            pids: 조회할 프로세스 ID 목록
+
+        Returns:
+            {pid: (process_name, exe_path)} 딕셔너리
+        """
+
+    @abstractmethod
+    def is_window(self, hwnd: int) -> bool:
+        """hwnd가 아직 유효한 창인지 확인합니다."""
+
+
+class Win32WindowBackend(WindowBackend):
+    """win32gui/psutil 기반 창 열거 백엔드 (Windows 전용)"""
+
+    def __init__(self) -> None:
+        """
+        Raises:
+            RuntimeError: pywin32 또는 psutil이 설치되어 있지 않은 경우
+        """
+        try:
+            import psutil
+            import win32gui
+            import win32process
+        except ImportError as e:
+            raise RuntimeError("Windows 전용 기능입니다. pywin32와 psutil 패키지가 필요합니다.") from e
+
+        self._psutil = psutil
+        self._win32gui = win32gui
+        self._win32process = win32process
+
+    def enum_windows(self) -> list[tuple[int, int, str]]:
+        win32gui = self._win32gui
+        win32process = self._win32process
+        windows: list[tuple[int, int, str]] = []
+
+        def enum_window_callback(hwnd: int, extra: Any) -> None:
+            if not win32gui.IsWindowVisible(hwnd):
+                return
+            title = win32gui.GetWindowText(hwnd)
+            # 빈 창 제목 제외
+            if not title:
+                return
+            try:
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            except Exception:
+                return
+            windows.append((hwnd, pid, title))
+
+        win32gui.EnumWindows(enum_window_callback, None)
+        return windows
+
+    def get_process_info(self, pids: Iterable[int]) -> dict[int, tuple[str, str | None]]:
+        psutil = self._psutil
+        info: dict[int, tuple[str, str | None]] = {}
+        for pid in pids:
+            try:
+                proc = psutil.Process(pid)
+                # oneshot: 프로세스 정보를 한 번의 시스템 호출로 묶어서 조회
+                with proc.oneshot():
+                    name = proc.name()
+                    try:
+                        exe_path = proc.exe()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        exe_path = None
+                info[pid] = (name, exe_path)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # 프로세스가 종료되었거나 접근 권한이 없는 경우 무시
+                continue
+        return info
+
+    def is_window(self, hwnd: int) -> bool:
+        try:
+            return bool(self._win32gui.IsWindow(hwnd))
+        except Exception:
+            return False
+
+
+class FakeWindowBackend(WindowBackend):
+    """
+    테스트용 가짜 백엔드
+
+    windows/processes를 직접 수정하여 창이 생기거나 사라지는 상황을 흉내낼 수 있습니다.
+    process_lookups에는 get_process_info로 조회된 pid가 순서대로 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        windows: list[tuple[int, int, str]] | None = None,
+        processes: dict[int, tuple[str, str | None]] | None = None,
+    ) -> None:
+        self.windows: list[tuple[int, int, str]] = list(windows or [])
+        self.processes: dict[int, tuple[str, str | None]] = dict(processes or {})
+        self.enum_calls = 0
+        self.process_lookups: list[int] = []
+
+    def enum_windows(self) -> list[tuple[int, int, str]]:
+        self.enum_calls += 1
+        return list(self.windows)
+
+    def get_process_info(self, pids: Iterable[int]) -> dict[int, tuple[str, str | None]]:
+        info: dict[int, tuple[str, str | None]] = {}
+        for pid in pids:
+            self.process_lookups.append(pid)
+            if pid in self.processes:
+                info[pid] = self.processes[pid]
+        return info
+
+    def is_window(self, hwnd: int) -> bool:
+        return any(window[0] == hwnd for window in self.windows)
+
+
+class WindowRegistry:
+    """
+    창/프로세스 레지스트리
+
+    창 목록 스냅샷을 hwnd, pid, 프로세스 이름(소문자), 창 제목으로 색인합니다.
+    TTL 안에서는 캐시된 스냅샷을 그대로 사용하고, 갱신 시에는 새로 나타난 pid만
+    백엔드에 프로세스 정보를 요청합니다 (pid별 정보는 프로세스가 살아있는 동안 재사용).
+    """
+
+    def __init__(self, backend: WindowBackend, ttl: float = DEFAULT_WINDOW_TTL_SECONDS) -> None:
+        """
+        WindowRegistry 초기화
+
+        Args:
+            backend: 창 열거 백엔드
+            ttl: 스냅샷 유효 시간 (초)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshed_at: float | None = None
+        self._process_cache: dict[int, tuple[str, str | None]] = {}
+        self._by_hwnd: dict[int, WindowInfo] = {}
+        self._by_pid: dict[int, list[WindowInfo]] = {}
+        self._by_name: dict[str, list[WindowInfo]] = {}
+        self._by_title: dict[str, list[WindowInfo]] = {}
+
+    def _is_fresh(self) -> bool:
+        return self._refreshed_at is not None and (time.monotonic() - self._refreshed_at) < self.ttl
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        스냅샷을 갱신합니다. TTL 안이면 force=True일 때만 갱신합니다.
+
+        Args:
+            force: TTL과 관계없이 강제로 갱신할지 여부
+        """
+        with self._lock:
+            if not force and self._is_fresh():
+                return
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """창 목록을 다시 열거하고 색인을 재구성합니다. (락을 잡은 상태에서 호출)"""
+        windows = self.backend.enum_windows()
+
+        # 새로 나타난 pid만 프로세스 정보 조회
+        live_pids = {pid for _, pid, _ in windows}
+        new_pids = live_pids.difference(self._process_cache)
+        if new_pids:
+            self._process_cache.update(self.backend.get_process_info(new_pids))
+        # 사라진 pid는 캐시에서 제거 (pid 재사용 대비)
+        for pid in set(self._process_cache).difference(live_pids):
+            del self._process_cache[pid]
+
+        by_hwnd: dict[int, WindowInfo] = {}
+        by_pid: dict[int, list[WindowInfo]] = {}
+        by_name: dict[str, list[WindowInfo]] = {}
+        by_title: dict[str, list[WindowInfo]] = {}
+        previous = self._by_hwnd
+
+        for hwnd, pid, title in windows:
+            process = self._process_cache.get(pid)
+            if process is None:
+                # 종료되었거나 접근할 수 없는 프로세스의 창은 제외
+                continue
+            info = previous.get(hwnd)
+            if info is not None and info.pid == pid:
+                # 기존 항목 재사용 (제목만 바뀌었을 수 있음)
+                info.title = title
+            else:
+                info = WindowInfo(hwnd, pid, title, process[0], process[1])
+            by_hwnd[hwnd] = info
+            by_pid.setdefault(pid, []).append(info)
+            by_name.setdefault(info.process_name.lower(), []).append(info)
+            by_title.setdefault(title, []).append(info)
+
+        self._by_hwnd = by_hwnd
+        self._by_pid = by_pid
+        self._by_name = by_name
+        self._by_title = by_title
+        self._refreshed_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """스냅샷을 무효화하여 다음 조회 시 갱신되도록 합니다."""
+        with self._lock:
+            self._refreshed_at = None
+
+    def get_by_hwnd(self, hwnd: int) -> WindowInfo | None:
+        """hwnd로 창을 찾습니다. 캐시된 창이 이미 닫혔으면 강제 갱신 후 다시 찾습니다."""
+        self.refresh()
+        info = self._by_hwnd.get(hwnd)
+        if info is not None and not self.backend.is_window(hwnd):
+            self.refresh(force=True)
+            info = self._by_hwnd.get(hwnd)
+        return info
+
+    def find_by_pid(self, pid: int) -> list[WindowInfo]:
+        """프로세스 ID로 창 목록을 찾습니다."""
+        self.refresh()
+        return list(self._by_pid.get(pid, ()))
+
+    def find_by_process_name(self, process_name: str) -> list[WindowInfo]:
+        """프로세스 이름(대소문자 무시)으로 창 목록을 찾습니다."""
+        self.refresh()
+        return list(self._by_name.get(process_name.lower(), ()))
+
+    def find_by_title(self, title: str, exact: bool = False) -> list[WindowInfo]:
+        """
+        창 제목으로 창 목록을 찾습니다.
+
+        Args:
+            title: 찾을 창 제목
+            exact: True면 정확히 일치, False면 부분 일치 (대소문자 무시, 정확히 일치하는 창이 앞에 옴)
+
+        Returns:
+            WindowInfo 목록
+        """
+        self.refresh()
+        exact_matches = list(self._by_title.get(title, ()))
+        if exact:
+            return exact_matches
+        needle = title.lower()
+        partial = [
+            info
+            for window_title, infos in self._by_title.items()
+            if window_title != title and needle in window_title.lower()
+            for info in infos
+        ]
+        return exact_matches + partial
+
+    def list_processes(self) -> list[dict[str, Any]]:
+        """
+        창이 있는 프로세스 목록을 프로세스 이름 기준으로 묶어 반환합니다.
+        (/api/processes/list 응답 형식)
+        """
+        self.refresh()
+        grouped: dict[str, dict[str, Any]] = {}
+        for info in self._by_hwnd.values():
+            entry = grouped.get(info.process_name)
+            if entry is None:
+                entry = grouped[info.process_name] = {
+                    "process_name": info.process_name,
+                    "process_id": info.pid,
+                    "exe_path": info.exe_path,
+                    "window_count": 0,
+                    "windows": [],
+                    "hwnd": info.hwnd,  # 포커스용 핸들 (첫 번째 창)
+                }
+            entry["windows"].append({"title": info.title, "hwnd": info.hwnd})
+            entry["window_count"] += 1
+
+        processes = list(grouped.values())
+        processes.sort(key=lambda x: x["process_name"].lower())
+        return processes
+
+
+# 전역 레지스트리 (Windows 백엔드는 처음 사용할 때 생성)
+_window_registry: WindowRegistry | None = None
+
+
+def get_window_registry() -> WindowRegistry:
+    """
+    전역 WindowRegistry 인스턴스를 반환합니다.
+
+    Raises:
+        RuntimeError: Windows 백엔드를 사용할 수 없는 경우
+    """
+    global _window_registry
+    if _window_registry is None:
+        _window_registry = WindowRegistry(Win32WindowBackend())
+    return _window_registry
+
+
+def set_window_registry(registry: WindowRegistry | None) -> None:
+    """전역 WindowRegistry를 교체합니다. (테스트에서 FakeWindowBackend를 사용할 때)"""
+    global _window_registry
+    _window_registry = registry
@@ -40,6 +40,16 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
         "is_boundary": False,
         "category": "action",
         "requires_folder_path": True,
+        # 실행 정책 기본값 (노드별 execution_policy 파라미터로 재정의 가능, nodes/node_execution_policy.py 참고)
+        # timeout 파라미터는 이미지 한 장당 검색 시간이고 노드는 폴더의 모든 이미지를 순서대로 검색하므로
+        # 전체 실행 시간이 이미지 수에 비례해 정해진 상한이 없어 기본 timeout_seconds는 두지 않음
+        # (노드별로 timeout_seconds를 지정하면 템플릿 매칭 스레드도 함께 중단됨)
+        "execution_policy": {
+            "max_attempts": 2,
+            "backoff_seconds": 1.0,
+            "jitter": 0.2,
+            "retry_on": ["exception"],
+        },
         # 노드 레벨 파라미터 (모든 상세 타입에 공통으로 사용되는 파라미터)
         "parameters": {
             "folder_path": {
@@ -140,6 +150,14 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
         "script": "processnodes/node-process-focus.js",
         "is_boundary": False,
         "category": "process",
+        # 실행 정책 기본값: 창 활성화는 일시적으로 실패하는 경우가 많아 짧은 백오프로 재시도
+        "execution_policy": {
+            "timeout_seconds": 10,
+            "max_attempts": 3,
+            "backoff_seconds": 0.3,
+            "jitter": 0.2,
+            "retry_on": ["exception", "timeout", "window_not_found"],
+        },
         # 상세 노드 타입 정의
         "detail_types": {},
         "parameters": {
@@ -189,6 +207,54 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
             },
         },
     },
+    "input-replay": {
+        "label": "입력 재생 노드",
+        "title": "입력 재생",
+        "description": "녹화된 마우스/키보드 입력을 녹화 당시의 타이밍대로 재생하는 노드입니다. 여러 개의 클릭/키 입력을 노드 하나로 실행합니다.",
+        "script": "inputnodes/node-input-replay.js",
+        "is_boundary": False,
+        "category": "action",
+        "parameters": {
+            "event_stream": {
+                "type": "string",
+                "label": "이벤트 스트림",
+                "description": "입력 녹화 API(/api/input-recorder/stop)가 반환한 event_stream JSON입니다.",
+                "default": "",
+                "required": True,
+                "placeholder": "입력 녹화 결과 JSON",
+            },
+            "speed": {
+                "type": "number",
+                "label": "재생 속도",
+                "description": "재생 속도 배율입니다. 2를 입력하면 2배 빠르게 재생합니다.",
+                "default": 1.0,
+                "required": False,
+                "min": 0.1,
+                "max": 10,
+            },
+        },
+        "input_schema": {
+            "action": {"type": "string", "description": "이전 노드 타입"},
+            "status": {"type": "string", "description": "이전 노드 실행 상태"},
+            "output": {"type": "any", "description": "이전 노드 출력 데이터"},
+        },
+        "output_schema": {
+            "action": {"type": "string", "description": "노드 타입"},
+            "status": {"type": "string", "description": "실행 상태 (completed/failed)"},
+            "output": {
+                "type": "object",
+                "description": "출력 데이터",
+                "properties": {
+                    "success": {"type": "boolean", "description": "재생 성공 여부"},
+                    "event_count": {"type": "number", "description": "스트림의 전체 이벤트 개수"},
+                    "dispatched": {"type": "number", "description": "실제로 재생된 이벤트 개수"},
+                    "duration_ms": {"type": "number", "description": "재생에 걸린 시간 (밀리초)"},
+                    "max_lateness_us": {"type": "number", "description": "목표 시각 대비 최대 지연 (마이크로초)"},
+                    "mean_lateness_us": {"type": "number", "description": "목표 시각 대비 평균 지연 (마이크로초)"},
+                },
+            },
+        },
+    },
     # === 로직 노드 (Logic Nodes) ===
     "condition": {
         "label": "조건 노드",
@@ -293,9 +359,13 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
                     "completed": {"type": "boolean", "description": "반복 완료 여부"},
                     "iterations": {
                         "type": "array",
-                        "description": "각 반복의 실행 결과",
+                        "description": "마지막 반복들의 실행 결과 (서버 반복 실행 시 최근 3회)",
                         "items": {"type": "object"},
                     },
+                    "summary": {
+                        "type": "object",
+                        "description": "반복 실행 집계 (반복 횟수, 노드별 성공/실패 횟수, 실패 정보)",
+                    },
                 },
             },
         },
@@ -308,6 +378,14 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
         "script": "excelnodes/node-excel-open.js",
         "is_boundary": False,
         "category": "action",
+        # 실행 정책 기본값: 엑셀 COM 서버 기동이 늦어 실패하는 경우 1회 재시도
+        # (Workbooks.Open 등 COM 호출은 블로킹이고 다른 스레드로 옮길 수 없어 취소할 수 없으므로 타임아웃은 두지 않음,
+        #  준비 대기는 open_excel_file의 max_wait_time으로 제한)
+        "execution_policy": {
+            "max_attempts": 2,
+            "backoff_seconds": 2.0,
+            "retry_on": ["exception", "win32com_error"],
+        },
         "parameters": {
             "file_path": {
                 "type": "string",
@@ -401,6 +479,99 @@ NODES_CONFIG: dict[str, dict[str, Any]] = {
             },
         },
     },
+    "excel-read": {
+        "label": "엑셀 읽기 노드",
+        "title": "엑셀 읽기",
+        "description": "엑셀 열기 노드로 열린 워크북의 행을 청크 단위로 읽는 노드입니다. 실행될 때마다 다음 청크를 출력하므로 반복 노드와 함께 사용하면 시트 전체를 메모리에 올리지 않고 처리할 수 있습니다. Windows 환경에서만 사용 가능합니다.",
+        "script": "excelnodes/node-excel-read.js",
+        "is_boundary": False,
+        "category": "action",
+        "parameters": {
+            "execution_id": {
+                "type": "string",
+                "label": "엑셀 실행 ID",
+                "description": "엑셀 열기 노드의 출력에서 execution_id를 선택하거나 직접 입력하세요.",
+                "default": "outdata.output.execution_id",
+                "required": True,
+                "placeholder": "이전 노드 출력에서 선택하거나 직접 입력",
+                "source": "previous_output",
+            },
+            "sheet_name": {
+                "type": "string",
+                "label": "시트 이름",
+                "description": "읽을 시트의 이름입니다. 비워두면 시트 인덱스 또는 활성 시트를 사용합니다.",
+                "default": "",
+                "required": False,
+                "placeholder": "예: Sheet1",
+            },
+            "sheet_index": {
+                "type": "number",
+                "label": "시트 인덱스",
+                "description": "읽을 시트의 인덱스입니다 (1부터 시작).",
+                "default": None,
+                "required": False,
+                "placeholder": "예: 1",
+                "min": 1,
+            },
+            "chunk_size": {
+                "type": "number",
+                "label": "청크 크기",
+                "description": "노드가 한 번 실행될 때 읽어올 행 개수입니다.",
+                "default": 100,
+                "required": False,
+                "min": 1,
+                "max": 10000,
+            },
+            "has_header": {
+                "type": "boolean",
+                "label": "첫 행을 헤더로 사용",
+                "description": "첫 행을 헤더로 사용하면 각 행이 {헤더: 값} 형태의 객체로 출력됩니다.",
+                "default": True,
+                "required": False,
+            },
+            "start_row": {
+                "type": "number",
+                "label": "시작 행",
+                "description": "읽기를 시작할 행 번호입니다 (데이터가 있는 첫 행이 1, 헤더 행 포함).",
+                "default": 1,
+                "required": False,
+                "min": 1,
+            },
+            "restart": {
+                "type": "boolean",
+                "label": "처음부터 다시 읽기",
+                "description": "이전에 읽던 위치를 무시하고 처음부터 다시 읽습니다.",
+                "default": False,
+                "required": False,
+            },
+        },
+        "input_schema": {
+            "action": {"type": "string", "description": "이전 노드 타입"},
+            "status": {"type": "string", "description": "이전 노드 실행 상태"},
+            "output": {"type": "any", "description": "이전 노드 출력 데이터"},
+        },
+        "output_schema": {
+            "action": {"type": "string", "description": "노드 타입"},
+            "status": {"type": "string", "description": "실행 상태 (completed/failed)"},
+            "output": {
+                "type": "object",
+                "description": "출력 데이터",
+                "properties": {
+                    "success": {"type": "boolean", "description": "성공 여부"},
+                    "execution_id": {"type": "string", "description": "엑셀 실행 ID"},
+                    "stream_id": {"type": "string", "description": "행 스트림 ID"},
+                    "sheet_name": {"type": "string", "description": "읽은 시트 이름"},
+                    "headers": {"type": "array", "description": "헤더 목록 (헤더를 사용하지 않으면 null)"},
+                    "rows": {"type": "array", "description": "현재 청크의 행 목록"},
+                    "row_count": {"type": "number", "description": "현재 청크의 행 개수"},
+                    "row_start": {"type": "number", "description": "현재 청크의 첫 행 번호"},
+                    "row_end": {"type": "number", "description": "현재 청크의 마지막 행 번호"},
+                    "chunk_index": {"type": "number", "description": "청크 순번 (0부터 시작)"},
+                    "has_more": {"type": "boolean", "description": "남은 행이 있는지 여부"},
+                },
+            },
+        },
+    },
     "excel-close": {
         "label": "엑셀 닫기 노드",
         "title": "엑셀 닫기",
@@ -30,10 +30,57 @@ class Settings:
     AUTO_CLICK_DELAY: float = float(os.getenv("AUTO_CLICK_DELAY", "0.5"))
     AUTO_MOVE_DELAY: float = float(os.getenv("AUTO_MOVE_DELAY", "1.0"))
     SCREENSHOT_INTERVAL: float = float(os.getenv("SCREENSHOT_INTERVAL", "0.1"))
+    # 입력 타이밍 정책: fast(인위적인 지연 없음) / humanized(사람처럼 보이는 지연 추가)
+    INPUT_TIMING_MODE: str = os.getenv("INPUT_TIMING_MODE", "fast").lower()
 
     # 로그 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.getenv("LOG_DIR", "log/logs")
+    # 파일 로그 포맷: plain(텍스트) / json(한 줄에 JSON 객체 하나)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "plain").lower()
+    # 로그 파일 로테이션 기준 크기(바이트)와 보관할 백업 파일 개수
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+    # 백그라운드 스레드(QueueListener)로 로그 출력 (False면 호출 스레드에서 바로 출력)
+    LOG_QUEUE: bool = os.getenv("LOG_QUEUE", "True").lower() == "true"
+    # 모듈별 로그 레벨 (예: "nodes=WARNING,services.action_service=DEBUG")
+    LOG_MODULE_LEVELS: str = os.getenv("LOG_MODULE_LEVELS", "")
+    # 모듈별 DEBUG/INFO 로그 샘플링 (예: "nodes.node_executor_wrapper=100" -> 호출 위치별 100개 중 1개만 기록)
+    LOG_SAMPLING: str = os.getenv("LOG_SAMPLING", "")
+    # 노드 실행 상세 추적 로그 (노드 데이터 전체, 핸들러 정보 등을 INFO로 출력, 느려지므로 디버깅 시에만 사용)
+    NODE_TRACE: bool = os.getenv("NODE_TRACE", "False").lower() == "true"
+
+    # 노드 실행 로그 보관 정책 (0이면 해당 기준 사용 안 함, 오래된 실행부터 실행 단위로 정리)
+    # 보관 기간 (일), 최대 로그 행 수, DB 최대 크기 (MB, 사용 중인 페이지 기준)
+    LOG_RETENTION_DAYS: int = int(os.getenv("LOG_RETENTION_DAYS", "30"))
+    LOG_RETENTION_MAX_ROWS: int = int(os.getenv("LOG_RETENTION_MAX_ROWS", "200000"))
+    LOG_RETENTION_MAX_MB: int = int(os.getenv("LOG_RETENTION_MAX_MB", "0"))
+    # 정리 주기 (초, 0이면 자동 정리 안 함)와 한 트랜잭션에서 삭제할 최대 로그 행 수
+    LOG_RETENTION_INTERVAL_SEC: int = int(os.getenv("LOG_RETENTION_INTERVAL_SEC", "3600"))
+    LOG_RETENTION_BATCH_SIZE: int = int(os.getenv("LOG_RETENTION_BATCH_SIZE", "500"))
+    # 정리 후 빈 페이지를 파일에서 반환 (PRAGMA incremental_vacuum)
+    LOG_RETENTION_VACUUM: bool = os.getenv("LOG_RETENTION_VACUUM", "True").lower() == "true"
+    # 정리한 로그를 gzip 압축 NDJSON 파일로 보관 (조회/복원 API로 다시 사용 가능)
+    LOG_ARCHIVE_ENABLED: bool = os.getenv("LOG_ARCHIVE_ENABLED", "True").lower() == "true"
+    LOG_ARCHIVE_DIR: str = os.getenv("LOG_ARCHIVE_DIR", "db/archives")
+
+    # 통계 카운터 설정
+    # 대시보드 실행 카운터 증분 반영 주기 (초, 0이면 요청마다 바로 반영, 조회 시에는 반영 전 증분도 포함)
+    STATS_FLUSH_INTERVAL_SEC: float = float(os.getenv("STATS_FLUSH_INTERVAL_SEC", "2"))
+
+    # 모니터링 설정
+    # 이벤트 루프 지연 모니터 (이벤트 루프를 막는 동기 호출 감지)
+    LOOP_MONITOR_ENABLED: bool = os.getenv("LOOP_MONITOR_ENABLED", "True").lower() == "true"
+    # 하트비트 간격과 멈춤으로 판단할 지연 기준 (밀리초)
+    LOOP_MONITOR_INTERVAL_MS: int = int(os.getenv("LOOP_MONITOR_INTERVAL_MS", "100"))
+    LOOP_STALL_THRESHOLD_MS: int = int(os.getenv("LOOP_STALL_THRESHOLD_MS", "200"))
+    # 메트릭 스냅샷 저장 간격 (초, 0이면 저장 안 함)과 스냅샷 보관 기간 (일)
+    METRICS_SNAPSHOT_INTERVAL_SEC: int = int(os.getenv("METRICS_SNAPSHOT_INTERVAL_SEC", "300"))
+    METRICS_RETENTION_DAYS: int = int(os.getenv("METRICS_RETENTION_DAYS", "90"))
+    # 실행 추적 (실행별 스팬 타임라인, 최근 TRACE_MAX_TRACES개 실행을 메모리에 보관, 실행당 최대 TRACE_MAX_SPANS개 스팬)
+    TRACE_ENABLED: bool = os.getenv("TRACE_ENABLED", "True").lower() == "true"
+    TRACE_MAX_TRACES: int = int(os.getenv("TRACE_MAX_TRACES", "10"))
+    TRACE_MAX_SPANS: int = int(os.getenv("TRACE_MAX_SPANS", "5000"))
 
 
 settings = Settings()
@@ -1,17 +1,23 @@
 # db 패키지 초기화 파일
 from .connection import DatabaseConnection
 from .database import DatabaseManager, db_manager
+from .metrics_repository import MetricsRepository
 from .node_repository import NodeRepository
 from .script_repository import ScriptRepository
+from .script_stats_repository import ScriptStatsRepository
 from .table_manager import TableManager
+from .trace_repository import TraceRepository
 from .user_settings_repository import UserSettingsRepository
 
 __all__ = [
     "DatabaseConnection",
     "DatabaseManager",
+    "MetricsRepository",
     "NodeRepository",
     "ScriptRepository",
+    "ScriptStatsRepository",
     "TableManager",
+    "TraceRepository",
     "UserSettingsRepository",
     "db_manager",
 ]
@@ -1,5 +1,6 @@
 """대시보드 통계 리포지토리 모듈"""
 
+from collections.abc import Mapping
 import os
 import sqlite3
 import sys
@@ -124,3 +125,67 @@ class DashboardStatsRepository:
                 (stat_key, stat_value),
             )
         return True
+
+    def increment_stat(self, stat_key: str, delta: int = 1) -> bool:
+        """
+        통계 값 증감 (없으면 delta 값으로 생성)
+
+        Args:
+            stat_key: 통계 키
+            delta: 증감값
+
+        Returns:
+            성공 여부
+        """
+        return self.increment_stats({stat_key: delta})
+
+    def increment_stats(self, deltas: Mapping[str, int]) -> bool:
+        """
+        여러 통계 값을 한 트랜잭션에서 증감
+        현재 값을 읽지 않고 stat_value = stat_value + ? 로 갱신하므로 동시 요청에도 값을 잃지 않습니다.
+
+        Args:
+            deltas: 통계 키-증감값 딕셔너리 (0인 값은 무시)
+
+        Returns:
+            성공 여부
+        """
+        result: bool = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._increment_stats_impl(cursor, deltas)
+        )
+        return result
+
+    def _increment_stats_impl(self, cursor: sqlite3.Cursor, deltas: Mapping[str, int]) -> bool:
+        """여러 통계 값 증감 구현"""
+        rows = [(stat_key, delta) for stat_key, delta in deltas.items() if delta]
+        if rows:
+            cursor.executemany(
+                """
+                INSERT INTO dashboard_stats (stat_key, stat_value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(stat_key) DO UPDATE SET
+                    stat_value = stat_value + excluded.stat_value,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                rows,
+            )
+        return True
+
+    def get_daily_stats(self, day: str) -> dict[str, int]:
+        """
+        하루 통계 조회 (트리거로 갱신되는 일별 카운터)
+
+        Args:
+            day: 로컬 날짜 (YYYY-MM-DD)
+
+        Returns:
+            통계 키-값 딕셔너리 (executions: 실행 횟수, failed_scripts: 실패한 스크립트 개수)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("SELECT stat_key, stat_value FROM dashboard_daily_stats WHERE day = ?", (day,))
+            return {row[0]: int(row[1]) for row in cursor.fetchall()}
+        finally:
+            conn.close()
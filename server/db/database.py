@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from datetime import date, datetime
 import logging
 import os
 import sys
+import time
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -21,9 +23,13 @@ try:
     from .connection import DatabaseConnection
     from .dashboard_stats_repository import DashboardStatsRepository
     from .log_stats_repository import LogStatsRepository
+    from .metrics_repository import MetricsRepository
     from .node_repository import NodeRepository
     from .script_repository import ScriptRepository
+    from .script_stats_repository import FINISHED_STATUSES, ScriptStatsRepository
+    from .stats_accumulator import StatsAccumulator
     from .table_manager import TableManager
+    from .trace_repository import TraceRepository
     from .user_settings_repository import UserSettingsRepository
 except ImportError:
     # 직접 실행 시 절대 import 사용
@@ -33,9 +39,13 @@ except ImportError:
     from db.connection import DatabaseConnection
     from db.dashboard_stats_repository import DashboardStatsRepository
     from db.log_stats_repository import LogStatsRepository
+    from db.metrics_repository import MetricsRepository
     from db.node_repository import NodeRepository
     from db.script_repository import ScriptRepository
+    from db.script_stats_repository import FINISHED_STATUSES, ScriptStatsRepository
+    from db.stats_accumulator import StatsAccumulator
     from db.table_manager import TableManager
+    from db.trace_repository import TraceRepository
     from db.user_settings_repository import UserSettingsRepository
 
 
@@ -63,17 +73,70 @@ class DatabaseManager:
         self.scripts = ScriptRepository(self.connection)  # 스크립트
         self.nodes = NodeRepository(self.connection)  # 노드
         self.dashboard_stats = DashboardStatsRepository(self.connection)  # 대시보드 통계
+        self.script_stats = ScriptStatsRepository(self.connection)  # 스크립트별 실행 통계
         self.node_execution_logs = NodeExecutionLogRepository(self.connection)  # 노드 실행 로그
         self.log_stats = LogStatsRepository(self.connection)  # 로그 통계
+        self.metrics = MetricsRepository(self.connection)  # 메트릭 스냅샷
+        self.traces = TraceRepository(self.connection)  # 저장된 실행 추적
+
+        # 대시보드 실행 카운터 증분 누적기 (요청마다 읽고 쓰지 않고 모아서 반영, main.py의 startup 이벤트에서 주기 반영 시작)
+        self.dashboard_counters = StatsAccumulator(self.dashboard_stats, "dashboard")
 
         # 데이터베이스 초기화는 main.py의 startup_event에서 수행
         # (모듈 로드 시점에는 DB 파일이 없을 수 있으므로)
 
-    def init_database(self) -> None:
-        """데이터베이스 초기화"""
-        self.table_manager.initialize()
-        # 기존 로그가 있으면 통계 계산 및 저장
-        self._initialize_log_stats()
+    def init_database(self, run_backfills: bool = True) -> dict[str, Any]:
+        """
+        데이터베이스 초기화 (아직 적용하지 않은 마이그레이션 단계만 실행)
+
+        Args:
+            run_backfills: 마이그레이션 후 데이터 채우기(통계 재계산, 검색 인덱스 등)를 바로 실행할지 여부
+                (False면 호출한 쪽에서 run_backfills()를 실행, 서버는 시작을 막지 않도록 작업 스레드에서 실행)
+
+        Returns:
+            스키마 확인 결과 (TableManager.initialize() 반환값)
+        """
+        result = self.table_manager.initialize()
+        if run_backfills:
+            self.run_backfills()
+        return result
+
+    def run_backfills(self) -> int:
+        """
+        데이터 채우기가 끝나지 않은 마이그레이션 단계의 데이터 채우기를 실행합니다.
+        단계의 작업이 모두 성공해야 완료로 기록하고, 실패하면 다음 시작 시 다시 실행합니다. (각 작업은 여러 번 실행해도 안전)
+
+        Returns:
+            완료한 단계 수
+        """
+        completed = 0
+        for migration in self.table_manager.get_pending_backfills():
+            started = time.perf_counter()
+            succeeded = True
+            for backfill in migration.backfills:
+                try:
+                    backfill(self)
+                except Exception as e:
+                    succeeded = False
+                    logger.warning(f"마이그레이션 {migration.version} 데이터 채우기 실패 (다음 시작 시 재시도): {e!s}")
+            if not succeeded:
+                continue
+            self.table_manager.mark_backfilled(migration.version)
+            completed += 1
+            logger.info(
+                f"마이그레이션 {migration.version}({migration.name}) 데이터 채우기 완료 - "
+                f"{round((time.perf_counter() - started) * 1000, 1)}ms"
+            )
+        return completed
+
+    def get_schema_status(self) -> dict[str, Any]:
+        """스키마 버전과 적용한 마이그레이션 단계 목록 (데이터 채우기 완료 여부 포함)"""
+        history = self.table_manager.get_migration_history()
+        return {
+            "version": max((row["version"] for row in history), default=0),
+            "pending_backfills": [row["version"] for row in history if row["backfilled_at"] is None],
+            "migrations": history,
+        }
 
     # 사용자 설정 메서드들 (기존 API 호환성 유지)
     def get_user_setting(self, setting_key: str, default_value: str | None = None) -> str | None:
@@ -97,9 +160,15 @@ class DatabaseManager:
         """새 스크립트 생성"""
         return self.scripts.create_script(name, description)
 
-    def get_all_scripts(self) -> list[dict[str, Any]]:
+    def get_all_scripts(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
         """모든 스크립트 목록 조회"""
-        return self.scripts.get_all_scripts()
+        return self.scripts.get_all_scripts(fields)
+
+    def get_scripts_page(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """스크립트 목록 한 페이지 조회 (키셋 페이지네이션)"""
+        return self.scripts.get_scripts_page(limit, cursor, fields)
 
     def get_script(self, script_id: int) -> dict[str, Any] | None:
         """
@@ -148,6 +217,30 @@ class DatabaseManager:
 
         return success
 
+    def patch_script_data(
+        self,
+        script_id: int,
+        nodes: list[dict[str, Any]],
+        removed_node_ids: list[str],
+        connections: list[dict[str, Any]] | None = None,
+    ) -> dict[str, int]:
+        """
+        스크립트의 노드 변경분 저장 (추가/변경할 노드와 삭제할 노드 ID만 전달)
+
+        Args:
+            script_id: 스크립트 ID
+            nodes: 추가하거나 변경할 노드 목록
+            removed_node_ids: 삭제할 노드 ID 목록
+            connections: 전체 연결 정보 목록 (None이면 기존 연결 유지)
+
+        Returns:
+            {"added", "updated", "removed", "unchanged"} 노드 개수
+        """
+        result = self.nodes.patch_nodes(script_id, nodes, removed_node_ids, connections)
+        if result["added"] or result["updated"] or result["removed"]:
+            self.scripts.update_script_timestamp(script_id)
+        return result
+
     def delete_script(self, script_id: int) -> bool:
         """스크립트 삭제"""
         return self.scripts.delete_script(script_id)
@@ -165,63 +258,29 @@ class DatabaseManager:
         """
         대시보드 통계 조회
 
-        Args:
-            use_cache: 캐시 사용 여부 (기본값: True, 현재는 사용하지 않음)
-
-        Returns:
-            통계 딕셔너리
-        """
-        # 항상 최신 데이터로 계산
-        return self.calculate_and_update_dashboard_stats()
-
-    def _is_cache_valid(self, cached_stats: dict[str, int]) -> bool:
-        """
-        캐시가 유효한지 확인
+        카운터는 스크립트 추가/삭제/활성 상태 변경과 실행 기록 저장/삭제 시 트리거로 같은 트랜잭션에서 갱신되므로
+        (TableManager._create_dashboard_counter_triggers) 항상 최신 값이며, 조회는 통계 행만 읽습니다.
+        전체 실행 카운터(all_*)는 아직 DB에 반영하지 않은 증분(dashboard_counters)을 더해서 반환합니다.
 
         Args:
-            cached_stats: 캐시된 통계 딕셔너리
+            use_cache: 이전 버전 호환용 (카운터가 항상 최신이므로 사용하지 않음)
 
         Returns:
-            캐시 유효 여부
+            통계 딕셔너리 (total_scripts, all_executions, all_failed_scripts, inactive_scripts,
+            today_executions, today_failed_scripts)
         """
-        if not cached_stats or len(cached_stats) == 0:
-            return False
-
-        # 모든 통계 키가 있는지 확인
-        required_keys = ["total_scripts", "all_executions", "all_failed_scripts", "inactive_scripts"]
-        if not all(key in cached_stats for key in required_keys):
-            return False
-
-        # updated_at 확인 (5분 이내 업데이트된 경우 유효)
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
-
-        try:
-            cursor.execute(
-                """
-                SELECT MIN(updated_at) FROM dashboard_stats
-                WHERE stat_key IN ('total_scripts', 'all_executions', 'all_failed_scripts', 'inactive_scripts')
-                """
-            )
-            result = cursor.fetchone()
-            if not result or not result[0]:
-                return False
-
-            # SQLite datetime 비교
-            from db.constants import DB_CONSTANTS
-
-            cache_minutes = DB_CONSTANTS.DASHBOARD_STATS_CACHE_MINUTES
-            cursor.execute(
-                f"""
-                SELECT COUNT(*) FROM dashboard_stats
-                WHERE stat_key IN ('total_scripts', 'all_executions', 'all_failed_scripts', 'inactive_scripts')
-                AND datetime(updated_at) > datetime('now', '-{cache_minutes} minutes')
-                """
-            )
-            count = cursor.fetchone()[0]
-            return count > 0
-        finally:
-            conn.close()
+        stats = self.dashboard_stats.get_all_stats()
+        for stat_key, delta in self.dashboard_counters.pending().items():
+            stats[stat_key] = stats.get(stat_key, 0) + delta
+        today = self.dashboard_stats.get_daily_stats(date.today().isoformat())
+        return {
+            "total_scripts": stats.get("total_scripts", 0),
+            "all_executions": stats.get("all_executions", 0),  # 전체 실행 시 실행된 스크립트 개수
+            "all_failed_scripts": stats.get("all_failed_scripts", 0),  # 전체 실행 시 실패한 스크립트 개수
+            "inactive_scripts": stats.get("inactive_scripts", 0),
+            "today_executions": today.get("executions", 0),
+            "today_failed_scripts": today.get("failed_scripts", 0),
+        }
 
     def update_dashboard_stats(self, stats: dict[str, int]) -> bool:
         """대시보드 통계 업데이트"""
@@ -239,176 +298,34 @@ class DatabaseManager:
             성공 여부
         """
         stats = {"all_executions": total_executions, "all_failed_scripts": failed_count}
-        return self.dashboard_stats.update_all_stats(stats)
+        # 대기 중인 증분을 버리고 설정 (설정 이전의 증분이 나중에 더해지지 않도록)
+        return self.dashboard_counters.set_stats(stats)
 
-    def update_stat(self, stat_key: str) -> bool:
+    def increment_all_execution_stats(self, executions: int, failed: int = 0) -> dict[str, int]:
         """
-        특정 통계만 업데이트 (이벤트 기반)
+        전체 실행 통계 증가 (현재 값을 읽지 않고 증분만 누적, 주기적으로 한 트랜잭션에서 반영)
 
         Args:
-            stat_key: 통계 키 ('total_scripts', 'today_executions', 'today_failed_scripts', 'inactive_scripts')
+            executions: 증가시킬 실행된 스크립트 개수
+            failed: 증가시킬 실패한 스크립트 개수
 
         Returns:
-            성공 여부
+            누적한 증분 (all_executions, all_failed_scripts)
         """
-        if stat_key == "total_scripts":
-            # 전체 스크립트 개수
-            all_scripts = self.get_all_scripts()
-            total_scripts = len(all_scripts)
-            return self.dashboard_stats.set_stat("total_scripts", total_scripts)
-
-        if stat_key == "inactive_scripts":
-            # 비활성 스크립트 개수
-            all_scripts = self.get_all_scripts()
-            inactive_scripts = sum(1 for script in all_scripts if not script.get("active", True))
-            return self.dashboard_stats.set_stat("inactive_scripts", inactive_scripts)
-
-        if stat_key == "today_executions":
-            # 오늘 실행 횟수
-            today_executions = self._get_today_executions_count()
-            return self.dashboard_stats.set_stat("today_executions", today_executions)
-
-        if stat_key == "today_failed_scripts":
-            # 오늘 실패한 스크립트 개수
-            today_failed = self._get_today_failed_scripts_count()
-            logger.info(f"[DB 통계] today_failed_scripts 계산 결과: {today_failed}")
-            result = self.dashboard_stats.set_stat("today_failed_scripts", today_failed)
-            logger.info(f"[DB 통계] today_failed_scripts DB 저장 결과: {result}")
-            return result
-
-        return False
-
-    def _get_today_executions_count(self) -> int:
-        """오늘 실행 횟수 조회"""
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
+        deltas = {"all_executions": executions, "all_failed_scripts": failed}
+        self.dashboard_counters.add(deltas)
+        if not self.dashboard_counters.running:
+            # 주기 반영을 사용하지 않으면 바로 반영
+            self.dashboard_counters.flush()
+        return deltas
 
-        try:
-            # script_executions 테이블이 존재하는지 확인
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='script_executions'")
-            table_exists = cursor.fetchone() is not None
-
-            if table_exists:
-                # 오늘 실행 횟수 (SQLite datetime 함수 사용, 타임존 고려)
-                # date(started_at, 'localtime'): UTC로 저장된 started_at을 로컬 타임존으로 변환 후 날짜 추출
-                # date('now', 'localtime'): 현재 로컬 날짜
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM script_executions
-                    WHERE date(started_at, 'localtime') = date('now', 'localtime')
-                    """
-                )
-                result = cursor.fetchone()
-                return result[0] if result else 0
-            return 0
-        finally:
-            conn.close()
-
-    def _get_today_failed_scripts_count(self) -> int:
-        """오늘 실패한 스크립트 개수 조회"""
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
-
-        try:
-            # script_executions 테이블이 존재하는지 확인
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='script_executions'")
-            table_exists = cursor.fetchone() is not None
-
-            if table_exists:
-                # 디버깅: 오늘의 모든 실행 기록 확인
-                cursor.execute(
-                    """
-                    SELECT script_id, status, started_at FROM script_executions
-                    WHERE date(started_at, 'localtime') = date('now', 'localtime')
-                    ORDER BY started_at DESC
-                    """
-                )
-                all_today_executions = cursor.fetchall()
-                logger.debug(f"[DB 통계] 오늘의 모든 실행 기록: {all_today_executions}")
+    def get_script_stats(self, script_id: int) -> dict[str, Any] | None:
+        """스크립트 하나의 실행 통계 조회 (완료된 실행이 없으면 None)"""
+        return self.script_stats.get_stats(script_id)
 
-                # 오늘 실패한 스크립트 개수 (고유 스크립트 수)
-                cursor.execute(
-                    """
-                    SELECT COUNT(DISTINCT script_id) FROM script_executions
-                    WHERE date(started_at, 'localtime') = date('now', 'localtime') AND status = 'error'
-                    """
-                )
-                result = cursor.fetchone()
-                failed_count = result[0] if result else 0
-
-                # 디버깅: 실패한 스크립트 ID 목록 확인
-                cursor.execute(
-                    """
-                    SELECT DISTINCT script_id FROM script_executions
-                    WHERE date(started_at, 'localtime') = date('now', 'localtime') AND status = 'error'
-                    """
-                )
-                failed_script_ids = [row[0] for row in cursor.fetchall()]
-                logger.info(
-                    f"[DB 통계] 오늘 실패한 스크립트 개수: {failed_count}, 스크립트 ID 목록: {failed_script_ids}"
-                )
-
-                return failed_count
-            return 0
-        finally:
-            conn.close()
-
-    def calculate_and_update_dashboard_stats(self) -> dict[str, int | float | None]:
-        """
-        대시보드 통계 계산 및 업데이트
-        - 전체 스크립트 개수
-        - 전체 실행 횟수 (전체 실행 시 실행된 스크립트 개수)
-        - 전체 실패한 스크립트 개수 (전체 실행 시 실패한 스크립트 개수)
-        - 비활성 스크립트 개수
-        """
-        # 전체 스크립트 개수
-        all_scripts = self.get_all_scripts()
-        total_scripts = len(all_scripts)
-
-        # 비활성 스크립트 개수
-        inactive_scripts = sum(1 for script in all_scripts if not script.get("active", True))
-
-        # 전체 실행 통계 조회 (dashboard_stats 테이블에서)
-        # 초기값이 없으면 0으로 설정 (마이그레이션 대비)
-        all_executions = self.dashboard_stats.get_stat("all_executions", 0)
-        all_failed_scripts = self.dashboard_stats.get_stat("all_failed_scripts", 0)
-
-        stats = {
-            "total_scripts": total_scripts,
-            "all_executions": all_executions,  # 전체 실행 시 실행된 스크립트 개수
-            "all_failed_scripts": all_failed_scripts,  # 전체 실행 시 실패한 스크립트 개수
-            "inactive_scripts": inactive_scripts,
-        }
-
-        # 통계 업데이트 (초기값이 없으면 자동으로 생성됨)
-        stats_to_cache = {
-            "total_scripts": total_scripts,
-            "all_executions": all_executions,
-            "all_failed_scripts": all_failed_scripts,
-            "inactive_scripts": inactive_scripts,
-        }
-        self.update_dashboard_stats(stats_to_cache)
-
-        return stats
-
-    def _initialize_log_stats(self) -> None:
-        """
-        서버 최초 실행 시 기존 로그가 있으면 통계를 계산하여 저장합니다.
-        """
-        try:
-            # 기존 로그가 있는지 확인
-            conn = self.connection.get_connection()
-            cursor = self.connection.get_cursor(conn)
-            try:
-                cursor.execute("SELECT COUNT(*) FROM node_execution_logs")
-                log_count = cursor.fetchone()[0] or 0
-                if log_count > 0:
-                    # 기존 로그가 있으면 통계 계산 및 저장
-                    self.log_stats.calculate_and_update_stats()
-            finally:
-                conn.close()
-        except Exception as e:
-            logger.warning(f"로그 통계 초기화 실패 (무시됨): {e!s}")
+    def rebuild_script_stats(self) -> int:
+        """실행 기록 전체로 스크립트별 실행 통계를 다시 만듭니다. (통계를 만든 스크립트 수 반환)"""
+        return self.script_stats.rebuild()
 
     def record_script_execution(
         self,
@@ -435,16 +352,8 @@ class DatabaseManager:
         cursor = self.connection.get_cursor(conn)
 
         try:
-            # script_executions 테이블이 존재하는지 확인
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='script_executions'")
-            table_exists = cursor.fetchone() is not None
-
-            if not table_exists:
-                logger.warning("[DB] script_executions 테이블이 존재하지 않습니다. 실행 기록 저장 건너뜀")
-                return None
-
-            from datetime import datetime
-
+            # 오늘 실행 횟수/실패한 스크립트 개수는 완료 상태 저장 시 트리거로 같은 트랜잭션에서 갱신됨
+            # 스크립트별 실행 통계(script_stats)는 실행이 완료 상태가 될 때 같은 트랜잭션에서 한 번 갱신
             if execution_id is None:
                 # 새 실행 기록 생성 (시작)
                 started_at = datetime.now().isoformat()
@@ -458,9 +367,11 @@ class DatabaseManager:
                     """,
                     (script_id, status, started_at, finished_at, error_message, execution_time_ms),
                 )
+                execution_id = cursor.lastrowid
+                if status in FINISHED_STATUSES:
+                    self.script_stats.record_execution(cursor, script_id, status, execution_time_ms, started_at)
 
                 conn.commit()
-                execution_id = cursor.lastrowid
 
                 logger.info(
                     f"[DB] 스크립트 실행 기록 저장 (시작) - 실행 ID: {execution_id}, 스크립트 ID: {script_id}, 상태: {status}"
@@ -469,6 +380,10 @@ class DatabaseManager:
                 # 기존 실행 기록 업데이트 (완료)
                 finished_at = datetime.now().isoformat()
 
+                cursor.execute(
+                    "SELECT script_id, status, started_at FROM script_executions WHERE id = ?", (execution_id,)
+                )
+                previous = cursor.fetchone()
                 cursor.execute(
                     """
                     UPDATE script_executions
@@ -477,6 +392,9 @@ class DatabaseManager:
                     """,
                     (status, finished_at, error_message, execution_time_ms, execution_id),
                 )
+                # 이미 완료 상태였던 실행(완료 기록 재전송 등)은 다시 세지 않음
+                if previous and previous[1] not in FINISHED_STATUSES and status in FINISHED_STATUSES:
+                    self.script_stats.record_execution(cursor, previous[0], status, execution_time_ms, previous[2])
 
                 conn.commit()
 
@@ -484,25 +402,6 @@ class DatabaseManager:
                     f"[DB] 스크립트 실행 기록 업데이트 (완료) - 실행 ID: {execution_id}, 스크립트 ID: {script_id}, 상태: {status}"
                 )
 
-            # 통계 업데이트 (완료 상태일 때만)
-            if status in ("success", "error", "cancelled"):
-                try:
-                    self.update_stat("today_executions")
-                    if status == "error":
-                        logger.info(f"[DB 통계] 실패한 스크립트 통계 업데이트 시작 - 스크립트 ID: {script_id}")
-                        update_result = self.update_stat("today_failed_scripts")
-                        if update_result:
-                            # 업데이트 후 현재 실패한 스크립트 개수 확인
-                            current_failed_count = self._get_today_failed_scripts_count()
-                            logger.info(
-                                f"[DB 통계] 실패한 스크립트 통계 업데이트 완료 - 현재 실패한 스크립트 개수: {current_failed_count}"
-                            )
-                        else:
-                            logger.warning(f"[DB 통계] 실패한 스크립트 통계 업데이트 실패 - 스크립트 ID: {script_id}")
-                    logger.debug("[DB 통계] 실행 기록 저장 후 통계 업데이트 완료")
-                except Exception as e:
-                    logger.warning(f"[DB 통계] 통계 업데이트 실패 (무시): {e!s}")
-
             return execution_id
         except Exception as e:
             logger.error(f"[DB] 스크립트 실행 기록 저장/업데이트 실패 - 스크립트 ID: {script_id}, 에러: {e!s}")
@@ -1,5 +1,6 @@
 """로그 통계 리포지토리 모듈"""
 
+from collections.abc import Mapping
 import os
 import sqlite3
 import sys
@@ -12,6 +13,49 @@ except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
 
+# 평균 실행 시간 계산용 누적 키 (average_execution_time = 합계 / 개수)
+EXECUTION_TIME_TOTAL_KEY = "execution_time_total"
+EXECUTION_TIME_COUNT_KEY = "execution_time_count"
+
+
+def increment_log_stats(cursor: sqlite3.Cursor, deltas: Mapping[str, int]) -> None:
+    """
+    로그 통계 값을 증감합니다. (읽지 않고 stat_value = stat_value + ? 로 갱신하므로 동시 요청에도 값을 잃지 않음)
+    호출한 쪽의 트랜잭션에서 실행되므로 로그 저장과 같은 트랜잭션에서 사용할 수 있습니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        deltas: 통계 키-증감값 딕셔너리 (0인 값은 무시)
+    """
+    rows = [(stat_key, delta) for stat_key, delta in deltas.items() if delta]
+    if not rows:
+        return
+    cursor.executemany(
+        """
+        INSERT INTO log_stats (stat_key, stat_value, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(stat_key) DO UPDATE SET
+            stat_value = stat_value + excluded.stat_value,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+        rows,
+    )
+    if EXECUTION_TIME_TOTAL_KEY in deltas or EXECUTION_TIME_COUNT_KEY in deltas:
+        # 평균 실행 시간은 누적 합계와 개수로 다시 계산 (같은 트랜잭션이므로 증감과 함께 반영됨)
+        cursor.execute(
+            """
+            UPDATE log_stats SET
+                stat_value = (
+                    SELECT IFNULL(t.stat_value / NULLIF(c.stat_value, 0), 0)
+                    FROM log_stats AS t, log_stats AS c
+                    WHERE t.stat_key = ? AND c.stat_key = ?
+                ),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE stat_key = 'average_execution_time'
+            """,
+            (EXECUTION_TIME_TOTAL_KEY, EXECUTION_TIME_COUNT_KEY),
+        )
+
 
 class LogStatsRepository:
     """로그 통계 관련 데이터베이스 작업을 처리하는 클래스"""
@@ -125,9 +169,36 @@ class LogStatsRepository:
             )
         return True
 
+    def increment_stat(self, stat_key: str, delta: int = 1) -> bool:
+        """
+        통계 값 증감 (없으면 delta 값으로 생성)
+
+        Args:
+            stat_key: 통계 키
+            delta: 증감값
+
+        Returns:
+            성공 여부
+        """
+        return self.increment_stats({stat_key: delta})
+
+    def increment_stats(self, deltas: Mapping[str, int]) -> bool:
+        """
+        여러 통계 값을 한 트랜잭션에서 증감 (increment_log_stats 참고)
+
+        Args:
+            deltas: 통계 키-증감값 딕셔너리
+
+        Returns:
+            성공 여부
+        """
+        self.connection.execute_with_connection(lambda _conn, cursor: increment_log_stats(cursor, deltas))
+        return True
+
     def calculate_and_update_stats(self) -> dict[str, int]:
         """
-        로그 통계를 계산하고 업데이트합니다.
+        로그 통계를 전체 로그에서 다시 계산하고 업데이트합니다.
+        로그 저장 시에는 같은 트랜잭션에서 증감하므로(increment_log_stats) 로그 삭제/복원 후 보정할 때만 사용합니다.
 
         Returns:
             계산된 통계 딕셔너리
@@ -136,6 +207,10 @@ class LogStatsRepository:
         cursor = self.connection.get_cursor(conn)
 
         try:
+            # 계산하는 동안 저장된 로그의 증분이 덮어써지지 않도록 처음부터 쓰기 잠금을 잡음
+            # (서버 시작 후 작업 스레드의 데이터 채우기, 로그 정리 후 보정은 로그 저장과 동시에 실행될 수 있음)
+            cursor.execute("BEGIN IMMEDIATE")
+
             # 전체 스크립트 실행 개수 (execution_id 기준 고유 개수)
             cursor.execute(
                 "SELECT COUNT(DISTINCT execution_id) FROM node_execution_logs WHERE execution_id IS NOT NULL"
@@ -153,13 +228,14 @@ class LogStatsRepository:
             # 평균 실행 시간 계산
             cursor.execute(
                 """
-                SELECT AVG(execution_time_ms)
+                SELECT SUM(execution_time_ms), COUNT(execution_time_ms)
                 FROM node_execution_logs
                 WHERE execution_time_ms IS NOT NULL AND execution_time_ms > 0
                 """
             )
-            avg_result = cursor.fetchone()[0]
-            average_execution_time = int(avg_result) if avg_result else 0
+            time_total, time_count = cursor.fetchone()
+            time_total = int(time_total or 0)
+            average_execution_time = time_total // time_count if time_count else 0
 
             stats = {
                 "total": total,
@@ -168,8 +244,10 @@ class LogStatsRepository:
                 "average_execution_time": average_execution_time,
             }
 
-            # 통계 업데이트
-            self._update_all_stats_impl(cursor, stats)
+            # 통계 업데이트 (이후 로그 저장 시 평균을 증분으로 계산하기 위한 누적 값 포함)
+            self._update_all_stats_impl(
+                cursor, {**stats, EXECUTION_TIME_TOTAL_KEY: time_total, EXECUTION_TIME_COUNT_KEY: time_count}
+            )
             conn.commit()
 
             return stats
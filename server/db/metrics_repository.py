@@ -0,0 +1,129 @@
+"""메트릭 스냅샷 리포지토리 모듈"""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+
+
+class MetricsRepository:
+    """메트릭 스냅샷(metrics_snapshots 테이블) 관련 데이터베이스 작업을 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        MetricsRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def save_snapshot(self, rows: list[dict[str, Any]], captured_at: str) -> int:
+        """
+        메트릭 스냅샷 행들을 한 번에 저장합니다.
+
+        Args:
+            rows: MetricsRegistry.state_to_rows() 결과 ({"metric", "labels", "value", "histogram"})
+            captured_at: 저장 시각 ("YYYY-MM-DD HH:MM:SS")
+
+        Returns:
+            저장한 행 수
+        """
+        result: int = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._save_snapshot_impl(cursor, rows, captured_at)
+        )
+        return result
+
+    def _save_snapshot_impl(self, cursor: sqlite3.Cursor, rows: list[dict[str, Any]], captured_at: str) -> int:
+        """메트릭 스냅샷 저장 구현"""
+        cursor.executemany(
+            """
+            INSERT INTO metrics_snapshots (captured_at, metric, labels, value, histogram)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    captured_at,
+                    row["metric"],
+                    json.dumps(row.get("labels") or {}, ensure_ascii=False, sort_keys=True),
+                    row.get("value"),
+                    json.dumps(row["histogram"]) if row.get("histogram") is not None else None,
+                )
+                for row in rows
+            ],
+        )
+        return len(rows)
+
+    def get_snapshot_rows(self, since: str, until: str | None = None) -> list[dict[str, Any]]:
+        """
+        기간 내 메트릭 스냅샷 행을 저장 시각 순서로 조회합니다.
+
+        Args:
+            since: 조회 시작 시각 ("YYYY-MM-DD HH:MM:SS", 포함)
+            until: 조회 종료 시각 (None이면 현재까지, 제외)
+
+        Returns:
+            스냅샷 행 목록 ({"captured_at", "metric", "labels", "value", "histogram"})
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            if until is None:
+                cursor.execute(
+                    """
+                    SELECT captured_at, metric, labels, value, histogram
+                    FROM metrics_snapshots
+                    WHERE captured_at >= ?
+                    ORDER BY captured_at, id
+                    """,
+                    (since,),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT captured_at, metric, labels, value, histogram
+                    FROM metrics_snapshots
+                    WHERE captured_at >= ? AND captured_at < ?
+                    ORDER BY captured_at, id
+                    """,
+                    (since, until),
+                )
+            return [
+                {
+                    "captured_at": row[0],
+                    "metric": row[1],
+                    "labels": json.loads(row[2]) if row[2] else {},
+                    "value": row[3],
+                    "histogram": json.loads(row[4]) if row[4] else None,
+                }
+                for row in cursor.fetchall()
+            ]
+        finally:
+            conn.close()
+
+    def delete_snapshots_before(self, cutoff: str) -> int:
+        """
+        보관 기간이 지난 메트릭 스냅샷을 삭제합니다.
+
+        Args:
+            cutoff: 이 시각 이전에 저장된 스냅샷 삭제 ("YYYY-MM-DD HH:MM:SS")
+
+        Returns:
+            삭제된 행 수
+        """
+        result: int = self.connection.execute_with_connection(
+            lambda _conn, cursor: (
+                cursor.execute("DELETE FROM metrics_snapshots WHERE captured_at < ?", (cutoff,)).rowcount
+            )
+        )
+        return result
@@ -0,0 +1,80 @@
+"""
+스키마 버전과 마이그레이션 단계 정의
+
+서버를 시작할 때마다 모든 CREATE TABLE/INDEX IF NOT EXISTS, ALTER TABLE ADD COLUMN 시도,
+통계 재계산을 다시 실행하지 않도록 적용한 단계를 schema_version 테이블에 기록하고
+아직 적용하지 않은 단계만 순서대로 실행합니다. (TableManager.initialize)
+
+- apply: 스키마 변경 (서버 시작 중 동기 실행, 여러 번 실행해도 안전해야 함)
+- backfills: 오래 걸릴 수 있는 데이터 채우기 (통계 재계산, 검색 인덱스 등)
+  서버 시작을 막지 않도록 작업 스레드에서 실행하며(DatabaseManager.run_backfills), 모두 성공해야 완료로 기록
+
+스키마를 바꿀 때는 create_tables()/migrate_tables()를 고치는 대신 MIGRATIONS 끝에 새 버전을 추가합니다.
+(버전 기록 전에 만든 DB는 버전 0으로 보고 모든 단계를 한 번 실행)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .database import DatabaseManager
+    from .table_manager import TableManager
+
+
+@dataclass(frozen=True)
+class Migration:
+    """마이그레이션 단계 하나"""
+
+    version: int
+    name: str
+    apply: Callable[[TableManager], None]
+    backfills: tuple[Callable[[DatabaseManager], Any], ...] = ()
+
+
+def _apply_baseline(tables: TableManager) -> None:
+    """버전 기록 이전의 전체 스키마 (테이블/인덱스/트리거 생성과 컬럼 추가)"""
+    tables.create_tables()
+    tables.migrate_tables()
+
+
+def _add_node_content_hash(tables: TableManager) -> None:
+    """노드 내용 해시 컬럼 추가 (노드 저장 시 바뀐 노드만 쓰기 위함, 기존 노드는 NULL이라 다음 저장 때 한 번 다시 씀)"""
+    tables.add_node_content_hash()
+
+
+def _rebucket_daily_stats(tables: TableManager) -> None:
+    """대시보드 일별 실행 통계를 완료 날짜 대신 시작 날짜 기준으로 다시 집계 (오늘 실행 횟수에 실행 중 기록 포함)"""
+    tables.rebucket_daily_stats()
+
+
+def _recount_log_stats(db: DatabaseManager) -> Any:
+    """로그 통계를 전체 로그로 다시 계산 (증분 통계용 누적 값이 없던 DB)"""
+    return db.log_stats.calculate_and_update_stats()
+
+
+def _fill_log_search_index(db: DatabaseManager) -> Any:
+    """검색 기능 추가 전에 저장된 로그를 전문 검색 인덱스에 추가"""
+    return db.node_execution_logs.ensure_search_index()
+
+
+def _build_script_stats(db: DatabaseManager) -> Any:
+    """스크립트별 실행 통계 테이블 추가 전의 실행 기록으로 통계 생성"""
+    return db.script_stats.ensure_built()
+
+
+# 버전 순서대로 정렬되어 있어야 함
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        1,
+        "baseline",
+        _apply_baseline,
+        backfills=(_recount_log_stats, _fill_log_search_index, _build_script_stats),
+    ),
+    Migration(2, "node_content_hash", _add_node_content_hash),
+    Migration(3, "dashboard_daily_started_at", _rebucket_daily_stats),
+)
+LATEST_VERSION = MIGRATIONS[-1].version
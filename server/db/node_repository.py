@@ -1,5 +1,7 @@
 """노드 리포지토리 모듈"""
 
+from collections.abc import Iterable
+import hashlib
 import json
 import os
 import sqlite3
@@ -43,90 +45,92 @@ class NodeRepository:
         cursor = self.connection.get_cursor(conn)
 
         try:
-            cursor.execute(
-                """
-                SELECT id, node_id, node_type, position_x, position_y, node_data,
-                       connected_to, connected_from,
-                       COALESCE(parameters, '{}') as parameters, description,
-                       created_at, updated_at,
-                       is_connected, connection_sequence, node_identifier
-                FROM nodes
-                WHERE script_id = ?
-                ORDER BY id
-            """,
-                (script_id,),
-            )
+            return self._select_nodes(cursor, script_id)
+        finally:
+            conn.close()
 
-            nodes = []
-            # nodes_config.py에 정의된 노드 타입만 허용
-            valid_node_types = set(NODES_CONFIG.keys())
-
-            for row in cursor.fetchall():
-                # SELECT 순서: id(0), node_id(1), node_type(2), position_x(3), position_y(4),
-                #              node_data(5), connected_to(6), connected_from(7), parameters(8), description(9),
-                #              created_at(10), updated_at(11), is_connected(12), connection_sequence(13), node_identifier(14)
-                node_type = row[2]
-
-                # nodes_config.py에 정의되지 않은 노드는 제외
-                if node_type not in valid_node_types:
-                    print(
-                        f"[NodeRepository] 경고: 정의되지 않은 노드 타입 '{node_type}' (노드 ID: {row[1]})를 건너뜁니다."
-                    )
-                    continue
-
-                connected_to_raw = row[6] if len(row) > 6 else None
-                connected_from_raw = row[7] if len(row) > 7 else None
-                parameters_raw = row[8] if len(row) > 8 else None
-                description = row[9] if len(row) > 9 else None
-                created_at = row[10] if len(row) > 10 else None
-                updated_at = row[11] if len(row) > 11 else None
-                is_connected = bool(row[12]) if len(row) > 12 and row[12] is not None else None
-                connection_sequence = row[13] if len(row) > 13 else None
-                node_identifier = row[14] if len(row) > 14 else None
-
-                connected_to = self._parse_json_field(connected_to_raw, [])
-                connected_from = self._parse_json_field(connected_from_raw, [])
-                parameters = self._parse_json_field(parameters_raw, {})
-
-                db_id = row[0]
-                node_id = row[1]
-
-                # node_data는 원본 그대로 사용 (메타데이터 제외)
-                node_data = json.loads(row[5])
-
-                # 메타데이터를 별도 딕셔너리로 분리
-                metadata = {
+    def _select_nodes(self, cursor: sqlite3.Cursor, script_id: int) -> list[dict[str, Any]]:
+        """노드 목록 조회 구현 (호출한 쪽의 연결/트랜잭션에서 실행)"""
+        cursor.execute(
+            """
+            SELECT id, node_id, node_type, position_x, position_y, node_data,
+                   connected_to, connected_from,
+                   COALESCE(parameters, '{}') as parameters, description,
+                   created_at, updated_at,
+                   is_connected, connection_sequence, node_identifier
+            FROM nodes
+            WHERE script_id = ?
+            ORDER BY id
+        """,
+            (script_id,),
+        )
+
+        nodes = []
+        # nodes_config.py에 정의된 노드 타입만 허용
+        valid_node_types = set(NODES_CONFIG.keys())
+
+        for row in cursor.fetchall():
+            # SELECT 순서: id(0), node_id(1), node_type(2), position_x(3), position_y(4),
+            #              node_data(5), connected_to(6), connected_from(7), parameters(8), description(9),
+            #              created_at(10), updated_at(11), is_connected(12), connection_sequence(13), node_identifier(14)
+            node_type = row[2]
+
+            # nodes_config.py에 정의되지 않은 노드는 제외
+            if node_type not in valid_node_types:
+                print(f"[NodeRepository] 경고: 정의되지 않은 노드 타입 '{node_type}' (노드 ID: {row[1]})를 건너뜁니다.")
+                continue
+
+            connected_to_raw = row[6] if len(row) > 6 else None
+            connected_from_raw = row[7] if len(row) > 7 else None
+            parameters_raw = row[8] if len(row) > 8 else None
+            description = row[9] if len(row) > 9 else None
+            created_at = row[10] if len(row) > 10 else None
+            updated_at = row[11] if len(row) > 11 else None
+            is_connected = bool(row[12]) if len(row) > 12 and row[12] is not None else None
+            connection_sequence = row[13] if len(row) > 13 else None
+            node_identifier = row[14] if len(row) > 14 else None
+
+            connected_to = self._parse_json_field(connected_to_raw, [])
+            connected_from = self._parse_json_field(connected_from_raw, [])
+            parameters = self._parse_json_field(parameters_raw, {})
+
+            db_id = row[0]
+            node_id = row[1]
+
+            # node_data는 원본 그대로 사용 (메타데이터 제외)
+            node_data = json.loads(row[5])
+
+            # 메타데이터를 별도 딕셔너리로 분리
+            metadata = {
+                "id": node_id,
+                "x": row[3],
+                "y": row[4],
+            }
+            if created_at:
+                metadata["createdAt"] = created_at
+            if updated_at:
+                metadata["updatedAt"] = updated_at
+
+            nodes.append(
+                {
                     "id": node_id,
-                    "x": row[3],
-                    "y": row[4],
+                    "type": node_type,
+                    "position": {"x": row[3], "y": row[4]},
+                    "data": node_data,
+                    "metadata": metadata,  # 메타데이터를 별도 필드로 추가
+                    "connected_to": connected_to,
+                    "connected_from": connected_from,
+                    "parameters": parameters,
+                    "description": description,
+                    "_db_id": db_id,  # 내부적으로 DB id 저장
+                    # 연결 정보 추가
+                    "is_connected": is_connected,
+                    "connection_sequence": connection_sequence,
+                    "node_identifier": node_identifier,
                 }
-                if created_at:
-                    metadata["createdAt"] = created_at
-                if updated_at:
-                    metadata["updatedAt"] = updated_at
-
-                nodes.append(
-                    {
-                        "id": node_id,
-                        "type": node_type,
-                        "position": {"x": row[3], "y": row[4]},
-                        "data": node_data,
-                        "metadata": metadata,  # 메타데이터를 별도 필드로 추가
-                        "connected_to": connected_to,
-                        "connected_from": connected_from,
-                        "parameters": parameters,
-                        "description": description,
-                        "_db_id": db_id,  # 내부적으로 DB id 저장
-                        # 연결 정보 추가
-                        "is_connected": is_connected,
-                        "connection_sequence": connection_sequence,
-                        "node_identifier": node_identifier,
-                    }
-                )
-
-            return nodes
-        finally:
-            conn.close()
+            )
+
+        return nodes
 
     def _parse_json_field(self, raw_value: str | None, default_value: Any) -> Any:
         """
@@ -237,10 +241,11 @@ class NodeRepository:
     def save_nodes(self, script_id: int, nodes: list[dict[str, Any]], connections: list[dict[str, Any]]) -> bool:
         """
         노드 저장 (연결 정보 포함)
+        저장된 노드와 비교하여 추가/변경된 노드만 쓰고, 목록에 없는 노드는 삭제합니다. (바뀌지 않은 노드는 쓰지 않음)
 
         Args:
             script_id: 스크립트 ID
-            nodes: 노드 목록
+            nodes: 노드 목록 (스크립트의 전체 노드)
             connections: 연결 정보 목록
 
         Returns:
@@ -249,96 +254,209 @@ class NodeRepository:
         # 연결 검증
         self.validate_connections(nodes, connections)
 
-        result: bool = self.connection.execute_with_connection(
+        self.connection.execute_with_connection(
             lambda _conn, cursor: self._save_nodes_impl(cursor, script_id, nodes, connections)
         )
-        return result
+        return True
 
     def _save_nodes_impl(
         self, cursor: sqlite3.Cursor, script_id: int, nodes: list[dict[str, Any]], connections: list[dict[str, Any]]
-    ) -> bool:
-        """노드 저장 구현"""
-        # 기존 노드 삭제
-        cursor.execute("DELETE FROM nodes WHERE script_id = ?", (script_id,))
+    ) -> dict[str, int]:
+        """노드 저장 구현 (목록에 없는 저장된 노드는 삭제)"""
+        existing = self._select_content_hashes(cursor, script_id)
+        node_ids = {node["id"] for node in nodes}
+        removed = [node_id for node_id in existing if node_id not in node_ids]
+        return self._write_nodes(cursor, script_id, nodes, connections, existing, removed)
+
+    def patch_nodes(
+        self,
+        script_id: int,
+        nodes: list[dict[str, Any]],
+        removed_node_ids: list[str],
+        connections: list[dict[str, Any]] | None = None,
+    ) -> dict[str, int]:
+        """
+        바뀐 노드만 받아서 저장합니다. (UI가 전체 노드 대신 변경분만 보내는 경우)
 
-        # connections 배열을 기반으로 각 노드의 connected_to/connected_from 계산
-        node_connected_to: dict[str, list[dict[str, Any]]] = {}
-        node_connected_from: dict[str, list[str]] = {}
+        Args:
+            script_id: 스크립트 ID
+            nodes: 추가하거나 변경할 노드 목록 (저장된 노드의 생략한 필드는 기존 값 유지)
+            removed_node_ids: 삭제할 노드 ID 목록
+            connections: 스크립트의 전체 연결 정보 목록 (None이면 저장된 연결에서 삭제한 노드의 연결만 제외)
 
-        # 모든 노드 ID 초기화
-        for node in nodes:
-            node_id = node["id"]
-            node_connected_to[node_id] = []
-            node_connected_from[node_id] = []
+        Returns:
+            {"added", "updated", "removed", "unchanged"} 노드 개수
 
-        # connections 배열을 순회하며 각 노드의 연결 정보 구성
-        for connection in connections:
-            from_node_id = connection.get("from")
-            to_node_id = connection.get("to")
-            output_type = connection.get("outputType")
-
-            if from_node_id and to_node_id:
-                # from 노드의 connected_to에 연결 정보 추가
-                if from_node_id in node_connected_to:
-                    existing_conn = next(
-                        (
-                            conn
-                            for conn in node_connected_to[from_node_id]
-                            if (isinstance(conn, dict) and conn.get("to") == to_node_id)
-                            or (isinstance(conn, str) and conn == to_node_id)
-                        ),
-                        None,
-                    )
-                    if not existing_conn:
-                        node_connected_to[from_node_id].append({"to": to_node_id, "outputType": output_type})
-
-                # to 노드의 connected_from에 from 노드 추가
-                if to_node_id in node_connected_from and from_node_id not in node_connected_from[to_node_id]:
-                    node_connected_from[to_node_id].append(from_node_id)
-
-        # 새 노드들 저장
+        Raises:
+            ValueError: 연결 검증 실패 또는 노드 ID가 중복된 경우
+        """
+        result: dict[str, int] = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._patch_nodes_impl(cursor, script_id, nodes, removed_node_ids, connections)
+        )
+        return result
+
+    def _patch_nodes_impl(
+        self,
+        cursor: sqlite3.Cursor,
+        script_id: int,
+        nodes: list[dict[str, Any]],
+        removed_node_ids: list[str],
+        connections: list[dict[str, Any]] | None,
+    ) -> dict[str, int]:
+        """노드 변경분 저장 구현"""
+        # 저장된 노드를 읽고 쓰는 동안 다른 저장이 끼어들지 않도록 처음부터 쓰기 잠금을 잡음
+        cursor.execute("BEGIN IMMEDIATE")
+        existing = self._select_content_hashes(cursor, script_id)
+        current = {node["id"]: node for node in self._select_nodes(cursor, script_id)}
+
+        removed = set(removed_node_ids)
+        for node_id in removed:
+            current.pop(node_id, None)
         for node in nodes:
-            node_id = node["id"]
-            connected_to_json = json.dumps(node_connected_to.get(node_id, []), ensure_ascii=False)
-            connected_from_json = json.dumps(node_connected_from.get(node_id, []), ensure_ascii=False)
+            if node["id"] in removed:
+                raise ValueError(f"노드 '{node['id']}'를 변경하면서 삭제할 수 없습니다.")
+            current[node["id"]] = {**current.get(node["id"], {}), **node}
+        merged = list(current.values())
+
+        if connections is None:
+            connections = [
+                connection
+                for connection in self.build_connections_from_nodes(merged)
+                if connection["from"] not in removed and connection["to"] not in removed
+            ]
+        self.validate_connections(merged, connections)
+        return self._write_nodes(
+            cursor, script_id, merged, connections, existing, [node_id for node_id in existing if node_id in removed]
+        )
 
-            parameters = node.get("parameters", {})
-            parameters_json = json.dumps(parameters, ensure_ascii=False)
+    def _select_content_hashes(self, cursor: sqlite3.Cursor, script_id: int) -> dict[str, str | None]:
+        """저장된 노드 ID별 내용 해시 (해시 컬럼 추가 전에 저장한 노드는 None)"""
+        cursor.execute("SELECT node_id, content_hash FROM nodes WHERE script_id = ?", (script_id,))
+        return dict(cursor.fetchall())
+
+    def _write_nodes(
+        self,
+        cursor: sqlite3.Cursor,
+        script_id: int,
+        nodes: list[dict[str, Any]],
+        connections: list[dict[str, Any]],
+        existing: dict[str, str | None],
+        removed: Iterable[str],
+    ) -> dict[str, int]:
+        """
+        내용 해시가 바뀐 노드만 UPSERT하고 삭제할 노드를 삭제합니다.
 
-            description = node.get("description") or None
+        Args:
+            nodes: 저장할 노드 목록 (연결 정보는 connections로 다시 계산)
+            existing: 저장된 노드 ID별 내용 해시
+            removed: 삭제할 노드 ID
 
-            # node_data에서 color 필드 제거
-            node_data = node.get("data", {}).copy()
-            node_data.pop("color", None)
+        Returns:
+            {"added", "updated", "removed", "unchanged"} 노드 개수
+        """
+        node_connected_to, node_connected_from = self._build_connection_maps(nodes, connections)
 
-            # 연결 정보 추출 (프론트엔드에서 전달된 값 사용)
-            is_connected = node.get("is_connected")
-            connection_sequence = node.get("connection_sequence")
-            node_identifier = node.get("node_identifier")
+        rows = {}
+        for node in nodes:
+            node_id = node["id"]
+            if node_id in rows:
+                raise ValueError(f"노드 ID '{node_id}'가 중복되었습니다.")
+            values = self._node_values(node, node_connected_to[node_id], node_connected_from[node_id])
+            rows[node_id] = (script_id, node_id, *values, _content_hash(values))
 
-            cursor.execute(
-                """
-                INSERT INTO nodes (script_id, node_id, node_type, position_x, position_y, node_data, connected_to, connected_from, parameters, description, is_connected, connection_sequence, node_identifier)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    script_id,
-                    node_id,
-                    node["type"],
-                    node["position"]["x"],
-                    node["position"]["y"],
-                    json.dumps(node_data, ensure_ascii=False),
-                    connected_to_json,
-                    connected_from_json,
-                    parameters_json,
-                    description,
-                    1 if is_connected else 0 if is_connected is False else None,
-                    connection_sequence,
-                    node_identifier,
-                ),
+        changed = [row for node_id, row in rows.items() if existing.get(node_id) != row[-1]]
+        removed_ids = list(removed)
+
+        cursor.executemany(
+            "DELETE FROM nodes WHERE script_id = ? AND node_id = ?", [(script_id, node_id) for node_id in removed_ids]
+        )
+        cursor.executemany(
+            """
+            INSERT INTO nodes (
+                script_id, node_id, node_type, position_x, position_y, node_data, connected_to, connected_from,
+                parameters, description, is_connected, connection_sequence, node_identifier, content_hash
             )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(script_id, node_id) DO UPDATE SET
+                node_type = excluded.node_type,
+                position_x = excluded.position_x,
+                position_y = excluded.position_y,
+                node_data = excluded.node_data,
+                connected_to = excluded.connected_to,
+                connected_from = excluded.connected_from,
+                parameters = excluded.parameters,
+                description = excluded.description,
+                is_connected = excluded.is_connected,
+                connection_sequence = excluded.connection_sequence,
+                node_identifier = excluded.node_identifier,
+                content_hash = excluded.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            changed,
+        )
 
-        return True
+        added = sum(1 for row in changed if row[1] not in existing)
+        return {
+            "added": added,
+            "updated": len(changed) - added,
+            "removed": len(removed_ids),
+            "unchanged": len(rows) - len(changed),
+        }
+
+    def _build_connection_maps(
+        self, nodes: list[dict[str, Any]], connections: list[dict[str, Any]]
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, list[str]]]:
+        """connections 배열로 각 노드의 connected_to/connected_from 계산 (같은 노드 쌍의 중복 연결은 처음 것만 사용)"""
+        node_connected_to: dict[str, list[dict[str, Any]]] = {node["id"]: [] for node in nodes}
+        node_connected_from: dict[str, list[str]] = {node["id"]: [] for node in nodes}
+        # 이미 추가한 (from, to) 쌍 (연결마다 목록을 다시 훑지 않도록 집합으로 확인)
+        seen_to: set[tuple[str, str]] = set()
+        seen_from: set[tuple[str, str]] = set()
+
+        for connection in connections:
+            from_node_id = connection.get("from")
+            to_node_id = connection.get("to")
+            if not from_node_id or not to_node_id:
+                continue
+            key = (from_node_id, to_node_id)
+
+            # from 노드의 connected_to에 연결 정보 추가
+            if from_node_id in node_connected_to and key not in seen_to:
+                seen_to.add(key)
+                node_connected_to[from_node_id].append({"to": to_node_id, "outputType": connection.get("outputType")})
+
+            # to 노드의 connected_from에 from 노드 추가
+            if to_node_id in node_connected_from and key not in seen_from:
+                seen_from.add(key)
+                node_connected_from[to_node_id].append(from_node_id)
+
+        return node_connected_to, node_connected_from
+
+    def _node_values(
+        self, node: dict[str, Any], connected_to: list[dict[str, Any]], connected_from: list[str]
+    ) -> tuple[Any, ...]:
+        """노드를 nodes 테이블 컬럼 값으로 변환 (node_type부터 node_identifier까지, 내용 해시 계산에도 사용)"""
+        # node_data에서 color 필드 제거
+        node_data = node.get("data", {}).copy()
+        node_data.pop("color", None)
+
+        # 연결 정보 (프론트엔드에서 전달된 값 사용)
+        is_connected = node.get("is_connected")
+
+        # 위치는 REAL 컬럼에 저장되므로 float로 맞춤 (조회한 값과 요청 값의 해시가 같도록)
+        return (
+            node["type"],
+            float(node["position"]["x"]),
+            float(node["position"]["y"]),
+            json.dumps(node_data, ensure_ascii=False),
+            json.dumps(connected_to, ensure_ascii=False),
+            json.dumps(connected_from, ensure_ascii=False),
+            json.dumps(node.get("parameters", {}), ensure_ascii=False),
+            node.get("description") or None,
+            1 if is_connected else 0 if is_connected is False else None,
+            node.get("connection_sequence"),
+            node.get("node_identifier"),
+        )
 
     def cleanup_duplicate_boundary_nodes(self, script_id: int, nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -391,6 +509,12 @@ class NodeRepository:
         return nodes
 
 
+def _content_hash(values: tuple[Any, ...]) -> str:
+    """노드 컬럼 값의 내용 해시 (저장된 해시와 같으면 쓰지 않음)"""
+    raw = json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
 # ============================================================================
 # 테스트 코드
 # ============================================================================
@@ -7,11 +7,38 @@ from typing import Any
 
 # 직접 실행 시와 모듈로 import 시 모두 지원
 try:
+    from utils.pagination import decode_cursor, encode_cursor, project
+
     from .connection import DatabaseConnection
 except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
+    from utils.pagination import decode_cursor, encode_cursor, project
+
+# 스크립트 목록 필드와 조회 컬럼 (fields= 로 선택 가능)
+_SCRIPT_COLUMNS = {
+    "id": "id",
+    "name": "name",
+    "description": "description",
+    "active": "COALESCE(active, 1)",
+    "execution_order": "COALESCE(execution_order, id)",
+    "last_executed_at": "last_executed_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+# 스크립트별 실행 통계 필드 (script_stats 테이블, 기본 키 조회이므로 실행 기록 수와 관계없음)
+_SCRIPT_STATS_COLUMNS = {
+    "total_executions": "IFNULL(st.total_executions, 0)",
+    "success_count": "IFNULL(st.success_count, 0)",
+    "error_count": "IFNULL(st.error_count, 0)",
+    "avg_execution_time_ms": "ROUND(st.execution_time_total * 1.0 / NULLIF(st.execution_time_count, 0), 1)",
+    "p50_execution_time_ms": "st.p50_execution_time_ms",
+    "p95_execution_time_ms": "st.p95_execution_time_ms",
+    "last_execution_status": "st.last_status",
+}
+_SCRIPT_COLUMNS.update(_SCRIPT_STATS_COLUMNS)
+SCRIPT_FIELDS = tuple(_SCRIPT_COLUMNS)
 
 
 class ScriptRepository:
@@ -69,49 +96,77 @@ class ScriptRepository:
         cursor.execute("UPDATE scripts SET execution_order = ? WHERE id = ?", (new_execution_order, rowid))
         return rowid
 
-    def get_all_scripts(self) -> list[dict[str, Any]]:
+    def get_all_scripts(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
         """
         모든 스크립트 목록 조회
 
+        Args:
+            fields: 반환할 필드 (None이면 전체, SCRIPT_FIELDS 중 선택)
+
+        Returns:
+            스크립트 목록 (실행 순서대로)
+        """
+        return self._query_scripts("", (), fields)
+
+    def get_scripts_page(
+        self, limit: int, cursor: str | None = None, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        스크립트 목록을 실행 순서대로 한 페이지 조회합니다. (키셋 페이지네이션)
+
+        Args:
+            limit: 조회할 최대 개수
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            fields: 반환할 필드 (None이면 전체)
+
         Returns:
-            스크립트 목록
+            (스크립트 목록, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 잘못된 커서인 경우
         """
+        where = ""
+        params: tuple[Any, ...] = ()
+        if cursor is not None:
+            # (실행 순서, id) 인덱스에서 커서 다음 위치부터 읽음
+            where = "WHERE (COALESCE(execution_order, id), id) > (?, ?)"
+            params = tuple(decode_cursor(cursor, 2))
+        # 다음 페이지가 있는지 확인하기 위해 하나 더 읽음
+        scripts = self._query_scripts(where, params, None, limit + 1)
+        next_cursor = None
+        if len(scripts) > limit:
+            del scripts[limit:]
+            last = scripts[-1]
+            next_cursor = encode_cursor(last["execution_order"], last["id"])
+        return project(scripts, fields), next_cursor
+
+    def _query_scripts(
+        self, where: str, params: tuple[Any, ...], fields: list[str] | None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """스크립트 목록 조회 공통 처리 (fields에 있는 컬럼만 읽음)"""
+        names = SCRIPT_FIELDS if fields is None else tuple(name for name in SCRIPT_FIELDS if name in fields)
+        columns = ", ".join(f"{_SCRIPT_COLUMNS[name]} AS {name}" for name in names)
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
             # active, last_executed_at, execution_order 필드 포함 (컬럼이 없을 수 있으므로 COALESCE 사용)
             # execution_order 기준으로 정렬 (NULL이면 id 사용)하여 대시보드와 스크립트 페이지의 순서를 일치시킴
-            # 이 순서는 '전체 실행' 시에도 사용됨
-            cursor.execute("""
-                SELECT
-                    id,
-                    name,
-                    description,
-                    COALESCE(active, 1) as active,
-                    COALESCE(execution_order, id) as execution_order,
-                    last_executed_at,
-                    created_at,
-                    updated_at
-                FROM scripts
-                ORDER BY COALESCE(execution_order, id) ASC, id ASC
-            """)
-
-            scripts = []
-            for row in cursor.fetchall():
-                scripts.append(
-                    {
-                        "id": row[0],
-                        "name": row[1],
-                        "description": row[2],
-                        "active": bool(row[3]) if row[3] is not None else True,
-                        "execution_order": row[4] if row[4] is not None else row[0],  # execution_order가 없으면 id 사용
-                        "last_executed_at": row[5],
-                        "created_at": row[6],
-                        "updated_at": row[7],
-                    }
-                )
-
+            # 이 순서는 '전체 실행' 시에도 사용됨 (idx_scripts_order_keyset 인덱스 순서)
+            # 통계 필드를 요청한 경우에만 script_stats 조인
+            join = ""
+            if any(name in _SCRIPT_STATS_COLUMNS for name in names):
+                join = "LEFT JOIN script_stats AS st ON st.script_id = scripts.id"
+            query = f"SELECT {columns} FROM scripts {join} {where} ORDER BY COALESCE(execution_order, id) ASC, id ASC"
+            if limit is not None:
+                query += " LIMIT ?"
+                params = (*params, limit)
+            cursor.execute(query, params)
+
+            scripts = [dict(zip(names, row, strict=True)) for row in cursor.fetchall()]
+            if "active" in names:
+                for script in scripts:
+                    script["active"] = bool(script["active"]) if script["active"] is not None else True
             return scripts
         finally:
             conn.close()
@@ -0,0 +1,267 @@
+"""
+스크립트별 실행 통계 리포지토리 모듈
+
+script_stats 테이블은 스크립트마다 한 행으로 실행 횟수, 실행 시간 합계/개수, 마지막 실행,
+최근 ROLLING_WINDOW번 실행의 p50/p95 실행 시간을 저장합니다.
+실행이 끝날 때(record_script_execution) 같은 트랜잭션에서 해당 스크립트 행만 갱신하므로
+조회는 실행 기록 수와 관계없이 기본 키 조회입니다. (이전의 script_stats 뷰는 조회마다 전체 실행 기록을 GROUP BY)
+"""
+
+import math
+import os
+import sqlite3
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+
+# 통계에 포함하는 완료 상태 (running은 끝날 때 한 번만 셈)
+FINISHED_STATUSES = ("success", "error", "cancelled")
+# p50/p95 계산에 사용할 최근 실행 수
+ROLLING_WINDOW = 100
+
+_FINISHED_SQL = ", ".join(f"'{status}'" for status in FINISHED_STATUSES)
+_STATS_COLUMNS = (
+    "script_id",
+    "total_executions",
+    "success_count",
+    "error_count",
+    "cancelled_count",
+    "execution_time_total",
+    "execution_time_count",
+    "p50_execution_time_ms",
+    "p95_execution_time_ms",
+    "last_execution_at",
+    "last_status",
+)
+
+
+def percentile(sorted_values: list[int], fraction: float) -> int | None:
+    """정렬된 값의 백분위수 (nearest-rank, 값이 없으면 None)"""
+    if not sorted_values:
+        return None
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class ScriptStatsRepository:
+    """스크립트별 실행 통계 관련 데이터베이스 작업을 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        ScriptStatsRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def record_execution(
+        self,
+        cursor: sqlite3.Cursor,
+        script_id: int,
+        status: str,
+        execution_time_ms: int | None,
+        started_at: str | None,
+    ) -> None:
+        """
+        완료된 실행 하나를 스크립트 통계에 더합니다. 호출한 쪽의 트랜잭션에서 실행합니다.
+        (실행 기록을 완료 상태로 저장한 직후, 실행마다 한 번만 호출)
+
+        Args:
+            cursor: 데이터베이스 커서
+            script_id: 스크립트 ID
+            status: 완료 상태 ('success', 'error', 'cancelled')
+            execution_time_ms: 실행 시간 (밀리초, 없으면 실행 시간 통계에서 제외)
+            started_at: 실행 시작 시간 (마지막 실행 시간)
+        """
+        has_time = execution_time_ms is not None
+        cursor.execute(
+            """
+            INSERT INTO script_stats (
+                script_id, total_executions, success_count, error_count, cancelled_count,
+                execution_time_total, execution_time_count, last_execution_at, last_status
+            ) VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(script_id) DO UPDATE SET
+                total_executions = total_executions + 1,
+                success_count = success_count + excluded.success_count,
+                error_count = error_count + excluded.error_count,
+                cancelled_count = cancelled_count + excluded.cancelled_count,
+                execution_time_total = execution_time_total + excluded.execution_time_total,
+                execution_time_count = execution_time_count + excluded.execution_time_count,
+                last_status = CASE
+                    WHEN IFNULL(excluded.last_execution_at, '') >= IFNULL(last_execution_at, '')
+                    THEN excluded.last_status ELSE last_status
+                END,
+                last_execution_at = CASE
+                    WHEN IFNULL(excluded.last_execution_at, '') >= IFNULL(last_execution_at, '')
+                    THEN excluded.last_execution_at ELSE last_execution_at
+                END
+            """,
+            (
+                script_id,
+                int(status == "success"),
+                int(status == "error"),
+                int(status == "cancelled"),
+                execution_time_ms if has_time else 0,
+                int(has_time),
+                started_at,
+                status,
+            ),
+        )
+        if has_time:
+            # 최근 실행 시간 구간이 바뀌었으므로 이 스크립트의 p50/p95만 다시 계산 (최대 ROLLING_WINDOW행)
+            cursor.execute(
+                f"""
+                SELECT execution_time_ms FROM script_executions
+                WHERE script_id = ? AND status IN ({_FINISHED_SQL}) AND execution_time_ms IS NOT NULL
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (script_id, ROLLING_WINDOW),
+            )
+            self._update_percentiles(cursor, {script_id: [row[0] for row in cursor.fetchall()]})
+
+    def _update_percentiles(self, cursor: sqlite3.Cursor, times_by_script: dict[int, list[int]]) -> None:
+        """스크립트별 최근 실행 시간으로 p50/p95 저장"""
+        rows = []
+        for script_id, times in times_by_script.items():
+            times.sort()
+            rows.append((percentile(times, 0.5), percentile(times, 0.95), script_id))
+        cursor.executemany(
+            "UPDATE script_stats SET p50_execution_time_ms = ?, p95_execution_time_ms = ? WHERE script_id = ?",
+            rows,
+        )
+
+    def get_stats(self, script_id: int) -> dict[str, Any] | None:
+        """
+        스크립트 하나의 실행 통계 조회
+
+        Returns:
+            통계 딕셔너리 또는 None (완료된 실행이 없는 경우)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(f"SELECT {', '.join(_STATS_COLUMNS)} FROM script_stats WHERE script_id = ?", (script_id,))
+            row = cursor.fetchone()
+            return _row_to_stats(row) if row else None
+        finally:
+            conn.close()
+
+    def get_all_stats(self) -> list[dict[str, Any]]:
+        """
+        모든 스크립트의 실행 통계 조회 (완료된 실행이 있는 스크립트만)
+
+        Returns:
+            통계 딕셔너리 목록 (스크립트 ID 순)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(f"SELECT {', '.join(_STATS_COLUMNS)} FROM script_stats ORDER BY script_id")
+            return [_row_to_stats(row) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def rebuild(self) -> int:
+        """
+        실행 기록 전체로 스크립트 통계를 다시 만듭니다. (한 트랜잭션, 통계가 실행 기록과 맞지 않을 때 사용)
+
+        Returns:
+            통계를 만든 스크립트 수
+        """
+        result: int = self.connection.execute_with_connection(lambda _conn, cursor: self._rebuild_impl(cursor))
+        return result
+
+    def _rebuild_impl(self, cursor: sqlite3.Cursor) -> int:
+        """스크립트 통계 재생성 구현"""
+        cursor.execute("DELETE FROM script_stats")
+        cursor.execute(f"""
+            INSERT INTO script_stats (
+                script_id, total_executions, success_count, error_count, cancelled_count,
+                execution_time_total, execution_time_count, last_execution_at, last_status
+            )
+            SELECT
+                e.script_id,
+                COUNT(*),
+                SUM(e.status = 'success'),
+                SUM(e.status = 'error'),
+                SUM(e.status = 'cancelled'),
+                IFNULL(SUM(e.execution_time_ms), 0),
+                COUNT(e.execution_time_ms),
+                MAX(e.started_at),
+                (
+                    SELECT last.status FROM script_executions AS last
+                    WHERE last.script_id = e.script_id AND last.status IN ({_FINISHED_SQL})
+                    ORDER BY last.started_at DESC, last.id DESC
+                    LIMIT 1
+                )
+            FROM script_executions AS e
+            JOIN scripts AS s ON s.id = e.script_id
+            WHERE e.status IN ({_FINISHED_SQL})
+            GROUP BY e.script_id
+        """)
+        rebuilt = cursor.rowcount
+
+        # 스크립트별 최근 ROLLING_WINDOW번 실행 시간
+        cursor.execute(
+            f"""
+            SELECT script_id, execution_time_ms FROM (
+                SELECT
+                    script_id,
+                    execution_time_ms,
+                    ROW_NUMBER() OVER (PARTITION BY script_id ORDER BY id DESC) AS recent
+                FROM script_executions
+                WHERE status IN ({_FINISHED_SQL}) AND execution_time_ms IS NOT NULL
+            )
+            WHERE recent <= ?
+            """,
+            (ROLLING_WINDOW,),
+        )
+        times_by_script: dict[int, list[int]] = {}
+        for script_id, execution_time_ms in cursor.fetchall():
+            times_by_script.setdefault(script_id, []).append(execution_time_ms)
+        self._update_percentiles(cursor, times_by_script)
+        return rebuilt
+
+    def ensure_built(self) -> int:
+        """
+        완료된 실행 기록이 있는데 통계가 비어 있으면(통계 테이블 추가 전 DB) 한 번 다시 만듭니다.
+
+        Returns:
+            통계를 만든 스크립트 수 (이미 있으면 0)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                f"""
+                SELECT
+                    EXISTS (SELECT 1 FROM script_stats),
+                    EXISTS (SELECT 1 FROM script_executions WHERE status IN ({_FINISHED_SQL}))
+                """
+            )
+            has_stats, has_executions = cursor.fetchone()
+        finally:
+            conn.close()
+        if has_stats or not has_executions:
+            return 0
+        return self.rebuild()
+
+
+def _row_to_stats(row: tuple[Any, ...]) -> dict[str, Any]:
+    """script_stats 행을 딕셔너리로 변환 (평균 실행 시간 포함)"""
+    stats = dict(zip(_STATS_COLUMNS, row, strict=True))
+    time_count = stats["execution_time_count"]
+    stats["avg_execution_time_ms"] = round(stats["execution_time_total"] / time_count, 1) if time_count else None
+    return stats
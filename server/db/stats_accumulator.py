@@ -0,0 +1,142 @@
+"""
+통계 카운터 증분 누적기
+요청마다 통계 행을 읽고 +1 해서 다시 쓰면(read-modify-write) 동시에 들어온 요청의 값이 사라지므로,
+증분은 메모리에 모아 두었다가 주기적으로 한 트랜잭션에서 stat_value = stat_value + ? 로 반영합니다.
+
+동작 방식:
+- add(): 잠금 안에서 메모리의 증분에 더하기만 함 (DB를 읽거나 쓰지 않음)
+- flush(): 모아 둔 증분을 꺼내 리포지토리의 increment_stats()로 반영 (실패하면 다시 합쳐서 다음 주기에 재시도)
+- interval마다 별도 스레드(asyncio.to_thread)에서 flush()하고, 서버 종료 시 남은 증분을 반영
+- 조회 시에는 DB 값에 아직 반영하지 않은 증분(pending())을 더하면 항상 최신 값
+- set_stats(): 값을 직접 설정(초기화 등)할 때는 해당 키의 대기 중인 증분을 버리고 설정 (반영 중인 증분과 겹치지 않음)
+
+사용 예시:
+    db_manager.dashboard_counters.add({"all_executions": 1, "all_failed_scripts": 1})
+    db_manager.dashboard_counters.start(settings.STATS_FLUSH_INTERVAL_SEC)  # 실행 중인 이벤트 루프 안에서 호출
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class CounterRepository(Protocol):
+    """카운터 저장소 인터페이스 (DashboardStatsRepository, LogStatsRepository)"""
+
+    def increment_stats(self, deltas: Mapping[str, int]) -> bool: ...
+
+    def update_all_stats(self, stats: dict[str, int]) -> bool: ...
+
+
+class StatsAccumulator:
+    """통계 카운터 증분을 메모리에 모아 주기적으로 DB에 반영하는 클래스"""
+
+    def __init__(self, repository: CounterRepository, name: str) -> None:
+        """
+        Args:
+            repository: 증분을 반영할 통계 리포지토리
+            name: 로그와 작업 이름에 사용할 이름 (예: 'dashboard')
+        """
+        self.repository = repository
+        self.name = name
+        self.interval = 0.0
+        self._pending: dict[str, int] = {}
+        # _pending 보호 (add는 이벤트 루프 스레드, flush는 작업 스레드에서 호출)
+        self._lock = threading.Lock()
+        # 반영(flush)과 직접 설정(set_stats)이 동시에 실행되지 않도록 함
+        self._write_lock = threading.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """주기 반영 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def add(self, deltas: Mapping[str, int]) -> None:
+        """증분을 더합니다. (DB 작업 없음, 0인 값은 무시)"""
+        with self._lock:
+            for stat_key, delta in deltas.items():
+                if delta:
+                    self._pending[stat_key] = self._pending.get(stat_key, 0) + delta
+
+    def pending(self) -> dict[str, int]:
+        """아직 DB에 반영하지 않은 증분"""
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """
+        모아 둔 증분을 한 트랜잭션에서 반영합니다. 실패하면 증분을 되돌려 놓고 예외를 다시 발생시킵니다.
+
+        Returns:
+            반영한 통계 키 개수
+        """
+        with self._write_lock:
+            with self._lock:
+                deltas, self._pending = self._pending, {}
+            if not deltas:
+                return 0
+            try:
+                self.repository.increment_stats(deltas)
+            except Exception:
+                self.add(deltas)
+                raise
+            return len(deltas)
+
+    def set_stats(self, stats: dict[str, int]) -> bool:
+        """
+        통계 값을 직접 설정합니다. 설정한 키의 대기 중인 증분은 버립니다. (설정 이후의 증분만 더해짐)
+
+        Args:
+            stats: 통계 키-값 딕셔너리
+        """
+        with self._write_lock:
+            with self._lock:
+                for stat_key in stats:
+                    self._pending.pop(stat_key, None)
+            return self.repository.update_all_stats(stats)
+
+    def start(self, interval: float) -> None:
+        """
+        주기 반영을 시작합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            interval: 반영 주기 (초, 0 이하면 주기 반영 안 함, 호출한 쪽에서 add() 후 바로 flush())
+        """
+        self.interval = interval
+        if self.running or interval <= 0:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name=f"{self.name}-stats-flush")
+        logger.info("[StatsAccumulator] %s 통계 증분 반영 시작 - 주기: %s초", self.name, interval)
+
+    async def stop(self) -> None:
+        """주기 반영을 멈추고 남은 증분을 반영합니다."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self._flush_async()
+
+    async def _run(self) -> None:
+        """interval마다 증분을 반영합니다."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self._flush_async()
+
+    async def _flush_async(self) -> None:
+        """작업 스레드에서 flush()를 실행합니다. (실패하면 다음 주기에 재시도)"""
+        try:
+            await asyncio.to_thread(self.flush)
+        except Exception as e:
+            logger.warning("[StatsAccumulator] %s 통계 증분 반영 실패 (다음 주기에 재시도): %s", self.name, e)
@@ -1,17 +1,24 @@
 """테이블 생성 및 마이그레이션 관리 모듈"""
 
 import contextlib
+import logging
 import os
 import sqlite3
 import sys
+import time
+from typing import Any
 
 # 직접 실행 시와 모듈로 import 시 모두 지원
 try:
     from .connection import DatabaseConnection
+    from .migrations import LATEST_VERSION, MIGRATIONS, Migration
 except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from db.connection import DatabaseConnection
+    from db.migrations import LATEST_VERSION, MIGRATIONS, Migration
+
+logger = logging.getLogger(__name__)
 
 
 class TableManager:
@@ -32,6 +39,9 @@ class TableManager:
         cursor = self.connection.get_cursor(conn)
 
         try:
+            # 새 DB는 증분 VACUUM 모드로 생성 (로그 정리 후 빈 페이지를 파일에서 반환, 기존 DB에는 영향 없음)
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
             # 스크립트 테이블 생성
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS scripts (
@@ -61,6 +71,9 @@ class TableManager:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_scripts_execution_order ON scripts(execution_order ASC)"
             )  # 실행 순서 기준 정렬 최적화 (전체 실행 시 사용)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scripts_order_keyset ON scripts(COALESCE(execution_order, id), id)"
+            )  # 스크립트 목록 정렬 순서와 같은 식 인덱스 (키셋 페이지네이션, 정렬용 임시 B-트리 없음)
 
             # 노드 테이블 생성
             cursor.execute("""
@@ -171,20 +184,13 @@ class TableManager:
                     is_connected INTEGER DEFAULT 0,
                     connection_sequence INTEGER,
                     node_identifier TEXT,
+                    attempt INTEGER DEFAULT 1,
                     FOREIGN KEY (script_id) REFERENCES scripts(id) ON DELETE CASCADE
                 )
             """)
             # 노드 실행 로그 인덱스 추가
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_execution_id ON node_execution_logs(execution_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_script_id ON node_execution_logs(script_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_node_id ON node_execution_logs(node_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_status ON node_execution_logs(status)")
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_node_logs_started_at ON node_execution_logs(started_at DESC)"
-            )
-            cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_node_logs_script_started ON node_execution_logs(script_id, started_at DESC)"
-            )
+            self._create_node_log_keyset_indexes(cursor)
 
             # 연결 정보 필드 마이그레이션 (기존 테이블에 컬럼 추가)
             # 기존 데이터와의 호환성을 위해 NULL 허용
@@ -197,12 +203,37 @@ class TableManager:
             with contextlib.suppress(Exception):
                 cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN node_identifier TEXT")
 
+            # 재시도 정책 적용 시 시도 횟수 (같은 로그 행에서 갱신)
+            with contextlib.suppress(Exception):
+                cursor.execute("ALTER TABLE node_execution_logs ADD COLUMN attempt INTEGER DEFAULT 1")
+
             # 연결 정보 인덱스 추가 (조회 최적화)
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_node_logs_connection_seq ON node_execution_logs(connection_sequence)"
             )
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_is_connected ON node_execution_logs(is_connected)")
 
+            # 페이로드(파라미터/결과/스택 트레이스) 참조 컬럼 (log_payloads.ref, 비어 있으면 행에 직접 저장된 이전 로그)
+            for column in ("parameters_ref", "result_ref", "traceback_ref"):
+                with contextlib.suppress(Exception):
+                    cursor.execute(f"ALTER TABLE node_execution_logs ADD COLUMN {column} TEXT")
+
+            # 노드 실행 로그 페이로드 테이블 (내용 해시 기준 중복 제거, zlib 압축 JSON)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS log_payloads (
+                    ref TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) WITHOUT ROWID
+            """)
+
+            # 에러 메시지/스택 트레이스/노드 이름 전문 검색 인덱스 (execution_logging.log_search 참고)
+            self._create_node_log_search_index(cursor)
+
+            # 실행 ID + 노드 ID당 최종 로그(completed/failed)는 하나만 (로그 저장 시 INSERT OR IGNORE로 중복 방지)
+            self._create_final_log_unique_index(cursor)
+
             # 로그 통계 테이블 생성 (실행 기록 페이지 통계)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS log_stats (
@@ -219,13 +250,16 @@ class TableManager:
             # completed: 완료된 로그 개수
             # failed: 실패한 로그 개수
             # average_execution_time: 평균 실행 시간 (밀리초)
+            # execution_time_total, execution_time_count: 평균 실행 시간을 증분으로 계산하기 위한 합계와 개수
             cursor.execute("""
                 INSERT OR IGNORE INTO log_stats (stat_key, stat_value, updated_at, created_at)
                 VALUES
                     ('total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                     ('completed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                     ('failed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
-                    ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                    ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('execution_time_total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                    ('execution_time_count', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """)
 
             # 태그 테이블 생성 (스크립트 분류 및 검색용)
@@ -275,31 +309,348 @@ class TableManager:
                     ('inactive_scripts', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """)
 
-            # 통계 뷰 생성 (대시보드용)
-            self._create_views(cursor)
+            # 대시보드 일별 통계 (오늘 실행 횟수, 오늘 실패한 스크립트 개수)
+            # day: 로컬 날짜 (YYYY-MM-DD), stat_key: 'executions' 또는 'failed_scripts'
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dashboard_daily_stats (
+                    day TEXT NOT NULL,
+                    stat_key TEXT NOT NULL,
+                    stat_value INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, stat_key)
+                ) WITHOUT ROWID
+            """)
+            # 날짜별 실패한 스크립트 (같은 날 같은 스크립트가 여러 번 실패해도 한 번만 세기 위한 집합)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS dashboard_daily_failed_scripts (
+                    day TEXT NOT NULL,
+                    script_id INTEGER NOT NULL,
+                    PRIMARY KEY (day, script_id)
+                ) WITHOUT ROWID
+            """)
+            self._create_dashboard_counter_triggers(cursor)
+
+            # 메트릭 스냅샷 테이블 생성 (서버 재시작 후에도 기간별 노드 실행 시간 분포/카운터 조회)
+            # 카운터/히스토그램은 직전 스냅샷 이후 증분, 게이지는 저장 시점 값을 기록
+            # histogram: 구간 개수 JSON (monitoring.metrics.LatencyHistogram.to_dict())
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS metrics_snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    captured_at TIMESTAMP NOT NULL,
+                    metric TEXT NOT NULL,
+                    labels TEXT NOT NULL DEFAULT '{}',
+                    value REAL,
+                    histogram TEXT
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metrics_snapshots_captured_at ON metrics_snapshots(captured_at)"
+            )
+
+            # 저장된 실행 추적 테이블 (요청 시에만 저장, 메모리의 최근 실행 추적은 서버 재시작 시 사라짐)
+            # trace: 스팬 목록을 포함한 JSON (monitoring.Trace.to_dict())
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS execution_traces (
+                    execution_id TEXT PRIMARY KEY,
+                    started_at TEXT,
+                    duration_ms REAL,
+                    span_count INTEGER NOT NULL DEFAULT 0,
+                    trace TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # 스크립트별 실행 통계 테이블 (실행 완료 시 갱신, 이전의 script_stats 뷰를 대체)
+            self._create_script_stats_table(cursor)
 
             conn.commit()
         finally:
             conn.close()
 
-    def _create_views(self, cursor: sqlite3.Cursor) -> None:
-        """성능 최적화를 위한 뷰 생성"""
-        # 스크립트 통계 뷰 (대시보드용)
+    def _create_node_log_keyset_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그 목록 조회용 인덱스 (키셋 페이지네이션)
+
+        목록은 (started_at, id) 역순으로 정렬하고 커서 다음 위치부터 읽으므로
+        조건 컬럼 + (started_at, id) 인덱스 하나로 조건 검색, 정렬, 커서 위치 찾기를 모두 처리합니다. (정렬용 임시 B-트리 없음)
+        """
+        # 정렬 키가 비어 있는 이전 로그는 키셋 조회에서 빠지므로 생성/종료 시각으로 채움
+        cursor.execute("""
+            UPDATE node_execution_logs SET started_at = COALESCE(created_at, finished_at)
+            WHERE started_at IS NULL
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_node_logs_started_keyset ON node_execution_logs(started_at, id)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_script_keyset ON node_execution_logs(script_id, started_at, id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_node_keyset ON node_execution_logs(node_id, started_at, id)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_node_logs_status_keyset ON node_execution_logs(status, started_at, id)"
+        )
+        # 위 인덱스의 앞부분과 같은 이전 인덱스 삭제 (쓰기 비용과 DB 크기 감소)
+        for index in (
+            "idx_node_logs_script_id",
+            "idx_node_logs_node_id",
+            "idx_node_logs_status",
+            "idx_node_logs_started_at",
+            "idx_node_logs_script_started",
+        ):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+
+    def _create_node_log_search_index(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그 전문 검색 인덱스 (FTS5)
+
+        rowid가 로그 ID인 FTS5 테이블로, 최종 로그 저장 시 리포지토리에서 함께 INSERT하고
+        로그가 삭제되면(보관 정책 정리, 스크립트 삭제 CASCADE 포함) 트리거로 삭제합니다.
+        기존 로그는 서버 시작 시 NodeExecutionLogRepository.ensure_search_index()에서 채웁니다.
+        FTS5를 지원하지 않는 SQLite에서는 만들지 않으며 검색 API만 사용할 수 없습니다.
+        """
+        try:
+            # prefix: 2~3글자 접두어 검색용 인덱스 (검색어 단어는 모두 접두어 검색)
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS node_log_search USING fts5(
+                    node_name, node_identifier, error_message, error_traceback,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"전문 검색 인덱스를 만들 수 없습니다 (FTS5 미지원, 로그 검색 사용 불가): {e!s}")
+            return
+        # ORDER BY rank 순위: 컬럼별 bm25 가중치 (에러 메시지에서 찾은 결과를 먼저 표시)
+        cursor.execute(
+            "INSERT INTO node_log_search (node_log_search, rank) VALUES ('rank', 'bm25(2.0, 2.0, 4.0, 1.0)')"
+        )
         cursor.execute("""
-            CREATE VIEW IF NOT EXISTS script_stats AS
-            SELECT
-                s.id,
-                s.name,
-                s.active,
-                s.last_executed_at,
-                COUNT(e.id) AS total_executions,
-                SUM(CASE WHEN e.status = 'success' THEN 1 ELSE 0 END) AS success_count,
-                SUM(CASE WHEN e.status = 'error' THEN 1 ELSE 0 END) AS error_count,
-                AVG(e.execution_time_ms) AS avg_execution_time_ms,
-                MAX(e.started_at) AS last_execution_at
-            FROM scripts s
-            LEFT JOIN script_executions e ON s.id = e.script_id
-            GROUP BY s.id, s.name, s.active, s.last_executed_at
+            CREATE TRIGGER IF NOT EXISTS trg_node_logs_search_delete
+            AFTER DELETE ON node_execution_logs
+            BEGIN
+                DELETE FROM node_log_search WHERE rowid = old.id;
+            END
+        """)
+
+    def _create_dashboard_counter_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """
+        대시보드 통계 카운터 트리거 생성
+
+        스크립트 추가/삭제/활성 상태 변경과 실행 기록 저장/삭제 시 같은 트랜잭션에서 카운터를 1씩 바꾸므로
+        통계 조회는 전체 테이블을 세지 않고 dashboard_stats, dashboard_daily_stats의 행만 읽습니다.
+        트리거를 처음 만들 때 기존 데이터로 카운터를 한 번 다시 계산합니다.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_scripts_stats_insert'")
+        if cursor.fetchone():
+            return
+
+        # 전체/비활성 스크립트 개수 (active가 비어 있으면 비활성으로 취급)
+        cursor.execute("""
+            CREATE TRIGGER trg_scripts_stats_insert AFTER INSERT ON scripts
+            BEGIN
+                UPDATE dashboard_stats SET stat_value = stat_value + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE stat_key = 'total_scripts';
+                UPDATE dashboard_stats SET stat_value = stat_value + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE stat_key = 'inactive_scripts' AND IFNULL(NEW.active, 0) = 0;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER trg_scripts_stats_delete AFTER DELETE ON scripts
+            BEGIN
+                UPDATE dashboard_stats SET stat_value = stat_value - 1, updated_at = CURRENT_TIMESTAMP
+                WHERE stat_key = 'total_scripts';
+                UPDATE dashboard_stats SET stat_value = stat_value - 1, updated_at = CURRENT_TIMESTAMP
+                WHERE stat_key = 'inactive_scripts' AND IFNULL(OLD.active, 0) = 0;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER trg_scripts_stats_active AFTER UPDATE OF active ON scripts
+            WHEN (IFNULL(OLD.active, 0) = 0) <> (IFNULL(NEW.active, 0) = 0)
+            BEGIN
+                UPDATE dashboard_stats
+                SET stat_value = stat_value + (IFNULL(NEW.active, 0) = 0) - (IFNULL(OLD.active, 0) = 0),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE stat_key = 'inactive_scripts';
+            END
+        """)
+
+        self._create_execution_counter_triggers(cursor)
+        self._recount_dashboard_stats(cursor)
+
+    def _create_execution_counter_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """
+        일별 실행 통계 트리거 생성 (이미 있으면 다시 만듦)
+
+        오늘 실행 횟수는 그날 시작한 실행 기록 수(실행 중 포함), 오늘 실패한 스크립트는 그날 시작한 실행 중
+        error 상태인 스크립트 수입니다. 실행 기록의 started_at(로컬 시각으로 저장됨) 날짜에 더하고,
+        실행 기록이 삭제되면(스크립트 삭제 CASCADE 등) 다시 뺍니다.
+        """
+        # trg_executions_stats_finish: 이전 버전의 완료 날짜 기준 트리거
+        for name in (
+            "trg_executions_stats_finish",
+            "trg_executions_stats_insert",
+            "trg_executions_stats_error",
+            "trg_executions_stats_error_update",
+            "trg_executions_stats_delete",
+        ):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+        day = "date(COALESCE(NEW.started_at, datetime('now', 'localtime')))"
+        # 그날 처음 실패한 스크립트면 실패한 스크립트 개수 증가
+        mark_failed = f"""
+                INSERT INTO dashboard_daily_stats (day, stat_key, stat_value)
+                SELECT {day}, 'failed_scripts', 1
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM dashboard_daily_failed_scripts WHERE day = {day} AND script_id = NEW.script_id
+                )
+                ON CONFLICT (day, stat_key) DO UPDATE SET stat_value = stat_value + 1;
+                INSERT OR IGNORE INTO dashboard_daily_failed_scripts (day, script_id) VALUES ({day}, NEW.script_id);
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER trg_executions_stats_insert AFTER INSERT ON script_executions
+            BEGIN
+                INSERT INTO dashboard_daily_stats (day, stat_key, stat_value) VALUES ({day}, 'executions', 1)
+                ON CONFLICT (day, stat_key) DO UPDATE SET stat_value = stat_value + 1;
+            END
+        """)
+        # 실패 상태로 바로 저장(INSERT)하는 경우와 running 기록을 error로 바꾸는(UPDATE) 경우 모두 처리
+        cursor.execute(f"""
+            CREATE TRIGGER trg_executions_stats_error AFTER INSERT ON script_executions
+            WHEN NEW.status = 'error'
+            BEGIN
+                {mark_failed}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER trg_executions_stats_error_update AFTER UPDATE OF status ON script_executions
+            WHEN NEW.status = 'error' AND OLD.status <> 'error'
+            BEGIN
+                {mark_failed}
+            END
+        """)
+        # 삭제된 실행 기록은 그날 통계에서 제외 (그날 그 스크립트의 다른 실패 기록이 없으면 실패한 스크립트에서도 제외)
+        old_day = "date(OLD.started_at)"
+        cursor.execute(f"""
+            CREATE TRIGGER trg_executions_stats_delete AFTER DELETE ON script_executions
+            BEGIN
+                UPDATE dashboard_daily_stats SET stat_value = stat_value - 1
+                WHERE day = {old_day} AND stat_key = 'executions';
+                UPDATE dashboard_daily_stats SET stat_value = stat_value - 1
+                WHERE day = {old_day} AND stat_key = 'failed_scripts' AND OLD.status = 'error'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM script_executions
+                      WHERE script_id = OLD.script_id AND status = 'error' AND date(started_at) = {old_day}
+                  );
+                DELETE FROM dashboard_daily_failed_scripts
+                WHERE day = {old_day} AND script_id = OLD.script_id AND OLD.status = 'error'
+                  AND NOT EXISTS (
+                      SELECT 1 FROM script_executions
+                      WHERE script_id = OLD.script_id AND status = 'error' AND date(started_at) = {old_day}
+                  );
+            END
+        """)
+
+    def _recount_dashboard_stats(self, cursor: sqlite3.Cursor) -> None:
+        """대시보드 카운터를 기존 데이터로 다시 계산합니다. (트리거 생성 시 한 번)"""
+        cursor.execute("""
+            UPDATE dashboard_stats SET
+                stat_value = CASE stat_key
+                    WHEN 'total_scripts' THEN (SELECT COUNT(*) FROM scripts)
+                    ELSE (SELECT COUNT(*) FROM scripts WHERE IFNULL(active, 0) = 0)
+                END,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE stat_key IN ('total_scripts', 'inactive_scripts')
+        """)
+        self._recount_daily_stats(cursor)
+        # 이전 버전에서 조회 시 다시 계산하여 저장하던 오늘 통계 (일별 통계로 대체)
+        cursor.execute("DELETE FROM dashboard_stats WHERE stat_key IN ('today_executions', 'today_failed_scripts')")
+
+    def _recount_daily_stats(self, cursor: sqlite3.Cursor) -> None:
+        """일별 실행 통계를 기존 실행 기록으로 다시 계산합니다. (시작 날짜 기준)"""
+        day = "date(started_at)"
+        cursor.execute("DELETE FROM dashboard_daily_stats")
+        cursor.execute("DELETE FROM dashboard_daily_failed_scripts")
+        cursor.execute(f"""
+            INSERT INTO dashboard_daily_failed_scripts (day, script_id)
+            SELECT DISTINCT {day}, script_id FROM script_executions
+            WHERE status = 'error' AND {day} IS NOT NULL
+        """)
+        cursor.execute(f"""
+            INSERT INTO dashboard_daily_stats (day, stat_key, stat_value)
+            SELECT {day}, 'executions', COUNT(*) FROM script_executions
+            WHERE {day} IS NOT NULL
+            GROUP BY {day}
+        """)
+        cursor.execute("""
+            INSERT INTO dashboard_daily_stats (day, stat_key, stat_value)
+            SELECT day, 'failed_scripts', COUNT(*) FROM dashboard_daily_failed_scripts GROUP BY day
+        """)
+
+    def rebucket_daily_stats(self) -> None:
+        """일별 실행 통계 트리거를 시작 날짜 기준으로 다시 만들고 기존 실행 기록으로 다시 계산합니다."""
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            self._create_execution_counter_triggers(cursor)
+            self._recount_daily_stats(cursor)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _create_final_log_unique_index(self, cursor: sqlite3.Cursor) -> None:
+        """
+        노드 실행 로그의 최종 로그 고유 인덱스 생성
+
+        running 로그는 더 이상 DB에 저장하지 않으므로(실행 중 로그는 메모리에 보관) 이전 버전에서 남은
+        running 로그를 삭제하고, 중복된 최종 로그는 가장 먼저 저장된 것만 남긴 뒤 인덱스를 생성합니다.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_node_logs_final_unique'")
+        if cursor.fetchone():
+            return
+
+        cursor.execute("DELETE FROM node_execution_logs WHERE status = 'running'")
+        cursor.execute("""
+            DELETE FROM node_execution_logs
+            WHERE execution_id IS NOT NULL
+              AND status IN ('completed', 'failed')
+              AND id NOT IN (
+                  SELECT MIN(id) FROM node_execution_logs
+                  WHERE execution_id IS NOT NULL AND status IN ('completed', 'failed')
+                  GROUP BY execution_id, node_id
+              )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_node_logs_final_unique
+            ON node_execution_logs(execution_id, node_id)
+            WHERE status IN ('completed', 'failed')
+        """)
+
+    def _create_script_stats_table(self, cursor: sqlite3.Cursor) -> None:
+        """
+        스크립트별 실행 통계 테이블 (ScriptStatsRepository)
+
+        이전 DB의 script_stats 뷰는 조회마다 script_executions 전체를 GROUP BY하므로 삭제하고 같은 이름의 테이블로 바꿉니다.
+        기존 실행 기록으로 채우는 작업은 DatabaseManager.init_database에서 한 번 수행합니다. (ScriptStatsRepository.ensure_built)
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = 'script_stats'")
+        if cursor.fetchone():
+            cursor.execute("DROP VIEW script_stats")
+        # last_execution_at: 마지막 완료 실행의 시작 시간, p50/p95: 최근 실행(ROLLING_WINDOW번)의 실행 시간 백분위수
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS script_stats (
+                script_id INTEGER PRIMARY KEY,
+                total_executions INTEGER NOT NULL DEFAULT 0,
+                success_count INTEGER NOT NULL DEFAULT 0,
+                error_count INTEGER NOT NULL DEFAULT 0,
+                cancelled_count INTEGER NOT NULL DEFAULT 0,
+                execution_time_total INTEGER NOT NULL DEFAULT 0,
+                execution_time_count INTEGER NOT NULL DEFAULT 0,
+                p50_execution_time_ms INTEGER,
+                p95_execution_time_ms INTEGER,
+                last_execution_at TIMESTAMP,
+                last_status TEXT,
+                FOREIGN KEY (script_id) REFERENCES scripts(id) ON DELETE CASCADE
+            )
         """)
 
     def migrate_tables(self) -> None:
@@ -398,17 +749,141 @@ class TableManager:
                         ('total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                         ('completed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
                         ('failed', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
-                        ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                        ('average_execution_time', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('execution_time_total', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP),
+                        ('execution_time_count', 0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
                 """)
 
             conn.commit()
         finally:
             conn.close()
 
-    def initialize(self) -> None:
-        """테이블 생성 및 마이그레이션 실행"""
-        self.create_tables()
-        self.migrate_tables()
+    def add_node_content_hash(self) -> None:
+        """nodes 테이블에 내용 해시 컬럼 추가 (NodeRepository가 저장 시 바뀐 노드를 찾는 데 사용)"""
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("PRAGMA table_info(nodes)")
+            if "content_hash" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE nodes ADD COLUMN content_hash TEXT")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _create_schema_version_table(self, cursor: sqlite3.Cursor) -> None:
+        """적용한 마이그레이션 단계를 기록하는 테이블 생성 (backfilled_at이 NULL이면 데이터 채우기 대기 중)"""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                duration_ms REAL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                backfilled_at TIMESTAMP
+            )
+        """)
+
+    def get_schema_version(self) -> int:
+        """
+        적용한 마지막 마이그레이션 버전
+
+        Returns:
+            버전 (버전 기록 전에 만든 DB나 새 DB는 0)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            self._create_schema_version_table(cursor)
+            conn.commit()
+            cursor.execute("SELECT MAX(version) FROM schema_version")
+            version: int = cursor.fetchone()[0] or 0
+            return version
+        finally:
+            conn.close()
+
+    def get_migration_history(self) -> list[dict[str, Any]]:
+        """적용한 마이그레이션 단계 목록 (버전 순)"""
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            self._create_schema_version_table(cursor)
+            conn.commit()
+            cursor.execute(
+                "SELECT version, name, duration_ms, applied_at, backfilled_at FROM schema_version ORDER BY version"
+            )
+            columns = ("version", "name", "duration_ms", "applied_at", "backfilled_at")
+            return [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+    def get_pending_backfills(self) -> list[Migration]:
+        """스키마는 적용했지만 데이터 채우기가 끝나지 않은 마이그레이션 단계 (버전 순)"""
+        pending = {row["version"] for row in self.get_migration_history() if row["backfilled_at"] is None}
+        return [migration for migration in MIGRATIONS if migration.version in pending]
+
+    def mark_backfilled(self, version: int) -> None:
+        """마이그레이션 단계의 데이터 채우기 완료 기록"""
+        self.connection.execute_with_connection(
+            lambda _conn, cursor: cursor.execute(
+                "UPDATE schema_version SET backfilled_at = CURRENT_TIMESTAMP WHERE version = ?", (version,)
+            )
+        )
+
+    def _record_migration(self, migration: Migration, duration_ms: float) -> None:
+        """적용한 마이그레이션 단계 기록 (데이터 채우기가 없으면 채우기도 완료로 기록)"""
+        self.connection.execute_with_connection(
+            lambda _conn, cursor: cursor.execute(
+                """
+                INSERT OR REPLACE INTO schema_version (version, name, duration_ms, backfilled_at)
+                VALUES (?, ?, ?, CASE WHEN ? THEN NULL ELSE CURRENT_TIMESTAMP END)
+                """,
+                (migration.version, migration.name, duration_ms, bool(migration.backfills)),
+            )
+        )
+
+    def initialize(self) -> dict[str, Any]:
+        """
+        아직 적용하지 않은 마이그레이션 단계만 버전 순서대로 실행합니다.
+        (최신 버전인 DB는 버전 조회 한 번으로 끝남, 데이터 채우기는 DatabaseManager.run_backfills()에서 실행)
+
+        Returns:
+            {"version": 적용 후 버전, "applied": 이번에 적용한 단계 목록, "duration_ms": 소요 시간}
+        """
+        started = time.perf_counter()
+        current = self.get_schema_version()
+        if current > LATEST_VERSION:
+            logger.warning(
+                "[DB] DB 스키마 버전(%s)이 서버가 아는 최신 버전(%s)보다 높습니다. 마이그레이션을 건너뜁니다.",
+                current,
+                LATEST_VERSION,
+            )
+
+        applied = []
+        for migration in MIGRATIONS:
+            if migration.version <= current:
+                continue
+            step_started = time.perf_counter()
+            migration.apply(self)
+            duration_ms = round((time.perf_counter() - step_started) * 1000, 1)
+            # 단계가 끝난 뒤에 기록 (중간에 실패하면 다음 시작 시 같은 단계를 다시 실행)
+            self._record_migration(migration, duration_ms)
+            applied.append({"version": migration.version, "name": migration.name, "duration_ms": duration_ms})
+            logger.info("[DB] 마이그레이션 %s(%s) 적용 완료 - %sms", migration.version, migration.name, duration_ms)
+
+        result = {
+            "version": max(current, LATEST_VERSION),
+            "applied": applied,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        logger.info(
+            "[DB] 스키마 확인 완료 - 버전: %s, 적용한 단계: %s개, 소요 시간: %sms",
+            result["version"],
+            len(applied),
+            result["duration_ms"],
+        )
+        return result
 
 
 # ============================================================================
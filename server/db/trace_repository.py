@@ -0,0 +1,127 @@
+"""실행 추적(trace) 저장 리포지토리 모듈"""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import Any
+
+# 직접 실행 시와 모듈로 import 시 모두 지원
+try:
+    from .connection import DatabaseConnection
+except ImportError:
+    # 직접 실행 시 절대 import 사용
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from db.connection import DatabaseConnection
+
+
+class TraceRepository:
+    """저장된 실행 추적(execution_traces 테이블) 관련 데이터베이스 작업을 처리하는 클래스"""
+
+    def __init__(self, connection: DatabaseConnection) -> None:
+        """
+        TraceRepository 초기화
+
+        Args:
+            connection: DatabaseConnection 인스턴스
+        """
+        self.connection = connection
+
+    def save_trace(self, trace: dict[str, Any]) -> None:
+        """
+        실행 추적을 저장합니다. (같은 실행 ID가 있으면 덮어씀)
+
+        Args:
+            trace: monitoring.Trace.to_dict() 결과
+        """
+        self.connection.execute_with_connection(lambda _conn, cursor: self._save_trace_impl(cursor, trace))
+
+    def _save_trace_impl(self, cursor: sqlite3.Cursor, trace: dict[str, Any]) -> None:
+        """실행 추적 저장 구현"""
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO execution_traces (execution_id, started_at, duration_ms, span_count, trace)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                trace["execution_id"],
+                trace.get("started_at"),
+                trace.get("duration_ms"),
+                len(trace.get("spans") or []),
+                json.dumps(trace, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+
+    def get_trace(self, execution_id: str) -> dict[str, Any] | None:
+        """
+        저장된 실행 추적을 조회합니다.
+
+        Args:
+            execution_id: 실행 ID
+
+        Returns:
+            Trace.to_dict() 형식의 딕셔너리 또는 None
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("SELECT trace FROM execution_traces WHERE execution_id = ?", (execution_id,))
+            row = cursor.fetchone()
+            result: dict[str, Any] | None = json.loads(row[0]) if row else None
+            return result
+        finally:
+            conn.close()
+
+    def list_traces(self, limit: int = 50) -> list[dict[str, Any]]:
+        """
+        저장된 실행 추적 요약 목록을 최근 저장 순으로 조회합니다. (스팬 본문은 제외)
+
+        Args:
+            limit: 최대 개수
+
+        Returns:
+            요약 목록 ({"execution_id", "started_at", "duration_ms", "span_count", "saved_at"})
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(
+                """
+                SELECT execution_id, started_at, duration_ms, span_count, created_at
+                FROM execution_traces
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            return [
+                {
+                    "execution_id": row[0],
+                    "started_at": row[1],
+                    "duration_ms": row[2],
+                    "span_count": row[3],
+                    "saved_at": row[4],
+                }
+                for row in cursor.fetchall()
+            ]
+        finally:
+            conn.close()
+
+    def delete_trace(self, execution_id: str) -> bool:
+        """
+        저장된 실행 추적을 삭제합니다.
+
+        Args:
+            execution_id: 실행 ID
+
+        Returns:
+            삭제 여부
+        """
+        result: bool = self.connection.execute_with_connection(
+            lambda _conn, cursor: (
+                cursor.execute("DELETE FROM execution_traces WHERE execution_id = ?", (execution_id,)).rowcount > 0
+            )
+        )
+        return result
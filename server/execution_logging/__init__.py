@@ -2,14 +2,38 @@
 로그 관련 모듈 통합
 """
 
+from pathlib import Path
+
+from config.server_config import settings
+
 from .execution_log_client import ExecutionLogClient, get_log_client
 from .execution_log_models import NodeExecutionLogRequest, NodeExecutionLogResponse
 from .execution_log_repository import NodeExecutionLogRepository
+from .in_flight_logs import InFlightLogStore
+from .log_archive import LogArchive
+from .log_retention import LogRetentionManager
+
+# 서버 전체에서 사용하는 로그 보관 정책 (main.py의 startup 이벤트에서 주기 정리 시작)
+# 보관 파일 디렉토리는 server 폴더 기준 상대 경로 (절대 경로도 가능)
+log_retention = LogRetentionManager(
+    LogArchive(str(Path(__file__).resolve().parent.parent / settings.LOG_ARCHIVE_DIR)),
+    retention_days=settings.LOG_RETENTION_DAYS,
+    max_rows=settings.LOG_RETENTION_MAX_ROWS,
+    max_mb=settings.LOG_RETENTION_MAX_MB,
+    interval=settings.LOG_RETENTION_INTERVAL_SEC,
+    batch_size=settings.LOG_RETENTION_BATCH_SIZE,
+    vacuum=settings.LOG_RETENTION_VACUUM,
+    archive_enabled=settings.LOG_ARCHIVE_ENABLED,
+)
 
 __all__ = [
     "ExecutionLogClient",
+    "InFlightLogStore",
+    "LogArchive",
+    "LogRetentionManager",
     "NodeExecutionLogRepository",
     "NodeExecutionLogRequest",
     "NodeExecutionLogResponse",
     "get_log_client",
+    "log_retention",
 ]
@@ -5,14 +5,16 @@ wrapper에서 서버로 로그를 전송하는 기능을 제공합니다.
 
 import asyncio
 from datetime import datetime
+import itertools
 from typing import Any
 
 import aiohttp
 
 from config.server_config import settings
 from log import log_manager
+from monitoring import LOG, metrics, tracer
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ExecutionLogClient:
@@ -37,6 +39,8 @@ class ExecutionLogClient:
 
         self.log_endpoint = f"{self.base_url}/api/logs/node-execution"
         self.enabled = True  # 로그 전송 활성화 여부
+        # 로그 이벤트 순서 번호 (단조 증가, 서버에서 늦게 도착하거나 재전송된 이벤트를 판별하는 데 사용)
+        self._sequence = itertools.count(1)
 
     async def send_log(
         self,
@@ -56,6 +60,8 @@ class ExecutionLogClient:
         is_connected: bool | None = None,
         connection_sequence: int | None = None,
         node_identifier: str | None = None,
+        attempt: int | None = None,
+        sequence: int | None = None,
     ) -> bool:
         """
         노드 실행 로그를 서버로 전송합니다.
@@ -74,6 +80,8 @@ class ExecutionLogClient:
             result: 실행 결과
             error_message: 에러 메시지
             error_traceback: 에러 스택 트레이스
+            attempt: 시도 횟수 (재시도 정책 적용 시, 1부터 시작)
+            sequence: 로그 이벤트 순서 번호 (재전송 시에도 같은 번호 사용)
 
         Returns:
             전송 성공 여부
@@ -104,6 +112,8 @@ class ExecutionLogClient:
             "is_connected": is_connected,
             "connection_sequence": connection_sequence,
             "node_identifier": node_identifier,
+            "attempt": attempt,
+            "sequence": sequence,
         }
 
         try:
@@ -113,19 +123,19 @@ class ExecutionLogClient:
                 session.post(self.log_endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=2)) as response,
             ):
                 if response.status == 200:
-                    logger.debug(f"[ExecutionLogClient] 로그 전송 성공 - 노드 ID: {node_id}, 상태: {status}")
+                    logger.debug("[ExecutionLogClient] 로그 전송 성공 - 노드 ID: %s, 상태: %s", node_id, status)
                     return True
                 error_text = await response.text()
                 logger.warning(
-                    f"[ExecutionLogClient] 로그 전송 실패 - 상태 코드: {response.status}, 응답: {error_text}"
+                    "[ExecutionLogClient] 로그 전송 실패 - 상태 코드: %s, 응답: %s", response.status, error_text
                 )
                 return False
         except asyncio.TimeoutError:
-            logger.warning(f"[ExecutionLogClient] 로그 전송 타임아웃 (2초) - 노드 ID: {node_id}, 상태: {status}")
+            logger.warning("[ExecutionLogClient] 로그 전송 타임아웃 (2초) - 노드 ID: %s, 상태: %s", node_id, status)
             return False
         except Exception as e:
             logger.warning(
-                f"[ExecutionLogClient] 로그 전송 중 오류 발생 - 노드 ID: {node_id}, 상태: {status}, 오류: {e!s}"
+                "[ExecutionLogClient] 로그 전송 중 오류 발생 - 노드 ID: %s, 상태: %s, 오류: %s", node_id, status, e
             )
             return False
 
@@ -147,6 +157,7 @@ class ExecutionLogClient:
         is_connected: bool | None = None,
         connection_sequence: int | None = None,
         node_identifier: str | None = None,
+        attempt: int | None = None,
     ) -> None:
         """
         노드 실행 로그를 비동기로 전송합니다 (fire-and-forget).
@@ -167,7 +178,14 @@ class ExecutionLogClient:
             result: 실행 결과
             error_message: 에러 메시지
             error_traceback: 에러 스택 트레이스
+            attempt: 시도 횟수 (재시도 정책 적용 시, 1부터 시작)
         """
+        # 이벤트 순서 번호는 첫 await 전에 부여 (태스크 생성 순서 = 이벤트 발생 순서)
+        sequence = next(self._sequence)
+        # 전송 중인 로그 수 (로그 서버가 느려지면 쌓이는 fire-and-forget 태스크 수)
+        metrics.log_queue_depth.add(1)
+        # 실행 추적: 로그 전송 구간 (노드 실행 중 만든 태스크이므로 해당 노드 구간의 하위로 기록)
+        sink_span = tracer.span("log_sink", LOG, node_id=node_id, status=status).open()
         try:
             # 전체 작업(재시도 포함)을 10초로 제한
             success = await asyncio.wait_for(
@@ -188,24 +206,42 @@ class ExecutionLogClient:
                     is_connected=is_connected,
                     connection_sequence=connection_sequence,
                     node_identifier=node_identifier,
+                    attempt=attempt,
+                    sequence=sequence,
                 ),
                 timeout=10.0,
             )
             if not success:
+                metrics.log_send_failures.inc()
                 # 로그 전송 실패 시 경고 로그 출력 (특히 실패한 노드의 경우)
                 logger.warning(
-                    f"[ExecutionLogClient] 로그 전송 실패 - 노드 ID: {node_id}, 노드 타입: {node_type}, 상태: {status}"
+                    "[ExecutionLogClient] 로그 전송 실패 - 노드 ID: %s, 노드 타입: %s, 상태: %s",
+                    node_id,
+                    node_type,
+                    status,
                 )
         except asyncio.TimeoutError:
+            metrics.log_send_failures.inc()
             # 전체 타임아웃(10초) 초과 시 경고 로그 출력
             logger.warning(
-                f"[ExecutionLogClient] 로그 전송 전체 타임아웃 (10초) - 노드 ID: {node_id}, 노드 타입: {node_type}, 상태: {status}"
+                "[ExecutionLogClient] 로그 전송 전체 타임아웃 (10초) - 노드 ID: %s, 노드 타입: %s, 상태: %s",
+                node_id,
+                node_type,
+                status,
             )
         except Exception as e:
+            metrics.log_send_failures.inc()
             # 로그 전송 실패는 노드 실행에 영향을 주지 않도록 조용히 처리하되, 경고 로그 출력
             logger.warning(
-                f"[ExecutionLogClient] 로그 전송 중 예외 발생 (무시됨) - 노드 ID: {node_id}, 노드 타입: {node_type}, 상태: {status}, 오류: {e!s}"
+                "[ExecutionLogClient] 로그 전송 중 예외 발생 (무시됨) - 노드 ID: %s, 노드 타입: %s, 상태: %s, 오류: %s",
+                node_id,
+                node_type,
+                status,
+                e,
             )
+        finally:
+            sink_span.close()
+            metrics.log_queue_depth.add(-1)
 
     async def _send_log_with_retry(
         self,
@@ -225,6 +261,8 @@ class ExecutionLogClient:
         is_connected: bool | None = None,
         connection_sequence: int | None = None,
         node_identifier: str | None = None,
+        attempt: int | None = None,
+        sequence: int | None = None,
     ) -> bool:
         """
         로그 전송을 재시도하며 시도합니다.
@@ -237,7 +275,8 @@ class ExecutionLogClient:
         max_retries = 3
         retry_delay = 0.3  # 초 (더 빠른 재시도)
 
-        for attempt in range(max_retries):
+        # 전송 재시도 횟수 (노드 시도 횟수 attempt와 구분)
+        for send_try in range(max_retries):
             success = await self.send_log(
                 execution_id=execution_id,
                 script_id=script_id,
@@ -252,18 +291,25 @@ class ExecutionLogClient:
                 result=result,
                 error_message=error_message,
                 error_traceback=error_traceback,
+                is_connected=is_connected,
+                connection_sequence=connection_sequence,
+                node_identifier=node_identifier,
+                attempt=attempt,
+                sequence=sequence,
             )
 
             if success:
-                if attempt > 0:
-                    logger.debug(f"[ExecutionLogClient] 로그 전송 성공 (재시도 {attempt}회 후) - 노드 ID: {node_id}")
+                if send_try > 0:
+                    logger.debug(
+                        "[ExecutionLogClient] 로그 전송 성공 (재시도 %s회 후) - 노드 ID: %s", send_try, node_id
+                    )
                 return True
 
             # 마지막 시도가 아니면 재시도 전 대기
-            if attempt < max_retries - 1:
+            if send_try < max_retries - 1:
                 await asyncio.sleep(retry_delay)
                 logger.debug(
-                    f"[ExecutionLogClient] 로그 전송 재시도 ({attempt + 1}/{max_retries}) - 노드 ID: {node_id}"
+                    "[ExecutionLogClient] 로그 전송 재시도 (%s/%s) - 노드 ID: %s", send_try + 1, max_retries, node_id
                 )
 
         # 모든 재시도 실패
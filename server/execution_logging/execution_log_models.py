@@ -27,6 +27,10 @@ class NodeExecutionLogRequest(BaseModel):
     is_connected: bool | None = Field(None, description="다른 노드와 연결되어 있는지 여부")
     connection_sequence: int | None = Field(None, description="시작 노드(0번째)를 기준으로 한 연결 순서")
     node_identifier: str | None = Field(None, description="노드 식별자 (이름, 타입, 순서 등을 포함한 읽기 쉬운 형식)")
+    attempt: int | None = Field(None, ge=1, description="시도 횟수 (재시도 정책 적용 시, 1부터 시작)")
+    sequence: int | None = Field(
+        None, ge=1, description="로그 이벤트 순서 번호 (늦게 도착하거나 재전송된 이벤트는 무시, 중복 저장 방지)"
+    )
 
 
 class NodeExecutionLogResponse(BaseModel):
@@ -1,16 +1,46 @@
 """노드 실행 로그 리포지토리 모듈"""
 
+from __future__ import annotations
+
+from datetime import datetime
 import json
 import os
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # 직접 실행 시와 모듈로 import 시 모두 지원
+# db 패키지는 불러오면 db/__init__에서 DatabaseManager가 이 모듈을 다시 불러오므로(순환 import)
+# 모듈 로드 시에는 불러오지 않음 (타입 힌트 전용, 로그 통계 함수는 사용하는 곳에서 불러옴)
 try:
-    from db.connection import DatabaseConnection
+    from execution_logging.in_flight_logs import InFlightLogStore
+    from execution_logging.log_payloads import FETCH_CHUNK_SIZE, EncodedPayload, decode_payload, encode_payload
+    from execution_logging.log_search import (
+        SEARCH_ORDERS,
+        SEARCH_TABLE,
+        build_match_query,
+        format_snippet,
+        snippet_sql,
+        traceback_text,
+    )
+    from utils.pagination import decode_cursor, encode_cursor, project
 except ImportError:
     # 직접 실행 시 절대 import 사용
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from execution_logging.in_flight_logs import InFlightLogStore
+    from execution_logging.log_payloads import FETCH_CHUNK_SIZE, EncodedPayload, decode_payload, encode_payload
+    from execution_logging.log_search import (
+        SEARCH_ORDERS,
+        SEARCH_TABLE,
+        build_match_query,
+        format_snippet,
+        snippet_sql,
+        traceback_text,
+    )
+    from utils.pagination import decode_cursor, encode_cursor, project
+
+if TYPE_CHECKING:
+    import sqlite3
+
     from db.connection import DatabaseConnection
 
 
@@ -25,6 +55,10 @@ class NodeExecutionLogRepository:
             connection: DatabaseConnection 인스턴스
         """
         self.connection = connection
+        # 실행 중(running) 노드 로그 (DB에는 완료 시 한 번만 저장)
+        self.in_flight = InFlightLogStore()
+        # 전문 검색 인덱스 존재 여부 (처음 저장/검색 시 확인, FTS5 미지원 SQLite면 False)
+        self._search_available: bool | None = None
 
     def create_log(
         self,
@@ -44,14 +78,17 @@ class NodeExecutionLogRepository:
         is_connected: bool | None = None,
         connection_sequence: int | None = None,
         node_identifier: str | None = None,
-    ) -> int:
+        attempt: int | None = None,
+        sequence: int | None = None,
+    ) -> int | None:
         """
-        노드 실행 로그 생성 또는 업데이트
+        노드 실행 로그 기록
 
-        - running 상태: 같은 execution_id와 node_id의 기존 running 로그를 삭제하고 새로 생성
-          (단, 이미 completed/failed 로그가 있으면 생성하지 않음)
-        - completed/failed 상태: 같은 execution_id와 node_id의 running 로그를 찾아서 업데이트
-          (없으면 새로 생성)
+        - running 상태(시작/재시도): DB에 쓰지 않고 실행 중 로그 저장소(in_flight)에만 반영
+          재시도(attempt > 1)는 같은 항목의 시도 횟수와 직전 시도의 에러만 갱신
+        - completed/failed 상태: 실행 중 로그와 합쳐 최종 로그 행을 한 번 INSERT
+          같은 execution_id와 node_id의 최종 로그가 이미 있으면 저장하지 않음 (고유 인덱스, INSERT OR IGNORE)
+        - sequence가 이미 반영한 이벤트보다 작거나 같으면(늦게 도착/재전송) 아무것도 하지 않음
 
         Args:
             execution_id: 워크플로우 실행 ID (같은 실행의 노드들을 그룹화)
@@ -67,463 +104,562 @@ class NodeExecutionLogRepository:
             result: 실행 결과
             error_message: 에러 메시지 (실패 시)
             error_traceback: 에러 스택 트레이스 (실패 시)
+            attempt: 시도 횟수 (재시도 정책 적용 시, 1부터 시작)
+            sequence: 로그 이벤트 순서 번호 (로그 클라이언트가 부여, 중복/역순 도착 판별용)
 
         Returns:
-            생성/업데이트된 로그 ID
+            저장된(또는 이미 있던) 최종 로그 ID, running 상태나 버려진 이벤트면 None
         """
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
-
-        try:
-            # JSON 직렬화
-            parameters_json = json.dumps(parameters) if parameters else "{}"
-            result_json = json.dumps(result) if result else "{}"
-
-            # execution_id와 node_id가 있는 경우에만 중복 방지 로직 적용
-            if execution_id and node_id:
-                if status == "running":
-                    # running 상태: 이미 completed/failed 로그가 있으면 생성하지 않음
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status IN ('completed', 'failed')
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    completed_log = cursor.fetchone()
-                    if completed_log:
-                        conn.commit()
-                        return completed_log[0]
-
-                    # 기존 running 로그 삭제 (중복 방지)
-                    cursor.execute(
-                        """
-                        DELETE FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                        """,
-                        (execution_id, node_id),
-                    )
-
-                elif status in ("completed", "failed"):
-                    # completed/failed 상태: running 로그를 찾아서 업데이트
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    running_log = cursor.fetchone()
-
-                    if running_log:
-                        # running 로그를 completed/failed로 업데이트
-                        log_id_to_update = running_log[0]
-                        # 연결 정보는 running 상태에서 이미 설정되므로 업데이트 시에는 유지
-                        # 필요시 파라미터로 받아서 업데이트할 수 있도록 함
-                        cursor.execute(
-                            """
-                            UPDATE node_execution_logs
-                            SET status = ?,
-                                finished_at = ?,
-                                execution_time_ms = ?,
-                                result = ?,
-                                error_message = ?,
-                                error_traceback = ?,
-                                is_connected = COALESCE(?, is_connected),
-                                connection_sequence = COALESCE(?, connection_sequence),
-                                node_identifier = COALESCE(?, node_identifier)
-                            WHERE id = ?
-                            """,
-                            (
-                                status,
-                                finished_at,
-                                execution_time_ms,
-                                result_json,
-                                error_message,
-                                error_traceback,
-                                1 if is_connected else 0 if is_connected is False else None,
-                                connection_sequence,
-                                node_identifier,
-                                log_id_to_update,
-                            ),
-                        )
+        key = (execution_id, node_id)
 
-                        # 남아있는 모든 running 로그 삭제 (중복 방지)
-                        cursor.execute(
-                            """
-                            DELETE FROM node_execution_logs
-                            WHERE execution_id = ? AND node_id = ? AND status = 'running'
-                            """,
-                            (execution_id, node_id),
-                        )
+        if status == "running":
+            self.in_flight.update(
+                key,
+                sequence,
+                {
+                    "script_id": script_id,
+                    "node_type": node_type,
+                    "node_name": node_name,
+                    "status": status,
+                    "started_at": started_at,
+                    "parameters": parameters,
+                    "error_message": error_message,
+                    "error_traceback": error_traceback,
+                    "is_connected": is_connected,
+                    "connection_sequence": connection_sequence,
+                    "node_identifier": node_identifier,
+                    "attempt": attempt,
+                },
+            )
+            return None
 
-                        conn.commit()
-                        return log_id_to_update
-
-                    # running 로그가 없고 이미 completed/failed 로그가 있으면 기존 로그 반환
-                    cursor.execute(
-                        """
-                        SELECT id FROM node_execution_logs
-                        WHERE execution_id = ? AND node_id = ? AND status IN ('completed', 'failed')
-                        ORDER BY id DESC
-                        LIMIT 1
-                        """,
-                        (execution_id, node_id),
-                    )
-                    existing_log = cursor.fetchone()
-                    if existing_log:
-                        conn.commit()
-                        return existing_log[0]
-
-            # 새 로그 생성
-            cursor.execute(
-                """
-                INSERT INTO node_execution_logs (
-                    execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback,
-                    is_connected, connection_sequence, node_identifier
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    execution_id,
-                    script_id,
-                    node_id,
-                    node_type,
-                    node_name,
-                    status,
-                    started_at,
-                    finished_at,
-                    execution_time_ms,
-                    parameters_json,
-                    result_json,
-                    error_message,
-                    error_traceback,
-                    1 if is_connected else 0 if is_connected is False else None,
-                    connection_sequence,
-                    node_identifier,
-                ),
+        applied, running = self.in_flight.finish(key, sequence)
+        if not applied:
+            return None
+        if running:
+            # 완료 로그에 없는 값은 실행 중 로그의 값 사용 (연결 정보 등)
+            started_at = started_at or running.get("started_at")
+            parameters = parameters or running.get("parameters")
+            is_connected = is_connected if is_connected is not None else running.get("is_connected")
+            connection_sequence = (
+                connection_sequence if connection_sequence is not None else running.get("connection_sequence")
             )
+            node_identifier = node_identifier or running.get("node_identifier")
+            attempt = attempt or running.get("attempt")
+        # 키셋 페이지네이션 정렬 키이므로 비워 두지 않음 (시작 로그가 도착하지 않은 경우 종료 시각 사용)
+        started_at = started_at or finished_at or datetime.now().isoformat()
 
-            log_id = cursor.lastrowid
-            if log_id is None:
-                raise ValueError("로그 생성 실패: lastrowid가 None입니다")
+        # 파라미터/결과/스택 트레이스는 압축하여 log_payloads 테이블에 저장 (로그 행에는 해시만 기록)
+        payloads = (encode_payload(parameters), encode_payload(result), encode_payload(error_traceback))
+        row = (
+            execution_id,
+            script_id,
+            node_id,
+            node_type,
+            node_name,
+            status,
+            started_at,
+            finished_at,
+            execution_time_ms,
+            error_message,
+            1 if is_connected else 0 if is_connected is False else None,
+            connection_sequence,
+            node_identifier,
+            attempt or 1,
+            *(payload.ref if payload else None for payload in payloads),
+        )
+        log_id: int | None = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._insert_final_log(cursor, row, payloads, error_traceback)
+        )
+        return log_id
 
-            conn.commit()
+    def _insert_final_log(
+        self,
+        cursor: sqlite3.Cursor,
+        row: tuple[Any, ...],
+        payloads: tuple[EncodedPayload | None, ...],
+        error_traceback: str | None,
+    ) -> int | None:
+        """최종 로그 행 INSERT (이미 있으면 기존 로그 ID 반환, 새로 저장하면 같은 트랜잭션에서 로그 통계 증가)"""
+        if _insert_row(cursor, row, payloads, error_traceback, self._has_search_index(cursor)):
+            log_id: int | None = cursor.lastrowid
+            _count_final_log(cursor, log_id, row)
             return log_id
-        except Exception as e:
-            conn.rollback()
-            raise e
+
+        # 같은 노드의 최종 로그가 이미 있음 (반복 실행 등) - 기존 로그 ID 반환
+        cursor.execute(
+            """
+            SELECT id FROM node_execution_logs
+            WHERE execution_id = ? AND node_id = ? AND status IN ('completed', 'failed')
+            """,
+            (row[0], row[2]),
+        )
+        existing = cursor.fetchone()
+        return existing[0] if existing else None
+
+    def _query_logs(
+        self,
+        where: str,
+        order: str,
+        params: tuple[Any, ...],
+        include_payload: bool,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        로그 목록 조회 공통 처리
+
+        include_payload가 False면 로그 행의 짧은 컬럼만 읽고(parameters/result/error_traceback 키 없음),
+        True면 log_payloads에서 페이로드를 한 번에 조회하여 압축을 해제합니다.
+        fields를 지정하면 해당 컬럼과 정렬 키(id, started_at)만 읽고, 페이로드 필드가 있을 때만 압축을 해제합니다.
+        (반환 값에는 정렬 키가 포함되므로 필요하면 호출한 쪽에서 project()로 제거)
+        """
+        names = _LIST_FIELDS
+        if fields is not None:
+            names = tuple(name for name in _LIST_FIELDS if name in fields or name in _KEYSET_FIELDS)
+            include_payload = any(name in fields for name in _PAYLOAD_FIELDS)
+        columns = ", ".join(names) + (", " + _PAYLOAD_COLUMNS if include_payload else "")
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute(f"SELECT {columns} FROM node_execution_logs {where} {order}", params)
+            rows = cursor.fetchall()
+            logs = [_row_to_log(row, names) for row in rows]
+            if include_payload:
+                payload_start = len(names)
+                refs = {ref for row in rows for ref in row[payload_start : payload_start + 3] if ref}
+                decoded = self._load_payloads(cursor, refs)
+                for log, row in zip(logs, rows, strict=True):
+                    _attach_payload(log, row[payload_start:], decoded)
+            return logs
         finally:
             conn.close()
 
-    def get_logs_by_execution_id(self, execution_id: str) -> list[dict[str, Any]]:
+    def _load_payloads(self, cursor: sqlite3.Cursor, refs: set[str]) -> dict[str, Any]:
+        """해시 목록의 페이로드를 조회하여 압축을 해제합니다."""
+        decoded: dict[str, Any] = {}
+        ref_list = list(refs)
+        for start in range(0, len(ref_list), FETCH_CHUNK_SIZE):
+            chunk = ref_list[start : start + FETCH_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(f"SELECT ref, data FROM log_payloads WHERE ref IN ({placeholders})", chunk)
+            for ref, data in cursor.fetchall():
+                decoded[ref] = decode_payload(data)
+        return decoded
+
+    def get_log(self, log_id: int) -> dict[str, Any] | None:
+        """
+        로그 하나를 페이로드(파라미터/결과/스택 트레이스)와 함께 조회
+
+        Args:
+            log_id: 로그 ID
+
+        Returns:
+            로그 또는 None
+        """
+        logs = self._query_logs("WHERE id = ?", "", (log_id,), include_payload=True)
+        return logs[0] if logs else None
+
+    def get_logs_by_execution_id(
+        self, execution_id: str, include_payload: bool = False, fields: list[str] | None = None
+    ) -> list[dict[str, Any]]:
         """
-        특정 실행 ID의 모든 로그 조회
+        특정 실행 ID의 모든 로그 조회 (아직 끝나지 않은 노드의 실행 중 로그 포함)
 
         Args:
             execution_id: 워크플로우 실행 ID
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부
+            fields: 반환할 필드 (None이면 전체, 페이로드 필드가 있을 때만 압축 해제)
 
         Returns:
             로그 목록
         """
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
+        # 실행 중 로그와 합치기 위해 node_id는 항상 읽음
+        query_fields = None if fields is None else [*fields, "node_id"]
+        logs = self._query_logs(
+            "WHERE execution_id = ?", "ORDER BY started_at ASC, id ASC", (execution_id,), include_payload, query_fields
+        )
 
-        try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at,
-                    is_connected, connection_sequence, node_identifier
-                FROM node_execution_logs
-                WHERE execution_id = ?
-                ORDER BY started_at ASC
-            """,
-                (execution_id,),
-            )
+        # 실행 중 로그 추가 (최종 로그가 이미 있는 노드는 제외 - 반복 실행 중인 노드)
+        finished_nodes = {log["node_id"] for log in logs}
+        running = [log for log in self.in_flight.list(execution_id) if log["node_id"] not in finished_nodes]
+        if running:
+            logs.extend(running)
+            logs.sort(key=lambda log: log["started_at"] or "")
 
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                    "is_connected": bool(row[15]) if row[15] is not None else None,
-                    "connection_sequence": row[16],
-                    "node_identifier": row[17],
-                }
-                logs.append(log)
+        return project(logs, fields)
 
-            return logs
-        finally:
-            conn.close()
+    def get_logs_page(
+        self,
+        script_id: int | None = None,
+        node_id: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+        include_payload: bool = False,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        로그를 최신순(started_at, id 역순)으로 한 페이지 조회합니다. (키셋 페이지네이션)
 
-    def get_logs_by_script_id(self, script_id: int, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+        이전 페이지의 next_cursor를 넘기면 그 다음 로그부터 인덱스에서 바로 읽으므로
+        OFFSET과 달리 뒤 페이지도 첫 페이지와 같은 비용으로 조회됩니다.
+        조건 없이 첫 페이지를 조회하면 아직 끝나지 않은 노드의 실행 중 로그(id 없음)도 함께 반환합니다.
+
+        Args:
+            script_id: 스크립트 ID (선택사항)
+            node_id: 노드 ID (선택사항)
+            status: 실행 상태 (선택사항)
+            limit: 조회할 최대 개수
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+            fields: 반환할 필드 (None이면 전체, 페이로드 필드가 있을 때만 압축 해제)
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부 (fields를 지정하면 무시)
+
+        Returns:
+            (로그 목록, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, value in (("script_id", script_id), ("node_id", node_id), ("status", status)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if cursor is not None:
+            # (started_at, id) 인덱스에서 커서 다음 위치부터 읽음
+            conditions.append("(started_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor, 2))
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+
+        # 다음 페이지가 있는지 확인하기 위해 하나 더 읽음
+        logs = self._query_logs(
+            where, "ORDER BY started_at DESC, id DESC LIMIT ?", (*params, limit + 1), include_payload, fields
+        )
+        has_more = len(logs) > limit
+        del logs[limit:]
+
+        if cursor is None and script_id is None and node_id is None and status in (None, "running"):
+            # 실행 중 로그 추가 (시작 시간 역순으로 합친 뒤 limit 적용)
+            running = self.in_flight.list()
+            if running:
+                has_more = has_more or len(logs) + len(running) > limit
+                logs.extend(running)
+                logs.sort(key=lambda log: log["started_at"] or "", reverse=True)
+                del logs[limit:]
+
+        next_cursor = None
+        if has_more:
+            # 페이지에 포함된 마지막 DB 로그 기준 (실행 중 로그에 밀려난 DB 로그는 다음 페이지에 포함됨)
+            last = next((log for log in reversed(logs) if log["id"] is not None), None)
+            if last is not None:
+                next_cursor = encode_cursor(last["started_at"], last["id"])
+        return project(logs, fields), next_cursor
+
+    def get_logs_by_script_id(
+        self,
+        script_id: int,
+        limit: int = 100,
+        offset: int = 0,
+        include_payload: bool = False,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         특정 스크립트의 로그 조회
 
         Args:
             script_id: 스크립트 ID
             limit: 조회할 최대 개수
-            offset: 건너뛸 개수
+            offset: 건너뛸 개수 (이전 버전 호환용, 뒤 페이지일수록 느려지므로 cursor 사용 권장)
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부
+            cursor: 이전 페이지의 다음 페이지 커서 (get_logs_page() 참고)
+            fields: 반환할 필드
 
         Returns:
             로그 목록
         """
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
-
-        try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at,
-                    is_connected, connection_sequence, node_identifier
-                FROM node_execution_logs
-                WHERE script_id = ?
-                ORDER BY started_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (script_id, limit, offset),
-            )
-
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                    "is_connected": bool(row[15]) if row[15] is not None else None,
-                    "connection_sequence": row[16],
-                    "node_identifier": row[17],
-                }
-                logs.append(log)
-
-            return logs
-        finally:
-            conn.close()
+        if offset and cursor is None:
+            return self._query_offset_page("script_id", script_id, limit, offset, include_payload, fields)
+        return self.get_logs_page(
+            script_id=script_id, limit=limit, cursor=cursor, fields=fields, include_payload=include_payload
+        )[0]
 
-    def get_logs_by_node_id(self, node_id: str, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
+    def get_logs_by_node_id(
+        self,
+        node_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        include_payload: bool = False,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         특정 노드의 로그 조회
 
         Args:
             node_id: 노드 ID
             limit: 조회할 최대 개수
-            offset: 건너뛸 개수
+            offset: 건너뛸 개수 (이전 버전 호환용, 뒤 페이지일수록 느려지므로 cursor 사용 권장)
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부
+            cursor: 이전 페이지의 다음 페이지 커서 (get_logs_page() 참고)
+            fields: 반환할 필드
 
         Returns:
             로그 목록
         """
-        conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
+        if offset and cursor is None:
+            return self._query_offset_page("node_id", node_id, limit, offset, include_payload, fields)
+        return self.get_logs_page(
+            node_id=node_id, limit=limit, cursor=cursor, fields=fields, include_payload=include_payload
+        )[0]
 
-        try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at,
-                    is_connected, connection_sequence, node_identifier
-                FROM node_execution_logs
-                WHERE node_id = ?
-                ORDER BY started_at DESC
-                LIMIT ? OFFSET ?
-            """,
-                (node_id, limit, offset),
-            )
+    def _query_offset_page(
+        self, column: str, value: Any, limit: int, offset: int, include_payload: bool, fields: list[str] | None
+    ) -> list[dict[str, Any]]:
+        """OFFSET 페이지 조회 (이전 버전 호환용)"""
+        logs = self._query_logs(
+            f"WHERE {column} = ?",
+            "ORDER BY started_at DESC, id DESC LIMIT ? OFFSET ?",
+            (value, limit, offset),
+            include_payload,
+            fields,
+        )
+        return project(logs, fields)
 
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                    "is_connected": bool(row[15]) if row[15] is not None else None,
-                    "connection_sequence": row[16],
-                    "node_identifier": row[17],
-                }
-                logs.append(log)
+    def get_recent_logs(self, limit: int = 100, include_payload: bool = False) -> list[dict[str, Any]]:
+        """
+        최근 로그 조회 (실행 중 로그 포함)
 
-            return logs
-        finally:
-            conn.close()
+        Args:
+            limit: 조회할 최대 개수
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부
 
-    def get_recent_logs(self, limit: int = 100) -> list[dict[str, Any]]:
+        Returns:
+            로그 목록
         """
-        최근 로그 조회
+        return self.get_logs_page(limit=limit, include_payload=include_payload)[0]
+
+    def get_failed_logs(
+        self, script_id: int | None = None, limit: int = 100, include_payload: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        실패한 로그 조회
 
         Args:
+            script_id: 스크립트 ID (선택사항, None이면 전체)
             limit: 조회할 최대 개수
+            include_payload: 파라미터/결과/스택 트레이스 포함 여부
 
         Returns:
             로그 목록
         """
+        return self.get_logs_page(script_id=script_id, status="failed", limit=limit, include_payload=include_payload)[0]
+
+    # ------------------------------------------------------------------
+    # 전문 검색 (execution_logging.log_search 참고)
+    # ------------------------------------------------------------------
+
+    def _has_search_index(self, cursor: sqlite3.Cursor) -> bool:
+        """전문 검색 인덱스 테이블이 있는지 확인합니다. (한 번만 조회)"""
+        if self._search_available is None:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,))
+            self._search_available = cursor.fetchone() is not None
+        return self._search_available
+
+    def search_logs(
+        self,
+        query: str,
+        script_id: int | None = None,
+        node_type: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        columns: list[str] | None = None,
+        order: str = "rank",
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        에러 메시지, 스택 트레이스, 노드 이름/식별자에서 검색어를 찾습니다.
+
+        FTS5 인덱스에서 검색어에 맞는 로그 ID를 찾은 뒤 로그 행을 ID로 읽고 조건을 적용하므로
+        로그 행 수가 아니라 검색어에 맞는 로그 수에 비례하여 시간이 걸립니다.
+
+        Args:
+            query: 검색어 (build_match_query() 참고)
+            script_id: 스크립트 ID (선택사항)
+            node_type: 노드 타입 (선택사항)
+            status: 실행 상태 (선택사항)
+            since: 이 시각 이후에 시작한 로그 (ISO 형식, 선택사항)
+            until: 이 시각 이전에 시작한 로그 (ISO 형식, 선택사항)
+            columns: 검색할 컬럼 (None이면 전체)
+            order: rank(관련도순) 또는 recent(최근 저장순)
+            limit: 조회할 최대 개수
+            cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+
+        Returns:
+            (로그 목록, 다음 페이지 커서 또는 None)
+            각 로그에는 목록 조회 필드와 snippet(검색어를 <mark>로 감싼 HTML), score(관련도, 클수록 관련 높음)가 포함됩니다.
+
+        Raises:
+            ValueError: 검색어, 컬럼, 정렬 방식 또는 커서가 잘못된 경우
+        """
+        if order not in SEARCH_ORDERS:
+            raise ValueError(f"잘못된 정렬 방식입니다: {order} (가능한 값: {', '.join(SEARCH_ORDERS)})")
+        conditions = [f"f.{SEARCH_TABLE} MATCH ?"]
+        params: list[Any] = [build_match_query(query, columns)]
+        for column, value, operator in (
+            ("l.script_id", script_id, "="),
+            ("l.node_type", node_type, "="),
+            ("l.status", status, "="),
+            ("l.started_at", since, ">="),
+            ("l.started_at", until, "<="),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+
+        # 커서: 관련도순은 건너뛸 개수, 최근 저장순은 마지막 로그 ID (rowid 역순으로 인덱스에서 바로 읽음)
+        position = 0
+        if cursor is not None:
+            cursor_order, position = decode_cursor(cursor, 2)
+            if cursor_order != order or not isinstance(position, int) or position < 0:
+                raise ValueError(f"잘못된 커서입니다: {cursor}")
+        if order == "recent":
+            if cursor is not None:
+                conditions.append("f.rowid < ?")
+                params.append(position)
+            order_by = "ORDER BY f.rowid DESC LIMIT ?"
+            params.append(limit + 1)
+        else:
+            order_by = "ORDER BY f.rank LIMIT ? OFFSET ?"
+            params.extend((limit + 1, position))
+
+        columns_sql = ", ".join(f"l.{name}" for name in _LIST_FIELDS)
         conn = self.connection.get_connection()
-        cursor = self.connection.get_cursor(conn)
+        db_cursor = self.connection.get_cursor(conn)
 
         try:
-            cursor.execute(
-                """
-                SELECT
-                    id, execution_id, script_id, node_id, node_type, node_name,
-                    status, started_at, finished_at, execution_time_ms,
-                    parameters, result, error_message, error_traceback, created_at,
-                    is_connected, connection_sequence, node_identifier
-                FROM node_execution_logs
-                ORDER BY started_at DESC
-                LIMIT ?
-            """,
-                (limit,),
+            if not self._has_search_index(db_cursor):
+                raise RuntimeError("전문 검색 인덱스가 없습니다. (SQLite FTS5 미지원)")
+            # CROSS JOIN: 검색 인덱스를 먼저 읽도록 조인 순서 고정 (로그 행은 ID로만 조회)
+            db_cursor.execute(
+                f"""
+                SELECT {columns_sql}, {snippet_sql(f"f.{SEARCH_TABLE}")}, f.rank
+                FROM {SEARCH_TABLE} AS f CROSS JOIN node_execution_logs AS l ON l.id = f.rowid
+                WHERE {" AND ".join(conditions)}
+                {order_by}
+                """,
+                params,
             )
-
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                    "is_connected": bool(row[15]) if row[15] is not None else None,
-                    "connection_sequence": row[16],
-                    "node_identifier": row[17],
-                }
-                logs.append(log)
-
-            return logs
+            rows = db_cursor.fetchall()
         finally:
             conn.close()
 
-    def get_failed_logs(self, script_id: int | None = None, limit: int = 100) -> list[dict[str, Any]]:
-        """
-        실패한 로그 조회
+        has_more = len(rows) > limit
+        del rows[limit:]
+        logs = []
+        for row in rows:
+            log = _row_to_log(row, _LIST_FIELDS)
+            log["snippet"] = format_snippet(row[-2])
+            log["score"] = round(-row[-1], 4)
+            logs.append(log)
 
-        Args:
-            script_id: 스크립트 ID (선택사항, None이면 전체)
-            limit: 조회할 최대 개수
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(order, logs[-1]["id"] if order == "recent" else position + limit)
+        return logs, next_cursor
+
+    def ensure_search_index(self) -> int:
+        """
+        전문 검색 인덱스가 비어 있는데 로그가 있으면 기존 로그로 채웁니다. (검색 기능 추가 전에 저장된 로그, 서버 시작 시 호출)
 
         Returns:
-            로그 목록
+            인덱싱한 로그 개수 (채울 필요가 없으면 0)
         """
         conn = self.connection.get_connection()
         cursor = self.connection.get_cursor(conn)
 
         try:
-            if script_id is not None:
+            if not self._has_search_index(cursor):
+                return 0
+            cursor.execute(f"SELECT 1 FROM {SEARCH_TABLE} LIMIT 1")
+            if cursor.fetchone():
+                return 0
+            cursor.execute("SELECT 1 FROM node_execution_logs LIMIT 1")
+            if not cursor.fetchone():
+                return 0
+        finally:
+            conn.close()
+        return self.rebuild_search_index()
+
+    def rebuild_search_index(self, batch_size: int = 1000) -> int:
+        """
+        전문 검색 인덱스를 로그 테이블 기준으로 다시 만듭니다.
+        압축 저장된 스택 트레이스를 풀어야 하므로 로그 ID 순으로 batch_size개씩 나누어 처리합니다.
+
+        Returns:
+            인덱싱한 로그 개수
+        """
+
+        def rebuild(_conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> int:
+            if not self._has_search_index(cursor):
+                return 0
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+            indexed = 0
+            last_id = 0
+            while True:
                 cursor.execute(
                     """
-                    SELECT
-                        id, execution_id, script_id, node_id, node_type, node_name,
-                        status, started_at, finished_at, execution_time_ms,
-                        parameters, result, error_message, error_traceback, created_at,
-                        is_connected, connection_sequence, node_identifier
-                    FROM node_execution_logs
-                    WHERE status = 'failed' AND script_id = ?
-                    ORDER BY started_at DESC
+                    SELECT l.id, l.node_name, l.node_identifier, l.error_message, l.error_traceback, p.data
+                    FROM node_execution_logs AS l
+                    LEFT JOIN log_payloads AS p ON p.ref = l.traceback_ref
+                    WHERE l.id > ?
+                    ORDER BY l.id
                     LIMIT ?
-                """,
-                    (script_id, limit),
+                    """,
+                    (last_id, batch_size),
                 )
-            else:
-                cursor.execute(
-                    """
-                    SELECT
-                        id, execution_id, script_id, node_id, node_type, node_name,
-                        status, started_at, finished_at, execution_time_ms,
-                        parameters, result, error_message, error_traceback, created_at,
-                        is_connected, connection_sequence, node_identifier
-                    FROM node_execution_logs
-                    WHERE status = 'failed'
-                    ORDER BY started_at DESC
-                    LIMIT ?
-                """,
-                    (limit,),
+                rows = cursor.fetchall()
+                if not rows:
+                    return indexed
+                cursor.executemany(
+                    f"""
+                    INSERT INTO {SEARCH_TABLE} (rowid, node_name, node_identifier, error_message, error_traceback)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            log_id,
+                            node_name,
+                            node_identifier,
+                            error_message,
+                            traceback_text(decode_payload(data) if data is not None else error_traceback),
+                        )
+                        for log_id, node_name, node_identifier, error_message, error_traceback, data in rows
+                    ],
                 )
+                indexed += len(rows)
+                last_id = rows[-1][0]
 
-            logs = []
-            for row in cursor.fetchall():
-                log = {
-                    "id": row[0],
-                    "execution_id": row[1],
-                    "script_id": row[2],
-                    "node_id": row[3],
-                    "node_type": row[4],
-                    "node_name": row[5],
-                    "status": row[6],
-                    "started_at": row[7],
-                    "finished_at": row[8],
-                    "execution_time_ms": row[9],
-                    "parameters": json.loads(row[10]) if row[10] else {},
-                    "result": json.loads(row[11]) if row[11] else {},
-                    "error_message": row[12],
-                    "error_traceback": row[13],
-                    "created_at": row[14],
-                    "is_connected": bool(row[15]) if row[15] is not None else None,
-                    "connection_sequence": row[16],
-                    "node_identifier": row[17],
-                }
-                logs.append(log)
+        indexed: int = self.connection.execute_with_connection(rebuild)
+        return indexed
 
-            return logs
-        finally:
-            conn.close()
+    def _delete_orphan_payloads(self, cursor: sqlite3.Cursor) -> int:
+        """어떤 로그도 참조하지 않는 페이로드를 삭제합니다. (로그 삭제 후 호출)"""
+        cursor.execute("""
+            DELETE FROM log_payloads
+            WHERE ref NOT IN (
+                SELECT parameters_ref FROM node_execution_logs WHERE parameters_ref IS NOT NULL
+                UNION
+                SELECT result_ref FROM node_execution_logs WHERE result_ref IS NOT NULL
+                UNION
+                SELECT traceback_ref FROM node_execution_logs WHERE traceback_ref IS NOT NULL
+            )
+        """)
+        return cursor.rowcount
 
     def delete_log(self, log_id: int) -> bool:
         """
@@ -541,6 +677,8 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs WHERE id = ?", (log_id,))
             deleted_count = cursor.rowcount
+            if deleted_count:
+                self._delete_orphan_payloads(cursor)
             conn.commit()
             return deleted_count > 0
         except Exception as e:
@@ -565,7 +703,10 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs WHERE execution_id = ?", (execution_id,))
             deleted_count = cursor.rowcount
+            if deleted_count:
+                self._delete_orphan_payloads(cursor)
             conn.commit()
+            self.in_flight.discard_execution(execution_id)
             return deleted_count
         except Exception as e:
             conn.rollback()
@@ -586,10 +727,357 @@ class NodeExecutionLogRepository:
         try:
             cursor.execute("DELETE FROM node_execution_logs")
             deleted_count = cursor.rowcount
+            cursor.execute("DELETE FROM log_payloads")
             conn.commit()
+            self.in_flight.clear()
             return deleted_count
         except Exception as e:
             conn.rollback()
             raise e
         finally:
             conn.close()
+
+    # ------------------------------------------------------------------
+    # 보관 정책 (execution_logging.log_retention.LogRetentionManager에서 작업 스레드로 호출)
+    # ------------------------------------------------------------------
+
+    def get_storage_stats(self) -> dict[str, Any]:
+        """
+        로그 행 수와 DB 파일 사용량
+
+        Returns:
+            log_count, payload_count, oldest_started_at,
+            db_bytes(파일 크기), used_bytes(빈 페이지 제외), free_bytes/free_pages(빈 페이지), auto_vacuum(0: NONE, 1: FULL, 2: INCREMENTAL)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            cursor.execute("SELECT COUNT(*) FROM node_execution_logs")
+            log_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM log_payloads")
+            payload_count = cursor.fetchone()[0]
+            # started_at 인덱스로 가장 오래된 값만 읽음
+            cursor.execute(
+                "SELECT started_at FROM node_execution_logs WHERE started_at IS NOT NULL ORDER BY started_at LIMIT 1"
+            )
+            oldest = cursor.fetchone()
+            page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+            page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+            auto_vacuum = cursor.execute("PRAGMA auto_vacuum").fetchone()[0]
+            return {
+                "log_count": log_count,
+                "payload_count": payload_count,
+                "oldest_started_at": oldest[0] if oldest else None,
+                "db_bytes": page_count * page_size,
+                "used_bytes": (page_count - freelist_count) * page_size,
+                "free_bytes": freelist_count * page_size,
+                "free_pages": freelist_count,
+                "auto_vacuum": auto_vacuum,
+            }
+        finally:
+            conn.close()
+
+    def select_prune_batch(self, cutoff: str | None, limit: int) -> list[int]:
+        """
+        정리할 로그 ID를 오래된 것부터 선택합니다.
+        실행 기록이 일부만 남지 않도록 선택된 로그와 같은 실행 ID의 로그를 모두 포함합니다. (limit을 조금 넘을 수 있음)
+
+        Args:
+            cutoff: 이 시각보다 먼저 시작한 로그만 선택 (None이면 시각 조건 없음)
+            limit: 선택 기준 로그 수
+
+        Returns:
+            로그 ID 목록 (없으면 빈 목록)
+        """
+        conn = self.connection.get_connection()
+        cursor = self.connection.get_cursor(conn)
+
+        try:
+            # started_at 인덱스를 오래된 쪽부터 읽음 (테이블 크기와 관계없이 limit개만 읽음)
+            if cutoff is None:
+                cursor.execute("SELECT id, execution_id FROM node_execution_logs ORDER BY started_at LIMIT ?", (limit,))
+            else:
+                cursor.execute(
+                    "SELECT id, execution_id FROM node_execution_logs WHERE started_at < ? ORDER BY started_at LIMIT ?",
+                    (cutoff, limit),
+                )
+            rows = cursor.fetchall()
+            ids = {row[0] for row in rows}
+            execution_ids = list({row[1] for row in rows if row[1] is not None})
+            for start in range(0, len(execution_ids), FETCH_CHUNK_SIZE):
+                chunk = execution_ids[start : start + FETCH_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT id FROM node_execution_logs WHERE execution_id IN ({placeholders})", chunk)
+                ids.update(row[0] for row in cursor.fetchall())
+            return sorted(ids)
+        finally:
+            conn.close()
+
+    def export_logs(self, log_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        로그를 페이로드와 함께 조회합니다. (보관 파일 저장용)
+
+        Args:
+            log_ids: 로그 ID 목록
+
+        Returns:
+            로그 목록 (ID 순)
+        """
+        logs: list[dict[str, Any]] = []
+        for start in range(0, len(log_ids), FETCH_CHUNK_SIZE):
+            chunk = tuple(log_ids[start : start + FETCH_CHUNK_SIZE])
+            placeholders = ", ".join("?" * len(chunk))
+            logs.extend(self._query_logs(f"WHERE id IN ({placeholders})", "ORDER BY id", chunk, include_payload=True))
+        return logs
+
+    def delete_logs_by_ids(self, log_ids: list[int], delete_payloads: bool = False) -> int:
+        """
+        로그를 한 트랜잭션으로 삭제합니다.
+
+        Args:
+            log_ids: 로그 ID 목록
+            delete_payloads: 참조가 없어진 페이로드도 함께 삭제할지 여부
+                (전체 로그를 한 번 훑으므로 여러 배치를 삭제할 때는 마지막에 delete_orphan_payloads()를 한 번 호출)
+
+        Returns:
+            삭제된 로그 개수
+        """
+
+        def delete(_conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> int:
+            deleted_count = 0
+            for start in range(0, len(log_ids), FETCH_CHUNK_SIZE):
+                chunk = log_ids[start : start + FETCH_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"DELETE FROM node_execution_logs WHERE id IN ({placeholders})", chunk)
+                deleted_count += cursor.rowcount
+            if deleted_count and delete_payloads:
+                self._delete_orphan_payloads(cursor)
+            return deleted_count
+
+        deleted: int = self.connection.execute_with_connection(delete)
+        return deleted
+
+    def delete_orphan_payloads(self) -> int:
+        """
+        어떤 로그도 참조하지 않는 페이로드를 삭제합니다.
+        (보관 정책 정리 후, 스크립트 삭제로 로그가 함께 삭제된 경우의 페이로드도 정리)
+
+        Returns:
+            삭제된 페이로드 개수
+        """
+        deleted: int = self.connection.execute_with_connection(
+            lambda _conn, cursor: self._delete_orphan_payloads(cursor)
+        )
+        return deleted
+
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        DB를 증분 VACUUM 모드(PRAGMA auto_vacuum = INCREMENTAL)로 전환합니다.
+        이미 만들어진 DB는 전체 VACUUM을 한 번 해야 적용되므로 시간이 걸릴 수 있습니다. (DB 크기에 비례)
+
+        Returns:
+            전환했으면 True, 이미 증분 모드면 False
+        """
+        conn = self.connection.get_connection()
+
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            return True
+        finally:
+            conn.close()
+
+    def incremental_vacuum(self, max_pages: int) -> int:
+        """
+        빈 페이지를 최대 max_pages개 파일에서 반환합니다. (증분 VACUUM 모드에서만 동작)
+
+        Returns:
+            남은 빈 페이지 수
+        """
+        conn = self.connection.get_connection()
+
+        try:
+            # execute()는 한 단계만 실행하여 한 페이지만 반환하므로 끝까지 실행하는 executescript() 사용
+            conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)})")
+            remaining: int = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return remaining
+        finally:
+            conn.close()
+
+    def import_logs(self, logs: list[dict[str, Any]]) -> int:
+        """
+        보관 파일에서 읽은 로그를 다시 저장합니다. (새 로그 ID 부여)
+        같은 실행 ID와 노드 ID의 최종 로그가 이미 있으면 저장하지 않으므로 여러 번 복원해도 중복되지 않습니다.
+
+        Args:
+            logs: export_logs() 형식의 로그 목록
+
+        Returns:
+            저장된 로그 개수
+        """
+
+        def insert(_conn: sqlite3.Connection, cursor: sqlite3.Cursor) -> int:
+            # 보관 후 삭제된 스크립트의 로그는 스크립트 연결 없이 복원 (외래키 제약조건)
+            script_ids = list({log["script_id"] for log in logs if log.get("script_id") is not None})
+            existing_scripts: set[int] = set()
+            for start in range(0, len(script_ids), FETCH_CHUNK_SIZE):
+                chunk = script_ids[start : start + FETCH_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"SELECT id FROM scripts WHERE id IN ({placeholders})", chunk)
+                existing_scripts.update(row[0] for row in cursor.fetchall())
+
+            search = self._has_search_index(cursor)
+            restored = 0
+            for log in logs:
+                payloads = (
+                    encode_payload(log.get("parameters")),
+                    encode_payload(log.get("result")),
+                    encode_payload(log.get("error_traceback")),
+                )
+                is_connected = log.get("is_connected")
+                row = (
+                    log.get("execution_id"),
+                    log.get("script_id") if log.get("script_id") in existing_scripts else None,
+                    log["node_id"],
+                    log["node_type"],
+                    log.get("node_name"),
+                    log["status"],
+                    log.get("started_at"),
+                    log.get("finished_at"),
+                    log.get("execution_time_ms"),
+                    log.get("error_message"),
+                    1 if is_connected else 0 if is_connected is False else None,
+                    log.get("connection_sequence"),
+                    log.get("node_identifier"),
+                    log.get("attempt") or 1,
+                    *(payload.ref if payload else None for payload in payloads),
+                )
+                if _insert_row(cursor, row, payloads, log.get("error_traceback"), search):
+                    restored += 1
+            return restored
+
+        restored: int = self.connection.execute_with_connection(insert)
+        return restored
+
+
+def _insert_row(
+    cursor: sqlite3.Cursor,
+    row: tuple[Any, ...],
+    payloads: tuple[EncodedPayload | None, ...],
+    error_traceback: str | None,
+    search: bool,
+) -> bool:
+    """
+    최종 로그 행과 페이로드 INSERT (같은 노드의 최종 로그가 이미 있으면 무시)
+    search가 True면 전문 검색 인덱스에도 같은 트랜잭션에서 추가합니다.
+
+    Returns:
+        저장 여부
+    """
+    cursor.execute(
+        """
+        INSERT OR IGNORE INTO node_execution_logs (
+            execution_id, script_id, node_id, node_type, node_name,
+            status, started_at, finished_at, execution_time_ms, error_message,
+            is_connected, connection_sequence, node_identifier, attempt,
+            parameters, result, error_traceback,
+            parameters_ref, result_ref, traceback_ref
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, NULL, NULL, ?, ?, ?)
+        """,
+        row,
+    )
+    if not cursor.rowcount:
+        return False
+    log_id = cursor.lastrowid
+    # 같은 내용의 페이로드가 이미 있으면 저장하지 않음 (중복 제거)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO log_payloads (ref, data, size) VALUES (?, ?, ?)",
+        [(payload.ref, payload.data, payload.size) for payload in payloads if payload],
+    )
+    if search:
+        # row 순서: node_name(4), error_message(9), node_identifier(12)
+        cursor.execute(
+            f"""
+            INSERT INTO {SEARCH_TABLE} (rowid, node_name, node_identifier, error_message, error_traceback)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (log_id, row[4], row[12], row[9], traceback_text(error_traceback)),
+        )
+    return True
+
+
+# 목록 조회 필드 (페이로드 제외, 컬럼 이름과 같음)
+_LIST_FIELDS = (
+    "id",
+    "execution_id",
+    "script_id",
+    "node_id",
+    "node_type",
+    "node_name",
+    "status",
+    "started_at",
+    "finished_at",
+    "execution_time_ms",
+    "error_message",
+    "created_at",
+    "is_connected",
+    "connection_sequence",
+    "node_identifier",
+    "attempt",
+)
+# 페이로드 필드 (log_payloads에서 압축 해제)
+_PAYLOAD_FIELDS = ("parameters", "result", "error_traceback")
+# 키셋 페이지네이션 정렬 키 (fields를 지정해도 항상 읽음)
+_KEYSET_FIELDS = ("id", "started_at")
+# fields= 로 선택할 수 있는 필드
+LOG_FIELDS = _LIST_FIELDS + _PAYLOAD_FIELDS
+# 상세 조회 시 추가로 읽는 컬럼 (해시 컬럼이 비어 있으면 이전 버전에서 행에 직접 저장한 값 사용)
+_PAYLOAD_COLUMNS = "parameters_ref, result_ref, traceback_ref, parameters, result, error_traceback"
+
+
+def _count_final_log(cursor: sqlite3.Cursor, log_id: int | None, row: tuple[Any, ...]) -> None:
+    """
+    새로 저장한 최종 로그만큼 로그 통계를 증가시킵니다. (LogStatsRepository.calculate_and_update_stats와 같은 기준)
+    전체 로그를 다시 세지 않고 stat_value = stat_value + ? 로 갱신하므로 로그가 많아도 비용이 같습니다.
+    """
+    # db 패키지는 모듈 로드 시 불러오지 않음 (순환 import, 파일 위쪽 참고)
+    from db.log_stats_repository import EXECUTION_TIME_COUNT_KEY, EXECUTION_TIME_TOTAL_KEY, increment_log_stats
+
+    # row 순서: execution_id(0), status(5), execution_time_ms(8)
+    execution_id, status, execution_time_ms = row[0], row[5], row[8]
+    deltas: dict[str, int] = {}
+    if status in ("completed", "failed"):
+        deltas[status] = 1
+    if execution_id is not None:
+        # 실행의 첫 로그면 실행 개수 증가
+        cursor.execute(
+            "SELECT 1 FROM node_execution_logs WHERE execution_id = ? AND id <> ? LIMIT 1", (execution_id, log_id)
+        )
+        if cursor.fetchone() is None:
+            deltas["total"] = 1
+    if execution_time_ms is not None and execution_time_ms > 0:
+        deltas[EXECUTION_TIME_TOTAL_KEY] = int(execution_time_ms)
+        deltas[EXECUTION_TIME_COUNT_KEY] = 1
+    increment_log_stats(cursor, deltas)
+
+
+def _row_to_log(row: tuple[Any, ...], names: tuple[str, ...]) -> dict[str, Any]:
+    """목록 조회 행을 로그 딕셔너리로 변환합니다."""
+    log = dict(zip(names, row, strict=False))
+    if log.get("is_connected") is not None:
+        log["is_connected"] = bool(log["is_connected"])
+    if "attempt" in log and log["attempt"] is None:
+        log["attempt"] = 1
+    return log
+
+
+def _attach_payload(log: dict[str, Any], payload_row: tuple[Any, ...], decoded: dict[str, Any]) -> None:
+    """상세 조회 행의 페이로드 컬럼(_PAYLOAD_COLUMNS 순서)을 로그 딕셔너리에 추가합니다."""
+    parameters_ref, result_ref, traceback_ref, parameters, result, error_traceback = payload_row
+    log["parameters"] = decoded.get(parameters_ref, {}) if parameters_ref else json.loads(parameters or "{}")
+    log["result"] = decoded.get(result_ref, {}) if result_ref else json.loads(result or "{}")
+    log["error_traceback"] = decoded.get(traceback_ref) if traceback_ref else error_traceback
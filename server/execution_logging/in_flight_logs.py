@@ -0,0 +1,146 @@
+"""
+실행 중 노드 로그 저장소
+running 상태(시작/재시도) 로그를 DB에 쓰지 않고 메모리에 보관합니다.
+노드가 끝나면(completed/failed) 보관 중인 값과 합쳐 최종 로그 행을 한 번만 저장합니다.
+
+순서 번호(sequence):
+    로그 클라이언트가 이벤트마다 붙이는 단조 증가 번호입니다. 로그 전송은 fire-and-forget 태스크라
+    시작 로그가 완료 로그보다 늦게 도착하거나, 타임아웃 후 재전송으로 같은 이벤트가 두 번 도착할 수 있습니다.
+    키(execution_id, node_id)별로 마지막으로 반영한 번호보다 작거나 같은 이벤트는 버립니다.
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+# 이 필드들은 이후 이벤트에 값이 없으면(None) 이전 값을 유지
+_STICKY_FIELDS = (
+    "script_id",
+    "node_type",
+    "node_name",
+    "started_at",
+    "parameters",
+    "is_connected",
+    "connection_sequence",
+    "node_identifier",
+)
+
+InFlightKey = tuple[str | None, str]
+
+
+class InFlightLogStore:
+    """실행 중인 노드의 로그 상태 (실행 ID, 노드 ID 기준)"""
+
+    def __init__(self, max_entries: int = 1000, max_finished: int = 10000) -> None:
+        """
+        Args:
+            max_entries: 보관할 실행 중 로그 수 (완료 로그가 오지 않은 항목이 쌓이지 않도록 오래된 것부터 제거)
+            max_finished: 완료 순서 번호를 기억할 노드 수 (완료 후 늦게 도착한 시작 로그를 버리기 위해 사용)
+        """
+        self.max_entries = max_entries
+        self.max_finished = max_finished
+        self._entries: OrderedDict[InFlightKey, dict[str, Any]] = OrderedDict()
+        self._finished: OrderedDict[InFlightKey, int] = OrderedDict()
+
+    def _is_stale(self, key: InFlightKey, sequence: int | None) -> bool:
+        """이미 반영한 이벤트보다 이전(또는 같은) 이벤트인지 확인합니다. (순서 번호가 없으면 항상 반영)"""
+        if sequence is None:
+            return False
+        entry = self._entries.get(key)
+        if entry is not None and entry["sequence"] is not None and sequence <= entry["sequence"]:
+            return True
+        finished = self._finished.get(key)
+        return finished is not None and sequence <= finished
+
+    def update(self, key: InFlightKey, sequence: int | None, fields: dict[str, Any]) -> bool:
+        """
+        running 이벤트(시작/재시도)를 반영합니다.
+
+        Args:
+            key: (execution_id, node_id)
+            sequence: 이벤트 순서 번호
+            fields: 로그 필드 (status, attempt, error_message 등)
+
+        Returns:
+            반영 여부 (늦게 도착했거나 중복된 이벤트면 False)
+        """
+        if self._is_stale(key, sequence):
+            return False
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"execution_id": key[0], "node_id": key[1]}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+
+        for name, value in fields.items():
+            if value is not None or name not in _STICKY_FIELDS:
+                entry[name] = value
+        entry["sequence"] = sequence
+        return True
+
+    def finish(self, key: InFlightKey, sequence: int | None) -> tuple[bool, dict[str, Any] | None]:
+        """
+        완료 이벤트(completed/failed)를 받았을 때 실행 중 로그를 꺼냅니다.
+
+        Returns:
+            (반영 여부, 실행 중 로그 또는 None)
+            늦게 도착했거나 중복된 완료 이벤트면 (False, None)
+        """
+        if self._is_stale(key, sequence):
+            return False, None
+
+        entry = self._entries.pop(key, None)
+        if sequence is not None:
+            self._finished[key] = sequence
+            self._finished.move_to_end(key)
+            while len(self._finished) > self.max_finished:
+                self._finished.popitem(last=False)
+        return True, entry
+
+    def list(self, execution_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        실행 중 로그 목록 (DB 로그와 같은 형식, id는 None)
+
+        Args:
+            execution_id: 지정하면 해당 실행의 로그만 반환
+        """
+        return [
+            _to_log_row(entry) for key, entry in self._entries.items() if execution_id is None or key[0] == execution_id
+        ]
+
+    def discard_execution(self, execution_id: str) -> None:
+        """실행 ID의 실행 중 로그를 삭제합니다. (로그 삭제 API와 함께 사용)"""
+        for key in [key for key in self._entries if key[0] == execution_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """모든 실행 중 로그를 삭제합니다."""
+        self._entries.clear()
+        self._finished.clear()
+
+
+def _to_log_row(entry: dict[str, Any]) -> dict[str, Any]:
+    """실행 중 로그를 조회 API 응답 형식(DB 로그 행과 같은 키)으로 변환합니다."""
+    return {
+        "id": None,
+        "execution_id": entry.get("execution_id"),
+        "script_id": entry.get("script_id"),
+        "node_id": entry.get("node_id"),
+        "node_type": entry.get("node_type"),
+        "node_name": entry.get("node_name"),
+        "status": entry.get("status", "running"),
+        "started_at": entry.get("started_at"),
+        "finished_at": None,
+        "execution_time_ms": None,
+        "parameters": entry.get("parameters") or {},
+        "result": {},
+        "error_message": entry.get("error_message"),
+        "error_traceback": entry.get("error_traceback"),
+        "created_at": None,
+        "is_connected": entry.get("is_connected"),
+        "connection_sequence": entry.get("connection_sequence"),
+        "node_identifier": entry.get("node_identifier"),
+        "attempt": entry.get("attempt") or 1,
+    }
@@ -0,0 +1,112 @@
+"""
+노드 실행 로그 보관 파일
+보관 정책으로 DB에서 정리한 로그를 gzip 압축 NDJSON 파일(한 줄에 로그 하나)로 저장하고 다시 읽습니다.
+
+- 파일 이름: node_logs_YYYYmmdd_HHMMSS.ndjson.gz (정리 주기마다 파일 하나)
+- 각 줄은 상세 조회(include_payload)와 같은 형식의 로그 딕셔너리 (파라미터/결과/스택 트레이스 포함)
+- 배치마다 gzip 멤버를 이어 붙이므로 정리 도중 중단되어도 이미 쓴 배치는 읽을 수 있음
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+import gzip
+import json
+import os
+import re
+from typing import Any
+
+ARCHIVE_PREFIX = "node_logs_"
+ARCHIVE_SUFFIX = ".ndjson.gz"
+# 경로 조작(../ 등)을 막기 위해 API로 받은 파일 이름은 이 형식만 허용
+_ARCHIVE_NAME_PATTERN = re.compile(r"^node_logs_\d{8}_\d{6}(_\d+)?\.ndjson\.gz$")
+
+
+class LogArchive:
+    """로그 보관 파일 디렉토리"""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Args:
+            directory: 보관 파일 디렉토리 (첫 저장 시 생성)
+        """
+        self.directory = directory
+
+    def path_for(self, name: str) -> str:
+        """
+        보관 파일 이름을 경로로 변환합니다.
+
+        Raises:
+            ValueError: 보관 파일 이름 형식이 아닌 경우
+        """
+        if not _ARCHIVE_NAME_PATTERN.match(name):
+            raise ValueError(f"잘못된 보관 파일 이름입니다: {name}")
+        return os.path.join(self.directory, name)
+
+    def new_name(self, now: datetime | None = None) -> str:
+        """새 보관 파일 이름 (같은 초에 만든 파일이 있으면 번호를 붙임)"""
+        base = f"{ARCHIVE_PREFIX}{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}"
+        name = base + ARCHIVE_SUFFIX
+        index = 1
+        while os.path.exists(os.path.join(self.directory, name)):
+            name = f"{base}_{index}{ARCHIVE_SUFFIX}"
+            index += 1
+        return name
+
+    def append(self, name: str, logs: list[dict[str, Any]]) -> None:
+        """
+        로그를 보관 파일 끝에 추가합니다. (파일이 없으면 생성)
+        DB에서 삭제하기 전에 호출하며, 디스크에 기록한 뒤 반환합니다.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        lines = "".join(json.dumps(log, ensure_ascii=False, default=str) + "\n" for log in logs)
+        with open(self.path_for(name), "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as archive:
+                archive.write(lines.encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def list(self) -> list[dict[str, Any]]:
+        """보관 파일 목록 (최신 파일부터)"""
+        if not os.path.isdir(self.directory):
+            return []
+        archives = []
+        for name in os.listdir(self.directory):
+            if not _ARCHIVE_NAME_PATTERN.match(name):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            archives.append(
+                {
+                    "name": name,
+                    "size_bytes": stat.st_size,
+                    "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+                }
+            )
+        archives.sort(key=lambda archive: archive["name"], reverse=True)
+        return archives
+
+    def iter_logs(
+        self,
+        name: str,
+        execution_id: str | None = None,
+        script_id: int | None = None,
+        status: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        보관 파일의 로그를 조건에 맞는 것만 차례로 읽습니다. (파일 전체를 메모리에 올리지 않음)
+
+        Raises:
+            ValueError: 보관 파일 이름 형식이 아닌 경우
+            FileNotFoundError: 보관 파일이 없는 경우
+        """
+        with gzip.open(self.path_for(name), "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if not line.strip():
+                    continue
+                log = json.loads(line)
+                if execution_id is not None and log.get("execution_id") != execution_id:
+                    continue
+                if script_id is not None and log.get("script_id") != script_id:
+                    continue
+                if status is not None and log.get("status") != status:
+                    continue
+                yield log
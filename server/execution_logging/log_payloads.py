@@ -0,0 +1,52 @@
+"""
+노드 실행 로그 페이로드 저장 형식
+파라미터/결과/스택 트레이스를 로그 행과 분리된 log_payloads 테이블에 압축하여 저장합니다.
+
+- 내용 주소 방식: 정규화한 JSON의 해시를 키로 사용하므로 같은 파라미터 집합은 한 번만 저장됩니다.
+- 압축: zlib (표준 라이브러리, 별도 의존성 없음)
+- 목록 조회는 로그 행만 읽고, 상세 조회(include_payload) 시에만 압축을 해제합니다.
+"""
+
+import hashlib
+import json
+from typing import Any
+import zlib
+
+# zlib 압축 수준 (로그 저장은 API 요청마다 일어나므로 속도와 압축률의 중간값 사용)
+COMPRESSION_LEVEL = 6
+# SQLite 바인드 변수 개수 제한(999) 안에서 한 번에 조회할 해시 수
+FETCH_CHUNK_SIZE = 500
+
+
+class EncodedPayload:
+    """압축된 페이로드 하나"""
+
+    __slots__ = ("data", "ref", "size")
+
+    def __init__(self, ref: str, data: bytes, size: int) -> None:
+        self.ref = ref
+        self.data = data
+        self.size = size
+
+
+def encode_payload(value: Any) -> EncodedPayload | None:
+    """
+    값을 저장 형식으로 변환합니다.
+
+    Args:
+        value: JSON 직렬화 가능한 값 (파라미터/결과 딕셔너리, 스택 트레이스 문자열)
+
+    Returns:
+        EncodedPayload (ref: 해시, data: 압축된 JSON, size: 압축 전 바이트 수), 빈 값이면 None
+    """
+    if not value:
+        return None
+    # 키 순서를 정렬해야 내용이 같은 파라미터가 같은 해시를 가짐
+    raw = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ref = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return EncodedPayload(ref, zlib.compress(raw, COMPRESSION_LEVEL), len(raw))
+
+
+def decode_payload(data: bytes) -> Any:
+    """encode_payload()로 저장한 데이터를 원래 값으로 되돌립니다."""
+    return json.loads(zlib.decompress(data))
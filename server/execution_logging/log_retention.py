@@ -0,0 +1,269 @@
+"""
+노드 실행 로그 보관 정책
+node_execution_logs가 계속 커지지 않도록 오래된 실행의 로그를 주기적으로 정리합니다.
+
+정리 기준 (0이면 사용 안 함, 모두 오래된 실행부터 실행 단위로 정리):
+- 보관 기간: retention_days일보다 먼저 시작한 로그
+- 행 수: 로그가 max_rows개를 넘는 만큼
+- 크기: DB 사용량(빈 페이지 제외)이 max_mb를 넘는 동안
+
+동작 방식:
+- 한 트랜잭션에서 batch_size개 정도만 삭제하고 배치 사이에 쉬어서 로그 저장 요청이 오래 기다리지 않게 함
+- 삭제 전 로그를 보관 파일(gzip 압축 NDJSON)에 기록 (LogArchive, 조회/복원 API에서 사용)
+- 정리 후 참조가 없어진 페이로드를 삭제하고, 빈 페이지를 PRAGMA incremental_vacuum으로 파일에서 반환
+- DB 작업은 별도 스레드(asyncio.to_thread)에서 수행하여 이벤트 루프를 막지 않음
+
+사용 예시:
+    from execution_logging import log_retention
+
+    log_retention.start(db_manager.node_execution_logs, on_pruned=db_manager.log_stats.calculate_and_update_stats)
+    summary = await log_retention.run_once()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+import time
+from typing import TYPE_CHECKING, Any
+
+from log import log_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .execution_log_repository import NodeExecutionLogRepository
+    from .log_archive import LogArchive
+
+logger = log_manager.get_logger(__name__)
+
+# 서버 시작 후 첫 정리까지 대기 시간 (초, 시작 직후의 요청과 겹치지 않도록)
+STARTUP_DELAY_SEC = 60
+# 배치 사이 대기 시간 (초, 그 사이에 로그 저장 요청이 쓰기 잠금을 얻을 수 있도록)
+BATCH_PAUSE_SEC = 0.05
+# incremental_vacuum 한 번에 반환할 최대 페이지 수 (4KB 페이지 기준 약 8MB)
+VACUUM_STEP_PAGES = 2000
+# PRAGMA auto_vacuum 값
+_AUTO_VACUUM_INCREMENTAL = 2
+
+
+class LogRetentionManager:
+    """노드 실행 로그를 보관 정책에 따라 주기적으로 정리하는 클래스"""
+
+    def __init__(
+        self,
+        archive: LogArchive,
+        retention_days: int,
+        max_rows: int,
+        max_mb: int,
+        interval: float,
+        batch_size: int,
+        vacuum: bool = True,
+        archive_enabled: bool = True,
+    ) -> None:
+        """
+        Args:
+            archive: 정리한 로그를 저장할 보관 파일 디렉토리
+            retention_days: 보관 기간 (일, 0 이하면 사용 안 함)
+            max_rows: 최대 로그 행 수 (0 이하면 사용 안 함)
+            max_mb: DB 최대 사용량 (MB, 0 이하면 사용 안 함)
+            interval: 정리 주기 (초, 0 이하면 자동 정리 안 함, run_once()로 직접 실행 가능)
+            batch_size: 한 트랜잭션에서 삭제할 로그 수
+            vacuum: 정리 후 빈 페이지를 파일에서 반환할지 여부
+            archive_enabled: 삭제 전 보관 파일에 기록할지 여부
+        """
+        self.archive = archive
+        self.retention_days = retention_days
+        self.max_rows = max_rows
+        self.max_mb = max_mb
+        self.interval = interval
+        self.batch_size = max(1, batch_size)
+        self.vacuum = vacuum
+        self.archive_enabled = archive_enabled
+        self.repository: NodeExecutionLogRepository | None = None
+        self.on_pruned: Callable[[], Any] | None = None
+        self.last_run: dict[str, Any] | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """주기 정리 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def enabled(self) -> bool:
+        """정리 기준이 하나라도 설정되어 있는지 여부"""
+        return self.retention_days > 0 or self.max_rows > 0 or self.max_mb > 0
+
+    def start(self, repository: NodeExecutionLogRepository, on_pruned: Callable[[], Any] | None = None) -> None:
+        """
+        주기 정리를 시작합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            repository: 노드 실행 로그 리포지토리
+            on_pruned: 로그를 삭제한 정리 주기가 끝날 때 작업 스레드에서 호출할 함수 (로그 통계 재계산 등)
+        """
+        self.repository = repository
+        self.on_pruned = on_pruned
+        if self.running or self.interval <= 0 or not self.enabled:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="log-retention")
+        logger.info(
+            "[LogRetention] 로그 보관 정책 시작 - 기간: %s일, 최대 행 수: %s, 최대 크기: %sMB, 주기: %s초",
+            self.retention_days,
+            self.max_rows,
+            self.max_mb,
+            self.interval,
+        )
+
+    async def stop(self) -> None:
+        """주기 정리를 멈춥니다. (진행 중인 배치는 트랜잭션 단위로 끝나거나 롤백됨)"""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        """interval마다 정리합니다."""
+        await asyncio.sleep(min(STARTUP_DELAY_SEC, self.interval))
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning("[LogRetention] 로그 정리 실패 (다음 주기에 재시도): %s", e)
+            await asyncio.sleep(self.interval)
+
+    def status(self) -> dict[str, Any]:
+        """보관 정책 설정과 마지막 정리 결과"""
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "retention_days": self.retention_days,
+            "max_rows": self.max_rows,
+            "max_mb": self.max_mb,
+            "interval_sec": self.interval,
+            "batch_size": self.batch_size,
+            "vacuum": self.vacuum,
+            "archive_enabled": self.archive_enabled,
+            "archive_dir": self.archive.directory,
+            "last_run": self.last_run,
+        }
+
+    async def run_once(self) -> dict[str, Any]:
+        """
+        보관 정책에 따라 한 번 정리합니다. (동시에 한 번만 실행)
+
+        Returns:
+            정리 결과 (삭제한 로그/페이로드 수, 보관 파일, 정리 전후 DB 사용량, 소요 시간)
+        """
+        repository = self.repository
+        if repository is None:
+            raise RuntimeError("로그 보관 정책이 시작되지 않았습니다.")
+
+        async with self._lock:
+            started = time.perf_counter()
+            before = await asyncio.to_thread(repository.get_storage_stats)
+            # 기존 DB는 증분 VACUUM 모드로 한 번 전환 (새 DB는 테이블 생성 시 이미 증분 모드)
+            if self.vacuum and before["auto_vacuum"] != _AUTO_VACUUM_INCREMENTAL:
+                logger.info("[LogRetention] DB를 증분 VACUUM 모드로 전환 중 (한 번만 수행)...")
+                await asyncio.to_thread(repository.enable_incremental_vacuum)
+
+            archive_name = self.archive.new_name() if self.archive_enabled else None
+            deleted = 0
+            archived = False
+
+            async def prune(cutoff: str | None, limit: int) -> int:
+                nonlocal deleted, archived
+                log_ids = await asyncio.to_thread(repository.select_prune_batch, cutoff, limit)
+                if not log_ids:
+                    return 0
+                count = await asyncio.to_thread(self._prune_batch, repository, log_ids, archive_name)
+                archived = archived or archive_name is not None
+                deleted += count
+                await asyncio.sleep(BATCH_PAUSE_SEC)
+                return count
+
+            # 1) 보관 기간
+            if self.retention_days > 0:
+                cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat(timespec="seconds")
+                while await prune(cutoff, self.batch_size):
+                    pass
+
+            # 2) 최대 행 수
+            if self.max_rows > 0:
+                excess = before["log_count"] - deleted - self.max_rows
+                while excess > 0:
+                    count = await prune(None, min(self.batch_size, excess))
+                    if not count:
+                        break
+                    excess -= count
+
+            # 3) 최대 크기 (페이로드가 크기의 대부분이므로 배치마다 함께 정리해야 사용량이 줄어듦)
+            if self.max_mb > 0:
+                max_bytes = self.max_mb * 1024 * 1024
+                while True:
+                    stats = await asyncio.to_thread(repository.get_storage_stats)
+                    if stats["used_bytes"] <= max_bytes or not stats["log_count"]:
+                        break
+                    if not await prune(None, self.batch_size):
+                        break
+                    await asyncio.to_thread(repository.delete_orphan_payloads)
+
+            # 스크립트 삭제로 로그가 함께 삭제된 경우의 페이로드도 여기서 정리
+            payloads_deleted = await asyncio.to_thread(repository.delete_orphan_payloads)
+            if deleted and self.on_pruned is not None:
+                try:
+                    await asyncio.to_thread(self.on_pruned)
+                except Exception as e:
+                    logger.warning("[LogRetention] 정리 후 처리 실패 (무시): %s", e)
+
+            released_bytes = 0
+            if self.vacuum:
+                released_bytes = await self._release_free_pages(repository)
+
+            after = await asyncio.to_thread(repository.get_storage_stats)
+            self.last_run = {
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "deleted_logs": deleted,
+                "deleted_payloads": payloads_deleted,
+                "archive": archive_name if archived else None,
+                "released_bytes": released_bytes,
+                "before": before,
+                "after": after,
+            }
+            if deleted or payloads_deleted:
+                logger.info(
+                    "[LogRetention] 로그 정리 완료 - 로그: %s개, 페이로드: %s개, 보관 파일: %s, 반환: %s바이트",
+                    deleted,
+                    payloads_deleted,
+                    self.last_run["archive"],
+                    released_bytes,
+                )
+            return self.last_run
+
+    def _prune_batch(self, repository: NodeExecutionLogRepository, log_ids: list[int], archive_name: str | None) -> int:
+        """로그 한 배치를 보관 파일에 기록한 뒤 삭제합니다. (작업 스레드에서 실행, 기록에 실패하면 삭제하지 않음)"""
+        if archive_name is not None:
+            self.archive.append(archive_name, repository.export_logs(log_ids))
+        return repository.delete_logs_by_ids(log_ids)
+
+    async def _release_free_pages(self, repository: NodeExecutionLogRepository) -> int:
+        """빈 페이지를 VACUUM_STEP_PAGES개씩 나누어 파일에서 반환합니다."""
+        before = await asyncio.to_thread(repository.get_storage_stats)
+        if before["auto_vacuum"] != _AUTO_VACUUM_INCREMENTAL:
+            return 0
+        remaining = before["free_pages"]
+        while remaining:
+            left = await asyncio.to_thread(repository.incremental_vacuum, VACUUM_STEP_PAGES)
+            if left >= remaining:
+                break
+            remaining = left
+            await asyncio.sleep(BATCH_PAUSE_SEC)
+        after = await asyncio.to_thread(repository.get_storage_stats)
+        released: int = before["db_bytes"] - after["db_bytes"]
+        return released
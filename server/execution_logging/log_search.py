@@ -0,0 +1,82 @@
+"""
+노드 실행 로그 전문 검색 (SQLite FTS5)
+에러 메시지, 스택 트레이스, 노드 이름/식별자를 검색어로 찾기 위한 검색어 변환과 스니펫 처리입니다.
+
+- 검색 인덱스: node_log_search 가상 테이블 (rowid = node_execution_logs.id, TableManager에서 생성)
+- 동기화: 최종 로그 저장 시 함께 INSERT, 로그 삭제 시 트리거로 삭제 (보관 정책 정리, 스크립트 삭제 포함)
+- 검색어: 공백으로 구분한 단어는 모두 포함(AND), 각 단어는 접두어 검색 ("타임아웃" -> "타임아웃이", "excel" -> "excel_open")
+  큰따옴표로 묶으면 구문 검색 ("element not found")
+"""
+
+import html
+import re
+
+# 검색 인덱스 테이블 이름과 컬럼 (순서는 테이블 정의와 같음)
+SEARCH_TABLE = "node_log_search"
+SEARCH_COLUMNS = ("node_name", "node_identifier", "error_message", "error_traceback")
+# 스택 트레이스는 끝부분(예외 종류와 메시지)만 인덱싱 (전체 내용은 log_payloads에 압축 저장되어 있음)
+TRACEBACK_MAX_CHARS = 4000
+# 스니펫 길이 (토큰 수)
+SNIPPET_TOKENS = 16
+# 검색 결과 정렬 방식 (rank: 관련도순, recent: 최근 저장순)
+SEARCH_ORDERS = ("rank", "recent")
+
+# 스니펫 강조 구분자 (HTML 이스케이프 후 <mark> 태그로 바꿈)
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def traceback_text(error_traceback: str | None) -> str | None:
+    """스택 트레이스에서 인덱싱할 부분 (끝부분 TRACEBACK_MAX_CHARS자)"""
+    if not error_traceback:
+        return None
+    return error_traceback[-TRACEBACK_MAX_CHARS:]
+
+
+def build_match_query(text: str, columns: list[str] | None = None) -> str:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환합니다.
+    FTS5 연산자(AND, OR, NEAR, *, : 등)는 모두 일반 문자로 취급하므로 검색어로 인한 구문 오류가 없습니다.
+
+    Args:
+        text: 검색어 (예: 'timeout excel', '"element not found"')
+        columns: 검색할 컬럼 (None이면 전체, SEARCH_COLUMNS 중에서 선택)
+
+    Returns:
+        MATCH 식 (예: '{error_message} : ("timeout"* "excel"*)')
+
+    Raises:
+        ValueError: 검색어가 비어 있거나 선택할 수 없는 컬럼인 경우
+    """
+    terms = []
+    for phrase, word in _TERM_PATTERN.findall(text):
+        value = (phrase or word).replace('"', "").strip()
+        if not value:
+            continue
+        # 구문은 그대로, 단어는 접두어 검색 (한국어 조사, 영어 어미가 붙은 단어도 찾음)
+        terms.append(f'"{value}"' if phrase else f'"{value}"*')
+    if not terms:
+        raise ValueError("검색어를 입력하세요.")
+
+    query = " ".join(terms)
+    if columns:
+        unknown = [column for column in columns if column not in SEARCH_COLUMNS]
+        if unknown:
+            raise ValueError(
+                f"검색할 수 없는 컬럼입니다: {', '.join(unknown)} (가능한 컬럼: {', '.join(SEARCH_COLUMNS)})"
+            )
+        query = f"{{{' '.join(columns)}}} : ({query})"
+    return query
+
+
+def snippet_sql(table: str) -> str:
+    """가장 잘 맞는 컬럼에서 검색어 주변을 잘라 강조 구분자로 감싸는 SQL 식"""
+    return f"snippet({table}, -1, char(2), char(3), '…', {SNIPPET_TOKENS})"
+
+
+def format_snippet(snippet: str | None) -> str | None:
+    """snippet_sql() 결과를 HTML 이스케이프하고 강조 부분을 <mark> 태그로 감쌉니다. (그대로 innerHTML에 사용 가능)"""
+    if not snippet:
+        return None
+    return html.escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
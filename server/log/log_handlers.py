@@ -0,0 +1,131 @@
+"""
+로그 포맷터/필터 모듈
+
+LogManager가 사용하는 파일용 포맷터와 필터를 정의합니다.
+
+- PLAIN_LOG_FORMAT: 색상 코드가 없는 파일용 텍스트 포맷
+- JsonFormatter: 한 줄에 JSON 객체 하나를 기록하는 파일용 포맷터 (로그 수집/분석용)
+- SamplingFilter: 자주 호출되는 위치의 DEBUG/INFO 로그를 N개 중 1개만 남기는 필터
+- DeferredFormatQueueHandler: 포맷팅을 QueueListener 스레드로 미루는 QueueHandler
+- parse_module_settings: "nodes=WARNING,services.action_service=DEBUG" 형식의 설정 문자열 파싱
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import json
+import logging
+from logging.handlers import QueueHandler
+from typing import Any
+
+# 콘솔/파일 공통 로그 포맷 (콘솔은 앞에 색상 코드만 추가)
+PLAIN_LOG_FORMAT = "[%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# LogRecord 기본 속성 (JSON 로그에서 extra 필드를 구분하기 위함)
+_RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+def parse_module_settings(value: str) -> dict[str, str]:
+    """
+    모듈별 설정 문자열을 딕셔너리로 파싱합니다.
+
+    Args:
+        value: "모듈=값" 쌍을 쉼표로 구분한 문자열 (예: "nodes=WARNING,services.action_service=DEBUG")
+
+    Returns:
+        {모듈 이름: 값} 딕셔너리 (형식이 잘못된 항목은 무시)
+    """
+    settings: dict[str, str] = {}
+    for item in value.split(","):
+        name, separator, setting = item.partition("=")
+        name = name.strip()
+        setting = setting.strip()
+        if separator and name and setting:
+            settings[name] = setting
+    return settings
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    JSON 로그 포맷터
+    레코드 하나를 JSON 객체 한 줄로 기록합니다. (logger.info(..., extra={...})로 넘긴 필드도 포함)
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """로그 레코드를 JSON 문자열로 변환합니다."""
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "func": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    로그 샘플링 필터
+    설정된 모듈에서 WARNING 미만 로그를 호출 위치(파일, 줄 번호)별로 N개 중 1개만 통과시킵니다.
+    WARNING 이상 로그는 항상 통과합니다.
+    """
+
+    def __init__(self, rates: dict[str, int]) -> None:
+        """
+        Args:
+            rates: {로거 이름 접두사: N} (예: {"Automation.services.action_service": 100} -> 100개 중 1개)
+        """
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate > 0}
+        # 로거 이름 -> 샘플링 비율 (접두사 매칭 결과 캐시, 1이면 샘플링 안 함)
+        self._rate_cache: dict[str, int] = {}
+        # (로거 이름, 파일 경로, 줄 번호) -> 지금까지 들어온 레코드 수
+        self._counters: dict[tuple[str, str, int], int] = {}
+
+    def _resolve_rate(self, logger_name: str) -> int:
+        """로거 이름에 해당하는 샘플링 비율을 찾습니다. (가장 긴 접두사 우선)"""
+        rate = self._rate_cache.get(logger_name)
+        if rate is None:
+            rate = 1
+            matched = -1
+            for name, value in self.rates.items():
+                if (logger_name == name or logger_name.startswith(name + ".")) and len(name) > matched:
+                    rate = value
+                    matched = len(name)
+            self._rate_cache[logger_name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """레코드 통과 여부를 반환합니다."""
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._resolve_rate(record.name)
+        if rate == 1:
+            return True
+        key = (record.name, record.pathname, record.lineno)
+        count = self._counters.get(key, 0)
+        self._counters[key] = count + 1
+        return count % rate == 0
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare()는 다른 프로세스로 보낼 수 있도록 호출 스레드에서 메시지와 예외 정보를 포맷합니다.
+    LogManager의 큐는 같은 프로세스의 QueueListener가 읽으므로 포맷팅도 리스너 스레드에서 하도록 레코드를 그대로 넘깁니다.
+    (메시지 인자는 출력 시점에 문자열로 바뀌므로, 로그 호출 뒤에 바뀐 객체는 바뀐 값으로 기록될 수 있음)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
@@ -3,8 +3,10 @@ LogManager Module
 
 싱글톤 패턴으로 설계되어 로그 설정을 중앙에서 관리하며, 다음과 같은 주요 기능을 포함합니다:
 
-- 로그 파일 생성 및 관리
-- 컬러 로그 포맷 지원
+- 로그 파일 생성 및 관리 (크기 기준 로테이션)
+- 컬러 로그 포맷 지원 (콘솔 전용, 파일은 plain/JSON 포맷)
+- 백그라운드 스레드 로그 출력 (QueueHandler/QueueListener, 호출 스레드는 큐에 넣기만 함)
+- 모듈별 로그 레벨과 자주 호출되는 경로의 로그 샘플링
 - 오래된 로그 파일 자동 정리
 
 사용 예시:
@@ -14,15 +16,22 @@ LogManager Module
     log_manager.logger.info("This is an info message")
     log_manager.logger.debug("This is a debug message")
     log_manager.logger.hr("Section Start", level=2)
+
+    # 모듈별 로거 (LOG_MODULE_LEVELS, LOG_SAMPLING 설정 적용)
+    logger = log_manager.get_logger(__name__)
+    logger.debug("노드 실행: %s", node_id)  # 지연 포맷팅 (레벨이 꺼져 있으면 문자열을 만들지 않음)
 """
 
 from __future__ import annotations
 
+import atexit
 from datetime import datetime
 import glob
 import logging
+from logging.handlers import QueueListener, RotatingFileHandler
 import os
 from pathlib import Path
+import queue
 import sys
 from typing import TYPE_CHECKING
 
@@ -31,12 +40,25 @@ if TYPE_CHECKING:
 
 import colorlog
 
+from .log_handlers import (
+    LOG_DATE_FORMAT,
+    PLAIN_LOG_FORMAT,
+    DeferredFormatQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    parse_module_settings,
+)
+
+# 루트 로거 이름 (모듈별 로거는 "Automation.services.action_service" 형식의 하위 로거)
+ROOT_LOGGER_NAME = "Automation"
+
 
 class LogManager:
     """
     로그 관리 클래스
 
     싱글톤 패턴으로 설계되었으며, 컬러 로그 포맷 및 로그 파일 정리를 지원합니다.
+    로그 출력은 QueueListener 백그라운드 스레드에서 수행됩니다.
     """
 
     _instance: LogManager | None = None
@@ -75,11 +97,25 @@ class LogManager:
 
             log_level_str = settings.LOG_LEVEL
             self.log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+            # 파일 로그 포맷 (plain: 텍스트, json: 한 줄에 JSON 객체 하나)
+            self.log_format = settings.LOG_FORMAT
+            # 파일 로테이션 기준 크기와 보관할 백업 파일 개수
+            self.max_bytes = settings.LOG_MAX_BYTES
+            self.backup_count = settings.LOG_BACKUP_COUNT
+            # 백그라운드 스레드 출력 여부 (False면 호출 스레드에서 바로 출력)
+            self.use_queue = settings.LOG_QUEUE
+            # 모듈별 로그 레벨 {모듈 이름: 레벨 이름}, 샘플링 비율 {모듈 이름: N}
+            self.module_levels = parse_module_settings(settings.LOG_MODULE_LEVELS)
+            self.sampling_rates = {
+                name: int(rate) for name, rate in parse_module_settings(settings.LOG_SAMPLING).items() if rate.isdigit()
+            }
+            self._listener: QueueListener | None = None
 
             self.max_files = max_files
             self._timestamp = self._init_timestamp()
             self.logger = self._init_logger()
             self._bind_hr_to_logger()
+            self._apply_module_levels()
             self.clean_up_logs()
             self.initialized = True
 
@@ -89,9 +125,10 @@ class LogManager:
 
     def _init_logger(self) -> Logger:
         """로거 초기화"""
-        logger = logging.getLogger("Automation")
+        logger = logging.getLogger(ROOT_LOGGER_NAME)
 
         # 기존 핸들러가 있으면 제거 (중복 방지)
+        self.shutdown()
         logger.handlers.clear()
 
         log_colors_config = {
@@ -102,38 +139,94 @@ class LogManager:
             "CRITICAL": "red,bg_white",
         }
 
-        formatter = colorlog.ColoredFormatter(
-            "[%(log_color)s%(asctime)s.%(msecs)03d][%(levelname).1s][%(filename)s(%(funcName)s):%(lineno)d] %(message)s",
-            log_colors=log_colors_config,
-            datefmt="%Y-%m-%d %H:%M:%S",
-            reset=True,
-            secondary_log_colors={},
-        )
-
         # 콘솔 핸들러 (컬러 로그)
         stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+        stream_handler.setFormatter(
+            colorlog.ColoredFormatter(
+                "[%(log_color)s" + PLAIN_LOG_FORMAT[1:],
+                log_colors=log_colors_config,
+                datefmt=LOG_DATE_FORMAT,
+                reset=True,
+                secondary_log_colors={},
+            )
+        )
 
         # 로그 파일명 생성
         script_name = os.path.basename(sys.argv[0]) if sys.argv else "unknown"
         logfile = f"{self._timestamp}_{script_name}.log"
         logpath = Path(self.directory)
 
-        # 파일 핸들러
-        file_handler = logging.FileHandler(logpath / logfile, encoding="utf-8")
-        file_handler.setFormatter(formatter)
-        file_handler.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
+        # 파일 핸들러 (크기 기준 로테이션, 색상 코드 없는 plain/JSON 포맷)
+        file_handler = RotatingFileHandler(
+            logpath / logfile, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8"
+        )
+        if self.log_format == "json":
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(PLAIN_LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+        # 레벨은 로거(루트/모듈별)에서 결정하므로 핸들러는 받은 레코드를 모두 출력
+        handlers: list[logging.Handler] = [stream_handler, file_handler]
+        sampling_filter = SamplingFilter(
+            {f"{ROOT_LOGGER_NAME}.{name}": rate for name, rate in self.sampling_rates.items()}
+        )
+
+        if self.use_queue:
+            # 호출 스레드는 레코드를 큐에 넣기만 하고, 포맷팅/파일 쓰기는 백그라운드 스레드에서 수행
+            # (기본 QueueHandler는 큐에 넣기 전에 호출 스레드에서 메시지를 포맷하므로 포맷팅을 미루는 핸들러 사용)
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            queue_handler = DeferredFormatQueueHandler(log_queue)
+            queue_handler.addFilter(sampling_filter)
+            logger.addHandler(queue_handler)
+            self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            # 종료 시 큐에 남은 로그를 모두 출력
+            atexit.register(self.shutdown)
+        else:
+            for handler in handlers:
+                handler.addFilter(sampling_filter)
+                logger.addHandler(handler)
 
         logger.propagate = False
         # 설정된 로그 레벨 적용
         logger.setLevel(self.log_level)
-        stream_handler.setLevel(self.log_level)
         logger.debug("Logger initialized")
 
         return logger
 
+    def get_logger(self, name: str) -> Logger:
+        """
+        모듈별 로거를 반환합니다.
+
+        루트 로거("Automation")의 하위 로거이므로 출력 핸들러는 공유하고,
+        LOG_MODULE_LEVELS/LOG_SAMPLING 설정은 모듈 이름(접두사) 기준으로 적용됩니다.
+
+        Args:
+            name: 모듈 이름 (보통 __name__, 예: "services.action_service")
+
+        Returns:
+            Logger 인스턴스
+        """
+        return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+    def _apply_module_levels(self) -> None:
+        """LOG_MODULE_LEVELS 설정을 모듈별 로거에 적용합니다. (예: "nodes=WARNING" -> Automation.nodes 이하 전체)"""
+        for name, level_name in self.module_levels.items():
+            level = getattr(logging, level_name.upper(), None)
+            if isinstance(level, int):
+                self.get_logger(name).setLevel(level)
+            else:
+                self.logger.warning("알 수 없는 모듈 로그 레벨: %s=%s", name, level_name)
+
+    def shutdown(self) -> None:
+        """백그라운드 로그 출력 스레드를 멈추고 큐에 남은 로그를 모두 출력합니다."""
+        listener = self._listener
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
     def hr(self, message: str = "", level: int = 1) -> None:
         """
         구분선을 출력하는 메서드.
@@ -144,9 +237,9 @@ class LogManager:
         """
         line = "=" * (level * 20)  # 구분선 길이 설정
         if message:
-            self.logger.info(f"\n{line}\n{message}\n{line}")
+            self.logger.info("\n%s\n%s\n%s", line, message, line)
         else:
-            self.logger.info(f"\n{line}")
+            self.logger.info("\n%s", line)
 
     def _bind_hr_to_logger(self) -> None:
         """
@@ -179,9 +272,12 @@ class LogManager:
                 file_to_remove = files.pop(0)
                 try:
                     os.remove(file_to_remove)
-                    self.logger.debug(f"오래된 로그 파일 삭제: {os.path.basename(file_to_remove)}")
+                    # 로테이션된 백업 파일(*.log.1, *.log.2, ...)도 함께 삭제
+                    for backup in glob.glob(glob.escape(file_to_remove) + ".*"):
+                        os.remove(backup)
+                    self.logger.debug("오래된 로그 파일 삭제: %s", os.path.basename(file_to_remove))
                 except OSError as e:
-                    self.logger.warning(f"로그 파일 삭제 실패: {file_to_remove}, 에러: {e}")
+                    self.logger.warning("로그 파일 삭제 실패: %s, 에러: %s", file_to_remove, e)
         except Exception as e:
             # clean_up_logs에서 에러가 발생해도 로거 초기화는 계속 진행
             print(f"[WARNING] 로그 정리 중 에러 발생: {e}")
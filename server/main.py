@@ -1,5 +1,7 @@
+import asyncio
 import mimetypes
 import os
+import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,7 +14,9 @@ from api import (
     action_router,
     config_router,
     dashboard_router,
+    input_recorder_router,
     log_router,
+    monitoring_router,
     node_router,
     screenshot_router,
     script_router,
@@ -21,6 +25,7 @@ from api import (
 from config.server_config import settings
 from db.database import db_manager
 from log import log_manager
+from monitoring import loop_monitor, metrics_snapshotter
 
 # 실행 명령어
 # cd server
@@ -35,7 +40,7 @@ ENVIRONMENT = settings.ENVIRONMENT  # 실행 환경 (development/production)
 DEV_MODE = settings.DEV_MODE  # 개발 모드 여부
 
 # 로거 초기화 (싱글톤 패턴)
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 logger.info("=" * 60)
 logger.info("서버 시작")
 logger.info(f"환경: {ENVIRONMENT}")
@@ -50,11 +55,15 @@ def initialize_database() -> None:
     db_path = db_manager.connection.db_path
     is_new_db = not os.path.exists(db_path)  # 새 데이터베이스 여부
 
+    started = time.perf_counter()
     try:
-        # 모든 경우에 테이블 생성 및 마이그레이션 실행
-        # (create_tables는 IF NOT EXISTS를 사용하므로 안전)
-        db_manager.init_database()  # 테이블 생성 및 마이그레이션
-        logger.info("✅ 데이터베이스 테이블 생성/마이그레이션 완료")
+        # 아직 적용하지 않은 마이그레이션 단계만 실행 (최신 버전이면 버전 조회만 함)
+        # 데이터 채우기(통계 재계산, 검색 인덱스 등)는 startup_event에서 작업 스레드로 실행
+        schema = db_manager.init_database(run_backfills=False)
+        logger.info(
+            f"✅ 데이터베이스 테이블 생성/마이그레이션 완료 - 버전: {schema['version']}, "
+            f"적용한 단계: {len(schema['applied'])}개 ({schema['duration_ms']}ms)"
+        )
 
         # 스크립트 데이터 처리
         scripts = db_manager.get_all_scripts()
@@ -152,6 +161,7 @@ def initialize_database() -> None:
         deleted_count = db_manager.user_settings.cleanup_duplicate_settings()
         if deleted_count > 0:
             logger.info(f"✅ 중복 설정 정리 완료: {deleted_count}개 행 삭제")
+        logger.info(f"✅ 데이터베이스 초기화 완료 ({round((time.perf_counter() - started) * 1000, 1)}ms)")
     except Exception as e:
         logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
         raise e
@@ -159,16 +169,47 @@ def initialize_database() -> None:
 
 app = FastAPI(title="AutoScript", description="API 서버", version="1.0.0")
 
+# 마이그레이션 데이터 채우기 작업 (서버 시작을 막지 않도록 작업 스레드에서 실행)
+backfill_task: asyncio.Task[int] | None = None
+
 
 # 서버 시작 시 데이터베이스 초기화
 @app.on_event("startup")
 async def startup_event() -> None:
     """서버 시작 시 실행되는 이벤트 핸들러"""
+    global backfill_task
     logger.info("서버 시작 이벤트 실행 중...")
     initialize_database()
+    # 마이그레이션 후 데이터 채우기 (완료되지 않은 단계가 없으면 바로 끝남, 실패하면 다음 시작 시 재시도)
+    backfill_task = asyncio.create_task(asyncio.to_thread(db_manager.run_backfills), name="db-backfill")
+    # 이벤트 루프 지연 모니터 시작 (이벤트 루프를 막는 동기 호출 감지)
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    # 메트릭 스냅샷 주기 저장 시작 (서버 재시작 후에도 기간별 메트릭 조회)
+    metrics_snapshotter.start(db_manager.metrics)
+    # 노드 실행 로그 보관 정책 (오래된 실행 로그를 보관 파일로 옮기고 DB 크기 유지)
+    # 실행 로그 패키지는 db 초기화 이후에 불러옴 (import 순서에 의존하지 않도록 사용하는 곳에서 import)
+    from execution_logging import log_retention
+
+    log_retention.start(db_manager.node_execution_logs, on_pruned=db_manager.log_stats.calculate_and_update_stats)
+    # 대시보드 실행 카운터 증분을 주기적으로 한 트랜잭션에서 반영
+    db_manager.dashboard_counters.start(settings.STATS_FLUSH_INTERVAL_SEC)
     logger.info("서버 시작 이벤트 완료")
 
 
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """서버 종료 시 실행되는 이벤트 핸들러"""
+    await loop_monitor.stop()
+    from execution_logging import log_retention
+
+    await log_retention.stop()
+    # 마지막 스냅샷 이후의 메트릭 저장
+    await metrics_snapshotter.stop()
+    # 아직 반영하지 않은 실행 카운터 증분 저장
+    await db_manager.dashboard_counters.stop()
+
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -188,6 +229,8 @@ app.include_router(action_node_router)
 app.include_router(dashboard_router)
 app.include_router(log_router)
 app.include_router(screenshot_router)
+app.include_router(input_recorder_router)
+app.include_router(monitoring_router)
 
 # 정적 파일 서빙 설정 (개발 환경)
 ui_path = os.path.join(os.path.dirname(__file__), "..", "UI", "src")
@@ -9,6 +9,7 @@ from .folder_path_models import FolderPathParams
 from .process_focus_models import ProcessFocusParams
 from .response_models import (
     BaseResponse,
+    CursorPageResponse,
     ErrorResponse,
     ListResponse,
     PaginatedResponse,
@@ -21,6 +22,7 @@ __all__ = [
     "ActionRequest",
     "ActionResponse",
     "BaseResponse",
+    "CursorPageResponse",
     "ErrorResponse",
     "FolderPathParams",
     "ListResponse",
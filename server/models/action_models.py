@@ -42,5 +42,8 @@ class NodeExecutionRequest(BaseModel):
     current_node_index: int | None = None  # 현재 노드 순번 (0부터 시작, 로깅용)
     previous_node_result: dict[str, Any] | None = None  # 이전 노드의 실행 결과 (데이터 전달용)
     repeat_info: dict[str, Any] | None = None  # 반복 노드 정보 (반복 횟수, 현재 반복 번호 등)
+    # 노드 연결 정보 ({from, to, outputType}) - 있으면 반복 노드의 아래 연결점에 연결된 노드들을 서버에서 반복 실행
+    connections: list[dict[str, Any]] | None = None
     execution_id: str | None = None  # 실행 ID (반복 노드 실행 시 같은 execution_id 사용)
     script_id: int | None = None  # 스크립트 ID (반복 노드 실행 시 같은 script_id 사용)
+    debug: bool = False  # True이면 응답에 실행 컨텍스트(보관 중인 노드 결과 등)를 포함
@@ -38,6 +38,12 @@ class ListResponse(BaseResponse):
     count: int | None = None
 
 
+class CursorPageResponse(ListResponse):
+    """커서 페이지 응답 모델 - 다음 페이지 커서를 포함한 리스트 응답 (키셋 페이지네이션)"""
+
+    next_cursor: str | None = None
+
+
 class PaginatedResponse(ListResponse):
     """페이지네이션 응답 모델 - 페이지네이션 정보를 포함한 리스트 응답"""
 
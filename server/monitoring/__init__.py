@@ -0,0 +1,59 @@
+"""
+런타임 모니터링 모듈 통합
+"""
+
+from config.server_config import settings
+
+from .execution_scope import ExecutionScope, execution_scope, get_current_scope, get_task_scope, run_in_scope
+from .loop_monitor import EventLoopMonitor, LoopStall
+from .metrics import LatencyHistogram, MetricsRegistry
+from .metrics_snapshot import MetricsSnapshotter
+from .tracing import DB, LOG, NODE, NOOP_SPAN, PHASE, REQUEST, Span, Trace, Tracer, to_chrome_trace
+
+# 서버 전체에서 사용하는 이벤트 루프 모니터 (main.py의 startup 이벤트에서 시작)
+loop_monitor = EventLoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold=settings.LOOP_STALL_THRESHOLD_MS / 1000,
+)
+
+# 서버 전체에서 사용하는 메트릭 레지스트리와 스냅샷 저장기 (main.py의 startup 이벤트에서 저장 시작)
+metrics = MetricsRegistry()
+metrics_snapshotter = MetricsSnapshotter(
+    metrics,
+    interval=settings.METRICS_SNAPSHOT_INTERVAL_SEC,
+    retention_days=settings.METRICS_RETENTION_DAYS,
+)
+
+# 서버 전체에서 사용하는 실행 추적기 (최근 실행의 스팬 타임라인을 메모리에 보관)
+tracer = Tracer(
+    enabled=settings.TRACE_ENABLED,
+    max_traces=settings.TRACE_MAX_TRACES,
+    max_spans=settings.TRACE_MAX_SPANS,
+)
+
+__all__ = [
+    "DB",
+    "LOG",
+    "NODE",
+    "NOOP_SPAN",
+    "PHASE",
+    "REQUEST",
+    "EventLoopMonitor",
+    "ExecutionScope",
+    "LatencyHistogram",
+    "LoopStall",
+    "MetricsRegistry",
+    "MetricsSnapshotter",
+    "Span",
+    "Trace",
+    "Tracer",
+    "execution_scope",
+    "get_current_scope",
+    "get_task_scope",
+    "loop_monitor",
+    "metrics",
+    "metrics_snapshotter",
+    "run_in_scope",
+    "to_chrome_trace",
+    "tracer",
+]
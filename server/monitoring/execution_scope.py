@@ -0,0 +1,126 @@
+"""
+실행 범위(execution scope) 추적
+현재 실행 중인 워크플로우 실행 ID와 노드를 보관합니다.
+
+- contextvars: 같은 태스크(와 그 안에서 만든 태스크)의 코드에서 get_current_scope()로 조회
+- 태스크별 등록: 다른 스레드(이벤트 루프 감시 스레드 등)에서 "지금 실행 중인 태스크가 어느 노드인지"를
+  get_task_scope(task)로 조회 (다른 태스크의 contextvars는 Python 3.12 미만에서 읽을 수 없으므로 별도로 등록)
+"""
+
+import asyncio
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ExecutionScope:
+    """실행 중인 노드 정보 (실행 ID, 노드 ID/타입/이름)"""
+
+    __slots__ = ("execution_id", "node_id", "node_name", "node_type", "script_id")
+
+    def __init__(
+        self,
+        execution_id: str | None,
+        node_id: str | None,
+        node_type: str | None,
+        node_name: str | None = None,
+        script_id: int | None = None,
+    ) -> None:
+        self.execution_id = execution_id
+        self.node_id = node_id
+        self.node_type = node_type
+        self.node_name = node_name
+        self.script_id = script_id
+
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환합니다. (API 응답/로그용)"""
+        return {
+            "execution_id": self.execution_id,
+            "script_id": self.script_id,
+            "node_id": self.node_id,
+            "node_type": self.node_type,
+            "node_name": self.node_name,
+        }
+
+
+# 현재 실행 범위 (노드 실행 중이 아니면 None)
+_current_scope: ContextVar[ExecutionScope | None] = ContextVar("execution_scope", default=None)
+# 태스크 -> 그 태스크에서 실행 중인 노드의 실행 범위
+_task_scopes: dict[asyncio.Task[Any], ExecutionScope] = {}
+
+
+def get_current_scope() -> ExecutionScope | None:
+    """현재 컨텍스트의 실행 범위를 반환합니다. (노드 실행 중이 아니면 None)"""
+    return _current_scope.get()
+
+
+def get_task_scope(task: asyncio.Task[Any]) -> ExecutionScope | None:
+    """
+    태스크에서 실행 중인 노드의 실행 범위를 반환합니다. (다른 스레드에서 호출 가능)
+
+    Args:
+        task: asyncio 태스크
+
+    Returns:
+        ExecutionScope 또는 None
+    """
+    return _task_scopes.get(task)
+
+
+@contextmanager
+def execution_scope(
+    execution_id: str | None,
+    node_id: str | None,
+    node_type: str | None,
+    node_name: str | None = None,
+    script_id: int | None = None,
+) -> Iterator[ExecutionScope]:
+    """
+    블록 안에서 실행 범위를 설정합니다. (블록을 벗어나면 이전 값으로 복원)
+
+    사용 예시:
+        with execution_scope(execution_id, node_id, "click"):
+            await func(parameters)
+    """
+    scope = ExecutionScope(execution_id, node_id, node_type, node_name, script_id)
+    token = _current_scope.set(scope)
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        # 이벤트 루프 밖에서 호출된 경우 (태스크별 등록 없이 contextvars만 사용)
+        task = None
+    previous = _task_scopes.get(task) if task is not None else None
+    if task is not None:
+        _task_scopes[task] = scope
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        if task is not None:
+            if previous is None:
+                _task_scopes.pop(task, None)
+            else:
+                _task_scopes[task] = previous
+
+
+async def run_in_scope(
+    awaitable: Awaitable[T],
+    execution_id: str | None,
+    node_id: str | None,
+    node_type: str | None,
+    node_name: str | None = None,
+    script_id: int | None = None,
+) -> T:
+    """
+    실행 범위 안에서 awaitable을 실행합니다.
+
+    asyncio.wait_for 등이 새 태스크를 만들어 실행하는 경우에도, 실제로 실행하는 태스크에 실행 범위가 등록됩니다.
+
+    사용 예시:
+        result = await asyncio.wait_for(run_in_scope(func(params), execution_id, node_id, "click"), timeout=10)
+    """
+    with execution_scope(execution_id, node_id, node_type, node_name, script_id):
+        return await awaitable
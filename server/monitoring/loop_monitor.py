@@ -0,0 +1,308 @@
+"""
+이벤트 루프 지연(lag) 모니터
+이벤트 루프를 오래 막는 동기 호출(time.sleep, 동기 SQLite, COM 호출, tkinter 대화상자 등)을 운영 중에 찾아냅니다.
+
+동작 방식:
+- 하트비트 코루틴: interval마다 깨어나 예정 시각보다 얼마나 늦게 깨어났는지(지연)를 측정하여 통계에 기록
+- 감시 스레드: 하트비트가 threshold 이상 멈춰 있으면 이벤트 루프 스레드의 스택을 캡처하고,
+  현재 실행 중인 태스크의 실행 범위(execution_id, 노드)로 원인을 기록
+- 노드 실행 래퍼는 노드 실행이 끝날 때 pop_node_stalls()로 해당 노드에서 발생한 멈춤을 가져와 실행 로그에 함께 기록
+
+사용 예시:
+    from monitoring import loop_monitor
+
+    loop_monitor.start()  # 실행 중인 이벤트 루프 안에서 호출
+    stats = loop_monitor.get_stats()
+"""
+
+import asyncio
+from collections import deque
+import contextlib
+from datetime import datetime
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from log import log_manager
+
+from .execution_scope import ExecutionScope, get_task_scope
+
+logger = log_manager.get_logger(__name__)
+
+# 지연 히스토그램 구간 상한 (밀리초, 마지막 구간은 그 이상 전체)
+LAG_BUCKETS_MS = (1, 5, 10, 50, 100, 250, 500, 1000)
+# 보관할 최근 멈춤 기록 개수
+DEFAULT_MAX_STALLS = 100
+# 캡처할 스택 프레임 수 (안쪽 프레임 기준)
+DEFAULT_STACK_LIMIT = 30
+# 노드별 멈춤 기록을 보관할 최대 노드 수 (실행 로그에 기록되지 않은 항목이 계속 쌓이지 않도록)
+_MAX_PENDING_NODES = 1000
+
+
+class LoopStall:
+    """이벤트 루프 멈춤 기록 하나"""
+
+    __slots__ = ("detected_at", "duration_ms", "scope", "stack", "started", "task_name")
+
+    def __init__(
+        self, started: float, scope: ExecutionScope | None, task_name: str | None, stack: list[str] | None
+    ) -> None:
+        """
+        Args:
+            started: 멈춤이 시작된 것으로 추정되는 시각 (time.monotonic 기준, 하트비트 예정 시각)
+            scope: 멈춤 당시 실행 중이던 노드의 실행 범위 (노드 실행 중이 아니면 None)
+            task_name: 멈춤 당시 실행 중이던 asyncio 태스크 이름
+            stack: 이벤트 루프 스레드의 스택 (하트비트로만 감지한 경우 None)
+        """
+        self.started = started
+        self.detected_at = datetime.now()
+        self.scope = scope
+        self.task_name = task_name
+        self.stack = stack
+        # 멈춘 시간 (멈춤이 끝난 뒤 하트비트가 측정하여 채움)
+        self.duration_ms: int | None = None
+
+    def finish(self, duration_ms: int | None = None) -> None:
+        """멈춘 시간을 기록합니다. (값이 없으면 시작 시각부터 지금까지로 추정)"""
+        if duration_ms is None:
+            duration_ms = int((time.monotonic() - self.started) * 1000)
+        self.duration_ms = duration_ms
+
+    def to_dict(self, include_stack: bool = True) -> dict[str, Any]:
+        """딕셔너리로 변환합니다. (API 응답/실행 로그용)"""
+        data: dict[str, Any] = {
+            "detected_at": self.detected_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "task_name": self.task_name,
+            **(self.scope.to_dict() if self.scope is not None else {"execution_id": None, "node_id": None}),
+        }
+        if include_stack:
+            data["stack"] = self.stack
+        return data
+
+
+class EventLoopMonitor:
+    """
+    이벤트 루프 지연 모니터
+    하트비트 코루틴으로 지연을 측정하고, 감시 스레드로 멈춘 지점의 스택을 캡처합니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        threshold: float = 0.2,
+        max_stalls: int = DEFAULT_MAX_STALLS,
+        stack_limit: int = DEFAULT_STACK_LIMIT,
+    ) -> None:
+        """
+        Args:
+            interval: 하트비트 간격 (초)
+            threshold: 멈춤으로 판단할 지연 기준 (초)
+            max_stalls: 보관할 최근 멈춤 기록 개수
+            stack_limit: 캡처할 스택 프레임 수
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self.stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        # (execution_id, node_id) -> 해당 노드 실행 중 발생한 멈춤 (실행 로그에 기록되면 제거)
+        self._node_stalls: dict[tuple[str | None, str | None], list[LoopStall]] = {}
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        # 마지막 하트비트 시각 (time.monotonic 기준, 감시 스레드가 읽음)
+        self._last_beat = 0.0
+        # 감시 스레드가 캡처했지만 아직 멈춘 시간이 측정되지 않은 멈춤
+        self._pending_stall: LoopStall | None = None
+
+        self.reset()
+
+    @property
+    def running(self) -> bool:
+        """모니터 실행 여부"""
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def reset(self) -> None:
+        """지연 통계와 멈춤 기록을 초기화합니다."""
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+        self.last_lag = 0.0
+        self.stall_count = 0
+        # 구간별 지연 샘플 수 (마지막 칸은 가장 큰 구간 이상)
+        self.buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.stalls.clear()
+        self._node_stalls.clear()
+
+    def start(self) -> None:
+        """모니터를 시작합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat(), name="event-loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            "[EventLoopMonitor] 이벤트 루프 모니터 시작 - 하트비트 간격: %dms, 멈춤 기준: %dms",
+            self.interval * 1000,
+            self.threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """모니터를 멈춥니다."""
+        self._stop_event.set()
+        task = self._heartbeat_task
+        self._heartbeat_task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        """interval마다 깨어나 지연을 측정합니다."""
+        loop = asyncio.get_running_loop()
+        interval = self.interval
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = max(loop.time() - expected, 0.0)
+            self._last_beat = time.monotonic()
+            self._record_lag(lag)
+
+    def _record_lag(self, lag: float) -> None:
+        """지연 샘플 하나를 통계에 기록하고, 기준을 넘으면 멈춤으로 기록합니다."""
+        self.samples += 1
+        self.total_lag += lag
+        self.last_lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        lag_ms = lag * 1000
+        index = 0
+        for bound in LAG_BUCKETS_MS:
+            if lag_ms < bound:
+                break
+            index += 1
+        self.buckets[index] += 1
+
+        stall = self._pending_stall
+        if stall is not None:
+            # 감시 스레드가 캡처한 멈춤의 실제 멈춘 시간 기록
+            self._pending_stall = None
+            stall.finish(int(lag_ms))
+        elif lag >= self.threshold:
+            # 감시 스레드가 확인하기 전에 끝난 멈춤 (스택/원인 정보 없음)
+            stall = LoopStall(time.monotonic() - lag, None, None, None)
+            stall.finish(int(lag_ms))
+            self.stall_count += 1
+            self.stalls.append(stall)
+        else:
+            return
+
+        scope = stall.scope
+        logger.warning(
+            "[EventLoopMonitor] 이벤트 루프 멈춤 %sms - 실행 ID: %s, 노드: %s (%s), 태스크: %s%s",
+            stall.duration_ms,
+            scope.execution_id if scope else None,
+            scope.node_id if scope else None,
+            scope.node_type if scope else None,
+            stall.task_name,
+            "\n" + "".join(stall.stack) if stall.stack else "",
+        )
+
+    def _watch(self) -> None:
+        """감시 스레드: 하트비트가 기준 시간 이상 멈추면 이벤트 루프 스레드의 스택을 캡처합니다."""
+        check_interval = min(self.interval, self.threshold / 2)
+        captured_beat = None
+        while not self._stop_event.wait(check_interval):
+            beat = self._last_beat
+            # 같은 멈춤은 한 번만 캡처 (하트비트가 다시 뛰면 새 멈춤으로 판단)
+            if beat == captured_beat or time.monotonic() - beat - self.interval < self.threshold:
+                continue
+            captured_beat = beat
+            try:
+                self._capture(beat + self.interval)
+            except Exception as e:
+                logger.debug("[EventLoopMonitor] 멈춤 캡처 실패: %s", e)
+
+    def _capture(self, started: float) -> None:
+        """이벤트 루프 스레드의 스택과 실행 중인 태스크의 실행 범위를 캡처합니다. (감시 스레드에서 호출)"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame, limit=self.stack_limit) if frame is not None else None
+
+        scope = None
+        task_name = None
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        if task is not None:
+            task_name = task.get_name()
+            scope = get_task_scope(task)
+
+        stall = LoopStall(started, scope, task_name, stack)
+        self.stall_count += 1
+        self.stalls.append(stall)
+        self._pending_stall = stall
+        if scope is not None:
+            if len(self._node_stalls) >= _MAX_PENDING_NODES:
+                # 가장 오래된 노드 기록 제거 (dict는 삽입 순서 유지)
+                self._node_stalls.pop(next(iter(self._node_stalls)), None)
+            self._node_stalls.setdefault((scope.execution_id, scope.node_id), []).append(stall)
+
+    def pop_node_stalls(self, execution_id: str | None, node_id: str | None) -> list[LoopStall] | None:
+        """
+        노드 실행 중 발생한 멈춤 기록을 가져오고 제거합니다. (노드 실행 래퍼가 실행 로그에 기록할 때 사용)
+
+        Args:
+            execution_id: 워크플로우 실행 ID
+            node_id: 노드 ID
+
+        Returns:
+            멈춤 기록 리스트 (없으면 None)
+        """
+        if not self._node_stalls:
+            return None
+        stalls = self._node_stalls.pop((execution_id, node_id), None)
+        if stalls:
+            for stall in stalls:
+                if stall.duration_ms is None:
+                    stall.finish()
+        return stalls
+
+    def get_stats(self, execution_id: str | None = None, limit: int = 20, include_stack: bool = True) -> dict[str, Any]:
+        """
+        지연 통계와 최근 멈춤 기록을 반환합니다.
+
+        Args:
+            execution_id: 지정하면 해당 실행 중에 발생한 멈춤만 반환
+            limit: 반환할 최근 멈춤 기록 개수
+            include_stack: 멈춤 기록에 스택 포함 여부
+
+        Returns:
+            통계 딕셔너리
+        """
+        stalls = list(self.stalls)
+        if execution_id is not None:
+            stalls = [s for s in stalls if s.scope is not None and s.scope.execution_id == execution_id]
+        recent = stalls[-limit:] if limit > 0 else []
+        bucket_labels = [f"<{bound}ms" for bound in LAG_BUCKETS_MS] + [f">={LAG_BUCKETS_MS[-1]}ms"]
+        return {
+            "running": self.running,
+            "interval_ms": int(self.interval * 1000),
+            "threshold_ms": int(self.threshold * 1000),
+            "samples": self.samples,
+            "avg_lag_ms": round(self.total_lag / self.samples * 1000, 3) if self.samples else 0.0,
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "stall_count": self.stall_count,
+            "histogram": dict(zip(bucket_labels, self.buckets, strict=True)),
+            "stalls": [s.to_dict(include_stack) for s in reversed(recent)],
+        }
@@ -0,0 +1,567 @@
+"""
+인프로세스 메트릭 레지스트리
+노드 실행 로그 테이블을 훑지 않고도 "이번 주 image-touch의 p95"와 같은 질문에 답할 수 있도록
+노드 타입/상태/스크립트별 실행 시간 분포와 주요 카운터를 메모리에서 집계합니다.
+
+구성:
+- LatencyHistogram: 로그 스케일 구간에 개수를 세는 스트리밍 히스토그램 (HDR 방식, 분위수 상대 오차 약 2% 이내)
+- CounterFamily / GaugeFamily / HistogramFamily: 레이블 값 튜플별 시계열을 보관하는 메트릭 묶음
+- MetricsRegistry: 서버에서 사용하는 메트릭 묶음 정의, Prometheus 텍스트/JSON 출력, 스냅샷용 증분 계산
+
+메트릭은 이벤트 루프 스레드에서 기록하는 것을 전제로 하며 잠금을 사용하지 않습니다.
+주기적인 SQLite 저장은 monitoring/metrics_snapshot.py(MetricsSnapshotter)가 담당합니다.
+
+사용 예시:
+    from monitoring import metrics
+
+    metrics.node_latency.observe(("image-touch", "completed", "3"), 125.0)
+    metrics.node_retries.inc(("image-touch", "timeout"))
+    with metrics.time_db("node_log_write"):
+        ...
+    text = metrics.to_prometheus()
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+# 2배 구간 하나를 나누는 하위 구간 수 (구간 폭 약 4.4%, 구간 대표값 기준 상대 오차 약 2.2%)
+SUB_BUCKETS = 16
+# Prometheus 히스토그램 출력 시 사용하는 구간 상한 (밀리초)
+PROMETHEUS_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000)
+# JSON/Prometheus로 출력하는 분위수
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+# Prometheus 메트릭 이름 접두사
+METRIC_PREFIX = "autoscript_"
+
+# 메트릭 종류
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+
+class LatencyHistogram:
+    """
+    스트리밍 지연 시간 히스토그램
+    값을 로그 스케일 구간(2배 구간을 SUB_BUCKETS개로 분할)에 세어 고정된 메모리로 분위수를 추정합니다.
+    구간별 개수만 보관하므로 병합/차감이 정확하고 SQLite에 그대로 저장할 수 있습니다.
+    """
+
+    __slots__ = ("buckets", "count", "max", "min", "sum", "zero_count")
+
+    def __init__(self) -> None:
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def record(self, value: float) -> None:
+        """값 하나를 기록합니다. (0 이하는 0 구간에 기록)"""
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.floor(math.log2(value) * SUB_BUCKETS)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    @staticmethod
+    def bucket_lower(index: int) -> float:
+        """구간의 하한"""
+        return float(2 ** (index / SUB_BUCKETS))
+
+    @staticmethod
+    def bucket_value(index: int) -> float:
+        """구간의 대표값 (하한과 상한의 기하 평균)"""
+        return float(2 ** ((index + 0.5) / SUB_BUCKETS))
+
+    def quantile(self, q: float) -> float | None:
+        """
+        분위수를 추정합니다.
+
+        Args:
+            q: 0~1 사이 분위 (예: 0.95)
+
+        Returns:
+            추정값 (기록된 값이 없으면 None, 실제 최솟값/최댓값 범위로 제한)
+        """
+        if self.count == 0:
+            return None
+        rank = max(math.ceil(q * self.count), 1)
+        seen = self.zero_count
+        if seen >= rank:
+            return 0.0
+        value = None
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                value = self.bucket_value(index)
+                break
+        if value is None:
+            value = self.max or 0.0
+        if self.min is not None:
+            value = max(value, self.min)
+        if self.max is not None:
+            value = min(value, self.max)
+        return value
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """다른 히스토그램의 기록을 합칩니다."""
+        if other.count == 0:
+            return
+        buckets = self.buckets
+        for index, count in other.buckets.items():
+            buckets[index] = buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def copy(self) -> LatencyHistogram:
+        """복사본을 반환합니다."""
+        histogram = LatencyHistogram()
+        histogram.buckets = dict(self.buckets)
+        histogram.zero_count = self.zero_count
+        histogram.count = self.count
+        histogram.sum = self.sum
+        histogram.min = self.min
+        histogram.max = self.max
+        return histogram
+
+    def subtract(self, previous: LatencyHistogram | None) -> LatencyHistogram:
+        """
+        이전 시점 복사본과의 차이(그 사이에 기록된 값)를 새 히스토그램으로 반환합니다.
+        최솟값/최댓값은 구간 경계로 근사합니다.
+        """
+        # 이전 복사본이 더 크면 그 사이에 초기화된 것이므로 전체를 증분으로 사용
+        if previous is None or previous.count == 0 or previous.count > self.count:
+            return self.copy()
+        delta = LatencyHistogram()
+        for index, count in self.buckets.items():
+            diff = count - previous.buckets.get(index, 0)
+            if diff > 0:
+                delta.buckets[index] = diff
+        delta.zero_count = self.zero_count - previous.zero_count
+        delta.count = self.count - previous.count
+        delta.sum = self.sum - previous.sum
+        if delta.count > 0:
+            delta.min = 0.0 if delta.zero_count else self.bucket_lower(min(delta.buckets))
+            delta.max = self.bucket_lower(max(delta.buckets) + 1) if delta.buckets else 0.0
+            if self.max is not None:
+                delta.max = min(delta.max, self.max)
+        return delta
+
+    def count_at_or_below(self, bound: float) -> int:
+        """대표값이 bound 이하인 기록 개수 (Prometheus 누적 구간 출력용)"""
+        total = self.zero_count
+        for index, count in self.buckets.items():
+            if self.bucket_value(index) <= bound:
+                total += count
+        return total
+
+    def summary(self) -> dict[str, Any]:
+        """개수, 평균, 최솟값/최댓값, 분위수 요약 (밀리초)"""
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "avg_ms": round(self.sum / self.count, 3) if self.count else None,
+            "min_ms": round(self.min, 3) if self.min is not None else None,
+            "max_ms": round(self.max, 3) if self.max is not None else None,
+        }
+        for q in QUANTILES:
+            value = self.quantile(q)
+            summary[f"p{round(q * 100)}_ms"] = round(value, 3) if value is not None else None
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장용 딕셔너리 (구간 개수 포함)"""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self.zero_count,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyHistogram:
+        """to_dict()로 만든 딕셔너리에서 히스토그램을 복원합니다."""
+        histogram = cls()
+        histogram.buckets = {int(index): int(count) for index, count in (data.get("buckets") or {}).items()}
+        histogram.zero_count = int(data.get("zero_count") or 0)
+        histogram.count = int(data.get("count") or 0)
+        histogram.sum = float(data.get("sum") or 0.0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class MetricFamily:
+    """이름과 레이블 이름이 같은 시계열 묶음 (레이블 값 튜플 -> 값)"""
+
+    __slots__ = ("description", "kind", "label_names", "name", "series")
+
+    def __init__(self, name: str, kind: str, description: str, label_names: tuple[str, ...] = ()) -> None:
+        """
+        Args:
+            name: 메트릭 이름 (Prometheus 출력 시 METRIC_PREFIX가 붙음)
+            kind: 메트릭 종류 (COUNTER, GAUGE, HISTOGRAM)
+            description: 메트릭 설명 (Prometheus HELP)
+            label_names: 레이블 이름 (observe/inc에 넘기는 레이블 값 튜플의 순서)
+        """
+        self.name = name
+        self.kind = kind
+        self.description = description
+        self.label_names = label_names
+        self.series: dict[tuple[str, ...], Any] = {}
+
+    def labels_dict(self, label_values: tuple[str, ...]) -> dict[str, str]:
+        """레이블 값 튜플을 {레이블 이름: 값} 딕셔너리로 변환합니다."""
+        return dict(zip(self.label_names, label_values, strict=False))
+
+
+class CounterFamily(MetricFamily):
+    """증가만 하는 카운터"""
+
+    __slots__ = ()
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, COUNTER, description, label_names)
+
+    def inc(self, label_values: tuple[str, ...] = (), amount: float = 1) -> None:
+        """카운터를 amount만큼 증가시킵니다."""
+        series = self.series
+        series[label_values] = series.get(label_values, 0) + amount
+
+
+class GaugeFamily(MetricFamily):
+    """현재 값을 나타내는 게이지 (큐 깊이 등)"""
+
+    __slots__ = ()
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, GAUGE, description, label_names)
+
+    def add(self, amount: float, label_values: tuple[str, ...] = ()) -> None:
+        """게이지 값을 amount만큼 더합니다. (감소는 음수)"""
+        series = self.series
+        series[label_values] = series.get(label_values, 0) + amount
+
+    def set(self, value: float, label_values: tuple[str, ...] = ()) -> None:
+        """게이지 값을 설정합니다."""
+        self.series[label_values] = value
+
+
+class HistogramFamily(MetricFamily):
+    """레이블 값별 지연 시간 히스토그램"""
+
+    __slots__ = ()
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, HISTOGRAM, description, label_names)
+
+    def observe(self, label_values: tuple[str, ...], value: float) -> None:
+        """값 하나를 기록합니다."""
+        histogram = self.series.get(label_values)
+        if histogram is None:
+            histogram = self.series[label_values] = LatencyHistogram()
+        histogram.record(value)
+
+
+# 메트릭 상태: {메트릭 이름: {레이블 값 튜플: 값 또는 LatencyHistogram}}
+MetricsState = dict[str, dict[tuple[str, ...], Any]]
+
+
+def _escape_label(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    """Prometheus 레이블 문자열 생성 (레이블이 없으면 빈 문자열)"""
+    text = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in pairs)
+    return f"{{{text}}}" if text else ""
+
+
+def _format_number(value: float) -> str:
+    """Prometheus 숫자 출력 (정수는 소수점 없이)"""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    서버 메트릭 레지스트리
+    노드 실행 시간 분포, 재시도/로그 전송 카운터, 로그 전송 대기 수, DB 작업 시간 분포를 보관합니다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now()
+        # 노드 실행 시간 (NodeExecutor가 완료/실패 시 기록, 재시도 대기 시간 포함)
+        self.node_latency = HistogramFamily(
+            "node_latency_ms", "노드 실행 시간 (밀리초)", ("node_type", "status", "script_id")
+        )
+        # 노드 재시도 횟수 (NodeExecutor가 재시도 전에 기록)
+        self.node_retries = CounterFamily("node_retries_total", "노드 재시도 횟수", ("node_type", "reason"))
+        # 전송 중인 실행 로그 수 (ExecutionLogClient가 전송 시작/종료 시 갱신)
+        self.log_queue_depth = GaugeFamily("log_queue_depth", "전송 대기/진행 중인 노드 실행 로그 수")
+        # 재시도 후에도 전송하지 못한 실행 로그 수
+        self.log_send_failures = CounterFamily("log_send_failures_total", "전송에 실패한 노드 실행 로그 수")
+        # DB 작업 시간 (time_db()로 감싼 작업)
+        self.db_latency = HistogramFamily("db_latency_ms", "DB 작업 시간 (밀리초)", ("operation",))
+        self.families: dict[str, MetricFamily] = {
+            family.name: family
+            for family in (
+                self.node_latency,
+                self.node_retries,
+                self.log_queue_depth,
+                self.log_send_failures,
+                self.db_latency,
+            )
+        }
+
+    @contextmanager
+    def time_db(self, operation: str) -> Iterator[None]:
+        """
+        감싼 블록의 실행 시간을 DB 작업 시간으로 기록합니다. (예외가 발생해도 기록)
+
+        Args:
+            operation: 작업 이름 (예: "node_log_write")
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.db_latency.observe((operation,), (time.perf_counter() - started) * 1000)
+
+    def reset(self) -> None:
+        """모든 메트릭을 초기화합니다."""
+        for family in self.families.values():
+            family.series.clear()
+        self.started_at = datetime.now()
+
+    # ------------------------------------------------------------------
+    # 스냅샷 (MetricsSnapshotter에서 사용)
+    # ------------------------------------------------------------------
+
+    def copy_state(self) -> MetricsState:
+        """현재 메트릭 값의 복사본을 반환합니다."""
+        state: MetricsState = {}
+        for name, family in self.families.items():
+            if family.kind == HISTOGRAM:
+                state[name] = {labels: histogram.copy() for labels, histogram in family.series.items()}
+            else:
+                state[name] = dict(family.series)
+        return state
+
+    def delta_state(self, current: MetricsState, previous: MetricsState | None) -> MetricsState:
+        """
+        두 시점 사이에 새로 기록된 값을 계산합니다.
+        카운터/히스토그램은 증분, 게이지는 현재 값을 사용하며 변화가 없는 시계열은 제외합니다.
+        """
+        previous = previous or {}
+        delta: MetricsState = {}
+        for name, series in current.items():
+            family = self.families.get(name)
+            if family is None:
+                continue
+            before = previous.get(name, {})
+            changed: dict[tuple[str, ...], Any] = {}
+            for labels, value in series.items():
+                if family.kind == HISTOGRAM:
+                    histogram = value.subtract(before.get(labels))
+                    if histogram.count > 0:
+                        changed[labels] = histogram
+                elif family.kind == COUNTER:
+                    previous_value = before.get(labels, 0)
+                    increase = value - previous_value if value >= previous_value else value
+                    if increase > 0:
+                        changed[labels] = increase
+                elif value != before.get(labels):
+                    changed[labels] = value
+            if changed:
+                delta[name] = changed
+        return delta
+
+    def state_to_rows(self, state: MetricsState) -> list[dict[str, Any]]:
+        """메트릭 상태를 저장용 행 목록으로 변환합니다. (metrics_snapshots 테이블 형식)"""
+        rows: list[dict[str, Any]] = []
+        for name, series in state.items():
+            family = self.families.get(name)
+            if family is None:
+                continue
+            for labels, value in series.items():
+                row: dict[str, Any] = {"metric": name, "labels": family.labels_dict(labels)}
+                if family.kind == HISTOGRAM:
+                    row["value"] = None
+                    row["histogram"] = value.to_dict()
+                else:
+                    row["value"] = value
+                    row["histogram"] = None
+                rows.append(row)
+        return rows
+
+    def rows_to_state(self, rows: Iterable[dict[str, Any]]) -> MetricsState:
+        """
+        저장된 스냅샷 행을 합쳐 메트릭 상태로 변환합니다.
+        카운터/히스토그램은 합산하고, 게이지는 가장 마지막 값을 사용합니다. (행은 저장 시각 순서로 전달)
+        """
+        state: MetricsState = {}
+        for row in rows:
+            family = self.families.get(row["metric"])
+            if family is None:
+                continue
+            labels_dict = row.get("labels") or {}
+            labels = tuple(str(labels_dict.get(label, "")) for label in family.label_names)
+            series = state.setdefault(family.name, {})
+            if family.kind == HISTOGRAM:
+                histogram = LatencyHistogram.from_dict(row.get("histogram") or {})
+                existing = series.get(labels)
+                if existing is None:
+                    series[labels] = histogram
+                else:
+                    existing.merge(histogram)
+            elif family.kind == COUNTER:
+                series[labels] = series.get(labels, 0) + (row.get("value") or 0)
+            else:
+                series[labels] = row.get("value") or 0
+        return state
+
+    def merge_states(self, base: MetricsState, extra: MetricsState) -> MetricsState:
+        """두 메트릭 상태를 합칩니다. (base를 수정하여 반환, 게이지는 extra 값 우선)"""
+        for name, series in extra.items():
+            family = self.families.get(name)
+            if family is None:
+                continue
+            target = base.setdefault(name, {})
+            for labels, value in series.items():
+                existing = target.get(labels)
+                if family.kind == HISTOGRAM:
+                    if existing is None:
+                        target[labels] = value.copy()
+                    else:
+                        existing.merge(value)
+                elif family.kind == COUNTER:
+                    target[labels] = (existing or 0) + value
+                else:
+                    target[labels] = value
+        return base
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 현재 메트릭을 출력합니다."""
+        lines: list[str] = []
+        for family in self.families.values():
+            name = METRIC_PREFIX + family.name
+            lines.append(f"# HELP {name} {family.description}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            for labels, value in sorted(family.series.items()):
+                pairs = list(zip(family.label_names, labels, strict=False))
+                if family.kind != HISTOGRAM:
+                    lines.append(f"{name}{_format_labels(pairs)} {_format_number(value)}")
+                    continue
+                for bound in PROMETHEUS_BUCKETS_MS:
+                    bucket_labels = _format_labels([*pairs, ("le", _format_number(bound))])
+                    lines.append(f"{name}_bucket{bucket_labels} {value.count_at_or_below(bound)}")
+                lines.append(f"{name}_bucket{_format_labels([*pairs, ('le', '+Inf')])} {value.count}")
+                lines.append(f"{name}_sum{_format_labels(pairs)} {_format_number(round(value.sum, 3))}")
+                lines.append(f"{name}_count{_format_labels(pairs)} {value.count}")
+            if family.kind == HISTOGRAM:
+                # 히스토그램 구간으로는 정밀한 분위수를 알 수 없으므로 추정 분위수를 게이지로 함께 출력
+                quantile_name = f"{name}_quantile"
+                lines.append(f"# HELP {quantile_name} {family.description} 추정 분위수")
+                lines.append(f"# TYPE {quantile_name} gauge")
+                for labels, histogram in sorted(family.series.items()):
+                    pairs = list(zip(family.label_names, labels, strict=False))
+                    for q in QUANTILES:
+                        estimate = histogram.quantile(q)
+                        if estimate is not None:
+                            quantile_labels = _format_labels([*pairs, ("quantile", str(q))])
+                            lines.append(f"{quantile_name}{quantile_labels} {_format_number(round(estimate, 3))}")
+        # 노드 실행 횟수 (노드 실행 시간 히스토그램의 개수를 노드 타입/상태별로 합산)
+        executions: dict[tuple[str, str], int] = {}
+        for (node_type, status, _script_id), histogram in self.node_latency.series.items():
+            key = (node_type, status)
+            executions[key] = executions.get(key, 0) + histogram.count
+        name = f"{METRIC_PREFIX}node_executions_total"
+        lines.append(f"# HELP {name} 노드 실행 횟수")
+        lines.append(f"# TYPE {name} counter")
+        for (node_type, status), count in sorted(executions.items()):
+            lines.append(f"{name}{_format_labels([('node_type', node_type), ('status', status)])} {count}")
+        return "\n".join(lines) + "\n"
+
+    def describe(
+        self,
+        state: MetricsState | None = None,
+        group_by: Iterable[str] | None = None,
+        filters: Mapping[str, str | None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        메트릭 상태를 대시보드용 JSON으로 변환합니다.
+
+        Args:
+            state: 변환할 메트릭 상태 (None이면 현재 값)
+            group_by: 노드 실행 레이블(node_type, status, script_id) 중 결과에 남길 레이블
+                      (None이면 모두 남김, 빠진 레이블은 합산, 다른 레이블은 항상 남김)
+            filters: {레이블 이름: 값} 조건 (해당 레이블이 있는 메트릭에만 적용, 값이 None이면 조건 없음)
+
+        Returns:
+            {메트릭 이름: [{레이블..., 요약 또는 value}]} 딕셔너리
+        """
+        if state is None:
+            state = self.copy_state()
+        filters = {name: value for name, value in (filters or {}).items() if value is not None}
+        collapsed = set() if group_by is None else set(self.node_latency.label_names) - set(group_by)
+        result: dict[str, Any] = {}
+        for name, family in self.families.items():
+            keep = [label for label in family.label_names if label not in collapsed]
+            keep_indexes = [family.label_names.index(label) for label in keep]
+            filter_indexes = [
+                (family.label_names.index(label), str(value))
+                for label, value in filters.items()
+                if label in family.label_names
+            ]
+            grouped: dict[tuple[str, ...], Any] = {}
+            for labels, value in state.get(name, {}).items():
+                if any(labels[index] != expected for index, expected in filter_indexes):
+                    continue
+                key = tuple(labels[index] for index in keep_indexes)
+                existing = grouped.get(key)
+                if family.kind == HISTOGRAM:
+                    if existing is None:
+                        grouped[key] = value.copy()
+                    else:
+                        existing.merge(value)
+                else:
+                    grouped[key] = (existing or 0) + value
+            entries = []
+            for key, value in sorted(grouped.items()):
+                entry: dict[str, Any] = dict(zip(keep, key, strict=False))
+                if family.kind == HISTOGRAM:
+                    entry.update(value.summary())
+                else:
+                    entry["value"] = value
+                entries.append(entry)
+            result[name] = entries
+        return result
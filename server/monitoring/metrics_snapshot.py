@@ -0,0 +1,153 @@
+"""
+메트릭 스냅샷 저장
+MetricsRegistry의 값을 주기적으로 SQLite(metrics_snapshots 테이블)에 저장하여 서버를 재시작해도 기간별 통계를 조회할 수 있게 합니다.
+
+동작 방식:
+- interval마다 마지막 저장 이후 새로 기록된 값(카운터/히스토그램 증분, 게이지 현재 값)만 한 번에 저장
+- 저장은 별도 스레드(asyncio.to_thread)에서 수행하여 이벤트 루프를 막지 않음
+- 보관 기간(retention_days)이 지난 스냅샷은 저장 시 함께 삭제
+- 기간 조회(load_history)는 저장된 스냅샷과 아직 저장되지 않은 증분을 합쳐서 반환
+
+DB 모듈에 의존하지 않도록 리포지토리는 start()에서 주입받습니다. (db.metrics_repository.MetricsRepository)
+
+사용 예시:
+    from monitoring import metrics_snapshotter
+
+    metrics_snapshotter.start(db_manager.metrics)  # 실행 중인 이벤트 루프 안에서 호출
+    state = await metrics_snapshotter.load_history(since)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Protocol
+
+from log import log_manager
+
+if TYPE_CHECKING:
+    from .metrics import MetricsRegistry, MetricsState
+
+logger = log_manager.get_logger(__name__)
+
+# 스냅샷 저장 시각 형식 (문자열 비교로 기간 조회)
+SNAPSHOT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class SnapshotRepository(Protocol):
+    """스냅샷 저장소 인터페이스 (db.metrics_repository.MetricsRepository)"""
+
+    def save_snapshot(self, rows: list[dict[str, Any]], captured_at: str) -> int: ...
+
+    def get_snapshot_rows(self, since: str, until: str | None = None) -> list[dict[str, Any]]: ...
+
+    def delete_snapshots_before(self, cutoff: str) -> int: ...
+
+
+class MetricsSnapshotter:
+    """메트릭 레지스트리를 주기적으로 SQLite에 저장하는 클래스"""
+
+    def __init__(self, registry: MetricsRegistry, interval: float, retention_days: int) -> None:
+        """
+        Args:
+            registry: 저장할 메트릭 레지스트리
+            interval: 저장 간격 (초, 0 이하면 주기 저장 안 함)
+            retention_days: 스냅샷 보관 기간 (일, 0 이하면 삭제 안 함)
+        """
+        self.registry = registry
+        self.interval = interval
+        self.retention_days = retention_days
+        self.repository: SnapshotRepository | None = None
+        self.last_snapshot_at: datetime | None = None
+        # 마지막으로 저장한 시점의 메트릭 복사본 (증분 계산 기준)
+        self._base: MetricsState | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """주기 저장 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    def start(self, repository: SnapshotRepository) -> None:
+        """주기 저장을 시작합니다. 실행 중인 이벤트 루프 안에서 호출해야 합니다."""
+        self.repository = repository
+        if self.running or self.interval <= 0:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="metrics-snapshot")
+        logger.info(
+            "[MetricsSnapshotter] 메트릭 스냅샷 저장 시작 - 간격: %s초, 보관 기간: %s일",
+            self.interval,
+            self.retention_days,
+        )
+
+    async def stop(self) -> None:
+        """주기 저장을 멈추고 남은 증분을 저장합니다."""
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self.repository is not None:
+            await self.snapshot()
+
+    async def _run(self) -> None:
+        """interval마다 스냅샷을 저장합니다."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.snapshot()
+
+    async def snapshot(self) -> int:
+        """
+        마지막 저장 이후의 증분을 저장합니다. 저장에 실패하면 다음 저장 때 함께 저장합니다.
+
+        Returns:
+            저장한 행 수
+        """
+        repository = self.repository
+        if repository is None:
+            return 0
+        state = self.registry.copy_state()
+        rows = self.registry.state_to_rows(self.registry.delta_state(state, self._base))
+        captured_at = datetime.now()
+        cutoff = None
+        if self.retention_days > 0:
+            cutoff = (captured_at - timedelta(days=self.retention_days)).strftime(SNAPSHOT_TIME_FORMAT)
+        try:
+            # 기록은 이벤트 루프 스레드에서만 하도록 작업 스레드 밖에서 시간을 잼
+            with self.registry.time_db("metrics_snapshot"):
+                saved = await asyncio.to_thread(self._save, repository, rows, captured_at, cutoff)
+        except Exception as e:
+            logger.warning("[MetricsSnapshotter] 메트릭 스냅샷 저장 실패 (다음 주기에 재시도): %s", e)
+            return 0
+        self._base = state
+        self.last_snapshot_at = captured_at
+        return saved
+
+    @staticmethod
+    def _save(
+        repository: SnapshotRepository, rows: list[dict[str, Any]], captured_at: datetime, cutoff: str | None
+    ) -> int:
+        """스냅샷 저장 및 오래된 스냅샷 삭제 (작업 스레드에서 실행)"""
+        saved = repository.save_snapshot(rows, captured_at.strftime(SNAPSHOT_TIME_FORMAT)) if rows else 0
+        if cutoff is not None:
+            repository.delete_snapshots_before(cutoff)
+        return saved
+
+    async def load_history(self, since: datetime) -> MetricsState:
+        """
+        since 이후의 메트릭을 조회합니다. (저장된 스냅샷 + 아직 저장되지 않은 증분)
+
+        Args:
+            since: 조회 시작 시각
+
+        Returns:
+            기간 동안 합산한 메트릭 상태 (MetricsRegistry.describe()에 전달)
+        """
+        state: MetricsState = {}
+        if self.repository is not None:
+            rows = await asyncio.to_thread(self.repository.get_snapshot_rows, since.strftime(SNAPSHOT_TIME_FORMAT))
+            state = self.registry.rows_to_state(rows)
+        pending = self.registry.delta_state(self.registry.copy_state(), self._base)
+        return self.registry.merge_states(state, pending)
@@ -0,0 +1,331 @@
+"""
+실행 추적(trace)
+워크플로우 실행(execution_id)마다 스팬 트리를 기록하여 느린 실행이 어디에서 시간을 썼는지 확인합니다.
+
+구성:
+- Span: 이름/분류/시작·종료 시각/속성을 가진 구간 하나 (with 문 또는 open()/close()로 사용)
+- Trace: 실행 ID 하나의 스팬 목록 (스팬 수 상한 초과 시 버린 개수만 기록)
+- Tracer: 최근 실행의 Trace를 보관하는 링 버퍼 (오래된 실행부터 제거), 현재 스팬은 contextvars로 추적
+- to_chrome_trace(): Chrome trace 이벤트 형식(chrome://tracing, Perfetto, speedscope에서 열기)으로 변환
+
+스팬 계층:
+    execute-nodes (요청)
+    └─ 노드 (process_node)
+       ├─ parameter_resolution (이전 노드 출력 경로 해석)
+       ├─ handler (NodeExecutor)
+       │  └─ attempt (시도별, 재시도 대기는 retry_backoff)
+       │     └─ screen_capture / template_match (image-touch 등)
+       └─ result_normalization
+    log_sink (실행 로그 전송, 백그라운드 태스크) / db_write (로그 저장 API)
+
+추적 중인 실행이 없거나(execution_id 없이 노드를 직접 실행) 스팬 수 상한에 도달하면
+tracer.span()은 아무것도 기록하지 않는 NOOP_SPAN을 반환하므로 비용이 거의 없습니다.
+
+사용 예시:
+    from monitoring import tracer
+
+    with tracer.trace(execution_id, "execute-nodes", script_id=1):
+        with tracer.span("handler", PHASE):
+            ...
+    chrome_json = to_chrome_trace(tracer.get_trace(execution_id).to_dict())
+"""
+
+from collections import OrderedDict
+import contextlib
+from contextvars import ContextVar, Token
+from datetime import datetime
+import time
+from typing import Any
+
+# 스팬 분류 (Chrome trace의 cat, 레인 구분에 사용)
+REQUEST = "request"
+NODE = "node"
+PHASE = "phase"
+LOG = "log"
+DB = "db"
+
+# Chrome trace 레인(tid): 실행 경로와 백그라운드 작업(로그 전송, DB 저장)을 다른 줄에 표시
+_LANES = {LOG: 2, DB: 3}
+_MAIN_LANE = 1
+_LANE_NAMES = {_MAIN_LANE: "execution", _LANES[LOG]: "log sink", _LANES[DB]: "db"}
+
+
+class Span:
+    """추적 구간 하나"""
+
+    __slots__ = (
+        "_token",
+        "attributes",
+        "category",
+        "end_ns",
+        "error",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "trace",
+    )
+
+    def __init__(
+        self, trace: "Trace", name: str, category: str, parent_id: int | None, attributes: dict[str, Any]
+    ) -> None:
+        self.trace = trace
+        self.name = name
+        self.category = category
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.span_id = 0
+        self.start_ns = 0
+        self.end_ns: int | None = None
+        self.error: str | None = None
+        self._token: Token[Span | None] | None = None
+
+    def open(self) -> "Span":
+        """구간을 시작하고 현재 스팬으로 설정합니다. (with 문 대신 사용할 때)"""
+        self.start_ns = time.perf_counter_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def close(self, error: BaseException | None = None) -> None:
+        """구간을 끝내고 현재 스팬을 이전 값으로 되돌립니다."""
+        self.end_ns = time.perf_counter_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        token = self._token
+        if token is not None:
+            self._token = None
+            # 다른 컨텍스트에서 닫힌 경우(연 태스크가 아닌 곳에서 close) 되돌릴 값이 없으므로 무시
+            with contextlib.suppress(ValueError):
+                _current_span.reset(token)
+
+    def set(self, key: str, value: Any) -> None:
+        """속성을 추가합니다. (실행 결과 등 구간이 끝날 때 알 수 있는 값)"""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        return self.open()
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        self.close(exc)
+
+    def to_dict(self, base_ns: int) -> dict[str, Any]:
+        """저장/내보내기용 딕셔너리 (시각은 Trace 시작 기준 마이크로초)"""
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        data: dict[str, Any] = {
+            "id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "category": self.category,
+            "start_us": (self.start_ns - base_ns) / 1000,
+            "duration_us": (end_ns - self.start_ns) / 1000,
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error is not None:
+            data["error"] = self.error
+        if self.end_ns is None:
+            data["unfinished"] = True
+        return data
+
+
+class _NoopSpan:
+    """추적하지 않을 때 사용하는 빈 스팬 (모든 메서드가 아무 일도 하지 않음)"""
+
+    __slots__ = ()
+
+    def open(self) -> "_NoopSpan":
+        return self
+
+    def close(self, error: BaseException | None = None) -> None:
+        pass
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+# 현재 스팬 (추적 중인 실행이 없으면 None)
+_current_span: ContextVar[Span | None] = ContextVar("trace_span", default=None)
+
+
+class Trace:
+    """실행 ID 하나의 스팬 목록"""
+
+    __slots__ = ("base_ns", "dropped_spans", "execution_id", "max_spans", "spans", "started_at")
+
+    def __init__(self, execution_id: str, max_spans: int) -> None:
+        self.execution_id = execution_id
+        self.max_spans = max_spans
+        self.started_at = datetime.now()
+        self.base_ns = time.perf_counter_ns()
+        self.spans: list[Span] = []
+        self.dropped_spans = 0
+
+    def new_span(
+        self, name: str, category: str, parent_id: int | None, attributes: dict[str, Any]
+    ) -> "Span | _NoopSpan":
+        """스팬을 만들어 목록에 추가합니다. (상한에 도달하면 NOOP_SPAN)"""
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return NOOP_SPAN
+        span = Span(self, name, category, parent_id, attributes)
+        self.spans.append(span)
+        span.span_id = len(self.spans)
+        return span
+
+    @property
+    def duration_ms(self) -> float:
+        """첫 스팬 시작부터 마지막 스팬 종료까지의 시간 (밀리초)"""
+        if not self.spans:
+            return 0.0
+        end_ns = max(span.end_ns or span.start_ns for span in self.spans)
+        return (end_ns - self.base_ns) / 1_000_000
+
+    def summary(self) -> dict[str, Any]:
+        """목록 조회용 요약"""
+        return {
+            "execution_id": self.execution_id,
+            "started_at": self.started_at.isoformat(timespec="milliseconds"),
+            "duration_ms": round(self.duration_ms, 3),
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """저장/내보내기용 딕셔너리 (요약 + 스팬 목록)"""
+        data = self.summary()
+        data["spans"] = [span.to_dict(self.base_ns) for span in self.spans]
+        return data
+
+
+class Tracer:
+    """
+    실행 추적기
+    최근 max_traces개 실행의 Trace를 메모리에 보관합니다. (오래된 실행부터 제거, 저장은 요청 시에만)
+    """
+
+    def __init__(self, enabled: bool = True, max_traces: int = 10, max_spans: int = 5000) -> None:
+        """
+        Args:
+            enabled: 추적 사용 여부 (False면 모든 스팬이 NOOP_SPAN)
+            max_traces: 메모리에 보관할 최근 실행 수
+            max_spans: 실행 하나에 기록할 최대 스팬 수 (반복 실행이 길어져도 메모리가 늘지 않도록)
+        """
+        self.enabled = enabled
+        self.max_traces = max_traces
+        self.max_spans = max_spans
+        self._traces: OrderedDict[str, Trace] = OrderedDict()
+
+    def _get_or_create(self, execution_id: str) -> Trace:
+        """실행 ID의 Trace를 가져오거나 새로 만듭니다. (같은 실행의 여러 요청은 하나의 Trace에 기록)"""
+        trace = self._traces.get(execution_id)
+        if trace is None:
+            trace = self._traces[execution_id] = Trace(execution_id, self.max_spans)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+        else:
+            self._traces.move_to_end(execution_id)
+        return trace
+
+    def trace(self, execution_id: str | None, name: str, **attributes: Any) -> "Span | _NoopSpan":
+        """
+        실행의 최상위 스팬(요청 단위)을 만듭니다. 안에서 만든 tracer.span()은 이 실행에 기록됩니다.
+
+        Args:
+            execution_id: 워크플로우 실행 ID (None이면 추적 안 함)
+            name: 스팬 이름 (예: "execute-nodes")
+            **attributes: 스팬 속성
+        """
+        if not self.enabled or not execution_id:
+            return NOOP_SPAN
+        return self._get_or_create(execution_id).new_span(name, REQUEST, None, attributes)
+
+    def span(self, name: str, category: str = PHASE, **attributes: Any) -> "Span | _NoopSpan":
+        """
+        현재 스팬의 하위 스팬을 만듭니다. (추적 중인 실행이 없으면 NOOP_SPAN)
+
+        Args:
+            name: 스팬 이름
+            category: 스팬 분류 (REQUEST, NODE, PHASE, LOG, DB)
+            **attributes: 스팬 속성
+        """
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        return parent.trace.new_span(name, category, parent.span_id, attributes)
+
+    def span_for(self, execution_id: str | None, name: str, category: str, **attributes: Any) -> "Span | _NoopSpan":
+        """
+        현재 컨텍스트와 무관하게 메모리에 있는 실행의 Trace에 스팬을 추가합니다.
+        다른 요청에서 처리되는 작업(로그 저장 API의 DB 쓰기 등)을 실행 추적에 포함할 때 사용합니다.
+        """
+        if not self.enabled or not execution_id:
+            return NOOP_SPAN
+        trace = self._traces.get(execution_id)
+        if trace is None:
+            return NOOP_SPAN
+        return trace.new_span(name, category, None, attributes)
+
+    def get_trace(self, execution_id: str) -> Trace | None:
+        """메모리에 있는 실행의 Trace를 반환합니다."""
+        return self._traces.get(execution_id)
+
+    def list_traces(self) -> list[dict[str, Any]]:
+        """메모리에 있는 Trace 요약 목록 (최근 실행 먼저)"""
+        return [trace.summary() for trace in reversed(self._traces.values())]
+
+    def clear(self) -> None:
+        """메모리에 있는 모든 Trace를 삭제합니다."""
+        self._traces.clear()
+
+
+def to_chrome_trace(trace: dict[str, Any]) -> dict[str, Any]:
+    """
+    Trace.to_dict() 결과를 Chrome trace 이벤트 형식으로 변환합니다.
+    chrome://tracing, https://ui.perfetto.dev, https://www.speedscope.app 에서 열 수 있습니다.
+
+    Args:
+        trace: Trace.to_dict() 결과 (저장된 Trace 포함)
+
+    Returns:
+        {"traceEvents": [...], "displayTimeUnit": "ms", "metadata": {...}}
+    """
+    spans = trace.get("spans") or []
+    lanes: dict[int, int] = {}
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": f"execution {trace['execution_id']}"}}
+    ]
+    for lane, lane_name in _LANE_NAMES.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": lane_name}})
+
+    for span in spans:
+        # 로그 전송/DB 저장은 노드가 끝난 뒤에도 이어지므로 별도 레인에 표시하고, 나머지는 상위 스팬의 레인을 따름
+        lane = _LANES.get(span["category"]) or lanes.get(span.get("parent_id") or 0, _MAIN_LANE)
+        lanes[span["id"]] = lane
+        args = dict(span.get("attributes") or {})
+        if span.get("error"):
+            args["error"] = span["error"]
+        events.append(
+            {
+                "name": span["name"],
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round(span["start_us"], 3),
+                "dur": round(span["duration_us"], 3),
+                "pid": 1,
+                "tid": lane,
+                "args": args,
+            }
+        )
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "metadata": {key: value for key, value in trace.items() if key != "spans"},
+    }
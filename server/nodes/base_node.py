@@ -32,7 +32,7 @@ class BaseNode(ABC):
     @property
     def logger(self) -> Logger:
         """노드에서 사용할 로거 인스턴스"""
-        return log_manager.logger
+        return log_manager.get_logger(type(self).__module__)
 
     @staticmethod
     @abstractmethod
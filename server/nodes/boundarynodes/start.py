@@ -10,7 +10,7 @@ from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import get_korea_time_str
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class StartNode(BaseNode):
@@ -34,7 +34,7 @@ class StartNode(BaseNode):
         time_str = get_korea_time_str()
 
         # 시작 노드 실행 로그
-        logger.info(f"[StartNode] 워크플로우 시작 - 시작 시간: {time_str}")
+        logger.info("[StartNode] 워크플로우 시작 - 시작 시간: %s", time_str)
 
         return {
             "action": "start",
@@ -16,7 +16,7 @@ from nodes.excelnodes.excel_manager import close_excel_objects, get_excel_object
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import create_failed_result, get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 try:
     import win32com.client
@@ -19,7 +19,7 @@ from nodes.excelnodes.excel_manager import open_excel_file
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import create_failed_result, get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ExcelCompareNode(BaseNode):
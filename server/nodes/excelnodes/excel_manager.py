@@ -11,7 +11,7 @@ from typing import Any
 
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 try:
     import win32com.client
@@ -21,6 +21,121 @@ except ImportError:
 # 전역 엑셀 객체 저장소: {execution_id: {"excel_app": excel_app, "workbook": workbook, "file_path": file_path}}
 _excel_objects: dict[str, dict[str, Any]] = {}
 
+# 행 스트림 저장소: {stream_id: ExcelRowStream}
+# 엑셀 읽기 노드가 시트 전체를 한 번에 출력하지 않고 청크 단위로 이어서 읽을 수 있도록 커서를 보관합니다.
+_row_streams: dict[str, "ExcelRowStream"] = {}
+
+
+class ExcelRowStream:
+    """
+    워크시트의 행을 청크 단위로 지연 로딩하는 스트림
+
+    한 번의 COM 호출(Range.Value)로 청크 하나만 읽어오므로,
+    시트 크기와 관계없이 메모리에는 현재 청크만 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        execution_id: str,
+        sheet: Any,
+        chunk_size: int,
+        has_header: bool = True,
+        start_row: int = 1,
+        end_row: int | None = None,
+        options: tuple[Any, ...] = (),
+    ) -> None:
+        """
+        ExcelRowStream 초기화
+
+        Args:
+            execution_id: 엑셀 실행 ID
+            sheet: 워크시트 객체
+            chunk_size: 한 번에 읽을 행 개수
+            has_header: 첫 행을 헤더로 사용할지 여부
+            start_row: 읽기 시작 행 (UsedRange의 첫 행이 1, 헤더 행 포함)
+            end_row: 읽기 종료 행 (시트 행 번호, None이면 UsedRange의 마지막 행)
+            options: 스트림을 만든 읽기 옵션 (옵션이 바뀌면 보관된 스트림을 재사용하지 않도록 비교용)
+        """
+        self.execution_id = execution_id
+        self.sheet = sheet
+        self.sheet_name = sheet.Name
+        self.chunk_size = max(1, int(chunk_size))
+        self.options = options
+
+        # UsedRange는 데이터가 있는 영역이므로 시트의 1행/A열에서 시작하지 않을 수 있음 (위쪽 빈 행, 왼쪽 빈 열)
+        used_range = sheet.UsedRange
+        first_row = int(used_range.Row)
+        self.first_column = int(used_range.Column)
+        self.column_count = int(used_range.Columns.Count)
+        last_row = first_row + int(used_range.Rows.Count) - 1
+        self.last_row = min(last_row, int(end_row)) if end_row else last_row
+
+        self.headers: list[str] | None = None
+        self.next_row = first_row + max(1, int(start_row)) - 1
+        if has_header and self.next_row <= self.last_row:
+            header_values = self._read_range(self.next_row, self.next_row)
+            self.headers = [str(value or "").strip() for value in header_values[0]] if header_values else []
+            self.next_row += 1
+
+        self.chunk_index = -1
+
+    @property
+    def has_more(self) -> bool:
+        """남은 행이 있는지 여부"""
+        return self.next_row <= self.last_row
+
+    def _read_range(self, first_row: int, last_row: int) -> list[tuple[Any, ...]]:
+        """지정된 행 범위를 한 번의 COM 호출로 읽어옵니다."""
+        if self.column_count < 1:
+            return []
+        last_column = self.first_column + self.column_count - 1
+        cells = self.sheet.Range(
+            self.sheet.Cells(first_row, self.first_column), self.sheet.Cells(last_row, last_column)
+        )
+        values = cells.Value
+        # 단일 셀 범위는 스칼라, 그 외에는 행 튜플의 튜플로 반환됨
+        if not isinstance(values, tuple):
+            return [(values,)]
+        return [row if isinstance(row, tuple) else (row,) for row in values]
+
+    def next_chunk(self) -> dict[str, Any]:
+        """
+        다음 청크를 읽어옵니다.
+
+        Returns:
+            청크 정보 딕셔너리 (rows, row_start, row_end, chunk_index, has_more)
+        """
+        if not self.has_more:
+            return {
+                "rows": [],
+                "row_start": None,
+                "row_end": None,
+                "chunk_index": self.chunk_index,
+                "has_more": False,
+            }
+
+        first_row = self.next_row
+        last_row = min(first_row + self.chunk_size - 1, self.last_row)
+        raw_rows = self._read_range(first_row, last_row)
+        self.next_row = last_row + 1
+        self.chunk_index += 1
+
+        if self.headers:
+            headers = self.headers
+            rows: list[Any] = [
+                {headers[i] or f"column_{i + 1}": value for i, value in enumerate(row)} for row in raw_rows
+            ]
+        else:
+            rows = [list(row) for row in raw_rows]
+
+        return {
+            "rows": rows,
+            "row_start": first_row,
+            "row_end": last_row,
+            "chunk_index": self.chunk_index,
+            "has_more": self.has_more,
+        }
+
 
 def store_excel_objects(execution_id: str, excel_app: Any, workbook: Any, file_path: str) -> None:
     """
@@ -75,6 +190,8 @@ def close_excel_objects(execution_id: str, save_changes: bool = False) -> bool:
     Returns:
         성공 여부
     """
+    cleanup_row_streams(execution_id)
+
     excel_data = _excel_objects.get(execution_id)
     if not excel_data:
         logger.warning(f"[ExcelManager] 엑셀 객체를 찾을 수 없음 - execution_id: {execution_id}")
@@ -118,6 +235,8 @@ def cleanup_excel_objects(execution_id: str) -> None:
     Args:
         execution_id: 실행 ID
     """
+    cleanup_row_streams(execution_id)
+
     if execution_id in _excel_objects:
         try:
             excel_data = _excel_objects[execution_id]
@@ -140,6 +259,56 @@ def cleanup_excel_objects(execution_id: str) -> None:
             logger.info(f"[ExcelManager] 엑셀 객체 강제 정리 완료 - execution_id: {execution_id}")
 
 
+def get_row_stream(stream_id: str) -> ExcelRowStream | None:
+    """
+    저장된 행 스트림을 가져옵니다.
+
+    Args:
+        stream_id: 스트림 ID
+
+    Returns:
+        ExcelRowStream 또는 None
+    """
+    return _row_streams.get(stream_id)
+
+
+def store_row_stream(stream_id: str, stream: ExcelRowStream) -> None:
+    """
+    행 스트림을 저장소에 저장합니다. (같은 ID의 기존 스트림은 교체)
+
+    Args:
+        stream_id: 스트림 ID
+        stream: ExcelRowStream 인스턴스
+    """
+    _row_streams[stream_id] = stream
+    logger.debug(f"[ExcelManager] 행 스트림 저장 - stream_id: {stream_id}, last_row: {stream.last_row}")
+
+
+def remove_row_stream(stream_id: str) -> None:
+    """
+    행 스트림을 저장소에서 제거합니다.
+
+    Args:
+        stream_id: 스트림 ID
+    """
+    _row_streams.pop(stream_id, None)
+
+
+def cleanup_row_streams(execution_id: str) -> None:
+    """
+    실행 ID에 속한 모든 행 스트림을 제거합니다.
+    워크북이 닫히면 시트 참조가 무효화되므로 엑셀 객체 정리 시 함께 호출됩니다.
+
+    Args:
+        execution_id: 실행 ID
+    """
+    stale_ids = [stream_id for stream_id, stream in _row_streams.items() if stream.execution_id == execution_id]
+    for stream_id in stale_ids:
+        del _row_streams[stream_id]
+    if stale_ids:
+        logger.debug(f"[ExcelManager] 행 스트림 {len(stale_ids)}개 정리 - execution_id: {execution_id}")
+
+
 def has_excel_objects(execution_id: str) -> bool:
     """
     실행 ID에 해당하는 엑셀 객체가 있는지 확인합니다.
@@ -0,0 +1,206 @@
+"""
+엑셀 읽기 노드
+win32를 사용하여 워크시트의 행을 청크 단위로 읽어오는 노드입니다.
+
+시트 전체를 한 번에 출력하지 않고, 서버 측에 행 스트림(커서)을 유지한 채
+노드가 실행될 때마다 다음 청크만 출력합니다. 반복 노드 안에서 사용하면
+시트 크기와 관계없이 일정한 메모리로 데이터 기반 스크립트를 처리할 수 있습니다.
+
+주의사항:
+- Windows 환경에서만 사용 가능합니다.
+- pywin32 라이브러리가 필요합니다 (pip install pywin32).
+- 엑셀 열기 노드 이후에 사용해야 합니다.
+"""
+
+from typing import Any
+
+from log import log_manager
+from nodes.base_node import BaseNode
+from nodes.excelnodes.excel_manager import (
+    ExcelRowStream,
+    get_excel_objects,
+    get_row_stream,
+    remove_row_stream,
+    store_row_stream,
+)
+from nodes.node_executor_wrapper import NodeExecutor
+from utils import create_failed_result, get_parameter
+
+logger = log_manager.get_logger(__name__)
+
+try:
+    import win32com.client
+except ImportError:
+    win32com = None
+
+# 청크 크기 기본값 및 상한
+DEFAULT_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 10000
+
+
+class ExcelReadNode(BaseNode):
+    """
+    엑셀 읽기 노드 클래스
+
+    Windows 환경에서만 동작하며, win32com을 사용하여 워크시트의 행을 청크 단위로 읽습니다.
+    같은 노드가 다시 실행되면 이전에 읽은 위치 다음부터 이어서 읽습니다.
+    """
+
+    @staticmethod
+    @NodeExecutor("excel-read")
+    async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
+        """
+        워크시트의 다음 행 청크를 읽어옵니다.
+
+        주의: Windows 환경에서만 사용 가능합니다. win32com을 사용하여 엑셀을 제어합니다.
+
+        Args:
+            parameters: 노드 파라미터
+                - execution_id: 엑셀 실행 ID (필수, 이전 노드 출력에서 선택 가능)
+                - sheet_name: 시트 이름 (선택, 비어있으면 sheet_index 또는 활성 시트 사용)
+                - sheet_index: 시트 인덱스 (선택, 1부터 시작)
+                - chunk_size: 한 번에 읽을 행 개수 (기본값: 100)
+                - has_header: 첫 행을 헤더로 사용할지 여부 (기본값: True)
+                - start_row: 읽기 시작 행 (기본값: 1, 데이터 영역(UsedRange)의 첫 행 기준, 헤더 행 포함)
+                - restart: 기존 스트림을 버리고 처음부터 다시 읽을지 여부 (기본값: False)
+                  (시트, chunk_size, has_header, start_row가 바뀌어도 처음부터 다시 읽음)
+
+        Returns:
+            실행 결과 딕셔너리
+        """
+        # win32com이 설치되어 있지 않은 경우
+        if win32com is None:
+            return create_failed_result(
+                action="excel-read",
+                reason="win32com_not_installed",
+                message="pywin32가 설치되어 있지 않습니다. pip install pywin32를 실행하세요.",
+                output={"success": False, "rows": [], "has_more": False},
+            )
+
+        # 파라미터 추출
+        execution_id = get_parameter(parameters, "execution_id", default="")
+        sheet_name = get_parameter(parameters, "sheet_name", default="")
+        sheet_index = get_parameter(parameters, "sheet_index")
+        has_header = bool(get_parameter(parameters, "has_header", default=True))
+        restart = bool(get_parameter(parameters, "restart", default=False))
+
+        try:
+            chunk_size = int(get_parameter(parameters, "chunk_size", default=DEFAULT_CHUNK_SIZE) or DEFAULT_CHUNK_SIZE)
+            start_row = int(get_parameter(parameters, "start_row", default=1) or 1)
+        except (TypeError, ValueError):
+            return create_failed_result(
+                action="excel-read",
+                reason="invalid_number_parameter",
+                message="chunk_size와 start_row는 숫자여야 합니다.",
+                output={"success": False, "rows": [], "has_more": False},
+            )
+        chunk_size = min(max(chunk_size, 1), MAX_CHUNK_SIZE)
+
+        # execution_id가 없으면 메타데이터의 _execution_id 사용 (하위 호환성)
+        if not execution_id:
+            execution_id = parameters.get("_execution_id")
+        if not execution_id:
+            return create_failed_result(
+                action="excel-read",
+                reason="execution_id_required",
+                message="execution_id가 필요합니다. 엑셀 열기 노드의 출력에서 execution_id를 선택하세요.",
+                output={"success": False, "rows": [], "has_more": False},
+            )
+
+        # 스트림 ID: 같은 엑셀 실행 안에서 노드마다 독립된 커서를 가짐
+        node_id = parameters.get("_node_id") or "excel-read"
+        stream_id = f"{execution_id}:{node_id}"
+        # 스트림을 만든 읽기 옵션 (이전 실행과 다르면 보관된 커서를 이어 쓰지 않고 새로 만듦)
+        stream_options = (str(sheet_name or ""), str(sheet_index or ""), chunk_size, has_header, start_row)
+
+        try:
+            stream = get_row_stream(stream_id)
+            if stream is not None and (restart or stream.options != stream_options):
+                remove_row_stream(stream_id)
+                stream = None
+
+            if stream is None:
+                excel_data = get_excel_objects(execution_id)
+                if not excel_data:
+                    return create_failed_result(
+                        action="excel-read",
+                        reason="excel_objects_not_found",
+                        message=f"execution_id '{execution_id}'에 해당하는 엑셀 객체를 찾을 수 없습니다. 엑셀 열기 노드를 먼저 실행하세요.",
+                        output={"success": False, "rows": [], "has_more": False},
+                    )
+
+                workbook = excel_data.get("workbook")
+                if not workbook:
+                    return create_failed_result(
+                        action="excel-read",
+                        reason="workbook_not_found",
+                        message="워크북 객체를 찾을 수 없습니다.",
+                        output={"success": False, "rows": [], "has_more": False},
+                    )
+
+                # 시트 결정: 이름 > 인덱스 > 활성 시트
+                try:
+                    if sheet_name:
+                        sheet = workbook.Worksheets(sheet_name)
+                    elif sheet_index not in (None, ""):
+                        sheet = workbook.Worksheets(int(sheet_index))
+                    else:
+                        sheet = workbook.ActiveSheet
+                except Exception as e:
+                    return create_failed_result(
+                        action="excel-read",
+                        reason="sheet_not_found",
+                        message=f"시트를 찾을 수 없습니다: {sheet_name or sheet_index}. 오류: {e!s}",
+                        output={"success": False, "rows": [], "has_more": False},
+                    )
+
+                stream = ExcelRowStream(
+                    execution_id=execution_id,
+                    sheet=sheet,
+                    chunk_size=chunk_size,
+                    has_header=has_header,
+                    start_row=start_row,
+                    options=stream_options,
+                )
+                store_row_stream(stream_id, stream)
+                logger.info(
+                    "[ExcelReadNode] 행 스트림 생성 - stream_id: %s, sheet: %s, last_row: %s, chunk_size: %s",
+                    stream_id,
+                    stream.sheet_name,
+                    stream.last_row,
+                    stream.chunk_size,
+                )
+
+            chunk = stream.next_chunk()
+
+            # 스트림을 모두 읽었으면 다음 실행 시 처음부터 다시 읽을 수 있도록 제거
+            if not chunk["has_more"]:
+                remove_row_stream(stream_id)
+
+            return {
+                "action": "excel-read",
+                "status": "completed",
+                "output": {
+                    "success": True,
+                    "execution_id": execution_id,
+                    "stream_id": stream_id,
+                    "sheet_name": stream.sheet_name,
+                    "headers": stream.headers,
+                    "rows": chunk["rows"],
+                    "row_count": len(chunk["rows"]),
+                    "row_start": chunk["row_start"],
+                    "row_end": chunk["row_end"],
+                    "chunk_index": chunk["chunk_index"],
+                    "has_more": chunk["has_more"],
+                },
+            }
+
+        except Exception as e:
+            logger.error("[ExcelReadNode] 행 읽기 중 오류 발생 - stream_id: %s, error: %s", stream_id, e)
+            remove_row_stream(stream_id)
+            return create_failed_result(
+                action="excel-read",
+                reason="row_read_error",
+                message=f"행을 읽는 중 오류가 발생했습니다: {e!s}",
+                output={"success": False, "rows": [], "has_more": False},
+            )
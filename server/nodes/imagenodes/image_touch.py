@@ -3,7 +3,9 @@
 화면에서 이미지를 찾아 터치하는 노드입니다.
 """
 
+import asyncio
 import os
+import threading
 from typing import Any
 
 from automation.input_handler import InputHandler
@@ -13,7 +15,7 @@ from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import create_failed_result, get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ImageTouchNode(BaseNode):
@@ -32,13 +34,13 @@ class ImageTouchNode(BaseNode):
         Returns:
             실행 결과 딕셔너리
         """
-        logger.info(f"[ImageTouchNode] execute 호출됨, parameters: {parameters}")
-        logger.info(f"[ImageTouchNode] parameters 키 목록: {list(parameters.keys()) if parameters else []}")
+        logger.info("[ImageTouchNode] execute 호출됨, parameters: %s", parameters)
+        logger.info("[ImageTouchNode] parameters 키 목록: %s", list(parameters.keys()) if parameters else [])
 
         # 파라미터 추출
         # folder_path: 이미지 폴더 경로 (필수)
         folder_path = get_parameter(parameters, "folder_path", default="")
-        logger.info(f"[ImageTouchNode] folder_path 추출 결과: {folder_path}")
+        logger.info("[ImageTouchNode] folder_path 추출 결과: %s", folder_path)
 
         # timeout: 이미지를 찾을 때까지 대기할 최대 시간 (초)
         # 파라미터에서 timeout 추출 (없으면 None)
@@ -48,17 +50,17 @@ class ImageTouchNode(BaseNode):
             try:
                 timeout = float(timeout_param)
                 if timeout <= 0:
-                    logger.warning(f"[ImageTouchNode] 잘못된 timeout 값: {timeout}, timeout 사용 안 함")
+                    logger.warning("[ImageTouchNode] 잘못된 timeout 값: %s, timeout 사용 안 함", timeout)
                     timeout = None
                 else:
-                    logger.debug(f"[ImageTouchNode] 파라미터에서 지정된 타임아웃 사용: {timeout}초")
+                    logger.debug("[ImageTouchNode] 파라미터에서 지정된 타임아웃 사용: %s초", timeout)
             except (ValueError, TypeError):
-                logger.warning(f"[ImageTouchNode] timeout 값 변환 실패: {timeout_param}, timeout 사용 안 함")
+                logger.warning("[ImageTouchNode] timeout 값 변환 실패: %s, timeout 사용 안 함", timeout_param)
                 timeout = None
 
         # folder_path가 없으면 실패로 반환
         if not folder_path:
-            logger.error(f"[ImageTouchNode] ❌ folder_path가 없습니다! parameters 전체: {parameters}")
+            logger.error("[ImageTouchNode] ❌ folder_path가 없습니다! parameters 전체: %s", parameters)
             return create_failed_result(
                 action="image-touch", reason="no_folder", message="폴더 경로가 제공되지 않았습니다."
             )
@@ -102,12 +104,22 @@ class ImageTouchNode(BaseNode):
         # 각 이미지 파일을 순회하며 화면에서 찾고 터치 시도
         for i, image_path in enumerate(image_files):
             try:
-                logger.debug(f"이미지 찾기 시도 {i + 1}/{len(image_files)}: {os.path.basename(image_path)}")
+                logger.debug("이미지 찾기 시도 %s/%s: %s", i + 1, len(image_files), os.path.basename(image_path))
 
                 # 이미지 찾기 (threshold를 0.7로 낮춤, 필요시 더 낮출 수 있음)
                 # timeout 파라미터를 전달하여 기본 타임아웃 설정 사용
                 # location: 찾은 이미지의 위치 (x, y, width, height) 또는 None
-                location = screen_capture.find_template(image_path, threshold=0.7, timeout=timeout)
+                # 템플릿 매칭은 time.sleep 폴링을 포함한 블로킹 작업이므로 별도 스레드에서 실행
+                # (이벤트 루프를 막지 않고, 실행 정책의 timeout_seconds 초과 시 이 await에서 취소될 수 있도록 함)
+                # 노드가 취소되면 stop_event로 검색 스레드의 남은 시도도 중단
+                stop_event = threading.Event()
+                try:
+                    location = await asyncio.to_thread(
+                        screen_capture.find_template, image_path, threshold=0.7, timeout=timeout, stop_event=stop_event
+                    )
+                except asyncio.CancelledError:
+                    stop_event.set()
+                    raise
 
                 # 이미지를 찾았으면 터치 시도
                 if location:
@@ -117,7 +129,7 @@ class ImageTouchNode(BaseNode):
                     center_x = x + w // 2
                     center_y = y + h // 2
 
-                    logger.debug(f"이미지 찾기 성공! 클릭 위치: ({center_x}, {center_y})")
+                    logger.debug("이미지 찾기 성공! 클릭 위치: (%s, %s)", center_x, center_y)
 
                     # 터치 (클릭)
                     # success: 클릭 성공 여부
@@ -134,7 +146,7 @@ class ImageTouchNode(BaseNode):
                     )
                 else:
                     # 이미지를 찾지 못한 경우
-                    logger.debug(f"이미지 찾기 실패: {os.path.basename(image_path)}")
+                    logger.debug("이미지 찾기 실패: %s", os.path.basename(image_path))
                     results.append(
                         {
                             "image": os.path.basename(image_path),
@@ -145,11 +157,11 @@ class ImageTouchNode(BaseNode):
 
             except Exception as e:
                 # 이미지 처리 중 예외 발생 시 에러 로그 출력
-                logger.error(f"이미지 처리 중 오류 발생 ({os.path.basename(image_path)}): {e}")
+                logger.error("이미지 처리 중 오류 발생 (%s): %s", os.path.basename(image_path), e)
                 import traceback
 
                 # 스택 트레이스 출력 (디버깅용)
-                logger.error(f"스택 트레이스: {traceback.format_exc()}")
+                logger.error("스택 트레이스: %s", traceback.format_exc())
                 # 결과에 에러 정보 추가
                 results.append({"image": os.path.basename(image_path), "error": str(e)})
 
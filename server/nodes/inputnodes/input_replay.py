@@ -0,0 +1,102 @@
+"""
+입력 재생 노드
+녹화된 마우스/키보드 이벤트 스트림을 녹화 당시의 타임라인대로 재생하는 노드입니다.
+
+이벤트 스트림은 입력 녹화 API(/api/input-recorder)로 녹화하여 얻습니다.
+여러 개의 클릭/키 입력 노드 대신 노드 하나로 긴 UI 조작을 재생할 수 있습니다.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+from automation.input_recorder import RecordedEventStream, replay_event_stream
+from log import log_manager
+from nodes.base_node import BaseNode
+from nodes.node_executor_wrapper import NodeExecutor
+from utils import create_failed_result, get_parameter
+
+logger = log_manager.get_logger(__name__)
+
+
+class InputReplayNode(BaseNode):
+    """입력 재생 노드 클래스"""
+
+    @staticmethod
+    @NodeExecutor("input-replay")
+    async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
+        """
+        녹화된 입력 이벤트 스트림을 재생합니다.
+
+        Args:
+            parameters: 노드 파라미터
+                - event_stream: 녹화된 이벤트 스트림 (JSON 문자열 또는 딕셔너리, 필수)
+                - speed: 재생 속도 배율 (기본값: 1.0)
+
+        Returns:
+            실행 결과 딕셔너리
+        """
+        event_stream = get_parameter(parameters, "event_stream", default="")
+        speed_raw = get_parameter(parameters, "speed", default=1.0)
+
+        try:
+            speed = float(speed_raw) if speed_raw not in (None, "") else 1.0
+        except (TypeError, ValueError):
+            speed = 1.0
+        if speed <= 0:
+            speed = 1.0
+
+        if not event_stream:
+            return create_failed_result(
+                action="input-replay",
+                reason="event_stream_required",
+                message="재생할 이벤트 스트림이 필요합니다. 입력 녹화 후 결과를 event_stream에 설정하세요.",
+                output={"success": False, "event_count": 0},
+            )
+
+        try:
+            payload = json.loads(event_stream) if isinstance(event_stream, str) else event_stream
+            stream = RecordedEventStream.from_dict(payload)
+        except (TypeError, ValueError, AttributeError, KeyError) as e:
+            # JSON 배열/스칼라, 열 값이 문자열이 아닌 경우 등 형식이 잘못된 스트림은 모두 실패 결과로 반환
+            return create_failed_result(
+                action="input-replay",
+                reason="invalid_event_stream",
+                message=f"이벤트 스트림 형식이 올바르지 않습니다: {e!s}",
+                output={"success": False, "event_count": 0},
+            )
+
+        logger.info(
+            "[InputReplayNode] 재생 시작 - 이벤트 %s개, 길이 %.1fms, 속도 x%s",
+            len(stream),
+            stream.duration_us / 1000,
+            speed,
+        )
+
+        # 재생은 busy-wait을 포함한 블로킹 작업이므로 별도 스레드에서 실행
+        # 노드가 취소되면 stop_event로 재생 스레드도 중단
+        stop_event = threading.Event()
+        try:
+            stats = await asyncio.to_thread(replay_event_stream, stream, speed, stop_event)
+        except asyncio.CancelledError:
+            stop_event.set()
+            raise
+
+        logger.info(
+            "[InputReplayNode] 재생 완료 - %s개 이벤트, 평균 지연 %sµs, 최대 지연 %sµs",
+            stats["dispatched"],
+            stats["mean_lateness_us"],
+            stats["max_lateness_us"],
+        )
+
+        return {
+            "action": "input-replay",
+            "status": "completed",
+            "output": {
+                "success": not stats["stopped"],
+                "event_count": len(stream),
+                "speed": speed,
+                **stats,
+            },
+        }
@@ -10,7 +10,7 @@ from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class RepeatNode(BaseNode):
@@ -21,7 +21,7 @@ class RepeatNode(BaseNode):
     async def execute(parameters: dict[str, Any]) -> dict[str, Any]:
         """
         반복 노드를 실행합니다.
-        실제 반복 실행은 워크플로우 실행 엔진에서 처리됩니다.
+        실제 반복 실행은 실행 계획의 반복 단계(services.repeat_loop.RepeatLoop)에서 처리됩니다.
 
         Args:
             parameters: 노드 파라미터
@@ -39,13 +39,13 @@ class RepeatNode(BaseNode):
         # 반복 횟수 검증
         # repeat_count가 숫자가 아니거나 1보다 작으면 기본값 1 사용
         if not isinstance(repeat_count, (int, float)) or repeat_count < 1:
-            logger.warning(f"[RepeatNode] 잘못된 반복 횟수: {repeat_count}, 기본값 1 사용")
+            logger.warning("[RepeatNode] 잘못된 반복 횟수: %s, 기본값 1 사용", repeat_count)
             repeat_count = 1
 
         # repeat_count를 정수로 변환 (소수점 제거)
         repeat_count = int(repeat_count)
 
-        logger.info(f"[RepeatNode] 반복 노드 실행 - 반복 횟수: {repeat_count}")
+        logger.info("[RepeatNode] 반복 노드 실행 - 반복 횟수: %s", repeat_count)
 
         return {
             "action": "repeat",
@@ -53,6 +53,6 @@ class RepeatNode(BaseNode):
             "output": {
                 "repeat_count": repeat_count,
                 "completed": True,
-                "iterations": [],  # 실제 반복 결과는 워크플로우 실행 엔진에서 채움
+                "iterations": [],  # 실제 반복 결과는 반복 단계(RepeatLoop)에서 채움
             },
         }
@@ -0,0 +1,217 @@
+"""
+노드 실행 정책 모듈
+
+노드 단위의 타임아웃/재시도/백오프 정책을 정의합니다.
+NodeExecutor가 노드를 실행할 때 이 정책을 적용하여,
+오래 걸리는 노드는 취소하고 불안정한 노드는 해당 노드만 다시 실행합니다.
+
+정책 결정 순서 (뒤에 오는 값이 우선):
+1. DEFAULT_EXECUTION_POLICY (타임아웃 없음, 1회 시도)
+2. NODES_CONFIG의 노드 타입별 "execution_policy"
+3. 노드별 재정의: 노드 파라미터의 "execution_policy" 또는 "_execution_policy" (딕셔너리 또는 JSON 문자열)
+
+정책 예시:
+    {
+        "timeout_seconds": 60,      # 1회 시도의 최대 실행 시간 (None 또는 0이면 제한 없음)
+        "max_attempts": 3,          # 최대 시도 횟수 (1이면 재시도 없음)
+        "backoff_seconds": 1.0,     # 첫 재시도 전 대기 시간
+        "backoff_multiplier": 2.0,  # 재시도마다 대기 시간에 곱하는 배수
+        "max_backoff_seconds": 30,  # 대기 시간 상한
+        "jitter": 0.2,              # 대기 시간 편차 비율 (0.2면 ±20%)
+        "retry_on": ["exception", "timeout"],
+    }
+
+retry_on 항목:
+- "exception": 노드 실행 중 예외 발생
+- "timeout": 타임아웃으로 취소됨
+- "failed": 노드가 실패 결과(status="failed")를 반환함 (모든 실패 사유)
+- 그 외 문자열: 실패 결과의 error.reason이 일치하는 경우 (예: "image_not_found")
+
+타임아웃은 코루틴 취소로 동작하므로 노드가 await하는 지점에서만 적용됩니다.
+블로킹 작업(템플릿 매칭 폴링 등)은 asyncio.to_thread로 실행해야 타임아웃이 제때 걸리며,
+그럴 수 없는 노드(스레드를 옮길 수 없는 COM 호출 등)에는 timeout_seconds를 지정하지 않습니다.
+"""
+
+import json
+import random
+from typing import Any
+
+from config.nodes_config import get_node_config
+from log import log_manager
+
+logger = log_manager.get_logger(__name__)
+
+# retry_on 예약어
+RETRY_ON_EXCEPTION = "exception"
+RETRY_ON_TIMEOUT = "timeout"
+RETRY_ON_FAILED = "failed"
+
+# 안전 상한 (설정 실수로 무한 재시도/무한 대기가 되지 않도록)
+MAX_ATTEMPTS_LIMIT = 10
+MAX_BACKOFF_LIMIT = 300.0
+
+
+class NodeExecutionPolicy:
+    """
+    노드 실행 정책 (타임아웃, 재시도, 백오프)
+
+    모든 시간 단위는 초입니다.
+    """
+
+    __slots__ = (
+        "backoff_multiplier",
+        "backoff_seconds",
+        "jitter",
+        "max_attempts",
+        "max_backoff_seconds",
+        "retry_on",
+        "timeout_seconds",
+    )
+
+    def __init__(
+        self,
+        timeout_seconds: float | None = None,
+        max_attempts: int = 1,
+        backoff_seconds: float = 0.0,
+        backoff_multiplier: float = 2.0,
+        max_backoff_seconds: float = 30.0,
+        jitter: float = 0.0,
+        retry_on: list[str] | tuple[str, ...] | None = None,
+    ) -> None:
+        """
+        NodeExecutionPolicy 초기화
+
+        Args:
+            timeout_seconds: 1회 시도의 최대 실행 시간 (None 또는 0 이하이면 제한 없음)
+            max_attempts: 최대 시도 횟수 (1 ~ MAX_ATTEMPTS_LIMIT)
+            backoff_seconds: 첫 재시도 전 대기 시간
+            backoff_multiplier: 재시도마다 대기 시간에 곱하는 배수 (1 이상)
+            max_backoff_seconds: 대기 시간 상한
+            jitter: 대기 시간 편차 비율 (0.0 ~ 1.0)
+            retry_on: 재시도 조건 목록 (None이면 ["exception", "timeout"])
+        """
+        timeout = float(timeout_seconds) if timeout_seconds not in (None, "") else None
+        self.timeout_seconds = timeout if timeout and timeout > 0 else None
+        self.max_attempts = min(max(int(max_attempts), 1), MAX_ATTEMPTS_LIMIT)
+        self.backoff_seconds = min(max(0.0, float(backoff_seconds)), MAX_BACKOFF_LIMIT)
+        self.backoff_multiplier = max(1.0, float(backoff_multiplier))
+        self.max_backoff_seconds = min(max(0.0, float(max_backoff_seconds)), MAX_BACKOFF_LIMIT)
+        self.jitter = min(max(0.0, float(jitter)), 1.0)
+        if retry_on is None:
+            retry_on = (RETRY_ON_EXCEPTION, RETRY_ON_TIMEOUT)
+        elif isinstance(retry_on, str):
+            retry_on = [item.strip() for item in retry_on.split(",")]
+        self.retry_on = frozenset(str(item) for item in retry_on if item)
+
+    def should_retry(self, attempt: int, failure: str, reason: str | None = None) -> bool:
+        """
+        실패한 시도를 다시 실행할지 판단합니다.
+
+        Args:
+            attempt: 방금 끝난 시도 번호 (1부터 시작)
+            failure: 실패 종류 ("exception", "timeout", "failed")
+            reason: 실패 결과의 error.reason (failure가 "failed"일 때)
+
+        Returns:
+            재시도 여부
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if failure in self.retry_on:
+            return True
+        return failure == RETRY_ON_FAILED and reason is not None and reason in self.retry_on
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        attempt번째 시도가 실패한 뒤 다음 시도 전까지 대기할 시간을 계산합니다.
+
+        Args:
+            attempt: 방금 끝난 시도 번호 (1부터 시작)
+
+        Returns:
+            대기 시간 (초, jitter 적용)
+        """
+        if self.backoff_seconds <= 0.0:
+            return 0.0
+        delay = min(self.backoff_seconds * (self.backoff_multiplier ** (attempt - 1)), self.max_backoff_seconds)
+        if self.jitter:
+            delay *= random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+        return max(0.0, delay)
+
+    def to_dict(self) -> dict[str, Any]:
+        """정책을 딕셔너리로 변환"""
+        return {
+            "timeout_seconds": self.timeout_seconds,
+            "max_attempts": self.max_attempts,
+            "backoff_seconds": self.backoff_seconds,
+            "backoff_multiplier": self.backoff_multiplier,
+            "max_backoff_seconds": self.max_backoff_seconds,
+            "jitter": self.jitter,
+            "retry_on": sorted(self.retry_on),
+        }
+
+
+# 기본 정책: 타임아웃 없음, 재시도 없음 (기존 동작과 동일)
+DEFAULT_EXECUTION_POLICY = NodeExecutionPolicy()
+
+# 노드 타입별 기본 정책 캐시 (NODES_CONFIG는 실행 중 바뀌지 않음)
+_type_policy_cache: dict[str, dict[str, Any]] = {}
+
+
+def _get_type_policy_config(node_type: str) -> dict[str, Any]:
+    """NODES_CONFIG에 정의된 노드 타입별 execution_policy를 가져옵니다."""
+    cached = _type_policy_cache.get(node_type)
+    if cached is None:
+        config = get_node_config(node_type) or {}
+        cached = dict(config.get("execution_policy") or {})
+        _type_policy_cache[node_type] = cached
+    return cached
+
+
+def _parse_override(value: Any) -> dict[str, Any]:
+    """노드별 재정의 값을 딕셔너리로 변환합니다. 형식이 잘못되면 무시합니다."""
+    if not value:
+        return {}
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            logger.warning("[NodeExecutionPolicy] execution_policy JSON 파싱 실패 (무시): %s", value)
+            return {}
+    return value if isinstance(value, dict) else {}
+
+
+def resolve_execution_policy(node_type: str, parameters: dict[str, Any]) -> NodeExecutionPolicy:
+    """
+    노드 타입 기본값과 노드별 재정의를 합쳐 실행 정책을 결정합니다.
+
+    Args:
+        node_type: 노드 타입 (NodeExecutor의 action_name)
+        parameters: 노드 파라미터 (execution_policy / _execution_policy 재정의 포함 가능)
+
+    Returns:
+        NodeExecutionPolicy 인스턴스
+    """
+    type_config = _get_type_policy_config(node_type)
+    override = _parse_override(parameters.get("_execution_policy")) or _parse_override(
+        parameters.get("execution_policy")
+    )
+    if not type_config and not override:
+        return DEFAULT_EXECUTION_POLICY
+
+    merged = {**type_config, **override}
+    try:
+        return NodeExecutionPolicy(
+            timeout_seconds=merged.get("timeout_seconds"),
+            max_attempts=merged.get("max_attempts", 1),
+            backoff_seconds=merged.get("backoff_seconds", 0.0),
+            backoff_multiplier=merged.get("backoff_multiplier", 2.0),
+            max_backoff_seconds=merged.get("max_backoff_seconds", 30.0),
+            jitter=merged.get("jitter", 0.0),
+            retry_on=merged.get("retry_on"),
+        )
+    except (TypeError, ValueError) as e:
+        logger.warning(
+            "[NodeExecutionPolicy] 잘못된 실행 정책 (기본 정책 사용) - 노드 타입: %s, 오류: %s", node_type, e
+        )
+        return DEFAULT_EXECUTION_POLICY
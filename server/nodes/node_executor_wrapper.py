@@ -48,14 +48,34 @@ import uuid
 from execution_logging.execution_log_client import get_log_client
 
 from log import log_manager
+from monitoring import loop_monitor, metrics, run_in_scope, tracer
+from nodes.node_execution_policy import (
+    RETRY_ON_EXCEPTION,
+    RETRY_ON_FAILED,
+    RETRY_ON_TIMEOUT,
+    NodeExecutionPolicy,
+    resolve_execution_policy,
+)
 from utils import create_failed_result, normalize_result, validate_parameters
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def _with_loop_stalls(result: dict[str, Any], execution_id: str | None, node_id: str) -> dict[str, Any]:
+    """
+    노드 실행 중 이벤트 루프 멈춤이 감지되었으면 실행 로그용 결과에 멈춤 기록(_loop_stalls)을 추가합니다.
+
+    노드에 반환되는 결과는 수정하지 않고, 멈춤이 있을 때만 복사본을 만듭니다.
+    """
+    stalls = loop_monitor.pop_node_stalls(execution_id, node_id)
+    if not stalls:
+        return result
+    return {**result, "_loop_stalls": [stall.to_dict() for stall in stalls]}
+
+
 class NodeExecutor:
     """
     노드 execute 메서드를 래핑하는 클래스 기반 데코레이터
@@ -64,6 +84,7 @@ class NodeExecutor:
     - 파라미터 검증 및 정규화 (None이면 빈 딕셔너리로 변환)
     - 에러 처리 및 로깅 (에러 발생 시 자동으로 실패 결과 반환)
     - 결과 정규화 (None이거나 dict가 아니면 자동으로 표준 형식으로 변환)
+    - 실행 정책 적용 (타임아웃 시 취소, 재시도/백오프, nodes/node_execution_policy.py 참고)
 
     사용 예시:
         # 기본 사용법
@@ -133,6 +154,9 @@ class NodeExecutor:
             # 로그 클라이언트 가져오기
             log_client = get_log_client()
 
+            # 실행 정책 결정 (NODES_CONFIG 기본값 + 노드별 재정의)
+            policy = resolve_execution_policy(self.action_name, validated_params)
+
             # 실행 시작 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
             _ = asyncio.create_task(  # noqa: RUF006
                 log_client.send_log_async(
@@ -147,62 +171,141 @@ class NodeExecutor:
                     is_connected=is_connected,
                     connection_sequence=connection_sequence,
                     node_identifier=node_identifier,
+                    attempt=1,
                 )
             )
 
-            try:
-                logger.debug(f"[{self.action_name}] 노드 실행 시작 - 파라미터: {validated_params}")
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    # 지연 포맷팅: 로그 레벨이 DEBUG가 아니면 파라미터 딕셔너리를 문자열로 만들지 않음
+                    logger.debug(
+                        "[%s] 노드 실행 시작 (시도 %d/%d) - 파라미터: %s",
+                        self.action_name,
+                        attempt,
+                        policy.max_attempts,
+                        validated_params,
+                    )
 
-                # 노드 실행
-                result = await func(validated_params)
+                    # 노드 실행 (타임아웃이 있으면 초과 시 실행 중인 코루틴을 취소)
+                    # 실행 범위 안에서 실행하여 이벤트 루프 모니터가 멈춤 원인을 이 노드로 기록할 수 있도록 함
+                    scoped = run_in_scope(
+                        func(validated_params), execution_id, node_id, self.action_name, node_name, script_id
+                    )
+                    # 실행 추적: 시도별 구간 (화면 캡처/템플릿 매칭 등 노드 내부 구간은 이 구간의 하위로 기록)
+                    with tracer.span("attempt", attempt=attempt):
+                        if policy.timeout_seconds is not None:
+                            result = await asyncio.wait_for(scoped, timeout=policy.timeout_seconds)
+                        else:
+                            result = await scoped
+
+                    # 결과 정규화
+                    normalized_result = normalize_result(result, self.action_name)
+
+                    # 노드가 실패 결과를 반환한 경우 retry_on 조건에 해당하면 재시도
+                    if normalized_result.get("status") == "failed":
+                        error_info = normalized_result.get("error")
+                        reason = error_info.get("reason") if isinstance(error_info, dict) else None
+                        if policy.should_retry(attempt, "failed", reason):
+                            await self._wait_before_retry(
+                                log_client,
+                                policy,
+                                attempt,
+                                RETRY_ON_FAILED,
+                                f"노드 실패 결과 반환 (reason: {reason})",
+                                execution_id=execution_id,
+                                script_id=script_id,
+                                node_id=node_id,
+                                node_name=node_name,
+                                started_at=started_at,
+                                parameters=log_parameters,
+                            )
+                            continue
+
+                    # 실행 종료 시간
+                    finished_at = datetime.now()
+                    elapsed_ms = time.time() * 1000 - start_time_ms
+                    execution_time_ms = int(elapsed_ms)
+                    metrics.node_latency.observe((self.action_name, "completed", str(script_id or "")), elapsed_ms)
+
+                    logger.debug("[%s] 노드 실행 완료 - 결과: %s", self.action_name, normalized_result)
+
+                    # 실행 완료 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
+                    _ = asyncio.create_task(  # noqa: RUF006
+                        log_client.send_log_async(
+                            execution_id=execution_id,
+                            script_id=script_id,
+                            node_id=node_id,
+                            node_type=self.action_name,
+                            node_name=node_name,
+                            status="completed",
+                            started_at=started_at,
+                            finished_at=finished_at,
+                            execution_time_ms=execution_time_ms,
+                            parameters=log_parameters,
+                            result=_with_loop_stalls(normalized_result, execution_id, node_id),
+                            is_connected=is_connected,
+                            connection_sequence=connection_sequence,
+                            node_identifier=node_identifier,
+                            attempt=attempt,
+                        )
+                    )
 
-                # 결과 정규화
-                normalized_result = normalize_result(result, self.action_name)
+                    return normalized_result
 
-                # 실행 종료 시간
-                finished_at = datetime.now()
-                execution_time_ms = int((time.time() * 1000) - start_time_ms)
+                except asyncio.TimeoutError:
+                    failure = RETRY_ON_TIMEOUT
+                    error_message = f"노드 실행 시간 초과 ({policy.timeout_seconds}초)"
+                    error_trace = None
+                    logger.error("[%s] %s - 시도 %s/%s", self.action_name, error_message, attempt, policy.max_attempts)
 
-                logger.debug(f"[{self.action_name}] 노드 실행 완료 - 결과: {normalized_result}")
+                    # 에러 결과 생성
+                    error_result = create_failed_result(
+                        action=self.action_name,
+                        reason="timeout",
+                        message=error_message,
+                        output={"error": error_message, "timeout_seconds": policy.timeout_seconds},
+                    )
 
-                # 실행 완료 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
-                _ = asyncio.create_task(  # noqa: RUF006
-                    log_client.send_log_async(
+                except Exception as e:
+                    failure = RETRY_ON_EXCEPTION
+                    error_message = str(e)
+                    error_trace = traceback.format_exc()
+
+                    logger.error("[%s] 노드 실행 실패: %s", self.action_name, e)
+                    logger.error("[%s] 스택 트레이스: %s", self.action_name, error_trace)
+
+                    # 에러 결과 생성
+                    error_result = create_failed_result(
+                        action=self.action_name,
+                        reason="execution_error",
+                        message=f"노드 실행 중 오류 발생: {e!s}",
+                        output={"error": str(e)},
+                    )
+
+                if policy.should_retry(attempt, failure):
+                    await self._wait_before_retry(
+                        log_client,
+                        policy,
+                        attempt,
+                        failure,
+                        error_message,
+                        error_trace,
                         execution_id=execution_id,
                         script_id=script_id,
                         node_id=node_id,
-                        node_type=self.action_name,
                         node_name=node_name,
-                        status="completed",
                         started_at=started_at,
-                        finished_at=finished_at,
-                        execution_time_ms=execution_time_ms,
                         parameters=log_parameters,
-                        result=normalized_result,
-                        is_connected=is_connected,
-                        connection_sequence=connection_sequence,
-                        node_identifier=node_identifier,
                     )
-                )
-
-                return normalized_result
+                    continue
 
-            except Exception as e:
                 # 실행 종료 시간
                 finished_at = datetime.now()
-                execution_time_ms = int((time.time() * 1000) - start_time_ms)
-                error_trace = traceback.format_exc()
-
-                logger.error(f"[{self.action_name}] 노드 실행 실패: {e}")
-                logger.error(f"[{self.action_name}] 스택 트레이스: {error_trace}")
-
-                # 에러 결과 생성
-                error_result = create_failed_result(
-                    action=self.action_name,
-                    reason="execution_error",
-                    message=f"노드 실행 중 오류 발생: {e!s}",
-                    output={"error": str(e)},
-                )
+                elapsed_ms = time.time() * 1000 - start_time_ms
+                execution_time_ms = int(elapsed_ms)
+                metrics.node_latency.observe((self.action_name, "failed", str(script_id or "")), elapsed_ms)
 
                 # 실행 실패 로그 전송 (비동기, fire-and-forget - 백그라운드에서 실행)
                 _ = asyncio.create_task(  # noqa: RUF006
@@ -217,12 +320,13 @@ class NodeExecutor:
                         finished_at=finished_at,
                         execution_time_ms=execution_time_ms,
                         parameters=log_parameters,
-                        result=error_result,
-                        error_message=str(e),
+                        result=_with_loop_stalls(error_result, execution_id, node_id),
+                        error_message=error_message,
                         error_traceback=error_trace,
                         is_connected=is_connected,
                         connection_sequence=connection_sequence,
                         node_identifier=node_identifier,
+                        attempt=attempt,
                     )
                 )
 
@@ -231,3 +335,52 @@ class NodeExecutor:
         # 래핑된 함수에 action_name 속성 추가 (자동 핸들러 등록을 위해)
         wrapper.action_name = self.action_name
         return wrapper
+
+    async def _wait_before_retry(
+        self,
+        log_client: Any,
+        policy: NodeExecutionPolicy,
+        attempt: int,
+        failure: str,
+        error_message: str,
+        error_trace: str | None = None,
+        **log_fields: Any,
+    ) -> None:
+        """
+        재시도 전 처리: 같은 로그 행에 다음 시도 번호를 기록하고 백오프 시간만큼 대기합니다.
+
+        Args:
+            log_client: 로그 클라이언트
+            policy: 실행 정책
+            attempt: 방금 실패한 시도 번호
+            failure: 실패 종류 (retry_on 값: failed, exception, timeout)
+            error_message: 실패 사유
+            error_trace: 에러 스택 트레이스 (예외인 경우)
+            **log_fields: 로그 전송에 사용할 공통 필드 (execution_id, node_id 등)
+        """
+        delay = policy.backoff_delay(attempt)
+        metrics.node_retries.inc((self.action_name, failure))
+        logger.warning(
+            "[%s] 노드 재시도 예정 (%s/%s) - 사유: %s, 대기: %.2f초",
+            self.action_name,
+            attempt + 1,
+            policy.max_attempts,
+            error_message,
+            delay,
+        )
+
+        # 새 로그 행을 만들지 않고 running 로그의 시도 횟수만 갱신
+        _ = asyncio.create_task(  # noqa: RUF006
+            log_client.send_log_async(
+                node_type=self.action_name,
+                status="running",
+                error_message=error_message,
+                error_traceback=error_trace,
+                attempt=attempt + 1,
+                **log_fields,
+            )
+        )
+
+        if delay > 0:
+            with tracer.span("retry_backoff", failure=failure, delay_seconds=delay):
+                await asyncio.sleep(delay)
@@ -3,6 +3,7 @@
 특정 프로세스/창에 포커스를 주는 노드입니다.
 """
 
+import asyncio
 import ctypes
 import time
 from typing import Any
@@ -12,12 +13,13 @@ import win32con
 import win32gui
 import win32process
 
+from automation.window_registry import WindowInfo, get_window_registry
 from log import log_manager
 from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import create_failed_result, get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class ProcessFocusNode(BaseNode):
@@ -111,156 +113,84 @@ class ProcessFocusNode(BaseNode):
                 action="process-focus", reason="no_target", message="process_id 또는 hwnd가 제공되지 않았습니다."
             )
 
-        # pygetwindow를 사용하여 창 찾기 (가장 안정적인 방법)
-        target_window = None
+        # 창 찾기는 WindowRegistry의 색인을 사용 (TTL 동안 창 목록을 캐시)
+        try:
+            registry = get_window_registry()
+        except RuntimeError as e:
+            return create_failed_result(action="process-focus", reason="window_registry_unavailable", message=str(e))
+
+        target_window: WindowInfo | None = None
 
-        # 방법 1: window_title로 찾기 (가장 정확)
+        # 방법 1: window_title로 찾기 (가장 정확, 정확히 일치하는 창 우선)
         if window_title:
-            try:
-                windows = gw.getWindowsWithTitle(window_title)
-                if windows:
-                    target_window = windows[0]
-                    logger.debug(f"window_title로 창 찾기 성공: {window_title}")
-            except Exception as e:
-                logger.warning(f"window_title로 창 찾기 실패: {e}")
+            windows = registry.find_by_title(window_title)
+            if windows:
+                target_window = windows[0]
+                logger.debug(f"window_title로 창 찾기 성공: {window_title}")
 
         # 방법 2: process_name으로 찾기
         if not target_window and process_name:
-            try:
-                windows = gw.getWindowsWithTitle(process_name)
-                if windows:
-                    # 정확한 창 제목이 있으면 매칭
-                    if window_title:
-                        for win in windows:
-                            if win.title == window_title:
-                                target_window = win
-                                break
-                    if not target_window:
-                        target_window = windows[0]
-                    logger.debug(f"process_name으로 창 찾기 성공: {process_name}")
-            except Exception as e:
-                logger.warning(f"process_name으로 창 찾기 실패: {e}")
+            windows = registry.find_by_process_name(process_name)
+            if windows:
+                target_window = windows[0]
+                logger.debug(f"process_name으로 창 찾기 성공: {process_name}")
 
         # 방법 3: hwnd로 직접 찾기
         if not target_window and hwnd:
-            try:
-                target_hwnd = int(hwnd)
-                # 모든 창을 열거하여 hwnd로 찾기
-                all_windows = gw.getAllWindows()
-                for win in all_windows:
-                    if hasattr(win, "_hWnd") and win._hWnd == target_hwnd:
-                        target_window = win
-                        logger.debug(f"hwnd로 창 찾기 성공: {hwnd}")
-                        break
-            except Exception as e:
-                logger.warning(f"hwnd로 창 찾기 실패: {e}")
+            target_window = registry.get_by_hwnd(int(hwnd))
+            if target_window:
+                logger.debug(f"hwnd로 창 찾기 성공: {hwnd}")
 
-        # 방법 4: win32gui로 직접 처리 (최후의 수단)
-        if not target_window:
-            if hwnd:
-                target_hwnd = int(hwnd)
-            else:
-                # process_id로 창 핸들 찾기
-                target_hwnd = None
-
-                def find_window_callback(hwnd: int, extra: Any) -> bool:
-                    nonlocal target_hwnd
-                    if win32gui.IsWindowVisible(hwnd):
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        if pid == process_id:
-                            target_hwnd = hwnd
-                            return False
-                    return True
+        # 방법 4: process_id로 찾기
+        if not target_window and process_id:
+            windows = registry.find_by_pid(int(process_id))
+            if windows:
+                target_window = windows[0]
+                logger.debug(f"process_id로 창 찾기 성공: {process_id}")
 
-                win32gui.EnumWindows(find_window_callback, None)
+        if target_window:
+            target_hwnd = target_window.hwnd
+        elif hwnd:
+            # 제목이 없는 창 등 레지스트리에 없는 hwnd는 그대로 사용 (최후의 수단)
+            target_hwnd = int(hwnd)
+        else:
+            # 창을 찾을 수 없는 경우
+            return create_failed_result(
+                action="process-focus", reason="window_not_found", message="창을 찾을 수 없습니다."
+            )
 
-                if not target_hwnd:
-                    raise ValueError(f"프로세스 ID {process_id}에 해당하는 창을 찾을 수 없습니다.")
+        window_label = target_window.title if target_window else None
 
+        # pygetwindow로 창 포커스 시도 (실패 시 win32gui로 대체)
+        try:
+            window = gw.Win32Window(target_hwnd)
+            # 창이 최소화되어 있으면 복원
+            if window.isMinimized:
+                window.restore()
+                await asyncio.sleep(0.1)
+
+            window.activate()
+            await asyncio.sleep(0.05)
+            window.restore()  # 다시 복원하여 최상단으로
+            logger.debug(f"pygetwindow로 창 포커스 성공: {window_label or target_hwnd}")
+        except Exception as activate_error:
+            logger.warning(f"pygetwindow.activate() 실패, win32gui로 대체: {activate_error}")
             # win32gui로 직접 처리 (강제 포커스 방법 사용)
-            try:
-                ProcessFocusNode._force_foreground_window(target_hwnd)
+            ProcessFocusNode._force_foreground_window(target_hwnd)
+            logger.debug(f"win32gui로 창 포커스 완료: {window_label or target_hwnd}")
 
-                return {
-                    "action": "process-focus",
-                    "status": "completed",
-                    "message": "프로세스에 포커스를 주었습니다.",
-                    "output": {"success": True, "process_id": process_id, "hwnd": target_hwnd},
-                }
-            except Exception as e:
-                # 기본 작업 실패 시 에러 발생
-                raise ValueError(f"창 포커스 실패: {e}")
-
-        # pygetwindow로 창 포커스 시도 (실패 시 win32gui로 대체)
+        message = (
+            f"프로세스 '{window_label}'에 포커스를 주었습니다." if window_label else "프로세스에 포커스를 주었습니다."
+        )
+        output: dict[str, Any] = {"success": True, "process_id": process_id, "hwnd": target_hwnd}
         if target_window:
-            try:
-                # 창이 최소화되어 있으면 복원
-                if target_window.isMinimized:
-                    target_window.restore()
-                    time.sleep(0.1)
-
-                # 창 활성화 및 포커스 시도
-                try:
-                    target_window.activate()
-                    time.sleep(0.05)
-                    target_window.restore()  # 다시 복원하여 최상단으로
-                    logger.debug(f"pygetwindow로 창 포커스 성공: {target_window.title}")
-
-                    return {
-                        "action": "process-focus",
-                        "status": "completed",
-                        "message": f"프로세스 '{target_window.title}'에 포커스를 주었습니다.",
-                        "output": {
-                            "success": True,
-                            "process_id": process_id,
-                            "hwnd": target_window._hWnd if hasattr(target_window, "_hWnd") else None,
-                            "window_title": target_window.title,
-                        },
-                    }
-                except Exception as activate_error:
-                    logger.warning(f"pygetwindow.activate() 실패, win32gui로 대체: {activate_error}")
-                    # pygetwindow 실패 시 win32gui로 대체
-                    target_hwnd = target_window._hWnd if hasattr(target_window, "_hWnd") else None
-                    if not target_hwnd:
-                        raise ValueError("창 핸들을 가져올 수 없습니다.")
-
-                    # win32gui로 직접 처리 (강제 포커스 방법 사용)
-                    ProcessFocusNode._force_foreground_window(target_hwnd)
-
-                    logger.debug(f"win32gui로 창 포커스 성공: {target_window.title}")
-
-                    return {
-                        "action": "process-focus",
-                        "status": "completed",
-                        "message": f"프로세스 '{target_window.title}'에 포커스를 주었습니다.",
-                        "output": {
-                            "success": True,
-                            "process_id": process_id,
-                            "hwnd": target_hwnd,
-                            "window_title": target_window.title,
-                        },
-                    }
-            except Exception as e:
-                logger.warning(f"pygetwindow 처리 실패: {e}")
-                # 최후의 수단: win32gui로 직접 처리
-                target_hwnd = target_window._hWnd if hasattr(target_window, "_hWnd") else None
-                if not target_hwnd and hwnd:
-                    target_hwnd = int(hwnd)
-
-                if not target_hwnd:
-                    raise ValueError(f"창 핸들을 가져올 수 없습니다: {e}")
-
-                # win32gui로 직접 처리 (강제 포커스 방법 사용)
-                ProcessFocusNode._force_foreground_window(target_hwnd)
-
-                logger.debug("win32gui로 창 포커스 완료 (대체 방법)")
-
-                return {
-                    "action": "process-focus",
-                    "status": "completed",
-                    "message": "프로세스에 포커스를 주었습니다.",
-                    "output": {"success": True, "process_id": process_id, "hwnd": target_hwnd},
-                }
-
-        # 창을 찾을 수 없는 경우
-        return create_failed_result(action="process-focus", reason="window_not_found", message="창을 찾을 수 없습니다.")
+            output["process_id"] = process_id or target_window.pid
+            output["process_name"] = target_window.process_name
+            output["window_title"] = target_window.title
+
+        return {
+            "action": "process-focus",
+            "status": "completed",
+            "message": message,
+            "output": output,
+        }
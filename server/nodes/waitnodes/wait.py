@@ -11,7 +11,7 @@ from nodes.base_node import BaseNode
 from nodes.node_executor_wrapper import NodeExecutor
 from utils import get_parameter
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class WaitNode(BaseNode):
@@ -47,13 +47,13 @@ class WaitNode(BaseNode):
             wait_time = 1
 
         # 대기 시작 로그
-        logger.info(f"[WaitNode] {wait_time}초 대기 시작")
+        logger.info("[WaitNode] %s초 대기 시작", wait_time)
 
         # 비동기 대기
         await asyncio.sleep(wait_time)
 
         # 대기 완료 로그
-        logger.info(f"[WaitNode] {wait_time}초 대기 완료")
+        logger.info("[WaitNode] %s초 대기 완료", wait_time)
 
         return {
             "action": "wait",
@@ -2,15 +2,20 @@
 액션 처리 서비스
 """
 
+from collections.abc import Awaitable, Callable
 import inspect
+import traceback
 from typing import Any
 
+from config.server_config import settings
 from log import log_manager
+from monitoring import NODE, tracer
 
 # 노드 모듈 import (자동으로 모든 노드가 import됨)
 import nodes
 from services.condition_service import ConditionService
 from services.node_execution_context import NodeExecutionContext
+from utils import ParameterPlan, compile_parameter_plan
 
 # config 모듈은 직접 import (같은 레벨에 있으므로)
 try:
@@ -26,7 +31,65 @@ except ImportError:
         return None
 
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
+
+# 노드 타입별로 실행 전에 값이 있는지 확인할 파라미터 키 (없으면 경고 로그)
+# image-touch 노드는 이미지 폴더 경로가 필요함
+REQUIRED_PARAMETER_KEYS: dict[str, tuple[str, ...]] = {
+    "image-touch": ("folder_path",),
+}
+
+# 노드 타입별 실행 전 데이터 준비 함수 (컨텍스트가 있을 때만 호출)
+# 조건 노드는 이전 노드의 출력을 받아서 조건을 평가함
+NodePreparer = Callable[[dict[str, Any], NodeExecutionContext], dict[str, Any]]
+NODE_PREPARERS: dict[str, NodePreparer] = {
+    "condition": ConditionService.prepare_condition_node_data,
+}
+
+
+class HandlerDescriptor:
+    """
+    노드 타입 하나의 실행 정보
+    핸들러 등록 시 한 번만 만들어 두고, 노드 실행마다 딕셔너리 조회 한 번으로 가져옵니다.
+    """
+
+    __slots__ = ("action", "handler", "label", "preparer", "required_keys")
+
+    def __init__(
+        self,
+        action: str,
+        handler: Callable[[dict[str, Any]], Awaitable[Any]],
+        label: str,
+        preparer: NodePreparer | None = None,
+        required_keys: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Args:
+            action: 결과 정규화에 사용할 액션 이름 (노드 타입 또는 실제 노드 종류)
+            handler: 노드 execute 메서드
+            label: 로그용 핸들러 이름 (예: "ClickNode.execute")
+            preparer: 실행 전 노드 데이터 준비 함수 (조건 노드 등)
+            required_keys: 실행 전에 값이 있는지 확인할 파라미터 키
+        """
+        self.action = action
+        self.handler = handler
+        self.label = label
+        self.preparer = preparer
+        self.required_keys = required_keys
+
+    def normalize(self, result: Any) -> dict[str, Any]:
+        """핸들러 결과를 표준 형식 dict로 정규화합니다. (None이거나 dict가 아니면 output으로 감쌈)"""
+        if result.__class__ is dict:
+            return result
+        if result is None:
+            return {"action": self.action, "status": "completed", "output": None}
+        if isinstance(result, dict):
+            return result
+        return {"action": self.action, "status": "completed", "output": result}
+
+    def with_action(self, action: str) -> "HandlerDescriptor":
+        """같은 핸들러를 다른 액션 이름으로 사용하는 실행 정보를 만듭니다. (실제 노드 종류 등록용)"""
+        return HandlerDescriptor(action, self.handler, self.label)
 
 
 class ActionService:
@@ -53,10 +116,49 @@ class ActionService:
         # 실제 노드 종류 핸들러 매핑 (action_node_type 사용, 자동으로 등록됨)
         # key: action_node_type (예: "http-api-request"), value: execute 메서드
         self.action_node_handlers: dict[str, Any] = {}
+        # 노드 실행 경로에서 사용하는 실행 정보 (핸들러 + 정규화 + 노드 타입별 메타데이터)
+        self.node_descriptors: dict[str, HandlerDescriptor] = {}
+        self.action_node_descriptors: dict[str, HandlerDescriptor] = {}
+        # 상세 추적 로그 (노드 데이터 전체, 핸들러 정보를 INFO로 출력)
+        self.trace_enabled = settings.NODE_TRACE
 
         # 모든 노드 클래스를 자동으로 스캔하여 핸들러 등록
         self._register_node_handlers()
 
+    def set_trace(self, enabled: bool) -> None:
+        """
+        상세 추적 로그를 켜거나 끕니다.
+
+        Args:
+            enabled: True면 노드마다 노드 데이터 전체와 핸들러 정보를 INFO 로그로 출력
+        """
+        self.trace_enabled = enabled
+
+    def register_handler(
+        self, action_name: str, handler: Callable[[dict[str, Any]], Awaitable[Any]], label: str | None = None
+    ) -> HandlerDescriptor:
+        """
+        노드 타입 핸들러를 등록하고 실행 정보를 만듭니다.
+
+        Args:
+            action_name: 노드 타입 (예: "click")
+            handler: 노드 execute 메서드
+            label: 로그용 핸들러 이름 (없으면 함수 이름)
+
+        Returns:
+            등록된 HandlerDescriptor
+        """
+        descriptor = HandlerDescriptor(
+            action_name,
+            handler,
+            label or getattr(handler, "__qualname__", repr(handler)),
+            NODE_PREPARERS.get(action_name),
+            REQUIRED_PARAMETER_KEYS.get(action_name, ()),
+        )
+        self.node_handlers[action_name] = handler
+        self.node_descriptors[action_name] = descriptor
+        return descriptor
+
     def _register_node_handlers(self) -> None:
         """
         모든 노드 클래스를 자동으로 스캔하여 핸들러를 등록합니다.
@@ -66,7 +168,8 @@ class ActionService:
 
         # nodes 모듈의 모든 속성을 순회
         logger.info(
-            f"[ActionService] 노드 핸들러 등록 시작 - nodes 모듈 속성 개수: {len([x for x in dir(nodes) if not x.startswith('_')])}"
+            "[ActionService] 노드 핸들러 등록 시작 - nodes 모듈 속성 개수: %s",
+            len([x for x in dir(nodes) if not x.startswith("_")]),
         )
         for _name, obj in inspect.getmembers(nodes):
             # 클래스이고 BaseNode를 상속받았으며, execute 메서드가 있는 경우
@@ -75,16 +178,17 @@ class ActionService:
                 # execute 메서드에 action_name 속성이 있는지 확인 (NodeExecutor 데코레이터가 추가함)
                 if hasattr(execute_method, "action_name"):
                     action_name = execute_method.action_name
-                    # node_handlers에 등록
-                    self.node_handlers[action_name] = execute_method
-                    logger.info(f"[ActionService] 노드 핸들러 자동 등록: {action_name} -> {obj.__name__}.execute")
+                    self.register_handler(action_name, execute_method, f"{obj.__name__}.execute")
+                    logger.info("[ActionService] 노드 핸들러 자동 등록: %s -> %s.execute", action_name, obj.__name__)
                 else:
                     logger.warning(
-                        f"[ActionService] 노드 클래스 {obj.__name__}의 execute 메서드에 action_name 속성이 없습니다."
+                        "[ActionService] 노드 클래스 %s의 execute 메서드에 action_name 속성이 없습니다.", obj.__name__
                     )
 
         logger.info(
-            f"[ActionService] 노드 핸들러 등록 완료 - 총 {len(self.node_handlers)}개 핸들러 등록됨: {list(self.node_handlers.keys())}"
+            "[ActionService] 노드 핸들러 등록 완료 - 총 %s개 핸들러 등록됨: %s",
+            len(self.node_handlers),
+            list(self.node_handlers.keys()),
         )
 
         # action_node_types.py의 handler와 매칭하여 action_node_handlers에 등록
@@ -98,7 +202,40 @@ class ActionService:
                 if handler_name and handler_name in self.node_handlers:
                     # action_node_handlers에 등록 (action_node_type -> execute 메서드 매핑)
                     self.action_node_handlers[action_node_type] = self.node_handlers[handler_name]
-                    logger.debug(f"액션 노드 핸들러 자동 등록: {action_node_type} -> {handler_name}")
+                    self.action_node_descriptors[action_node_type] = self.node_descriptors[handler_name].with_action(
+                        action_node_type
+                    )
+                    logger.debug("액션 노드 핸들러 자동 등록: %s -> %s", action_node_type, handler_name)
+
+    def get_descriptor(self, action_type: str, action_node_type: str | None = None) -> HandlerDescriptor:
+        """
+        실행할 핸들러의 실행 정보를 찾습니다.
+
+        Args:
+            action_type: 액션 타입 (노드 타입)
+            action_node_type: 실제 노드 종류 (있으면 우선 사용)
+
+        Returns:
+            HandlerDescriptor
+
+        Raises:
+            ValueError: 등록되지 않은 액션 타입인 경우
+        """
+        # 실제 노드 종류가 지정되고 등록되어 있으면 해당 핸들러 사용
+        if action_node_type:
+            descriptor = self.action_node_descriptors.get(action_node_type)
+            if descriptor is not None:
+                return descriptor
+
+        descriptor = self.node_descriptors.get(action_type)
+        if descriptor is None:
+            logger.error(
+                "[process_action] 지원하지 않는 액션 타입: %s (등록된 핸들러: %s)",
+                action_type,
+                list(self.node_handlers.keys()),
+            )
+            raise ValueError(f"지원하지 않는 액션 타입: {action_type}")
+        return descriptor
 
     async def process_action(
         self, action_type: str, parameters: dict[str, Any], action_node_type: str | None = None
@@ -118,68 +255,66 @@ class ActionService:
         if parameters is None:
             parameters = {}
 
-        logger.info(
-            f"[process_action] 호출됨 - 액션 타입: {action_type}, 실제 노드 종류: {action_node_type}, 파라미터: {parameters}"
-        )
-
         try:
-            # 실제 노드 종류가 지정된 경우 해당 핸들러 사용
-            # action_node_type이 있으면 action_node_handlers에서 핸들러 찾기
-            if action_node_type:
-                # action_node_handlers에서 핸들러 가져오기 (없으면 None)
-                handler = self.action_node_handlers.get(action_node_type)
-                # 핸들러가 있으면 실행
-                if handler:
-                    logger.debug(f"실제 노드 종류 핸들러 실행 중: {action_node_type}")
-                    result = await handler(parameters)
-                    logger.debug(f"실제 노드 종류 핸들러 실행 완료: {result}")
-
-                    # 결과가 None이면 기본값 반환
-                    if result is None:
-                        result = {"action": action_node_type, "status": "completed", "output": None}
-
-                    # 결과가 dict가 아니면 dict로 변환
-                    if not isinstance(result, dict):
-                        result = {"action": action_node_type, "status": "completed", "output": result}
-
-                    return result
-
-            # 노드 핸들러 사용
-            logger.info(f"[process_action] 사용 가능한 핸들러: {list(self.node_handlers.keys())}")
-            logger.info(f"[process_action] 요청된 액션 타입: {action_type}")
-
-            handler = self.node_handlers.get(action_type)
-            if not handler:
-                logger.error(
-                    f"[process_action] 지원하지 않는 액션 타입: {action_type} (등록된 핸들러: {list(self.node_handlers.keys())})"
+            descriptor = self.get_descriptor(action_type, action_node_type)
+            if self.trace_enabled:
+                logger.info(
+                    "[process_action] 액션 타입: %s, 실제 노드 종류: %s, 핸들러: %s, 파라미터: %s",
+                    action_type,
+                    action_node_type,
+                    descriptor.label,
+                    parameters,
                 )
-                raise ValueError(f"지원하지 않는 액션 타입: {action_type}")
+            # 핸들러 실행 (비동기 함수) 후 결과를 표준 형식으로 정규화
+            return descriptor.normalize(await descriptor.handler(parameters))
+        except Exception as e:
+            # 예외 발생 시 에러 로그 출력 후 재발생
+            logger.error("process_action 에러: %s", e)
+            # 스택 트레이스 출력 (디버깅용)
+            logger.error("process_action 스택 트레이스: %s", traceback.format_exc())
+            # 예외 재발생 (상위에서 처리하도록)
+            raise e
 
-            logger.info(f"[process_action] 핸들러 찾음: {handler} (action_type: {action_type})")
+    @staticmethod
+    def _merge_node_data(node: dict[str, Any]) -> dict[str, Any]:
+        """
+        노드의 data와 parameters를 병합한 새 딕셔너리를 반환합니다.
 
-            logger.debug(f"핸들러 실행 중: {handler.__name__}")
-            # 핸들러 실행 (비동기 함수)
-            result = await handler(parameters)
-            logger.debug(f"핸들러 실행 완료: {result}")
+        원본 노드 데이터는 수정하지 않습니다 (반복 실행 시 경로 문자열이 해석된 값으로 덮어써지지 않도록).
 
-            # 결과가 None이면 기본값 반환 (표준 형식으로 변환)
-            if result is None:
-                result = {"action": action_type, "status": "completed", "output": None}
+        Args:
+            node: 노드 데이터
 
-            # 결과가 dict가 아니면 dict로 변환 (표준 형식으로 변환)
-            if not isinstance(result, dict):
-                result = {"action": action_type, "status": "completed", "output": result}
+        Returns:
+            병합된 노드 데이터 (parameters가 우선)
+        """
+        node_data = node.get("data") or {}
 
-            return result
-        except Exception as e:
-            # 예외 발생 시 에러 로그 출력 후 재발생
-            logger.error(f"process_action 에러: {e}")
-            import traceback
+        # parameters를 node_data에 병합 (parameters가 우선순위가 높음)
+        # DB에서 불러온 노드는 parameters 필드에 파라미터가 저장되어 있음
+        node_parameters = node.get("parameters")
+        if node_parameters and isinstance(node_parameters, dict):
+            return {**node_data, **node_parameters}
+        return dict(node_data)
 
-            # 스택 트레이스 출력 (디버깅용)
-            logger.error(f"process_action 스택 트레이스: {traceback.format_exc()}")
-            # 예외 재발생 (상위에서 처리하도록)
-            raise e
+    def compile_parameter_plan(self, node: dict[str, Any]) -> ParameterPlan:
+        """
+        노드의 파라미터 해석 계획을 컴파일합니다.
+
+        같은 노드를 여러 번 실행할 때(반복 노드 등) 한 번만 컴파일하여 process_node에 전달합니다.
+        조건 노드는 조건도 여기서 컴파일하여 계획에 보관합니다.
+
+        Args:
+            node: 노드 데이터
+
+        Returns:
+            ParameterPlan 인스턴스
+        """
+        node_data = self._merge_node_data(node)
+        plan = compile_parameter_plan(node_data)
+        if node.get("type") == "condition":
+            plan = ConditionService.compile_condition_plan(node_data, plan)
+        return plan
 
     async def process_node(
         self,
@@ -187,6 +322,7 @@ class ActionService:
         context: NodeExecutionContext | None = None,
         execution_id: str | None = None,
         script_id: int | None = None,
+        parameter_plan: ParameterPlan | None = None,
     ) -> dict[str, Any]:
         """
         개별 노드를 처리하는 함수
@@ -199,64 +335,72 @@ class ActionService:
             context: 노드 실행 컨텍스트 (데이터 전달용)
             execution_id: 워크플로우 실행 ID (로그 추적용)
             script_id: 스크립트 ID (로그 추적용)
+            parameter_plan: 미리 컴파일된 파라미터 해석 계획 (없으면 노드 데이터에서 컴파일)
+                같은 노드를 반복 실행할 때는 compile_parameter_plan()의 결과를 넘겨 재사용합니다.
 
         Returns:
             항상 dict를 반환 (None이면 기본값 반환)
         """
-        logger.debug(f"process_node 호출됨 - 노드: {node}")
+        trace = self.trace_enabled
+        if trace:
+            logger.info("[process_node] 호출됨 - 노드: %s", node)
 
+        # 실행 추적: 노드 구간 (추적 중인 실행이 없으면 아무것도 기록하지 않음)
+        node_span = tracer.span(str(node.get("type")), NODE, node_id=node.get("id")).open()
         try:
             node_type = node.get("type")
-            node_data = node.get("data")
             node_id = node.get("id", "")
 
-            # node_data가 None이면 빈 dict로 변환
-            if node_data is None:
-                node_data = {}
+            # 노드 데이터 준비 (data + parameters 병합, 노드 실행당 딕셔너리 복사는 이 한 번뿐)
+            node_data = self._merge_node_data(node)
 
-            # parameters를 node_data에 병합 (parameters가 우선순위가 높음)
-            # DB에서 불러온 노드는 parameters 필드에 파라미터가 저장되어 있음
-            node_parameters = node.get("parameters")
-            if node_parameters and isinstance(node_parameters, dict):
-                # node_data에 parameters를 병합 (parameters가 우선)
-                node_data = {**node_data, **node_parameters}
-                logger.debug(f"[process_node] parameters 병합 완료: {list(node_parameters.keys())}")
+            # 파라미터 해석 계획 (경로 문자열 파라미터 목록)
+            # 해석 전 원본 값으로 컴파일해야 하므로 메타데이터 추가/경로 해석보다 먼저 수행
+            if parameter_plan is None:
+                parameter_plan = compile_parameter_plan(node_data)
 
             node_name = node_data.get("title") or node_data.get("name")
 
             # 로그 추적을 위한 메타데이터를 node_data에 추가 (내부 메타데이터는 _ 접두사 사용)
-            # execution_id: 워크플로우 실행 ID (로그 추적용)
+            # execution_id: 워크플로우 실행 ID, script_id: 스크립트 ID, node_id: 노드 ID, node_name: 노드 이름 (있으면만)
             if execution_id is not None:
                 node_data["_execution_id"] = execution_id
-            # script_id: 스크립트 ID (로그 추적용)
             if script_id is not None:
                 node_data["_script_id"] = script_id
-            # node_id: 노드 ID (로그 추적용)
             node_data["_node_id"] = node_id
-            # node_name: 노드 이름 (로그 추적용, 있으면만 추가)
             if node_name:
                 node_data["_node_name"] = node_name
-
-            # 노드 식별자 포맷팅
-            node_identifier_parts = []
-            if node_name:
-                node_identifier_parts.append(node_name)
-            node_identifier_parts.append(f"({node_type})")
-            if node_id and node_id != "start":
-                node_identifier_parts.append(f"ID:{node_id}")
-            node_identifier = " ".join(node_identifier_parts) if node_identifier_parts else f"{node_type}(ID:{node_id})"
-
-            logger.info(f"[process_node] 노드 실행: {node_identifier}")
-            logger.debug(f"[process_node] 노드 데이터 키 목록: {list(node_data.keys()) if node_data else []}")
-
-            # folder_path 파라미터 확인 (image-touch 노드용)
-            # image-touch 노드는 이미지 폴더 경로가 필요함
-            if node_type == "image-touch":
-                folder_path = node_data.get("folder_path")
-                logger.info(f"[process_node][image-touch] folder_path 값: {folder_path}")
-                # folder_path가 없으면 경고 출력
-                if not folder_path:
-                    logger.warning(f"[process_node][image-touch] ⚠️ folder_path가 없습니다! node_data 전체: {node_data}")
+            # 실행 계획을 만들 때 컴파일한 조건 (조건 노드가 실행마다 컴파일/캐시 조회를 하지 않도록 전달)
+            if parameter_plan.condition is not None:
+                node_data["_compiled_condition"] = parameter_plan.condition
+
+            # 실행할 핸들러 (등록 시 미리 만든 실행 정보, 없으면 ValueError)
+            descriptor = self.get_descriptor(
+                str(node_type) if node_type else "unknown", node_data.get("action_node_type")
+            )
+            # 노드 타입별 메타데이터 (데이터 준비 함수, 필수 파라미터 키)는 노드 타입 기준
+            type_descriptor = descriptor if descriptor.action == node_type else self.node_descriptors.get(node_type)
+
+            if trace:
+                logger.info(
+                    "[process_node] 노드 실행: %s (%s) ID:%s -> %s, 데이터 키 목록: %s",
+                    node_name,
+                    node_type,
+                    node_id,
+                    descriptor.label,
+                    list(node_data),
+                )
+            else:
+                # 지연 포맷팅: 로그 레벨이 DEBUG가 아니면 문자열을 만들지 않음
+                logger.debug("[process_node] 노드 실행: %s (%s) ID:%s", node_name, node_type, node_id)
+
+            # 필수 파라미터 확인 (image-touch 노드의 folder_path 등)
+            if type_descriptor is not None:
+                for key in type_descriptor.required_keys:
+                    if not node_data.get(key):
+                        logger.warning("[process_node][%s] ⚠️ %s가 없습니다!", node_type, key)
+                        if trace:
+                            logger.info("[process_node][%s] node_data 전체: %s", node_type, node_data)
 
             # 컨텍스트가 있으면 현재 노드 설정
             # 컨텍스트는 노드 간 데이터 전달을 위한 객체
@@ -264,109 +408,92 @@ class ActionService:
                 # 현재 노드 ID 설정 (다음 노드에서 이전 노드로 참조할 때 사용)
                 context.set_current_node(node_id)
 
-                # 조건 노드인 경우 조건 서비스를 통해 데이터 준비
-                # 조건 노드는 이전 노드의 출력을 받아서 조건을 평가함
-                if node_type == "condition":
-                    node_data = ConditionService.prepare_condition_node_data(node_data, context)
+                # 실행 추적: 데이터 준비와 파라미터 경로 해석 구간
+                with tracer.span("parameter_resolution"):
+                    # 노드 타입별 데이터 준비 (조건 노드는 조건 서비스를 통해 이전 노드 출력으로 데이터 준비)
+                    if type_descriptor is not None and type_descriptor.preparer is not None:
+                        node_data = type_descriptor.preparer(node_data, context)
 
-                # 모든 노드의 파라미터에서 경로 문자열을 실제 값으로 자동 해석
-                # 이전 노드 결과가 있으면 모든 파라미터 값이 "output."으로 시작하는 경로 문자열인지 확인하고
-                # 실제 값으로 변환합니다. 이렇게 하면 엑셀 노드뿐만 아니라 모든 노드에서
-                # 이전 노드 출력 값을 자동으로 사용할 수 있습니다.
-                if context:
+                    # 모든 노드의 파라미터에서 경로 문자열을 실제 값으로 자동 해석
+                    # 파라미터 해석 계획에 기록된 동적 파라미터만 해석하고, 정적 파라미터는 건너뜁니다.
+                    # 이렇게 하면 엑셀 노드뿐만 아니라 모든 노드에서 이전 노드 출력 값을 자동으로 사용할 수 있습니다.
                     prev_result = context.get_previous_node_result()
-                    if prev_result and isinstance(prev_result, dict):
-                        # 이전 노드 결과는 {action, status, output} 형식
-                        # 경로 해석을 위해 outdata 구조로 래핑 (경로 해석용, 실제 결과는 그대로)
-                        prev_result_wrapped = {"outdata": prev_result}
-
-                        # 이전 노드의 입력 파라미터를 indata로 준비 (이전 노드의 node_data에서 가져옴)
-                        # 현재는 이전 노드의 입력 데이터를 직접 가져올 수 없으므로,
-                        # 경로 해석 시 indata는 현재 노드의 입력 데이터를 사용
-                        current_indata = {
-                            k: v
-                            for k, v in node_data.items()
-                            if k not in ("_execution_id", "_script_id", "_node_id", "_node_name", "output_override")
-                            and not k.startswith("_")
-                        }
-
-                        # 범용 필드 경로 해석 유틸리티 사용
-                        from utils.field_path_resolver import resolve_parameter_paths
-
-                        # node_data의 모든 파라미터에서 경로 문자열 해석
-                        # outdata: 이전 노드의 실행 결과
-                        # indata: 현재 노드의 입력 파라미터 (또는 이전 노드의 입력 파라미터를 참조할 수 있도록)
-                        resolve_parameter_paths(node_data, prev_result_wrapped, current_indata)
-                        logger.debug(f"[process_node] 파라미터 경로 해석 완료 - 노드 타입: {node_type}")
-
-                        # execution_id 파라미터가 비어있고, 이전 노드 출력에 execution_id가 있으면 자동으로 가져오기
-                        # 엑셀 노드 등에서 execution_id가 필수인 경우를 위한 자동 채움
-                        if "execution_id" in node_data:
-                            execution_id_value = node_data.get("execution_id")
-                            if not execution_id_value or execution_id_value == "":
-                                prev_output = prev_result.get("output")
-                                if isinstance(prev_output, dict) and "execution_id" in prev_output:
-                                    node_data["execution_id"] = prev_output.get("execution_id")
-                                    logger.info(
-                                        f"[process_node] execution_id가 비어있어 이전 노드 출력에서 자동으로 가져옴: "
-                                        f"{prev_output.get('execution_id')}"
-                                    )
-
-                logger.debug(f"준비된 노드 데이터: {node_data}")
-
-            # 실제 노드 종류 가져오기
-            action_node_type = node_data.get("action_node_type")
+                    if not parameter_plan.is_static:
+                        # 이전 노드 결과는 {action, status, output} 형식 (outdata 경로의 루트)
+                        # indata 경로가 있을 때만 현재 노드의 입력 데이터(내부 메타데이터 제외)를 준비
+                        current_indata = None
+                        if parameter_plan.needs_indata:
+                            current_indata = {
+                                k: v for k, v in node_data.items() if k != "output_override" and not k.startswith("_")
+                            }
+
+                        # nodes.이름 경로는 컨텍스트에서 해당 노드의 결과를 찾아 해석
+                        parameter_plan.resolve(node_data, prev_result, current_indata, context)
+                        if trace:
+                            logger.info(
+                                "[process_node] 파라미터 경로 해석 완료 - 노드 타입: %s, 동적 파라미터: %s",
+                                node_type,
+                                list(parameter_plan.dynamic_keys),
+                            )
+
+                    # execution_id 파라미터가 비어있고, 이전 노드 출력에 execution_id가 있으면 자동으로 가져오기
+                    # 엑셀 노드 등에서 execution_id가 필수인 경우를 위한 자동 채움
+                    if prev_result and "execution_id" in node_data and not node_data["execution_id"]:
+                        prev_output = prev_result.get("output") if isinstance(prev_result, dict) else None
+                        if isinstance(prev_output, dict) and "execution_id" in prev_output:
+                            node_data["execution_id"] = prev_output["execution_id"]
+                            logger.info(
+                                "[process_node] execution_id가 비어있어 이전 노드 출력에서 자동으로 가져옴: %s",
+                                prev_output["execution_id"],
+                            )
+
+                    if trace:
+                        logger.info("[process_node] 준비된 노드 데이터: %s", node_data)
 
             # 항상 실제 노드를 실행합니다.
             # output_override는 UI에서 출력 미리보기를 표시하기 위한 용도이며,
             # 실제 실행을 건너뛰지 않습니다. 이는 예상치 못한 동작을 방지하고
             # 실제 노드의 부수 효과(파일 열기, API 호출 등)가 항상 실행되도록 보장합니다.
-            output_override = node_data.get("output_override")
-            if output_override is not None:
+            if trace and node_data.get("output_override") is not None:
                 logger.info(
                     "[process_node] output_override가 설정되어 있지만 실제 노드를 실행합니다. "
                     "(output_override는 UI 미리보기용이며 실행을 건너뛰지 않습니다)"
                 )
 
-            # 액션 실행 (항상 실제 실행)
-            node_type_str = str(node_type) if node_type else "unknown"
-            result = await self.process_action(node_type_str, node_data, action_node_type)
-            logger.debug(f"process_action 결과: {result}")
-
-            # 결과가 None이면 기본값으로 변환
-            if result is None:
-                result = {"action": node_type, "status": "completed", "output": None}
-
-            # 결과가 dict가 아니면 dict로 변환
-            if not isinstance(result, dict):
-                result = {"action": node_type, "status": "completed", "output": result}
-
-            # output 필드가 없으면 추가
-            if "output" not in result:
-                result["output"] = None
-
-            # 메타데이터를 결과에 추가
-            if execution_id is not None:
-                result["_execution_id"] = execution_id
-            if script_id is not None:
-                result["_script_id"] = script_id
-            result["_node_id"] = node_id
-            if node_name:
-                result["_node_name"] = node_name
+            # 액션 실행 (항상 실제 실행) 후 결과를 표준 형식으로 정규화
+            with tracer.span("handler", handler=descriptor.label):
+                raw_result = await descriptor.handler(node_data)
+            with tracer.span("result_normalization"):
+                result = descriptor.normalize(raw_result)
+
+                # output 필드가 없으면 추가
+                if "output" not in result:
+                    result["output"] = None
+
+                # 메타데이터를 결과에 추가
+                if execution_id is not None:
+                    result["_execution_id"] = execution_id
+                if script_id is not None:
+                    result["_script_id"] = script_id
+                result["_node_id"] = node_id
+                if node_name:
+                    result["_node_name"] = node_name
 
             # 컨텍스트에 항상 결과 저장
             if context:
                 context.add_node_result(node_id, node_name, result)
 
-            logger.debug(f"process_node 최종 결과: {result}")
+            if trace:
+                logger.info("[process_node] 최종 결과: %s", result)
+            node_span.set("status", result.get("status"))
             return result
         except Exception as e:
+            node_span.set("status", "failed")
             # 예외 발생 시 에러 로그 출력
-            logger.error(f"process_node 에러: {e}")
-            import traceback
+            logger.error("process_node 에러: %s", e)
 
             # 스택 트레이스 출력 (디버깅용)
-            logger.error(f"process_node 스택 트레이스: {traceback.format_exc()}")
+            logger.error("process_node 스택 트레이스: %s", traceback.format_exc())
 
             # 에러 발생 시에도 결과 반환 (표준 형식으로 에러 결과 생성)
             # error_result: 에러 정보를 포함한 표준 형식의 결과
@@ -383,3 +510,5 @@ class ActionService:
 
             # 예외 재발생 (상위에서 처리하도록)
             raise e
+        finally:
+            node_span.close()
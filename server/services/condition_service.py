@@ -7,13 +7,42 @@ from typing import Any
 
 from log import log_manager
 from services.node_execution_context import NodeExecutionContext
+from utils import CompiledCondition, ParameterPlan
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
+
+# 조건을 정의하는 파라미터 키 (하나라도 경로 문자열이면 실행 시 값이 정해지므로 미리 컴파일할 수 없음)
+CONDITION_PARAMETER_KEYS = frozenset(("condition_type", "field_path", "compare_value"))
 
 
 class ConditionService:
     """조건 노드 처리 서비스 클래스"""
 
+    @staticmethod
+    def compile_condition_plan(node_data: dict[str, Any], plan: ParameterPlan) -> ParameterPlan:
+        """
+        조건 노드의 조건을 실행 계획을 만들 때 한 번만 컴파일하여 파라미터 해석 계획에 보관합니다.
+
+        조건 파라미터가 경로 문자열(동적)이면 실행마다 값이 달라지므로 컴파일하지 않고,
+        조건 노드가 실행 시 get_compiled_condition으로 컴파일합니다.
+
+        Args:
+            node_data: 노드 데이터 딕셔너리 (해석 전 원본 값)
+            plan: 노드의 파라미터 해석 계획
+
+        Returns:
+            컴파일된 조건을 보관한 계획 (컴파일할 수 없으면 전달받은 계획 그대로)
+        """
+        if CONDITION_PARAMETER_KEYS.intersection(plan.dynamic_keys):
+            return plan
+        # 조건 노드의 파라미터 기본값/변환과 동일하게 컴파일 (ConditionNode.execute 참고)
+        condition = CompiledCondition(
+            str(node_data.get("condition_type", "equals")),
+            str(node_data.get("field_path") or ""),
+            node_data.get("compare_value", ""),
+        )
+        return plan.with_condition(condition)
+
     @staticmethod
     def prepare_condition_node_data(node_data: dict[str, Any], context: NodeExecutionContext | None) -> dict[str, Any]:
         """
@@ -40,7 +69,7 @@ class ConditionService:
             # 이전 노드의 output 필드를 previous_output으로 추가
             # output 필드가 있으면 그것을 사용, 없으면 전체 결과를 사용
             node_data["previous_output"] = previous_result.get("output", previous_result)
-            logger.debug(f"[ConditionService] 조건 노드에 이전 노드 출력 주입: {node_data.get('previous_output')}")
+            logger.debug("[ConditionService] 조건 노드에 이전 노드 출력 주입: %s", node_data.get("previous_output"))
         else:
             # 이전 노드 결과가 없으면 경고 출력 (조건 평가 시 False 반환됨)
             logger.warning("[ConditionService] 이전 노드의 결과를 찾을 수 없습니다.")
@@ -1,13 +1,21 @@
 """
 노드 실행 컨텍스트 관리
 노드 간 데이터 전달을 위한 컨텍스트 클래스
+
+메모리 관리:
+    컨텍스트는 이후 노드에서 참조될 수 있는 결과만 보관합니다.
+    - 이전 노드 결과 (get_previous_node_result): 항상 마지막으로 추가된 결과 1개
+    - 이름/ID 참조 (nodes.이름 경로): 파라미터 해석 계획에서 참조하는 노드의 결과
+    그 외 결과는 다음 노드 결과가 추가될 때 해제되고, 노드별 상태(status)만 남습니다.
+    노드별 상태와 이름 매핑은 노드 개수만큼만 커지므로 반복 실행 횟수와 관계없이 메모리가 일정합니다.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 class NodeExecutionContext:
@@ -16,19 +24,32 @@ class NodeExecutionContext:
     이전 노드들의 실행 결과를 저장하고 관리합니다.
     """
 
-    def __init__(self) -> None:
-        """컨텍스트 초기화"""
+    def __init__(self, retained_refs: Iterable[str] | None = None) -> None:
+        """
+        컨텍스트 초기화
+
+        Args:
+            retained_refs: 이후 노드에서 이름/ID로 참조하는 노드 이름 또는 ID 목록
+                (None이면 모든 결과를 보관 - 참조 정보가 없는 경우의 기존 동작)
+        """
         # 노드별 실행 결과 저장: {node_id: {result_data}}
         # key: 노드 ID, value: 노드 실행 결과 (표준 형식: {action, status, output})
+        # 참조될 수 있는 결과만 보관 (retained_refs 참고)
         self.node_results: dict[str, dict[str, Any]] = {}
 
         # 노드 이름으로 ID 찾기: {node_name: node_id}
         # key: 노드 이름, value: 노드 ID (이름으로 노드를 찾을 때 사용)
         self.node_name_map: dict[str, str] = {}
 
-        # 실행 순서 저장
-        # 노드가 실행된 순서대로 노드 ID를 저장 (이전 노드 찾기용)
-        self.execution_order: list[str] = []
+        # 노드 ID로 이름 찾기: {node_id: node_name} (결과 보관 여부 판단용)
+        self._node_id_names: dict[str, str] = {}
+
+        # 노드별 마지막 실행 상태: {node_id: status}
+        # 처음 실행된 순서대로 유지되므로 실행 순서 역할도 함 (dict는 삽입 순서 보장, O(1) 갱신)
+        self.node_statuses: dict[str, Any] = {}
+
+        # 마지막으로 결과가 추가된 노드 ID (다음 노드의 이전 노드)
+        self.last_node_id: str | None = None
 
         # 현재 실행 중인 노드 ID
         # 현재 실행 중인 노드의 ID (디버깅 및 로깅용)
@@ -38,27 +59,50 @@ class NodeExecutionContext:
         # 워크플로우 전체에서 공유할 데이터 (향후 확장용)
         self.workflow_data: dict[str, Any] = {}
 
+        # 이름/ID로 참조되는 노드 (None이면 모두 보관)
+        self.retained_refs: frozenset[str] | None = frozenset(retained_refs) if retained_refs is not None else None
+
+    @property
+    def execution_order(self) -> list[str]:
+        """노드가 처음 실행된 순서대로 노드 ID 목록을 반환합니다."""
+        return list(self.node_statuses)
+
+    def _is_retained(self, node_id: str) -> bool:
+        """노드 결과를 이후 노드에서 이름/ID로 참조할 수 있는지 확인합니다."""
+        refs = self.retained_refs
+        if refs is None or node_id in refs:
+            return True
+        node_name = self._node_id_names.get(node_id)
+        return node_name is not None and node_name in refs
+
     def add_node_result(self, node_id: str, node_name: str | None, result: dict[str, Any]) -> None:
         """
         노드 실행 결과를 추가합니다.
 
+        직전 노드의 결과는 이후 노드에서 참조되지 않으면 해제됩니다.
+
         Args:
             node_id: 노드 ID
             node_name: 노드 이름 (선택적)
             result: 노드 실행 결과
         """
+        previous_node_id = self.last_node_id
+
         # 노드 실행 결과 저장
         self.node_results[node_id] = result
+        self.node_statuses[node_id] = result.get("status") if isinstance(result, dict) else None
+        self.last_node_id = node_id
 
         # 노드 이름이 있으면 이름-ID 매핑 추가
         if node_name:
             self.node_name_map[node_name] = node_id
+            self._node_id_names[node_id] = node_name
 
-        # 실행 순서에 노드 ID 추가 (중복 방지)
-        if node_id not in self.execution_order:
-            self.execution_order.append(node_id)
+        # 직전 노드 결과가 더 이상 참조될 수 없으면 해제 (상태는 node_statuses에 남음)
+        if previous_node_id is not None and previous_node_id != node_id and not self._is_retained(previous_node_id):
+            self.node_results.pop(previous_node_id, None)
 
-        logger.debug(f"노드 실행 결과 추가: {node_id} ({node_name})")
+        logger.debug("노드 실행 결과 추가: %s (%s)", node_id, node_name)
 
     def get_node_result(self, node_id: str | None = None) -> dict[str, Any] | None:
         """
@@ -68,17 +112,11 @@ class NodeExecutionContext:
             node_id: 노드 ID (None이면 현재 노드의 이전 노드 결과 반환)
 
         Returns:
-            노드 실행 결과 또는 None
+            노드 실행 결과 또는 None (참조되지 않아 해제된 결과도 None)
         """
-        # node_id가 None이면 현재 노드의 이전 노드 결과 반환
+        # node_id가 None이면 이전 노드(마지막으로 추가된 노드)의 결과 반환
         if node_id is None:
-            # 실행 순서가 있으면 마지막 노드(이전 노드)의 결과 반환
-            if len(self.execution_order) > 0:
-                # prev_node_id: 이전 노드 ID (실행 순서의 마지막 요소)
-                prev_node_id = self.execution_order[-1]
-                return self.node_results.get(prev_node_id)
-            # 실행 순서가 없으면 None 반환
-            return None
+            return self.get_previous_node_result()
 
         # node_id가 지정되었으면 해당 노드의 결과 반환
         return self.node_results.get(node_id)
@@ -103,39 +141,39 @@ class NodeExecutionContext:
         이전 노드의 실행 결과를 가져옵니다.
 
         Returns:
-            이전 노드의 실행 결과 또는 None
+            이전 노드(마지막으로 결과가 추가된 노드)의 실행 결과 또는 None
         """
-        # 실행 순서가 있으면 마지막 노드(이전 노드)의 결과 반환
-        if len(self.execution_order) > 0:
-            # prev_node_id: 이전 노드 ID (실행 순서의 마지막 요소)
-            prev_node_id = self.execution_order[-1]
-            return self.node_results.get(prev_node_id)
-        # 실행 순서가 없으면 None 반환
-        return None
+        if self.last_node_id is None:
+            return None
+        return self.node_results.get(self.last_node_id)
 
     def set_current_node(self, node_id: str) -> None:
         """현재 실행 중인 노드 설정"""
         self.current_node_id = node_id
 
     def get_all_results(self) -> dict[str, dict[str, Any]]:
-        """모든 노드의 실행 결과를 반환합니다."""
+        """보관 중인 모든 노드의 실행 결과를 반환합니다."""
         return self.node_results.copy()
 
     def clear(self) -> None:
         """컨텍스트 초기화"""
         self.node_results.clear()
         self.node_name_map.clear()
-        self.execution_order.clear()
+        self._node_id_names.clear()
+        self.node_statuses.clear()
+        self.last_node_id = None
         self.current_node_id = None
         self.workflow_data.clear()
         logger.debug("노드 실행 컨텍스트 초기화됨")
 
     def to_dict(self) -> dict[str, Any]:
-        """컨텍스트를 딕셔너리로 변환합니다."""
+        """컨텍스트를 딕셔너리로 변환합니다. (디버깅용)"""
         return {
             "node_results": self.node_results,
             "node_name_map": self.node_name_map,
+            "node_statuses": self.node_statuses,
             "execution_order": self.execution_order,
+            "last_node_id": self.last_node_id,
             "current_node_id": self.current_node_id,
             "workflow_data": self.workflow_data,
         }
@@ -146,7 +184,16 @@ class NodeExecutionContext:
         context = cls()
         context.node_results = data.get("node_results", {})
         context.node_name_map = data.get("node_name_map", {})
-        context.execution_order = data.get("execution_order", [])
+        context._node_id_names = {node_id: name for name, node_id in context.node_name_map.items()}
+        # 상태 정보가 없는 이전 형식은 실행 순서와 결과로 복원
+        node_statuses = data.get("node_statuses")
+        if node_statuses is None:
+            node_statuses = {
+                node_id: (context.node_results.get(node_id) or {}).get("status")
+                for node_id in data.get("execution_order", [])
+            }
+        context.node_statuses = node_statuses
+        context.last_node_id = data.get("last_node_id") or next(reversed(node_statuses), None)
         context.current_node_id = data.get("current_node_id")
         context.workflow_data = data.get("workflow_data", {})
         return context
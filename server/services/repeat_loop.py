@@ -0,0 +1,334 @@
+"""
+반복 실행 계획
+반복 노드의 아래 연결점(bottom)에 연결된 노드 체인(반복 본문)을 한 번만 컴파일하고 지정한 횟수만큼 실행합니다.
+
+연결 규칙 (NodeRepository.validate_connections와 동일):
+    - 반복 노드의 아래 연결점(bottom)은 반복 본문의 시작이며 출력으로 카운트하지 않습니다.
+    - 반복 노드의 일반 출력은 반복이 끝난 뒤 이어서 실행할 노드입니다.
+    - 반복 본문은 bottom 연결 노드부터 일반 출력을 따라가며, 출력이 없는 노드에서 끝납니다.
+
+메모리 관리:
+    반복마다 결과를 모두 쌓지 않고 집계(반복/노드별 성공·실패 횟수, 앞쪽 실패 일부, 마지막 K회 결과)만 유지하므로
+    반복 횟수와 관계없이 메모리가 반복 본문 크기에 비례합니다.
+"""
+
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from log import log_manager
+from utils.field_path_resolver import ParameterPlan
+
+logger = log_manager.get_logger(__name__)
+
+# 반복 노드 결과에 남길 마지막 반복 결과 개수
+DEFAULT_LAST_ITERATIONS = 3
+# 집계에 기록할 실패 정보 최대 개수 (이후 실패는 개수만 센다)
+MAX_RECORDED_FAILURES = 20
+
+# 반복 노드의 아래 연결점(반복 본문 시작) 출력 타입
+REPEAT_BODY_OUTPUT_TYPE = "bottom"
+
+
+def is_failed_result(result: dict[str, Any]) -> bool:
+    """노드 실행 결과가 실패인지 확인합니다. (status가 failed이거나 error 필드가 있는 경우)"""
+    return result.get("status") == "failed" or bool(result.get("error"))
+
+
+class PlanNode:
+    """
+    실행 계획의 노드 단계
+    노드 데이터와 미리 컴파일된 파라미터 해석 계획을 함께 보관합니다.
+    """
+
+    __slots__ = ("index", "node", "node_id", "node_name", "node_type", "plan")
+
+    def __init__(self, node: dict[str, Any], index: int, plan: ParameterPlan | None) -> None:
+        """
+        Args:
+            node: 노드 데이터
+            index: 요청 노드 목록에서의 위치 (노드 순번 표시용)
+            plan: 미리 컴파일된 파라미터 해석 계획
+        """
+        data = node.get("data") or {}
+        self.node = node
+        self.index = index
+        self.node_id: str = node.get("id", f"node_{index}")
+        self.node_type: str = node.get("type", "unknown")
+        self.node_name: str | None = data.get("title") or data.get("name")
+        self.plan = plan
+
+
+class RepeatLoopSummary:
+    """
+    반복 실행 집계
+    반복 횟수와 관계없이 일정한 크기를 유지합니다.
+    """
+
+    __slots__ = (
+        "completed_iterations",
+        "failed_iterations",
+        "failure_count",
+        "failures",
+        "last_iterations",
+        "node_counts",
+        "repeat_node_id",
+        "total_iterations",
+    )
+
+    def __init__(
+        self, repeat_node_id: str | None, total_iterations: int, last_k: int = DEFAULT_LAST_ITERATIONS
+    ) -> None:
+        self.repeat_node_id = repeat_node_id
+        self.total_iterations = total_iterations
+        # 실제로 실행된 반복 수 / 실패 노드가 하나라도 있었던 반복 수
+        self.completed_iterations = 0
+        self.failed_iterations = 0
+        # 노드별 성공/실패 횟수: {node_id: {"completed": n, "failed": n}}
+        self.node_counts: dict[str, dict[str, int]] = {}
+        # 전체 실패 횟수와 앞쪽 실패 정보 (MAX_RECORDED_FAILURES개까지)
+        self.failure_count = 0
+        self.failures: list[dict[str, Any]] = []
+        # 마지막 K회 반복 결과
+        self.last_iterations: deque[dict[str, Any]] = deque(maxlen=max(last_k, 1))
+
+    def record(self, iteration: int, results: list[dict[str, Any]]) -> None:
+        """
+        한 번의 반복 결과를 집계에 반영합니다.
+
+        Args:
+            iteration: 반복 번호 (1부터 시작)
+            results: 반복 본문의 노드 실행 결과 목록
+        """
+        iteration_failed = False
+        for result in results:
+            node_id = result.get("_node_id") or result.get("node_id") or "unknown"
+            counts = self.node_counts.get(node_id)
+            if counts is None:
+                counts = self.node_counts[node_id] = {"completed": 0, "failed": 0}
+
+            if is_failed_result(result):
+                counts["failed"] += 1
+                iteration_failed = True
+                self.failure_count += 1
+                if len(self.failures) < MAX_RECORDED_FAILURES:
+                    self.failures.append(
+                        {
+                            "iteration": iteration,
+                            "node_id": node_id,
+                            "error": result.get("error") or result.get("message"),
+                        }
+                    )
+            else:
+                counts["completed"] += 1
+
+        self.completed_iterations += 1
+        if iteration_failed:
+            self.failed_iterations += 1
+        self.last_iterations.append({"iteration": iteration, "results": results})
+
+    @property
+    def last_results(self) -> list[dict[str, Any]]:
+        """마지막 반복의 노드 실행 결과 목록"""
+        return self.last_iterations[-1]["results"] if self.last_iterations else []
+
+    def to_dict(self) -> dict[str, Any]:
+        """집계를 응답용 딕셔너리로 변환합니다. (마지막 K회 결과는 포함하지 않음)"""
+        return {
+            "repeat_node_id": self.repeat_node_id,
+            "total_iterations": self.total_iterations,
+            "completed_iterations": self.completed_iterations,
+            "failed_iterations": self.failed_iterations,
+            "failure_count": self.failure_count,
+            "failures": self.failures,
+            "node_counts": self.node_counts,
+        }
+
+
+# 노드 하나를 실행하는 함수: (노드 단계, 반복 정보 (현재 반복, 전체 반복) 또는 None) -> 표준 결과 dict
+NodeRunner = Callable[[PlanNode, "tuple[int, int] | None"], Awaitable[dict[str, Any]]]
+
+
+class RepeatLoop:
+    """
+    반복 실행 단계
+    반복 노드와 한 번만 컴파일된 반복 본문을 보관합니다.
+    """
+
+    __slots__ = ("body", "repeat_node", "repeat_node_id")
+
+    def __init__(self, repeat_node: PlanNode | None, body: list["PlanStep"], repeat_node_id: str | None = None) -> None:
+        """
+        Args:
+            repeat_node: 반복 노드 단계 (None이면 반복 횟수를 외부에서 지정 - repeat_info 요청)
+            body: 반복 본문 실행 단계 목록
+            repeat_node_id: 반복 노드 ID (repeat_node가 없을 때 집계 표시용)
+        """
+        self.repeat_node = repeat_node
+        self.body = body
+        self.repeat_node_id = repeat_node.node_id if repeat_node else repeat_node_id
+
+    async def run(
+        self, runner: NodeRunner, repeat_count: int, last_k: int = DEFAULT_LAST_ITERATIONS
+    ) -> RepeatLoopSummary:
+        """
+        반복 본문을 repeat_count번 실행하고 집계를 반환합니다.
+
+        Args:
+            runner: 노드 하나를 실행하는 함수
+            repeat_count: 반복 횟수
+            last_k: 집계에 남길 마지막 반복 결과 개수
+
+        Returns:
+            RepeatLoopSummary 인스턴스
+        """
+        summary = RepeatLoopSummary(self.repeat_node_id, repeat_count, last_k)
+        logger.info("[RepeatLoop] 반복 실행 시작 - 반복 노드: %s, 반복 횟수: %s", self.repeat_node_id, repeat_count)
+        for iteration in range(1, repeat_count + 1):
+            results = await run_steps(self.body, runner, (iteration, repeat_count))
+            summary.record(iteration, results)
+        logger.info(
+            "[RepeatLoop] 반복 실행 완료 - 반복 노드: %s, %s회 실행, 실패 반복: %s회",
+            self.repeat_node_id,
+            summary.completed_iterations,
+            summary.failed_iterations,
+        )
+        return summary
+
+    async def execute(self, runner: NodeRunner, iteration: tuple[int, int] | None = None) -> dict[str, Any]:
+        """
+        반복 노드를 실행한 뒤 반복 횟수만큼 본문을 실행합니다.
+
+        반복 노드 결과의 output에 집계(summary)와 마지막 K회 결과(iterations)를 채워 반환합니다.
+
+        Args:
+            runner: 노드 하나를 실행하는 함수
+            iteration: 바깥 반복 정보 (중첩 반복일 때)
+
+        Returns:
+            반복 노드 실행 결과 (표준 형식)
+        """
+        if self.repeat_node is None:
+            raise ValueError("반복 노드가 없는 반복 단계는 run()으로 실행해야 합니다.")
+        result = await runner(self.repeat_node, iteration)
+        output = result.get("output")
+        if is_failed_result(result) or not isinstance(output, dict):
+            return result
+
+        repeat_count = output.get("repeat_count", 1)
+        summary = await self.run(runner, repeat_count if isinstance(repeat_count, int) else 1)
+        output["iterations"] = list(summary.last_iterations)
+        output["summary"] = summary.to_dict()
+        output["completed"] = summary.completed_iterations == repeat_count
+        return result
+
+
+# 실행 계획 단계: 일반 노드 또는 반복 단계
+PlanStep = PlanNode | RepeatLoop
+
+
+async def run_steps(
+    steps: list[PlanStep], runner: NodeRunner, iteration: tuple[int, int] | None = None
+) -> list[dict[str, Any]]:
+    """
+    실행 계획 단계들을 순서대로 실행하고 각 단계의 결과 목록을 반환합니다.
+
+    Args:
+        steps: 실행 계획 단계 목록
+        runner: 노드 하나를 실행하는 함수
+        iteration: 반복 정보 (현재 반복, 전체 반복) - 반복 본문 실행 시
+
+    Returns:
+        단계별 실행 결과 목록 (반복 단계는 집계가 채워진 반복 노드 결과 1개)
+    """
+    results = []
+    for step in steps:
+        if isinstance(step, RepeatLoop):
+            results.append(await step.execute(runner, iteration))
+        else:
+            results.append(await runner(step, iteration))
+    return results
+
+
+def collect_repeat_body(repeat_node_id: str, connections: list[dict[str, Any]]) -> list[str]:
+    """
+    반복 노드의 아래 연결점에 연결된 노드 체인(반복 본문)의 노드 ID 목록을 반환합니다.
+
+    bottom 연결 노드부터 일반 출력(조건 노드의 true/false 제외)을 따라가며,
+    출력이 없거나 반복 노드로 돌아오는 노드에서 끝납니다. (클라이언트 반복 실행과 같은 규칙)
+
+    Args:
+        repeat_node_id: 반복 노드 ID
+        connections: 연결 정보 목록 ({from, to, outputType})
+
+    Returns:
+        반복 본문 노드 ID 목록 (실행 순서)
+    """
+    body_start = None
+    next_node: dict[str, str] = {}
+    for connection in connections:
+        from_node_id = connection.get("from")
+        to_node_id = connection.get("to")
+        output_type = connection.get("outputType")
+        if from_node_id == repeat_node_id and output_type == REPEAT_BODY_OUTPUT_TYPE:
+            body_start = body_start or to_node_id
+        elif (not output_type or output_type == "output") and from_node_id not in next_node:
+            next_node[from_node_id] = to_node_id
+
+    body: list[str] = []
+    visited = {repeat_node_id}
+    current = body_start
+    while current and current not in visited:
+        visited.add(current)
+        body.append(current)
+        current = next_node.get(current)
+    return body
+
+
+def compile_execution_plan(
+    nodes: list[dict[str, Any]],
+    parameter_plans: dict[str, ParameterPlan],
+    connections: list[dict[str, Any]] | None = None,
+) -> list[PlanStep]:
+    """
+    요청 노드 목록을 실행 계획으로 컴파일합니다.
+
+    연결 정보가 있으면 반복 노드의 반복 본문을 반복 단계(RepeatLoop)로 묶고,
+    반복 본문에 속한 노드는 최상위 순서에서 제외합니다. 연결 정보가 없으면 노드 목록 순서대로 실행합니다.
+
+    Args:
+        nodes: 요청 노드 목록 (실행 순서)
+        parameter_plans: 노드 ID별 파라미터 해석 계획
+        connections: 연결 정보 목록 (선택)
+
+    Returns:
+        실행 계획 단계 목록
+    """
+    plan_nodes = [PlanNode(node, i, None) for i, node in enumerate(nodes)]
+    for plan_node in plan_nodes:
+        plan_node.plan = parameter_plans.get(plan_node.node_id)
+
+    if not connections:
+        return list(plan_nodes)
+
+    by_id = {plan_node.node_id: plan_node for plan_node in plan_nodes}
+    in_body: set[str] = set()
+
+    def build(plan_node: PlanNode, ancestors: frozenset[str]) -> PlanStep:
+        if plan_node.node_type != "repeat" or plan_node.node_id in ancestors:
+            return plan_node
+        body_ids = [node_id for node_id in collect_repeat_body(plan_node.node_id, connections) if node_id in by_id]
+        if not body_ids:
+            return plan_node
+        in_body.update(body_ids)
+        inner = ancestors | {plan_node.node_id}
+        return RepeatLoop(plan_node, [build(by_id[node_id], inner) for node_id in body_ids])
+
+    steps = [build(plan_node, frozenset()) for plan_node in plan_nodes]
+    # 반복 본문에 속한 노드(중첩 반복 포함)는 반복 단계 안에서만 실행
+    return [step for step in steps if _step_node_id(step) not in in_body]
+
+
+def _step_node_id(step: PlanStep) -> str | None:
+    """실행 계획 단계의 노드 ID (반복 단계는 반복 노드 ID)"""
+    return step.repeat_node_id if isinstance(step, RepeatLoop) else step.node_id
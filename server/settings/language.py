@@ -6,7 +6,7 @@
 from db.database import db_manager
 from log import log_manager
 
-logger = log_manager.logger
+logger = log_manager.get_logger(__name__)
 
 
 def get_language(default: str = "en") -> str:
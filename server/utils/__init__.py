@@ -2,7 +2,16 @@
 공통 유틸리티 모듈
 """
 
-from .field_path_resolver import resolve_field_path, resolve_parameter_paths
+from .condition_predicate import CompiledCondition, compile_condition, compile_condition_node, get_compiled_condition
+from .field_path_resolver import (
+    FieldPathAccessor,
+    ParameterPlan,
+    compile_field_path,
+    compile_parameter_plan,
+    compile_relative_path,
+    resolve_field_path,
+    resolve_parameter_paths,
+)
 from .parameter_validator import get_parameter, validate_parameters
 from .result_formatter import (
     create_failed_result,
@@ -13,9 +22,18 @@ from .result_formatter import (
 from .time_utils import get_korea_time_str
 
 __all__ = [
+    "CompiledCondition",
+    "FieldPathAccessor",
+    "ParameterPlan",
+    "compile_condition",
+    "compile_condition_node",
+    "compile_field_path",
+    "compile_parameter_plan",
+    "compile_relative_path",
     "create_failed_result",
     "create_success_result",
     "ensure_output_is_dict",
+    "get_compiled_condition",
     "get_korea_time_str",
     "get_parameter",
     "normalize_result",
@@ -0,0 +1,241 @@
+"""
+조건 평가 유틸리티
+조건 타입과 비교값을 미리 컴파일하여 값 하나를 받아 True/False를 반환하는 함수(술어)로 만듭니다.
+
+비교값 변환(float(), str())은 컴파일할 때 한 번만 수행되고,
+평가 시에는 조건 타입 문자열 비교 없이 컴파일된 함수만 호출합니다.
+같은 (조건 타입, 비교값) 조합은 캐시되어 재사용됩니다.
+
+조건 타입:
+- equals / not_equals: 문자열로 변환하여 비교
+- contains / not_contains: 비교값이 실제 값(문자열 변환)에 포함되는지 확인
+- greater_than / less_than / greater_or_equal / less_or_equal: 숫자로 변환하여 비교 (변환 실패 시 False)
+- is_empty / is_not_empty: None, 빈 문자열, 빈 리스트/딕셔너리 여부
+- always_true / always_false / random: 실제 값과 무관한 조건 (워크플로우 엔진용)
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+import operator
+import random
+from typing import Any
+
+from .field_path_resolver import FieldPathAccessor, compile_relative_path
+
+# 컴파일된 조건 술어: 실제 값을 받아 조건 만족 여부를 반환
+ConditionPredicate = Callable[[Any], bool]
+
+# 컴파일 캐시 크기 (워크플로우의 조건 종류는 많지 않으므로 충분함)
+_COMPILE_CACHE_SIZE = 1024
+
+# 숫자 비교 조건 타입 -> 비교 연산자
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    "greater_than": operator.gt,
+    "less_than": operator.lt,
+    "greater_or_equal": operator.ge,
+    "less_or_equal": operator.le,
+}
+
+
+def _always_true(_actual_value: Any) -> bool:
+    return True
+
+
+def _always_false(_actual_value: Any) -> bool:
+    return False
+
+
+def _random_choice(_actual_value: Any) -> bool:
+    return random.random() < 0.5
+
+
+def _is_empty(actual_value: Any) -> bool:
+    # None, 빈 문자열, 빈 리스트/딕셔너리인 경우
+    return actual_value is None or actual_value == "" or (isinstance(actual_value, (list, dict)) and not actual_value)
+
+
+def _is_not_empty(actual_value: Any) -> bool:
+    return not _is_empty(actual_value)
+
+
+def _build_numeric(compare: Callable[[float, float], bool], compare_value: Any) -> ConditionPredicate:
+    """숫자 비교 술어 생성 (비교값은 여기서 한 번만 float로 변환)"""
+    try:
+        target = float(compare_value)
+    except (ValueError, TypeError):
+        # 비교값이 숫자가 아니면 어떤 값이 와도 False
+        return _always_false
+
+    def predicate(actual_value: Any) -> bool:
+        try:
+            return compare(float(actual_value), target)
+        except (ValueError, TypeError):
+            # 숫자로 변환할 수 없으면 False 반환
+            return False
+
+    return predicate
+
+
+def _build_predicate(condition_type: str, compare_value: Any, default: bool) -> ConditionPredicate:
+    """조건 타입별 술어 생성"""
+    numeric = _NUMERIC_OPERATORS.get(condition_type)
+    if numeric is not None:
+        return _build_numeric(numeric, compare_value)
+
+    if condition_type in ("equals", "not_equals", "contains", "not_contains"):
+        target = str(compare_value)
+        if condition_type == "equals":
+            return lambda actual_value: str(actual_value) == target
+        if condition_type == "not_equals":
+            return lambda actual_value: str(actual_value) != target
+        if condition_type == "contains":
+            return lambda actual_value: target in str(actual_value)
+        return lambda actual_value: target not in str(actual_value)
+
+    if condition_type == "is_empty":
+        return _is_empty
+    if condition_type == "is_not_empty":
+        return _is_not_empty
+    if condition_type == "always_true":
+        return _always_true
+    if condition_type == "always_false":
+        return _always_false
+    if condition_type == "random":
+        return _random_choice
+
+    # 알 수 없는 조건 타입은 기본값 반환
+    return _always_true if default else _always_false
+
+
+# typed=True: 1, 1.0, True는 문자열 비교 결과가 다르므로 서로 다른 캐시 키로 취급
+@lru_cache(maxsize=_COMPILE_CACHE_SIZE, typed=True)
+def _compile_condition_cached(condition_type: str, compare_value: Any, default: bool) -> ConditionPredicate:
+    return _build_predicate(condition_type, compare_value, default)
+
+
+def compile_condition(condition_type: str, compare_value: Any = "", default: bool = False) -> ConditionPredicate:
+    """
+    조건 타입과 비교값을 술어 함수로 컴파일합니다.
+
+    Args:
+        condition_type: 조건 타입 (equals, greater_than, is_empty 등)
+        compare_value: 비교할 값 (숫자 비교 조건은 컴파일 시 float로 변환)
+        default: 알 수 없는 조건 타입일 때의 평가 결과
+
+    Returns:
+        실제 값을 받아 True/False를 반환하는 함수
+    """
+    try:
+        return _compile_condition_cached(condition_type, compare_value, default)
+    except TypeError:
+        # 비교값이 해시 불가능한 타입(리스트 등)이면 캐시 없이 컴파일
+        return _build_predicate(condition_type, compare_value, default)
+
+
+class CompiledCondition:
+    """
+    컴파일된 조건
+    필드 경로 접근자와 조건 술어를 함께 보관합니다. (조건 노드 하나당 한 번 컴파일)
+    """
+
+    __slots__ = ("_check", "accessor", "compare_value", "condition_type", "field_path", "predicate")
+
+    def __init__(
+        self, condition_type: str, field_path: str = "", compare_value: Any = "", default: bool = False
+    ) -> None:
+        """
+        Args:
+            condition_type: 조건 타입
+            field_path: 입력 값에서 비교할 필드 경로 (비어 있으면 입력 값 전체를 비교)
+            compare_value: 비교할 값
+            default: 알 수 없는 조건 타입일 때의 평가 결과
+        """
+        self.condition_type = condition_type
+        self.field_path = field_path
+        self.compare_value = compare_value
+        self.accessor: FieldPathAccessor | None = compile_relative_path(str(field_path)) if field_path else None
+        self.predicate = compile_condition(condition_type, compare_value, default)
+        # 필드 추출과 조건 평가를 하나의 함수로 합성 (평가 시 분기/속성 조회 최소화)
+        self._check = self._compose()
+
+    def _compose(self) -> ConditionPredicate:
+        """필드 경로 형태에 맞춰 (값 -> 필드 추출 -> 술어) 함수를 합성합니다."""
+        predicate = self.predicate
+        if not self.field_path:
+            return predicate
+        accessor = self.accessor
+        if accessor is None:
+            # 경로 형식이 잘못되었으면 항상 None과 비교
+            return lambda _value: predicate(None)
+        steps = accessor.steps
+        if len(steps) == 1 and type(steps[0]) is str:
+            # 가장 흔한 단일 키 경로는 딕셔너리 조회 한 번으로 처리
+            key = steps[0]
+            return lambda value: predicate(value.get(key) if isinstance(value, dict) else None)
+        get_from = accessor.get_from
+        return lambda value: predicate(get_from(value))
+
+    def extract(self, value: Any) -> Any:
+        """입력 값에서 비교할 값을 추출합니다. (경로가 잘못되었거나 접근 불가능하면 None)"""
+        if not self.field_path:
+            return value
+        return self.accessor.get_from(value) if self.accessor is not None else None
+
+    def evaluate(self, value: Any) -> bool:
+        """입력 값에서 필드를 추출하여 조건을 평가합니다."""
+        return self._check(value)
+
+
+# (조건 타입, 필드 경로, 비교값 타입, 비교값, 기본값) -> CompiledCondition
+_CONDITION_CACHE: dict[tuple[Any, ...], CompiledCondition] = {}
+
+
+def get_compiled_condition(
+    condition_type: str, field_path: str = "", compare_value: Any = "", default: bool = False
+) -> CompiledCondition:
+    """
+    캐시된 CompiledCondition을 반환합니다. (없으면 컴파일하여 캐시)
+
+    실행마다 파라미터로 조건을 받는 조건 노드처럼, 미리 컴파일해 둘 곳이 없는 경우에 사용합니다.
+    조회는 딕셔너리 한 번이므로 조건 타입 비교 체인보다 저렴합니다.
+
+    Args:
+        condition_type: 조건 타입
+        field_path: 입력 값에서 비교할 필드 경로
+        compare_value: 비교할 값
+        default: 알 수 없는 조건 타입일 때의 평가 결과
+
+    Returns:
+        CompiledCondition 인스턴스
+    """
+    # 1, 1.0, True는 문자열 비교 결과가 다르므로 비교값 타입도 키에 포함
+    key = (condition_type, field_path, compare_value.__class__, compare_value, default)
+    try:
+        condition = _CONDITION_CACHE.get(key)
+    except TypeError:
+        # 비교값이 해시 불가능한 타입(리스트 등)이면 캐시 없이 컴파일
+        return CompiledCondition(condition_type, field_path, compare_value, default)
+    if condition is None:
+        if len(_CONDITION_CACHE) >= _COMPILE_CACHE_SIZE:
+            _CONDITION_CACHE.clear()
+        condition = _CONDITION_CACHE[key] = CompiledCondition(condition_type, field_path, compare_value, default)
+    return condition
+
+
+def compile_condition_node(node_data: dict[str, Any], default: bool = False) -> CompiledCondition:
+    """
+    조건 노드 데이터(condition_type, field_path, compare_value)를 컴파일합니다.
+
+    Args:
+        node_data: 조건 노드 데이터
+        default: 알 수 없는 조건 타입일 때의 평가 결과
+
+    Returns:
+        CompiledCondition 인스턴스
+    """
+    return CompiledCondition(
+        node_data.get("condition_type", "equals"),
+        node_data.get("field_path") or "",
+        node_data.get("compare_value", ""),
+        default,
+    )
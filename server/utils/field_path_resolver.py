@@ -5,14 +5,305 @@
 경로 형식:
 - outdata.output.execution_id: 이전 노드의 전체 결과에서 output.execution_id 접근
 - outdata.action: 이전 노드의 action 필드 접근
-- indata.parameter_name: 현재 노드의 입력 파라미터 접근 (향후 지원)
+- outdata.output.rows[0].name: 리스트 인덱스 접근 (outdata.output.rows.0.name 도 동일, 음수 인덱스 가능)
+- indata.parameter_name: 현재 노드의 입력 파라미터 접근
+- nodes.노드이름.output.value: 이름(또는 ID)으로 지정한 노드의 결과 접근
+  (이름에 점이나 공백이 있으면 nodes["노드 이름"].output.value)
+- output.data.xxx / output.xxx: 이전 형식 (outdata.output.xxx로 변환됨, 하위 호환성)
+
+경로 문자열은 한 번만 컴파일되어 FieldPathAccessor(키/인덱스 튜플)로 캐시됩니다.
+노드 파라미터도 ParameterPlan으로 컴파일하여 경로가 아닌(정적) 파라미터는 해석 단계를 건너뜁니다.
 """
 
-from typing import Any
+from functools import lru_cache
+import re
+from typing import TYPE_CHECKING, Any
 
 from log import log_manager
 
-logger = log_manager.logger
+if TYPE_CHECKING:
+    from .condition_predicate import CompiledCondition
+
+logger = log_manager.get_logger(__name__)
+
+# 경로 루트 종류
+ROOT_OUTDATA = "outdata"
+ROOT_INDATA = "indata"
+ROOT_NODES = "nodes"
+# 상대 경로 (조건 노드의 field_path처럼 특정 값에서 시작하는 경로)
+ROOT_VALUE = "value"
+
+# 경로 세그먼트: .key / [0] / ["key"] / ['key']
+_SEGMENT_PATTERN = re.compile(r"\.([^.\[\]]*)|\[(-?\d+)\]|\[\"([^\"]*)\"\]|\['([^']*)'\]")
+
+# 이전 형식 접두사 -> 새로운 형식 접두사 (긴 접두사부터 확인)
+_LEGACY_PREFIXES = (
+    ("output.data.output.", "outdata.output."),
+    ("output.data.", "outdata.output."),
+    ("output.", "outdata.output."),
+)
+
+# 컴파일 캐시 크기 (워크플로우의 경로 표현식 종류는 많지 않으므로 충분함)
+_COMPILE_CACHE_SIZE = 4096
+
+
+class FieldPathAccessor:
+    """
+    컴파일된 필드 경로
+
+    경로 문자열을 미리 (루트, 노드 참조, 키/인덱스 튜플)로 분해해 두어
+    값을 가져올 때 문자열 분리나 접두사 비교를 하지 않습니다.
+    """
+
+    __slots__ = ("expression", "node_ref", "root", "steps")
+
+    def __init__(self, expression: str, root: str, steps: tuple[str | int, ...], node_ref: str | None = None) -> None:
+        """
+        FieldPathAccessor 초기화
+
+        Args:
+            expression: 원본 경로 문자열
+            root: 경로 루트 (outdata, indata, nodes, value)
+            steps: 루트 이후의 키(str)/인덱스(int) 튜플
+            node_ref: nodes 루트일 때 참조할 노드 이름 또는 ID
+        """
+        self.expression = expression
+        self.root = root
+        self.steps = steps
+        self.node_ref = node_ref
+
+    def __repr__(self) -> str:
+        return f"FieldPathAccessor({self.expression!r})"
+
+    def get(self, outdata: Any = None, indata: Any = None, context: Any = None) -> Any | None:
+        """
+        경로에 해당하는 값을 가져옵니다.
+
+        Args:
+            outdata: 이전 노드의 실행 결과 {action, status, output}
+            indata: 현재 노드의 입력 파라미터
+            context: 노드 실행 컨텍스트 (nodes 루트 경로 해석용, NodeExecutionContext)
+
+        Returns:
+            해석된 값 (경로를 따라갈 수 없으면 None)
+        """
+        root = self.root
+        if root == ROOT_OUTDATA:
+            value = outdata
+        elif root == ROOT_INDATA:
+            value = indata
+        elif root == ROOT_NODES:
+            if context is None:
+                return None
+            value = context.get_node_result_by_name(self.node_ref) or context.get_node_result(self.node_ref)
+        else:
+            value = outdata
+
+        if value is None:
+            return None
+        return self.get_from(value)
+
+    def get_from(self, value: Any) -> Any | None:
+        """
+        주어진 값에서 시작하여 키/인덱스를 따라간 값을 반환합니다.
+
+        Args:
+            value: 시작 값
+
+        Returns:
+            해석된 값 (경로를 따라갈 수 없으면 None)
+        """
+        for step in self.steps:
+            if type(step) is int:
+                if isinstance(value, (list, tuple)):
+                    if -len(value) <= step < len(value):
+                        value = value[step]
+                        continue
+                    return None
+                # 딕셔너리의 숫자 키("0")는 문자열 키로 접근
+                step = str(step)
+            if isinstance(value, dict):
+                value = value.get(step)
+            else:
+                # dict가 아니면 더 이상 접근 불가능하므로 None 반환
+                return None
+        return value
+
+
+def _parse_steps(expression: str, start: int) -> tuple[str | int, ...] | None:
+    """경로 문자열의 start 위치부터 세그먼트를 파싱합니다. 형식이 잘못되면 None을 반환합니다."""
+    steps: list[str | int] = []
+    position = start
+    length = len(expression)
+    while position < length:
+        match = _SEGMENT_PATTERN.match(expression, position)
+        if match is None:
+            return None
+        dotted, index, double_quoted, single_quoted = match.groups()
+        if dotted is not None:
+            # "outdata." 처럼 끝이 점이면 빈 세그먼트 -> 무시 (루트 전체)
+            if dotted:
+                steps.append(int(dotted) if dotted.lstrip("-").isdigit() else dotted)
+        elif index is not None:
+            steps.append(int(index))
+        else:
+            steps.append(double_quoted if double_quoted is not None else single_quoted)
+        position = match.end()
+    return tuple(steps)
+
+
+@lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def compile_field_path(expression: str) -> FieldPathAccessor | None:
+    """
+    경로 문자열을 FieldPathAccessor로 컴파일합니다. (결과는 캐시됨)
+
+    Args:
+        expression: 경로 문자열 (outdata./indata./nodes. 또는 이전 형식 output.)
+
+    Returns:
+        FieldPathAccessor 또는 None (경로 문자열이 아닌 경우)
+    """
+    path = expression
+    # 이전 형식을 새로운 형식으로 변환 (컴파일 시 한 번만 수행)
+    # "output.data.output.execution_id" -> "outdata.output.execution_id" (중복 output 제거)
+    # "output.data.execution_id" -> "outdata.output.execution_id"
+    # "output.execution_id" -> "outdata.output.execution_id"
+    if path.startswith("output."):
+        for legacy_prefix, new_prefix in _LEGACY_PREFIXES:
+            if path.startswith(legacy_prefix):
+                path = new_prefix + path[len(legacy_prefix) :]
+                break
+
+    if path.startswith("outdata."):
+        steps = _parse_steps(path, len("outdata"))
+        return FieldPathAccessor(expression, ROOT_OUTDATA, steps) if steps is not None else None
+
+    if path.startswith("indata."):
+        steps = _parse_steps(path, len("indata"))
+        return FieldPathAccessor(expression, ROOT_INDATA, steps) if steps is not None else None
+
+    if path.startswith(("nodes.", "nodes[")):
+        steps = _parse_steps(path, len("nodes"))
+        # 첫 세그먼트는 노드 이름/ID
+        if not steps:
+            return None
+        return FieldPathAccessor(expression, ROOT_NODES, steps[1:], node_ref=str(steps[0]))
+
+    return None
+
+
+@lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def compile_relative_path(path: str) -> FieldPathAccessor | None:
+    """
+    특정 값에서 시작하는 상대 경로를 컴파일합니다. (결과는 캐시됨)
+
+    조건 노드의 field_path처럼 루트 없이 "output.value", "rows[0].name" 형태로 쓰는 경로에 사용합니다.
+
+    Args:
+        path: 상대 경로 문자열
+
+    Returns:
+        FieldPathAccessor 또는 None (형식이 잘못된 경우)
+    """
+    steps = _parse_steps(path if path.startswith("[") else f".{path}", 0)
+    if steps is None:
+        return None
+    return FieldPathAccessor(path, ROOT_VALUE, steps)
+
+
+class ParameterPlan:
+    """
+    노드 파라미터 해석 계획
+
+    노드 파라미터 중 경로 문자열인(동적) 파라미터와 그 접근자를 미리 기록해 둡니다.
+    정적 파라미터는 해석 단계에서 다시 검사하지 않습니다.
+    조건 노드는 조건 파라미터가 정적이면 컴파일된 조건도 함께 보관하여 실행마다 컴파일/캐시 조회를 하지 않습니다.
+    """
+
+    __slots__ = ("condition", "dynamic", "needs_indata", "node_refs")
+
+    def __init__(
+        self, dynamic: tuple[tuple[str, FieldPathAccessor], ...], condition: "CompiledCondition | None" = None
+    ) -> None:
+        """
+        ParameterPlan 초기화
+
+        Args:
+            dynamic: (파라미터 키, 접근자) 튜플
+            condition: 미리 컴파일된 조건 (조건 노드, 조건 파라미터가 모두 정적인 경우)
+        """
+        self.dynamic = dynamic
+        self.condition = condition
+        # indata 경로가 있을 때만 현재 노드 입력 데이터를 준비하면 됨
+        self.needs_indata = any(accessor.root == ROOT_INDATA for _, accessor in dynamic)
+        # nodes.이름 경로로 참조하는 노드 이름/ID (실행 컨텍스트가 결과를 보관해야 하는 노드)
+        self.node_refs = frozenset(accessor.node_ref for _, accessor in dynamic if accessor.root == ROOT_NODES)
+
+    @property
+    def is_static(self) -> bool:
+        """해석할 동적 파라미터가 없는지 여부"""
+        return not self.dynamic
+
+    @property
+    def dynamic_keys(self) -> tuple[str, ...]:
+        """동적 파라미터 키 목록"""
+        return tuple(key for key, _ in self.dynamic)
+
+    def with_condition(self, condition: "CompiledCondition") -> "ParameterPlan":
+        """컴파일된 조건을 보관하는 새 계획을 반환합니다. (공유되는 STATIC_PARAMETER_PLAN을 수정하지 않도록 복사)"""
+        return ParameterPlan(self.dynamic, condition)
+
+    def resolve(
+        self, node_data: dict[str, Any], outdata: Any = None, indata: Any = None, context: Any = None
+    ) -> dict[str, Any]:
+        """
+        동적 파라미터를 실제 값으로 교체합니다. (원본 수정)
+
+        경로를 해석할 수 없으면(None) 원래 문자열을 그대로 둡니다.
+
+        Args:
+            node_data: 노드 데이터 딕셔너리
+            outdata: 이전 노드의 실행 결과
+            indata: 현재 노드의 입력 파라미터 (needs_indata일 때만 필요)
+            context: 노드 실행 컨텍스트 (nodes 경로 해석용)
+
+        Returns:
+            경로가 해석된 노드 데이터 딕셔너리
+        """
+        for key, accessor in self.dynamic:
+            resolved_value = accessor.get(outdata, indata, context)
+            if resolved_value is not None:
+                node_data[key] = resolved_value
+        return node_data
+
+
+# 동적 파라미터가 없는 노드가 공유하는 계획
+STATIC_PARAMETER_PLAN = ParameterPlan(())
+
+
+def compile_parameter_plan(node_data: dict[str, Any] | None) -> ParameterPlan:
+    """
+    노드 데이터에서 동적(경로 문자열) 파라미터를 찾아 해석 계획을 만듭니다.
+
+    내부 메타데이터(_ 접두사) 키는 제외합니다.
+
+    Args:
+        node_data: 노드 데이터 딕셔너리 (해석 전 원본 값)
+
+    Returns:
+        ParameterPlan 인스턴스
+    """
+    if not node_data:
+        return STATIC_PARAMETER_PLAN
+
+    dynamic = []
+    for key, value in node_data.items():
+        if type(value) is str and not key.startswith("_"):
+            accessor = compile_field_path(value)
+            if accessor is not None:
+                dynamic.append((key, accessor))
+
+    return ParameterPlan(tuple(dynamic)) if dynamic else STATIC_PARAMETER_PLAN
 
 
 def resolve_field_path(field_path: str, previous_output: dict[str, Any] | None) -> Any | None:
@@ -24,6 +315,7 @@ def resolve_field_path(field_path: str, previous_output: dict[str, Any] | None)
             - "outdata.output.execution_id": 이전 노드의 output.execution_id
             - "outdata.action": 이전 노드의 action 필드
             - "outdata.output": 이전 노드의 전체 output 객체
+            - "outdata.output.rows[0]": 이전 노드 output.rows의 첫 번째 항목
             - "indata.parameter_name": 이전 노드의 입력 파라미터
         previous_output: 경로 해석용 래핑 구조
             - {"outdata": {"action": "...", "status": "...", "output": {...}}, "indata": {...}}
@@ -57,67 +349,14 @@ def resolve_field_path(field_path: str, previous_output: dict[str, Any] | None)
     if not previous_output or not isinstance(previous_output, dict):
         return None
 
-    # outdata. 또는 indata.으로 시작하는 경로만 처리
+    # outdata. 또는 indata.으로 시작하는 경로만 처리 (nodes 경로는 컨텍스트가 필요하므로 제외)
     if not field_path.startswith(("outdata.", "indata.")):
         return None
 
-    try:
-        if field_path.startswith("outdata."):
-            # "outdata." 제거
-            path = field_path[8:]  # "outdata." 길이만큼 제거
-
-            # previous_output에서 outdata 가져오기
-            if "outdata" not in previous_output:
-                return None
-
-            resolved_value = previous_output["outdata"]
-
-            # 경로가 비어있으면 전체 outdata 반환
-            if not path:
-                return resolved_value
-
-            # 경로를 점(.)으로 분리하여 중첩된 딕셔너리 접근
-            keys = path.split(".")
-            for key in keys:
-                if isinstance(resolved_value, dict):
-                    resolved_value = resolved_value.get(key)
-                else:
-                    # dict가 아니면 더 이상 접근 불가능하므로 None 반환
-                    return None
-
-            return resolved_value
-
-        if field_path.startswith("indata."):
-            # "indata." 제거
-            path = field_path[7:]  # "indata." 길이만큼 제거
-
-            # previous_output에서 indata 가져오기
-            if "indata" not in previous_output:
-                return None
-
-            resolved_value = previous_output["indata"]
-
-            # 경로가 비어있으면 전체 indata 반환
-            if not path:
-                return resolved_value
-
-            # 경로를 점(.)으로 분리하여 중첩된 딕셔너리 접근
-            keys = path.split(".")
-            for key in keys:
-                if isinstance(resolved_value, dict):
-                    resolved_value = resolved_value.get(key)
-                else:
-                    # dict가 아니면 더 이상 접근 불가능하므로 None 반환
-                    return None
-
-            return resolved_value
-
-        # 위의 조건에 해당하지 않는 경우 (이론적으로 도달 불가능)
-        return None
-
-    except Exception as e:
-        logger.warning(f"[FieldPathResolver] 경로 해석 실패: {field_path}, 오류: {e!s}")
+    accessor = compile_field_path(field_path)
+    if accessor is None:
         return None
+    return accessor.get(previous_output.get("outdata"), previous_output.get("indata"))
 
 
 def resolve_parameter_paths(
@@ -126,9 +365,12 @@ def resolve_parameter_paths(
     """
     노드 데이터의 모든 파라미터에서 경로 문자열을 실제 값으로 변환합니다.
 
+    반복 실행되는 노드는 compile_parameter_plan()으로 계획을 한 번 만들어
+    ParameterPlan.resolve()를 직접 호출하는 것이 더 빠릅니다.
+
     Args:
         node_data: 노드 데이터 딕셔너리 (파라미터 포함)
-        previous_output: 이전 노드의 결과 딕셔너리 (outdata 구조 또는 직접 구조)
+        previous_output: 이전 노드의 결과 딕셔너리 (outdata 구조)
         current_indata: 현재 노드의 입력 데이터 (indata 구조)
 
     Returns:
@@ -149,47 +391,8 @@ def resolve_parameter_paths(
     if not previous_output or not isinstance(previous_output, dict):
         return node_data
 
-    # previous_output을 outdata 구조로 통일 (indata 포함)
-    wrapped_output = previous_output.copy()
-    if current_indata:
-        wrapped_output["indata"] = current_indata
-
-    # node_data의 모든 키-값 쌍을 순회
-    for key, value in node_data.items():
-        # 값이 문자열이고 경로 문자열인 경우
-        if isinstance(value, str):
-            # 새로운 형식: outdata. 또는 indata.로 시작
-            if value.startswith(("outdata.", "indata.")):
-                # 경로 해석
-                resolved_value = resolve_field_path(value, wrapped_output)
-                if resolved_value is not None:
-                    # 경로가 성공적으로 해석되었으면 실제 값으로 교체
-                    node_data[key] = resolved_value
-                    logger.debug(f"[FieldPathResolver] 파라미터 '{key}' 경로 해석: '{value}' -> {resolved_value}")
-            # 이전 형식: output.data. 또는 output.으로 시작 (하위 호환성)
-            elif value.startswith("output."):
-                # 이전 형식을 새로운 형식으로 변환
-                # "output.data.output.execution_id" -> "outdata.output.execution_id" (중복 output 제거)
-                # "output.data.execution_id" -> "outdata.output.execution_id"
-                # "output.execution_id" -> "outdata.output.execution_id"
-                normalized_path = value
-                if normalized_path.startswith("output.data.output."):
-                    # "output.data.output." 제거 후 "outdata.output." 추가 (중복 output 제거)
-                    normalized_path = "outdata.output." + normalized_path[19:]
-                elif normalized_path.startswith("output.data."):
-                    # "output.data." 제거 후 "outdata.output." 추가
-                    normalized_path = "outdata.output." + normalized_path[12:]
-                elif normalized_path.startswith("output."):
-                    # "output." 제거 후 "outdata.output." 추가
-                    normalized_path = "outdata.output." + normalized_path[7:]
-
-                # 변환된 경로로 해석
-                resolved_value = resolve_field_path(normalized_path, wrapped_output)
-                if resolved_value is not None:
-                    # 경로가 성공적으로 해석되었으면 실제 값으로 교체
-                    node_data[key] = resolved_value
-                    logger.debug(
-                        f"[FieldPathResolver] 파라미터 '{key}' 경로 해석 (이전 형식 변환): '{value}' -> '{normalized_path}' -> {resolved_value}"
-                    )
-
-    return node_data
+    plan = compile_parameter_plan(node_data)
+    if plan.is_static:
+        return node_data
+    indata = current_indata if current_indata is not None else previous_output.get("indata")
+    return plan.resolve(node_data, previous_output.get("outdata"), indata)
@@ -0,0 +1,80 @@
+"""
+키셋(커서) 페이지네이션과 필드 선택 유틸리티
+
+OFFSET 페이지네이션은 건너뛸 행을 모두 읽으므로 뒤 페이지일수록 느려집니다.
+키셋 페이지네이션은 이전 페이지 마지막 행의 정렬 키(예: started_at, id)를 커서로 넘겨받아
+인덱스에서 그 다음 위치부터 바로 읽으므로 페이지 위치와 관계없이 비용이 같습니다.
+
+커서는 정렬 키 값을 JSON 배열로 만들어 base64url로 인코딩한 문자열입니다. (클라이언트는 내용을 해석하지 않고 그대로 전달)
+"""
+
+import base64
+from collections.abc import Iterable
+import json
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 값을 커서 문자열로 인코딩합니다.
+
+    Examples:
+        >>> encode_cursor("2024-01-15T14:30:25", 123)
+    """
+    raw = json.dumps(list(values), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩합니다.
+
+    Args:
+        cursor: encode_cursor()로 만든 문자열
+        size: 정렬 키 개수
+
+    Raises:
+        ValueError: 잘못된 커서인 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return values
+
+
+def parse_fields(fields: str | None, allowed: Iterable[str]) -> list[str] | None:
+    """
+    쉼표로 구분한 필드 목록(fields= 쿼리 파라미터)을 검사합니다.
+
+    Args:
+        fields: 예) "id,status,started_at" (None이나 빈 문자열이면 전체 필드)
+        allowed: 선택할 수 있는 필드 이름
+
+    Returns:
+        필드 이름 목록 (중복 제거, 입력 순서 유지) 또는 None (전체 필드)
+
+    Raises:
+        ValueError: 선택할 수 없는 필드가 포함된 경우
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not names:
+        return None
+    allowed = tuple(allowed)
+    allowed_set = set(allowed)
+    unknown = [name for name in names if name not in allowed_set]
+    if unknown:
+        raise ValueError(f"선택할 수 없는 필드입니다: {', '.join(unknown)} (가능한 필드: {', '.join(allowed)})")
+    return names
+
+
+def project(items: list[dict[str, Any]], fields: list[str] | None) -> list[dict[str, Any]]:
+    """항목마다 선택한 필드만 남깁니다. (fields가 None이면 그대로 반환)"""
+    if fields is None:
+        return items
+    return [{name: item.get(name) for name in fields} for item in items]
@@ -1,10 +1,13 @@
 import asyncio
+from collections import deque
 from enum import Enum
 import time
 
 # Any: 모든 타입을 허용하는 타입 힌트
 from typing import TYPE_CHECKING, Any
 
+from utils.condition_predicate import CompiledCondition
+
 # TYPE_CHECKING: 타입 체커(mypy 등)가 코드를 분석할 때만 True가 됨
 # 실행 시에는 False이므로 이 블록의 코드는 실행되지 않음 (타입 체크용으로만 사용)
 if TYPE_CHECKING:
@@ -59,19 +62,67 @@ class NodeStatus(Enum):
     SKIPPED = "skipped"
 
 
+# 조건 노드의 분기 출력 타입
+BRANCH_TRUE = "true"
+BRANCH_FALSE = "false"
+
+
+def _normalize_connected_to(connected_to: list[Any] | None) -> list[tuple[str, str | None]]:
+    """
+    출력 연결 목록을 (다음 노드 ID, 출력 타입) 튜플 목록으로 정규화합니다.
+
+    NodeRepository.build_connections_from_nodes와 같은 형식을 받습니다.
+    (객체 형식 {"to", "outputType"}과 문자열 형식 모두 지원)
+    """
+    if not isinstance(connected_to, list):
+        return []
+    connections = []
+    for item in connected_to:
+        if isinstance(item, dict):
+            if item.get("to"):
+                connections.append((item["to"], item.get("outputType")))
+        elif isinstance(item, str):
+            connections.append((item, None))
+    return connections
+
+
 class WorkflowNode:
     """워크플로우 노드 클래스
     워크플로우를 구성하는 개별 노드를 나타내는 클래스입니다.
     각 노드는 고유한 ID, 타입, 데이터를 가지며 실행 상태를 추적합니다.
+
+    __slots__를 사용하여 인스턴스별 __dict__를 만들지 않습니다. (노드 수/반복 실행이 많을 때 메모리와 속성 접근 비용 절감)
+    엔진에 추가된 노드는 상태가 바뀔 때 엔진의 상태별 개수를 함께 갱신합니다.
     """
 
-    def __init__(self, node_id: str, node_type: NodeType, data: dict[str, Any]) -> None:
+    __slots__ = (
+        "_status",
+        "_status_counts",
+        "condition",
+        "connected_to",
+        "data",
+        "end_time",
+        "error_message",
+        "id",
+        "result",
+        "start_time",
+        "type",
+    )
+
+    def __init__(
+        self,
+        node_id: str,
+        node_type: NodeType,
+        data: dict[str, Any],
+        connected_to: list[Any] | None = None,
+    ) -> None:
         """워크플로우 노드 초기화
 
         Args:
             node_id: 노드의 고유 식별자 (예: "node_1", "start", "click_123")
             node_type: 노드의 타입 (CLICK, WAIT, CONDITION, LOOP, CUSTOM 중 하나)
             data: 노드 실행에 필요한 파라미터 데이터 (예: 클릭 좌표, 대기 시간 등)
+            connected_to: 출력 연결 목록 ({"to": 노드 ID, "outputType": "true"/"false"/None} 또는 노드 ID 문자열)
         """
         # node_id: 노드의 고유 식별자 (예: "node_1", "start", "click_123")
         self.id = node_id
@@ -79,8 +130,10 @@ class WorkflowNode:
         self.type = node_type
         # data: 노드 실행에 필요한 파라미터 데이터 (예: 클릭 좌표, 대기 시간 등)
         self.data = data
-        # status: 노드의 현재 실행 상태 (초기값: PENDING - 대기 중)
-        self.status = NodeStatus.PENDING
+        # _status_counts: 상태별 노드 개수 (엔진에 추가될 때 엔진의 카운터가 연결됨, 없으면 None)
+        self._status_counts: dict[NodeStatus, int] | None = None
+        # _status: 노드의 현재 실행 상태 (초기값: PENDING - 대기 중, status 프로퍼티로 접근)
+        self._status = NodeStatus.PENDING
         # start_time: 노드 실행 시작 시간 (타임스탬프, 초기값: None)
         self.start_time: float | None = None
         # end_time: 노드 실행 종료 시간 (타임스탬프, 초기값: None)
@@ -89,6 +142,32 @@ class WorkflowNode:
         self.error_message: str | None = None
         # result: 노드 실행 결과 데이터 (초기값: None)
         self.result: dict[str, Any] | None = None
+        # connected_to: 출력 연결 목록 [(다음 노드 ID, 출력 타입)] (출력 타입: 조건 노드는 "true"/"false", 일반 출력은 None)
+        self.connected_to = _normalize_connected_to(connected_to)
+        # condition: 컴파일된 조건 (조건 노드만, 실행 계획을 만들 때 컴파일)
+        self.condition: CompiledCondition | None = None
+
+    @property
+    def status(self) -> NodeStatus:
+        """노드의 현재 실행 상태"""
+        return self._status
+
+    @status.setter
+    def status(self, value: NodeStatus) -> None:
+        # 엔진에 추가된 노드면 상태별 개수를 증분 갱신 (실행 요약에서 전체 노드를 다시 세지 않도록)
+        counts = self._status_counts
+        if counts is not None:
+            counts[self._status] -= 1
+            counts[value] += 1
+        self._status = value
+
+    def reset(self) -> None:
+        """실행 상태를 초기화합니다. (같은 노드 객체를 다시 실행할 때 사용)"""
+        self.status = NodeStatus.PENDING
+        self.start_time = None
+        self.end_time = None
+        self.error_message = None
+        self.result = None
 
     def to_dict(self) -> dict[str, Any]:
         """노드를 딕셔너리로 변환합니다.
@@ -133,8 +212,15 @@ class WorkflowEngine:
         self.start_time: float | None = None
         # end_time: 워크플로우 실행 종료 시간 (타임스탬프, 초기값: None)
         self.end_time: float | None = None
-        # results: 각 노드의 실행 결과 리스트 (각 노드 실행 후 결과를 저장)
-        self.results: list[dict[str, Any]] = []
+        # _executed: 실행(또는 스킵)된 노드 목록 (실행 순서)
+        # 노드 객체 참조만 저장하고, 딕셔너리는 results 프로퍼티로 직렬화할 때 만듦
+        self._executed: list[WorkflowNode] = []
+        # _status_counts: 상태별 노드 개수 (노드 상태가 바뀔 때 증분 갱신되어 실행 요약에서 노드를 다시 세지 않음)
+        self._status_counts: dict[NodeStatus, int] = dict.fromkeys(NodeStatus, 0)
+        # _node_map: 노드 ID -> 노드 객체 (분기 라우팅 시 다음 노드 조회용, 실행 계획을 만들 때 구성)
+        self._node_map: dict[str, WorkflowNode] = {}
+        # _previous_result: 직전에 실행된 노드의 결과 (조건 노드의 입력 값)
+        self._previous_result: dict[str, Any] | None = None
 
         # 노드 핸들러 등록: 노드 타입별 실행 함수 매핑
         # node_handlers: 노드 타입을 키로 하고 해당 노드 타입의 실행 함수를 값으로 하는 딕셔너리
@@ -160,9 +246,17 @@ class WorkflowEngine:
         Args:
             node: 추가할 노드 객체
         """
+        # 상태별 개수 카운터 연결 (노드 상태가 바뀌면 엔진의 카운터가 함께 갱신됨)
+        node._status_counts = self._status_counts
+        self._status_counts[node.status] += 1
         # nodes 리스트에 노드 추가 (워크플로우에 포함시킴)
         self.nodes.append(node)
 
+    @property
+    def results(self) -> list[dict[str, Any]]:
+        """각 노드의 실행 결과 리스트 (실행 순서, 조회할 때 딕셔너리로 직렬화)"""
+        return [node.to_dict() for node in self._executed]
+
     def add_nodes_from_dict(self, nodes_data: list[dict[str, Any]]) -> None:
         """딕셔너리 리스트에서 노드들을 추가합니다.
         딕셔너리 형태의 노드 데이터 리스트를 받아서 WorkflowNode 객체로 변환하여 추가합니다.
@@ -186,6 +280,7 @@ class WorkflowEngine:
                 node_id=node_data.get("id", f"node_{len(self.nodes)}"),
                 node_type=NodeType(node_data.get("type", "click")),
                 data=node_data.get("data", {}),
+                connected_to=node_data.get("connected_to"),
             )
             # 생성된 노드를 워크플로우에 추가 (nodes 리스트에 추가)
             self.add_node(node)
@@ -213,10 +308,14 @@ class WorkflowEngine:
         self.start_time = time.time()
         # current_node_index: 현재 실행 중인 노드 인덱스를 0으로 초기화 (첫 번째 노드부터 시작)
         self.current_node_index = 0
-        # results: 실행 결과 리스트를 빈 리스트로 초기화 (각 노드의 실행 결과를 저장할 공간)
-        self.results = []
+        # _executed: 실행된 노드 목록을 빈 리스트로 초기화 (각 노드의 실행 결과를 저장할 공간)
+        self._executed = []
+        self._previous_result = None
 
         try:
+            # 실행 계획 구성 (조건 컴파일, 노드 ID 맵) - 실행당 한 번
+            self._build_plan()
+
             # 실행 모드에 따라 적절한 실행 함수 호출
             # SEQUENTIAL: 모든 노드를 순서대로 실행 (조건 없이)
             if self.execution_mode == ExecutionMode.SEQUENTIAL:
@@ -257,9 +356,9 @@ class WorkflowEngine:
             # current_node_index: 현재 실행 중인 노드 인덱스 업데이트 (진행 상황 추적용)
             self.current_node_index = i
             # 현재 노드 실행 (비동기 함수이므로 await 필요)
-            result = await self._execute_node(node)
-            # 실행 결과를 results 리스트에 추가 (나중에 실행 요약에 사용됨)
-            self.results.append(result)
+            await self._execute_node(node)
+            # 실행된 노드를 기록 (나중에 실행 요약에서 직렬화)
+            self._executed.append(node)
 
             # 실패한 경우 중단 여부 확인
             # 노드 상태가 FAILED이고 stop_on_failure가 True인 경우 실행 중단
@@ -270,11 +369,35 @@ class WorkflowEngine:
                 # break: for 루프를 즉시 종료하여 다음 노드들을 실행하지 않음
                 break
 
+    def _build_plan(self) -> None:
+        """실행 계획을 구성합니다.
+        조건 노드의 조건(조건 타입, 필드 경로, 비교값)을 한 번만 컴파일하고 노드 ID 맵을 만듭니다.
+        노드를 실행할 때마다 조건 타입 문자열을 비교하거나 비교값을 변환하지 않도록 합니다.
+        """
+        self._node_map = {node.id: node for node in self.nodes}
+        for node in self.nodes:
+            if node.type == NodeType.CONDITION:
+                node.condition = self._compile_condition(node)
+
+    @staticmethod
+    def _compile_condition(node: WorkflowNode) -> CompiledCondition:
+        """조건 노드의 조건을 컴파일합니다. (알 수 없는 조건 타입은 True로 평가 - 기존 동작)"""
+        return CompiledCondition(
+            node.data.get("condition_type", "always_true"),
+            node.data.get("field_path") or "",
+            node.data.get("compare_value", ""),
+            default=True,
+        )
+
     async def _execute_conditional(self) -> None:
         """조건부 실행
-        조건 노드를 만나면 조건을 평가하여 분기 실행합니다.
-        조건이 False이면 해당 노드를 스킵하고 다음 노드로 진행합니다.
+        노드에 연결 정보(connected_to)가 있으면 조건 결과에 따라 true/false 분기로 라우팅합니다.
+        연결 정보가 없으면 노드 목록 순서대로 실행하며, 조건이 False인 조건 노드만 스킵합니다.
         """
+        if any(node.connected_to for node in self.nodes):
+            await self._execute_routed()
+            return
+
         # 모든 노드를 순차적으로 순회
         # i: 현재 노드의 인덱스
         # node: 현재 처리할 노드 객체
@@ -291,25 +414,81 @@ class WorkflowEngine:
                 if not condition_result:
                     # node.status: 노드 상태를 SKIPPED로 설정 (실행하지 않고 건너뜀)
                     node.status = NodeStatus.SKIPPED
-                    # results: 스킵된 노드 정보를 결과 리스트에 추가
-                    self.results.append(node.to_dict())
+                    # 스킵된 노드도 실행 결과 목록에 기록
+                    self._executed.append(node)
                     # continue: 다음 노드로 넘어감 (현재 노드는 실행하지 않음)
                     continue
 
             # 조건 노드가 아니거나 조건이 True인 경우 노드 실행
-            result = await self._execute_node(node)
-            # 실행 결과를 results 리스트에 추가
-            self.results.append(result)
+            await self._execute_node(node)
+            # 실행된 노드를 기록
+            self._executed.append(node)
+
+    async def _execute_routed(self) -> None:
+        """연결 정보를 따라 실행합니다. (분기 라우팅)
+        들어오는 연결이 없는 노드(시작 노드)부터 출력 연결을 따라 실행합니다.
+        조건 노드는 평가 결과에 맞는 출력("true"/"false")만 따라가므로,
+        선택되지 않은 분기의 노드는 실행 대기열에 들어가지 않습니다. (실행 후 SKIPPED로 표시)
+        각 노드의 입력(조건 노드가 평가하는 값)은 BFS 순서상 직전 노드가 아니라 그 노드를 대기열에 넣은 선행 노드의 결과입니다.
+        """
+        targets = {to for node in self.nodes for to, _ in node.connected_to}
+        entries = [node for node in self.nodes if node.id not in targets] or self.nodes[:1]
+
+        # queue: 실행할 노드 대기열 / scheduled: 대기열에 넣은 노드 ID (합류 지점 중복 실행 방지)
+        queue = deque(entries)
+        scheduled = {node.id for node in entries}
+        position_map = {node.id: i for i, node in enumerate(self.nodes)}
+        # inputs: 노드 ID -> 연결을 따라 그 노드를 대기열에 넣은 선행 노드의 결과
+        # (분기가 여러 갈래로 나뉘면 BFS 순서상 직전 노드는 다른 갈래의 노드일 수 있음)
+        inputs: dict[str, dict[str, Any] | None] = {}
+
+        while queue:
+            node = queue.popleft()
+            self.current_node_index = position_map[node.id]
+            self._previous_result = inputs.pop(node.id, None)
+            await self._execute_node(node)
+            self._executed.append(node)
+            # _execute_node가 기록한 이 노드의 결과 (실패 시 {"error": ...})
+            output = self._previous_result
+
+            # 실패한 경우 중단 여부 확인 (순차 실행과 같은 stop_on_failure 규칙)
+            # 중단하지 않으면 순차 실행처럼 다음 노드를 계속 실행
+            failed = node.status == NodeStatus.FAILED
+            if failed and node.data.get("stop_on_failure", True):
+                break
 
-    async def _execute_node(self, node: WorkflowNode) -> dict[str, Any]:
+            # 다음으로 실행할 출력 타입 결정
+            # 조건 노드: 평가 결과에 맞는 분기만 / 그 외(실패해서 분기를 고를 수 없는 조건 노드 포함): 분기 출력이 아닌 모든 출력
+            if node.type == NodeType.CONDITION and not failed:
+                branch = BRANCH_TRUE if node.result and node.result.get("result") else BRANCH_FALSE
+                next_ids = [to for to, output_type in node.connected_to if output_type == branch]
+            else:
+                next_ids = [
+                    to for to, output_type in node.connected_to if output_type not in (BRANCH_TRUE, BRANCH_FALSE)
+                ]
+
+            for next_id in next_ids:
+                next_node = self._node_map.get(next_id)
+                if next_node is not None and next_id not in scheduled:
+                    scheduled.add(next_id)
+                    inputs[next_id] = output
+                    queue.append(next_node)
+
+        # 대기열에 들어가지 않은 노드 (선택되지 않은 분기 등)는 SKIPPED로 표시
+        for node in self.nodes:
+            if node.id not in scheduled:
+                node.status = NodeStatus.SKIPPED
+
+    async def _execute_node(self, node: WorkflowNode) -> WorkflowNode:
         """개별 노드를 실행합니다.
-        노드의 타입에 맞는 핸들러 함수를 찾아 실행하고, 실행 결과를 반환합니다.
+        노드의 타입에 맞는 핸들러 함수를 찾아 실행하고, 실행 상태와 결과를 노드에 기록합니다.
+        결과 딕셔너리는 만들지 않으며, 필요할 때 node.to_dict()로 직렬화합니다.
 
         Args:
             node: 실행할 노드 객체
 
         Returns:
-            노드 실행 결과를 포함한 딕셔너리
+            실행된 노드 객체 (status, result, 실행 시간 포함)
         """
         # 노드 상태를 RUNNING으로 설정 (실행 중 상태 표시)
         node.status = NodeStatus.RUNNING
@@ -346,8 +525,11 @@ class WorkflowEngine:
             # 성공/실패 관계없이 노드 실행 종료 시간 기록 (실행 시간 측정을 위해)
             node.end_time = time.time()
 
-        # 노드 정보를 딕셔너리로 변환하여 반환 (상태, 결과, 시간 등 모든 정보 포함)
-        return node.to_dict()
+        # 다음 조건 노드의 입력 값으로 사용
+        self._previous_result = result
+
+        # 노드 객체를 그대로 반환 (상태, 결과, 시간 등 모든 정보 포함)
+        return node
 
     async def _handle_click_node(self, node: WorkflowNode) -> dict[str, Any]:
         """클릭 노드 처리
@@ -410,41 +592,54 @@ class WorkflowEngine:
         """루프 노드 처리
         루프 노드를 실행합니다. 지정된 횟수만큼 루프 내부 노드들을 반복 실행합니다.
 
+        루프 내부 노드 객체는 루프 시작 시 한 번만 만들고 반복마다 상태만 초기화하여 재사용합니다.
+        반복별 결과는 개수만 집계하고, 마지막 반복의 결과만 딕셔너리로 반환합니다. (반복 횟수와 관계없이 일정한 메모리)
+
         Args:
             node: 루프 노드 객체 (data에 loop_count와 nodes 정보 포함)
 
         Returns:
-            루프 실행 결과 딕셔너리 (모든 반복의 실행 결과 포함)
+            루프 실행 결과 딕셔너리 (상태별 실행 횟수와 마지막 반복의 실행 결과 포함)
         """
         # loop_count: 반복 횟수 (기본값: 1)
         loop_count = node.data.get("loop_count", 1)
         # loop_nodes: 루프 내부에서 실행할 노드 데이터 리스트 (기본값: 빈 리스트)
         loop_nodes = node.data.get("nodes", [])
 
-        # results: 모든 반복의 실행 결과를 저장할 리스트 (각 반복의 각 노드 결과를 저장)
-        results = []
+        # 루프 내부 노드 객체를 한 번만 생성 (고유한 ID 부여, 예: "loop_1_loop_click_1")
+        # 엔진 카운터에 연결하지 않으므로 실행 요약의 노드 개수에는 포함되지 않음
+        body = [
+            WorkflowNode(
+                node_id=f"{node.id}_loop_{loop_node_data.get('id', 'unknown')}",
+                node_type=NodeType(loop_node_data.get("type", "click")),
+                data=loop_node_data.get("data", {}),
+            )
+            for loop_node_data in loop_nodes
+        ]
+
+        # 상태별 실행 횟수 (완료/실패)
+        completed = 0
+        failed = 0
         # 지정된 횟수만큼 반복 실행
-        # i: 현재 반복 횟수 (0부터 시작, 예: 0, 1, 2, ...)
-        for i in range(loop_count):
-            # 루프 내부 노드들 실행
-            # loop_node_data: 루프 내부에서 실행할 각 노드의 데이터 딕셔너리
-            for loop_node_data in loop_nodes:
-                # 각 반복마다 새로운 WorkflowNode 객체 생성 (고유한 ID 부여)
-                # node_id: 고유한 ID 생성 (예: "loop_1_loop_0_click_1")
-                #   - f"{node.id}_loop_{i}_{loop_node_data.get('id', 'unknown')}":
-                #     루프 노드 ID + 반복 횟수 + 내부 노드 ID 조합
-                loop_node = WorkflowNode(
-                    node_id=f"{node.id}_loop_{i}_{loop_node_data.get('id', 'unknown')}",
-                    node_type=NodeType(loop_node_data.get("type", "click")),
-                    data=loop_node_data.get("data", {}),
-                )
-                # 루프 내부 노드 실행 (비동기 함수이므로 await 필요)
-                result = await self._execute_node(loop_node)
-                # 실행 결과를 results 리스트에 추가 (나중에 반환할 때 사용)
-                results.append(result)
-
-        # 루프 실행 완료 결과 반환
-        return {"action": "loop", "loop_count": loop_count, "results": results, "success": True}
+        for _ in range(loop_count):
+            for loop_node in body:
+                # 이전 반복의 상태/결과 초기화 후 실행
+                loop_node.reset()
+                await self._execute_node(loop_node)
+                if loop_node.status == NodeStatus.COMPLETED:
+                    completed += 1
+                else:
+                    failed += 1
+
+        # 루프 실행 완료 결과 반환 (마지막 반복 결과만 직렬화)
+        return {
+            "action": "loop",
+            "loop_count": loop_count,
+            "completed": completed,
+            "failed": failed,
+            "results": [loop_node.to_dict() for loop_node in body] if loop_count > 0 else [],
+            "success": failed == 0,
+        }
 
     async def _handle_custom_node(self, node: WorkflowNode) -> dict[str, Any]:
         """커스텀 노드 처리
@@ -469,33 +664,19 @@ class WorkflowEngine:
 
     async def _evaluate_condition(self, node: WorkflowNode) -> bool:
         """조건을 평가합니다.
-        노드의 condition_type에 따라 조건 평가 결과를 반환합니다.
+        실행 계획을 만들 때 컴파일된 조건으로 직전 노드의 결과를 평가합니다.
+        (field_path가 있으면 직전 노드 결과에서 해당 필드를 추출하여 비교)
 
         Args:
             node: 조건 노드 객체
 
         Returns:
-            조건 평가 결과 (True 또는 False)
+            조건 평가 결과 (True 또는 False, 알 수 없는 조건 타입은 True)
         """
-        # condition_type: 조건 타입 (기본값: "always_true")
-        condition_type = node.data.get("condition_type", "always_true")
-
-        # 조건 타입에 따라 평가 결과 반환
-        # always_true: 항상 True 반환 (조건을 항상 만족)
-        if condition_type == "always_true":
-            return True
-        # always_false: 항상 False 반환 (조건을 항상 만족하지 않음)
-        if condition_type == "always_false":
-            return False
-        # random: 랜덤하게 True 또는 False 반환 (확률적으로 조건 만족)
-        if condition_type == "random":
-            import random
-
-            # random.choice: [True, False] 리스트에서 랜덤하게 하나 선택
-            return random.choice([True, False])
-
-        # 알 수 없는 조건 타입인 경우 기본값으로 True 반환 (안전한 기본값)
-        return True
+        # 실행 계획 밖에서 호출된 경우 (execute_workflow를 거치지 않음) 즉시 컴파일
+        if node.condition is None:
+            node.condition = self._compile_condition(node)
+        return node.condition.evaluate(self._previous_result)
 
     def _get_execution_summary(self) -> dict[str, Any]:
         """실행 요약을 반환합니다.
@@ -506,19 +687,14 @@ class WorkflowEngine:
         """
         # total_nodes: 전체 노드 개수 (워크플로우에 포함된 모든 노드 수)
         total_nodes = len(self.nodes)
+        # 상태별 노드 개수 (노드 상태가 바뀔 때 증분 갱신된 카운터를 그대로 사용 - 노드 목록을 다시 순회하지 않음)
+        counts = self._status_counts
         # completed_nodes: 완료된 노드 개수 (COMPLETED 상태인 노드들)
-        # [n for n in self.nodes if n.status == NodeStatus.COMPLETED]:
-        #   모든 노드 중에서 상태가 COMPLETED인 노드들만 필터링하여 리스트 생성
-        # len(): 필터링된 리스트의 길이 = 완료된 노드 개수
-        completed_nodes = len([n for n in self.nodes if n.status == NodeStatus.COMPLETED])
+        completed_nodes = counts[NodeStatus.COMPLETED]
         # failed_nodes: 실패한 노드 개수 (FAILED 상태인 노드들)
-        # [n for n in self.nodes if n.status == NodeStatus.FAILED]:
-        #   모든 노드 중에서 상태가 FAILED인 노드들만 필터링하여 리스트 생성
-        failed_nodes = len([n for n in self.nodes if n.status == NodeStatus.FAILED])
+        failed_nodes = counts[NodeStatus.FAILED]
         # skipped_nodes: 스킵된 노드 개수 (SKIPPED 상태인 노드들)
-        # [n for n in self.nodes if n.status == NodeStatus.SKIPPED]:
-        #   모든 노드 중에서 상태가 SKIPPED인 노드들만 필터링하여 리스트 생성
-        skipped_nodes = len([n for n in self.nodes if n.status == NodeStatus.SKIPPED])
+        skipped_nodes = counts[NodeStatus.SKIPPED]
 
         # execution_time: 실행 시간 계산 (종료 시간 - 시작 시간)
         # end_time과 start_time이 모두 존재하는 경우에만 계산, 없으면 0